@@ -860,9 +860,12 @@ with dai.Device(pipeline) as device:
     inStreams = ["in_left", "in_right"]
     inStreamsCameraID = [dai.CameraBoardSocket.CAM_B, dai.CameraBoardSocket.CAM_C]
     in_q_list = []
+    in_pool_list = []
     for s in inStreams:
         q = device.getInputQueue(s)
         in_q_list.append(q)
+        # Recycled frames, to not reallocate frame data on each send
+        in_pool_list.append(q.createPool(dai.ImgFrame, count=q.getMaxSize() + 2, capacity=width * height))
 
     # Create a receive queue for each stream
     q_list = []
@@ -888,7 +891,7 @@ with dai.Device(pipeline) as device:
                 data = data.reshape(height*width)
                 tstamp = datetime.timedelta(seconds = timestamp_ms // 1000,
                                             milliseconds = timestamp_ms % 1000)
-                img = dai.ImgFrame()
+                img = in_pool_list[i].acquire()
                 img.setData(data)
                 img.setTimestamp(tstamp)
                 img.setInstanceNum(inStreamsCameraID[i])
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+
+from http.server import BaseHTTPRequestHandler, HTTPServer
+import depthai as dai
+
+PORT = 9100
+
+# Create pipeline
+pipeline = dai.Pipeline()
+
+# Define source and output
+camRgb = pipeline.create(dai.node.ColorCamera)
+xoutVideo = pipeline.create(dai.node.XLinkOut)
+
+xoutVideo.setStreamName("video")
+
+# Properties
+camRgb.setBoardSocket(dai.CameraBoardSocket.CAM_A)
+camRgb.setResolution(dai.ColorCameraProperties.SensorResolution.THE_1080_P)
+camRgb.setVideoSize(1920, 1080)
+
+# Linking
+camRgb.video.link(xoutVideo.input)
+
+# Connect to device and start pipeline
+with dai.Device(pipeline) as device:
+    # Device is read at most once per second, regardless of how often metrics are scraped
+    device.setSystemInformationLoggingRate(1)
+    video = device.getOutputQueue(name="video", maxSize=1, blocking=False)
+
+    exporter = dai.MetricsExporter()
+    exporter.addDevice(device)
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path != "/metrics":
+                self.send_error(404)
+                return
+            body = exporter.scrape().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    print(f"Serving metrics on http://localhost:{PORT}/metrics")
+    HTTPServer(("", PORT), MetricsHandler).serve_forever()
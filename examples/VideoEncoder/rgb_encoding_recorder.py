@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+
+import depthai as dai
+import time
+
+# Create pipeline
+pipeline = dai.Pipeline()
+
+# Define sources and outputs
+camRgb = pipeline.create(dai.node.ColorCamera)
+videoEnc = pipeline.create(dai.node.VideoEncoder)
+xoutVideo = pipeline.create(dai.node.XLinkOut)
+xoutPreview = pipeline.create(dai.node.XLinkOut)
+
+xoutVideo.setStreamName('h265')
+xoutPreview.setStreamName('preview')
+
+# Properties
+camRgb.setBoardSocket(dai.CameraBoardSocket.CAM_A)
+camRgb.setResolution(dai.ColorCameraProperties.SensorResolution.THE_4_K)
+camRgb.setPreviewSize(300, 300)
+videoEnc.setDefaultProfilePreset(30, dai.VideoEncoderProperties.Profile.H265_MAIN)
+
+# Linking
+camRgb.video.link(videoEnc.input)
+camRgb.preview.link(xoutPreview.input)
+videoEnc.bitstream.link(xoutVideo.input)
+
+# Connect to device and start pipeline
+with dai.Device(pipeline) as device:
+
+    # Messages are recorded on the queues' reading threads, queues aren't consumed here
+    for name in ['h265', 'preview']:
+        device.getOutputQueue(name=name, maxSize=1, blocking=False)
+
+    # Both streams are written into a single indexed file by a native writer thread
+    with dai.Recorder(device, ['h265', 'preview'], 'session.dairec', policy=dai.Recorder.Policy.BLOCK) as recorder:
+        print("Press Ctrl+C to stop recording...")
+        try:
+            while True:
+                time.sleep(1)
+                stats = recorder.getStats()
+                print(f"Recorded {stats.numRecorded} messages ({stats.numBytes / 1e6:.1f} MB), dropped {stats.numDropped}")
+        except KeyboardInterrupt:
+            # Keyboard interrupt (Ctrl + C) detected
+            pass
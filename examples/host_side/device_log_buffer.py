@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+import depthai as dai
+import time
+
+# Start defining a pipeline
+pipeline = dai.Pipeline()
+
+# Script node logging verbosely
+script = pipeline.create(dai.node.Script)
+script.setScript("""
+    import time
+    i = 0
+    while True:
+        node.debug(f"Debug message {i}")
+        i += 1
+        time.sleep(0.001)
+""")
+
+# Connect to device with pipeline
+with dai.Device(pipeline) as device:
+    device.setLogLevel(dai.LogLevel.DEBUG)
+    # Don't print device logs to console, they are retrieved in batches below
+    device.setLogOutputLevel(dai.LogLevel.OFF)
+
+    # Messages are buffered natively, Python isn't invoked per message
+    device.setLogBufferCapacity(4096)
+    # All messages are also written to a file by a native writer thread
+    device.setLogFileSink("device.log")
+
+    while True:
+        time.sleep(1)
+        messages = device.getLogMessages(maxCount=1000)
+        if len(messages) > 0:
+            print(f"Retrieved {len(messages)} messages, last: '{messages[-1].payload}'")
+        print(f"Dropped: {device.getNumDroppedLogMessages()} from buffer, {device.getNumDroppedFileSinkLogMessages()} from file sink")
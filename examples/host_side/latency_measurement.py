@@ -1,5 +1,4 @@
 import depthai as dai
-import numpy as np
 # Create pipeline
 pipeline = dai.Pipeline()
 # This might improve reducing the latency on some systems
@@ -18,13 +17,22 @@ camRgb.isp.link(xout.input)
 with dai.Device(pipeline) as device:
     print(device.getUsbSpeed())
     q = device.getOutputQueue(name="out")
-    diffs = np.array([])
+    count = 0
     while True:
         imgFrame = q.get()
         # Latency in miliseconds 
         latencyMs = (dai.Clock.now() - imgFrame.getTimestamp()).total_seconds() * 1000
-        diffs = np.append(diffs, latencyMs)
-        print('Latency: {:.2f} ms, Average latency: {:.2f} ms, Std: {:.2f}'.format(latencyMs, np.average(diffs), np.std(diffs)))
-        
+        # Split into transport (until received by the host) and host backlog (waiting in the queue)
+        transportMs = (imgFrame.getTimestampHostArrival() - imgFrame.getTimestamp()).total_seconds() * 1000
+        backlogMs = (imgFrame.getTimestampHostDequeue() - imgFrame.getTimestampHostArrival()).total_seconds() * 1000
+        print('Latency: {:.2f} ms (transport {:.2f} ms, backlog {:.2f} ms)'.format(latencyMs, transportMs, backlogMs))
+
+        # Latency histograms are kept by the library, print their percentiles once per second
+        count += 1
+        if count % 60 == 0:
+            for name, report in device.getLatencyReport().items():
+                total = report.total
+                print('{}: average {:.2f} ms, p50 {:.2f} ms, p99 {:.2f} ms, max {:.2f} ms'.format(name, total.mean, total.p50, total.p99, total.max))
+
         # Not relevant for this example
         # cv2.imshow('frame', imgFrame.getCvFrame())
\ No newline at end of file
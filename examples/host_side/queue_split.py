@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+import cv2
+import depthai as dai
+
+# Create pipeline
+pipeline = dai.Pipeline()
+
+# Add all three cameras
+camRgb = pipeline.create(dai.node.ColorCamera)
+left = pipeline.create(dai.node.MonoCamera)
+right = pipeline.create(dai.node.MonoCamera)
+
+# Create XLink output
+xout = pipeline.create(dai.node.XLinkOut)
+xout.setStreamName("frames")
+
+# Properties
+camRgb.setPreviewSize(300, 300)
+left.setCamera("left")
+left.setResolution(dai.MonoCameraProperties.SensorResolution.THE_400_P)
+right.setCamera("right")
+right.setResolution(dai.MonoCameraProperties.SensorResolution.THE_400_P)
+
+# Stream all the camera streams through the same XLink node
+camRgb.preview.link(xout.input)
+left.out.link(xout.input)
+right.out.link(xout.input)
+
+# Connect to device and start pipeline
+with dai.Device(pipeline) as device:
+
+    # Route frames into per camera queues by their instance number, without passing them through Python
+    split = device.getOutputQueue(name="frames", maxSize=4, blocking=False).split(dai.MessageDemux.Key.INSTANCE_NUM)
+    # Each child queue keeps its own size and blocking behavior
+    queues = {
+        "color": split.getQueue(0),
+        "left": split.getQueue(1, maxSize=2, blocking=False),
+        "right": split.getQueue(2, maxSize=2, blocking=False),
+    }
+
+    while True:
+        for name, q in queues.items():
+            inFrame = q.tryGet()
+            if inFrame is not None:
+                cv2.imshow(name, inFrame.getCvFrame())
+
+        if cv2.waitKey(1) == ord('q'):
+            break
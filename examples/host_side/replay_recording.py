@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+
+import cv2
+import depthai as dai
+import sys
+from datetime import timedelta
+
+# Recording made with dai.Recorder, eg. by VideoEncoder/rgb_encoding_recorder.py
+path = sys.argv[1] if len(sys.argv) > 1 else 'session.dairec'
+
+# No device needed, messages are replayed in real time in timestamp order.
+# Replayed queues are blocking, so only the displayed stream is replayed, other recorded streams (eg. h265) would stall it
+with dai.ReplayDevice(path, speed=1.0, streams=['preview']) as device:
+    print('Replayed streams:', device.getOutputQueueNames())
+    qPreview = device.getOutputQueue('preview', maxSize=4, blocking=True)
+
+    while not device.isFinished() or qPreview.has():
+        if device.getQueueEvent('preview', timeout=timedelta(milliseconds=100)) == '':
+            continue
+        for frame in qPreview.tryGetAll():
+            cv2.imshow('preview', frame.getCvFrame())
+
+        if cv2.waitKey(1) == ord('q'):
+            break
@@ -3,12 +3,51 @@
 #include "depthai-shared/common/Point2f.hpp"
 #include <vector>
 
+// project
+#include "device/CalibrationMaps.hpp"
+#include "device/CalibrationProjection.hpp"
+
+// Read-only arrays viewing cached maps, which are kept alive by the arrays
+static py::tuple mapsToNumpy(std::shared_ptr<const dai::python::CalibrationMaps::Maps> maps){
+    using Maps = dai::python::CalibrationMaps::Maps;
+    auto owner = [&maps](){
+        auto* holder = new std::shared_ptr<const Maps>(maps);
+        return py::capsule(holder, [](void* p){ delete reinterpret_cast<std::shared_ptr<const Maps>*>(p); });
+    };
+    const py::ssize_t height = maps->height, width = maps->width;
+    py::array first, second;
+    if(maps->format == dai::python::CalibrationMaps::Format::FLOAT32){
+        first = py::array_t<float>({height, width}, maps->mapX.data(), owner());
+        second = py::array_t<float>({height, width}, maps->mapY.data(), owner());
+    } else {
+        first = py::array_t<std::int16_t>({height, width, py::ssize_t(2)}, maps->mapXY.data(), owner());
+        second = py::array_t<std::uint16_t>({height, width}, maps->mapInterpolation.data(), owner());
+    }
+    first.attr("setflags")(py::arg("write") = false);
+    second.attr("setflags")(py::arg("write") = false);
+    return py::make_tuple(first, second);
+}
+
+using FloatArray = py::array_t<float, py::array::c_style | py::array::forcecast>;
+
+// Number of rows of an array of points with given number of coordinates
+static std::size_t numPoints(const FloatArray& array, py::ssize_t coordinates, const char* name){
+    if(array.ndim() != 2 || array.shape(1) != coordinates) {
+        throw std::invalid_argument(std::string(name) + " must be an array of shape (N, " + std::to_string(coordinates) + ")");
+    }
+    return static_cast<std::size_t>(array.shape(0));
+}
+
 void CalibrationHandlerBindings::bind(pybind11::module& m, void* pCallstack){
 
     using namespace dai;
 
     // Type definitions
     py::class_<CalibrationHandler> calibrationHandler(m, "CalibrationHandler", DOC(dai, CalibrationHandler));
+    py::class_<python::WarpMesh> warpMesh(m, "WarpMesh", "Sparse mesh of source image coordinates, sampled every step pixels of the output image");
+    py::class_<python::CalibrationMaps> calibrationMaps(m, "CalibrationMaps", "Cache of undistortion and rectification maps and meshes generated from calibration");
+    py::enum_<python::CalibrationMaps::Format> calibrationMapsFormat(calibrationMaps, "Format");
+    py::class_<python::CalibrationMaps::CacheStats> calibrationMapsCacheStats(calibrationMaps, "CacheStats");
 
     ///////////////////////////////////////////////////////////////////////
     ///////////////////////////////////////////////////////////////////////
@@ -23,6 +62,36 @@ void CalibrationHandlerBindings::bind(pybind11::module& m, void* pCallstack){
     ///////////////////////////////////////////////////////////////////////
 
     // Bindings
+    warpMesh
+        .def(py::init<>())
+        .def_readwrite("width", &python::WarpMesh::width, "Number of mesh points in a row")
+        .def_readwrite("height", &python::WarpMesh::height, "Number of mesh rows")
+        .def_readwrite("stepWidth", &python::WarpMesh::stepWidth)
+        .def_readwrite("stepHeight", &python::WarpMesh::stepHeight)
+        .def_readwrite("points", &python::WarpMesh::points, "Source coordinates, row by row from top left")
+        .def("toStereoMeshData", &python::WarpMesh::toStereoMeshData, "Retrieves the mesh in StereoDepth mesh format, a sequence of (y, x) float points, as accepted by StereoDepth.loadMeshData")
+        ;
+
+    calibrationMapsFormat
+        .value("FLOAT32", python::CalibrationMaps::Format::FLOAT32, "Separate x and y float32 maps")
+        .value("FIXED_POINT", python::CalibrationMaps::Format::FIXED_POINT, "Interleaved int16 integer coordinates and uint16 interpolation table indices, as OpenCV's CV_16SC2 and CV_16UC1")
+        ;
+
+    calibrationMapsCacheStats
+        .def(py::init<>())
+        .def_readwrite("numHits", &python::CalibrationMaps::CacheStats::numHits)
+        .def_readwrite("numMisses", &python::CalibrationMaps::CacheStats::numMisses)
+        .def_readwrite("numEntries", &python::CalibrationMaps::CacheStats::numEntries)
+        ;
+
+    calibrationMaps
+        .def_readonly_static("DEFAULT_CACHE_CAPACITY", &python::CalibrationMaps::DEFAULT_CACHE_CAPACITY)
+        .def_static("setCacheCapacity", &python::CalibrationMaps::setCacheCapacity, py::arg("capacity"), "Sets number of maps and meshes retained in cache, evicting least recently used ones")
+        .def_static("getCacheCapacity", &python::CalibrationMaps::getCacheCapacity, "Retrieves number of maps and meshes retained in cache")
+        .def_static("getCacheStats", &python::CalibrationMaps::getCacheStats, "Retrieves cache statistics")
+        .def_static("clearCache", &python::CalibrationMaps::clearCache, "Discards cached maps and meshes and resets statistics")
+        ;
+
     calibrationHandler
         .def(py::init<>(), DOC(dai, CalibrationHandler, CalibrationHandler))
         .def(py::init<dai::Path>(), DOC(dai, CalibrationHandler, CalibrationHandler, 2))
@@ -80,6 +149,74 @@ void CalibrationHandlerBindings::bind(pybind11::module& m, void* pCallstack){
         .def("setCameraExtrinsics", &CalibrationHandler::setCameraExtrinsics, py::arg("srcCameraId"), py::arg("destCameraId"), py::arg("rotationMatrix"), py::arg("translation"), py::arg("specTranslation") = std::vector<float>(3,0), DOC(dai, CalibrationHandler, setCameraExtrinsics))
         .def("setImuExtrinsics", &CalibrationHandler::setImuExtrinsics, py::arg("destCameraId"), py::arg("rotationMatrix"), py::arg("translation"), py::arg("specTranslation") = std::vector<float>(3,0), DOC(dai, CalibrationHandler, setImuExtrinsics))
 
+        .def("getUndistortMaps", [](const CalibrationHandler& calib, CameraBoardSocket socket, std::tuple<int, int> size, float alpha, python::CalibrationMaps::Format format) {
+            std::shared_ptr<const python::CalibrationMaps::Maps> maps;
+            {
+                py::gil_scoped_release release;
+                maps = python::CalibrationMaps::getUndistortMaps(calib, socket, size, alpha, format);
+            }
+            return mapsToNumpy(maps);
+        }, py::arg("cameraId"), py::arg("size"), py::arg("alpha") = -1.0f, py::arg("format") = python::CalibrationMaps::Format::FLOAT32,
+        "Retrieves maps undistorting images of a camera for cv2.remap: (mapX, mapY) for FLOAT32, (mapXY, interpolation) for FIXED_POINT format. "
+        "Intrinsics are scaled to given (width, height) size. Alpha between 0 (only valid pixels retained) and 1 (all source pixels retained) sets new intrinsics, "
+        "negative keeps calibrated intrinsics. Results are cached and read-only")
+        .def("getRectificationMaps", [](const CalibrationHandler& calib, CameraBoardSocket left, CameraBoardSocket right, std::tuple<int, int> size, python::CalibrationMaps::Format format) {
+            std::pair<std::shared_ptr<const python::CalibrationMaps::Maps>, std::shared_ptr<const python::CalibrationMaps::Maps>> maps;
+            {
+                py::gil_scoped_release release;
+                maps = python::CalibrationMaps::getRectificationMaps(calib, left, right, size, format);
+            }
+            return py::make_tuple(mapsToNumpy(maps.first), mapsToNumpy(maps.second));
+        }, py::arg("left"), py::arg("right"), py::arg("size"), py::arg("format") = python::CalibrationMaps::Format::FLOAT32,
+        "Retrieves maps rectifying images of the calibrated stereo pair for cv2.remap, with intrinsics of the right camera, as a tuple of left and right maps. "
+        "See getUndistortMaps for formats. Results are cached and read-only")
+        .def("getUndistortMesh", [](const CalibrationHandler& calib, CameraBoardSocket socket, std::tuple<int, int> size, float alpha, std::tuple<int, int> step) {
+            py::gil_scoped_release release;
+            return python::WarpMesh(*python::CalibrationMaps::getUndistortMesh(calib, socket, size, alpha, step));
+        }, py::arg("cameraId"), py::arg("size"), py::arg("alpha") = -1.0f, py::arg("step") = std::make_tuple(16, 16),
+        "Retrieves a mesh undistorting images of a camera, as getUndistortMaps but sampled every step pixels, eg. for Warp.setWarpMesh")
+        .def("getRectificationMeshes", [](const CalibrationHandler& calib, CameraBoardSocket left, CameraBoardSocket right, std::tuple<int, int> size, std::tuple<int, int> step) {
+            py::gil_scoped_release release;
+            const auto meshes = python::CalibrationMaps::getRectificationMeshes(calib, left, right, size, step);
+            return std::make_pair(python::WarpMesh(*meshes.first), python::WarpMesh(*meshes.second));
+        }, py::arg("left"), py::arg("right"), py::arg("size"), py::arg("step") = std::make_tuple(16, 16),
+        "Retrieves meshes rectifying images of the calibrated stereo pair, as getRectificationMaps but sampled every step pixels, eg. for StereoDepth.loadMeshData with WarpMesh.toStereoMeshData")
+
+        .def("unproject", [](const CalibrationHandler& calib, CameraBoardSocket socket, FloatArray pixels, FloatArray depth, std::tuple<int, int> size) {
+            const auto count = numPoints(pixels, 2, "Pixels");
+            if(depth.size() != static_cast<py::ssize_t>(count)) throw std::invalid_argument("Depth must have a value for each pixel");
+            FloatArray points({static_cast<py::ssize_t>(count), py::ssize_t(3)});
+            {
+                py::gil_scoped_release release;
+                python::CalibrationProjection::unproject(calib, socket, pixels.data(), depth.data(), count, size, points.mutable_data());
+            }
+            return points;
+        }, py::arg("cameraId"), py::arg("pixels"), py::arg("depth"), py::arg("size"),
+        "Converts (N, 2) pixels with N depth values (distance along the optical axis) to (N, 3) points in the camera coordinate system, in units of depth, "
+        "removing lens distortion. Intrinsics are scaled to given (width, height) size and cached")
+        .def("project", [](const CalibrationHandler& calib, CameraBoardSocket socket, FloatArray points, std::tuple<int, int> size) {
+            const auto count = numPoints(points, 3, "Points");
+            FloatArray pixels({static_cast<py::ssize_t>(count), py::ssize_t(2)});
+            {
+                py::gil_scoped_release release;
+                python::CalibrationProjection::project(calib, socket, points.data(), count, size, pixels.mutable_data());
+            }
+            return pixels;
+        }, py::arg("cameraId"), py::arg("points"), py::arg("size"),
+        "Converts (N, 3) points in the camera coordinate system to (N, 2) pixels, applying lens distortion. Points behind the camera are projected to NaN. "
+        "Intrinsics are scaled to given (width, height) size and cached")
+        .def("transform", [](const CalibrationHandler& calib, CameraBoardSocket src, CameraBoardSocket dst, FloatArray points, bool useSpecTranslation) {
+            const auto count = numPoints(points, 3, "Points");
+            FloatArray out({static_cast<py::ssize_t>(count), py::ssize_t(3)});
+            {
+                py::gil_scoped_release release;
+                python::CalibrationProjection::transform(calib, src, dst, points.data(), count, useSpecTranslation, out.mutable_data());
+            }
+            return out;
+        }, py::arg("srcCamera"), py::arg("dstCamera"), py::arg("points"), py::arg("useSpecTranslation") = false,
+        "Transforms (N, 3) points from the coordinate system of srcCamera to dstCamera. Points are in centimeters, the unit of calibration translations. "
+        "Extrinsics are cached")
+
         .def("setStereoLeft", &CalibrationHandler::setStereoLeft, py::arg("cameraId"), py::arg("rectifiedRotation"), DOC(dai, CalibrationHandler, setStereoLeft))
         .def("setStereoRight", &CalibrationHandler::setStereoRight, py::arg("cameraId"), py::arg("rectifiedRotation"), DOC(dai, CalibrationHandler, setStereoRight));
 
@@ -2,18 +2,278 @@
 
 // std
 #include <chrono>
+#include <memory>
+#include <mutex>
+#include <unordered_map>
 
 // depthai
 #include "depthai/device/DataQueue.hpp"
 
+// project
+#include "queue/HostTimestamps.hpp"
+#include "queue/MessageDemux.hpp"
+#include "queue/MessageFilter.hpp"
+#include "queue/MessagePool.hpp"
+#include "queue/MessageQueue.hpp"
+#include "queue/QueueMonitor.hpp"
+#include "queue/SystemInformationCollector.hpp"
+#include "utility/Tracer.hpp"
+
+// To prevent blocking whole python interpreter, blocking functions like 'get' and 'send'
+// are pooled with a reasonable delay and check for python interrupt signal in between.
+// Shared between DataOutputQueue and host side MessageQueue
+
+// Stamps messages retrieved from Python, accounts them in queue statistics and traces them
+static void queueOnConsumed(const void* q, const std::string& name, const std::shared_ptr<dai::ADatatype>* messages, std::size_t count){
+    using dai::python::HostTimestamps;
+    auto monitor = dai::python::QueueMonitor::find(q);
+    for(std::size_t i = 0; i < count; i++){
+        HostTimestamps::TimePoint arrival, dequeue;
+        const bool first = HostTimestamps::stampDequeue(*messages[i], arrival, dequeue);
+        if(monitor && first) monitor->onDequeued(*messages[i], arrival, dequeue);
+        dai::python::Tracer::instant("dequeue", "queue", name, messages[i]->getRaw()->sequenceNum);
+    }
+    if(monitor) monitor->onConsumed(count);
+}
+// Queue name is only retrieved (copied) while tracing
+template<typename Q>
+static void queueOnConsumed(Q& q, const std::vector<std::shared_ptr<dai::ADatatype>>& messages){
+    if(messages.empty()) return;
+    queueOnConsumed(&q, dai::python::Tracer::isEnabled() ? q.getName() : std::string(), messages.data(), messages.size());
+}
+template<typename Q>
+static void queueOnConsumed(Q& q, const std::shared_ptr<dai::ADatatype>& msg){
+    if(msg) queueOnConsumed(&q, dai::python::Tracer::isEnabled() ? q.getName() : std::string(), &msg, 1);
+}
+
+template<typename Q>
+static int queueAddCallbackHelper(Q& q, py::function cb){
+    using dai::python::Tracer;
+    pybind11::module inspect_module = pybind11::module::import("inspect");
+    pybind11::object result = inspect_module.attr("signature")(cb).attr("parameters");
+    auto numParams = pybind11::len(result);
+
+    // Wrap into a callback with queue name and message, so its execution can be traced
+    std::function<void(std::string, std::shared_ptr<dai::ADatatype>)> callback;
+    if(numParams == 2){
+        callback = cb.cast<std::function<void(std::string, std::shared_ptr<dai::ADatatype>)>>();
+    } else if (numParams == 1){
+        auto f = cb.cast<std::function<void(std::shared_ptr<dai::ADatatype>)>>();
+        callback = [f](std::string, std::shared_ptr<dai::ADatatype> msg){ f(std::move(msg)); };
+    } else if (numParams == 0){
+        auto f = cb.cast<std::function<void()>>();
+        callback = [f](std::string, std::shared_ptr<dai::ADatatype>){ f(); };
+    } else {
+        throw py::value_error("Callback must take either zero, one or two arguments");
+    }
+    return q.addCallback([callback](std::string name, std::shared_ptr<dai::ADatatype> msg){
+        Tracer::Scope scope("callback", "callback", name, msg ? msg->getRaw()->sequenceNum : -1);
+        callback(std::move(name), std::move(msg));
+    });
+}
+
+template<typename Q>
+static std::vector<std::shared_ptr<dai::ADatatype>> queueGetAllHelper(Q& obj){
+    std::vector<std::shared_ptr<dai::ADatatype>> messages;
+    bool timedout = true;
+    do {
+        {
+            // releases python GIL
+            py::gil_scoped_release release;
+
+            // block for 100ms
+            messages = obj.getAll(std::chrono::milliseconds(100), timedout);
+        }
+
+        // reacquires python GIL for PyErr_CheckSignals call
+
+        // check if interrupt triggered in between
+        if (PyErr_CheckSignals() != 0) throw py::error_already_set();
+
+    } while(timedout); // Keep reiterating until a message is received (not timedout)
+
+    queueOnConsumed(obj, messages);
+    return messages;
+}
+
+template<typename Q>
+static std::shared_ptr<dai::ADatatype> queueGetHelper(Q& obj){
+    std::shared_ptr<dai::ADatatype> d = nullptr;
+    bool timedout = true;
+    do {
+        {
+            // releases python GIL
+            py::gil_scoped_release release;
+
+            // block for 100ms
+            d = obj.get(std::chrono::milliseconds(100), timedout);
+        }
+
+        // reacquires python GIL for PyErr_CheckSignals call
+
+        // check if interrupt triggered in between
+        if (PyErr_CheckSignals() != 0) throw py::error_already_set();
+
+    } while(timedout);
+
+    queueOnConsumed(obj, d);
+    return d;
+}
+
+template<typename Q>
+static std::shared_ptr<dai::ADatatype> queueTryGetHelper(Q& obj){
+    auto d = obj.tryGet();
+    queueOnConsumed(obj, d);
+    return d;
+}
+
+template<typename Q>
+static std::vector<std::shared_ptr<dai::ADatatype>> queueTryGetAllHelper(Q& obj){
+    auto messages = obj.tryGetAll();
+    queueOnConsumed(obj, messages);
+    return messages;
+}
+
+// Creates a pool of messages by calling the given Python type
+static std::shared_ptr<dai::python::MessagePool> createMessagePool(py::object type, unsigned int count, std::size_t capacity){
+    auto factory = [&type](){
+        return type().cast<std::shared_ptr<dai::ADatatype>>();
+    };
+    return std::make_shared<dai::python::MessagePool>(factory, count, capacity);
+}
+
+// Serializes sends to a DataInputQueue from this process, so a batch sent with 'sendMany' isn't interleaved with other sends.
+// Mutexes of destroyed queues are purged as new queues are added
+static std::shared_ptr<std::mutex> inputQueueSendMutex(const std::shared_ptr<dai::DataInputQueue>& q){
+    struct Entry {
+        std::weak_ptr<dai::DataInputQueue> queue;
+        std::shared_ptr<std::mutex> mtx;
+    };
+    static std::mutex mapMtx;
+    static std::unordered_map<const dai::DataInputQueue*, Entry> mutexes;
+    std::unique_lock<std::mutex> l(mapMtx);
+    auto it = mutexes.find(q.get());
+    // An expired entry belongs to a destroyed queue whose address got reused
+    if(it != mutexes.end() && !it->second.queue.expired()) return it->second.mtx;
+    for(auto e = mutexes.begin(); e != mutexes.end();) e = e->second.queue.expired() ? mutexes.erase(e) : std::next(e);
+    auto mtx = std::make_shared<std::mutex>();
+    mutexes[q.get()] = Entry{q, mtx};
+    return mtx;
+}
+
+// Sends a message, accounting it and time spent blocked in queue statistics. Send mutex must be held
+static bool inputQueueSend(dai::DataInputQueue& obj, const std::shared_ptr<dai::RawBuffer>& rawMsg, std::chrono::milliseconds timeout){
+    dai::python::Tracer::Scope scope("send", "send", dai::python::Tracer::isEnabled() ? obj.getName() : std::string(), rawMsg ? rawMsg->sequenceNum : -1);
+    auto monitor = dai::python::QueueMonitor::find(&obj);
+    const auto t1 = std::chrono::steady_clock::now();
+    const bool sent = obj.send(rawMsg, timeout);
+    if(monitor){
+        const auto blocked = std::chrono::steady_clock::now() - t1;
+        if(sent) monitor->onSent(rawMsg->data.size(), blocked);
+        else monitor->onBlocked(blocked);
+    }
+    return sent;
+}
+
+// Sends a batch in order, until all messages are sent or timeout expires. Send mutex, if given, is held for the whole batch
+// Not atomic: on timeout, the messages sent so far stay queued, as the queue can't reserve room for a whole batch
+template <typename T, typename Send>
+static std::size_t sendBatchHelper(const std::vector<T>& batch, std::chrono::milliseconds timeout, std::mutex* sendMtx, Send send){
+    using namespace std::chrono;
+
+    // if timeout < 0, unlimited timeout
+    const bool unlimitedTimeout = timeout < milliseconds(0);
+    const auto deadline = steady_clock::now() + timeout;
+
+    std::size_t numSent = 0;
+    std::unique_lock<std::mutex> l;
+    if(sendMtx != nullptr) l = std::unique_lock<std::mutex>(*sendMtx, std::defer_lock);
+    while(numSent < batch.size()) {
+        {
+            // releases python GIL, for the whole batch unless timeout is unlimited
+            py::gil_scoped_release release;
+            if(sendMtx != nullptr && !l.owns_lock()) l.lock();
+
+            while(numSent < batch.size()) {
+                auto remaining = unlimitedTimeout ? milliseconds(100) : duration_cast<milliseconds>(deadline - steady_clock::now());
+                if(remaining < milliseconds(0)) remaining = milliseconds(0);
+                if(!send(batch[numSent], remaining)) break;
+                numSent++;
+            }
+        }
+
+        // reacquires python GIL for PyErr_CheckSignals call
+
+        // check if interrupt triggered in between
+        if (PyErr_CheckSignals() != 0) throw py::error_already_set();
+
+        if(!unlimitedTimeout) break;
+    }
+
+    return numSent;
+}
+
+static std::size_t inputQueueSendManyHelper(const std::shared_ptr<dai::DataInputQueue>& queue, const std::vector<std::shared_ptr<dai::ADatatype>>& msgs, std::chrono::milliseconds timeout){
+    auto& obj = *queue;
+
+    // Serialize and validate all messages first, so a batch isn't partially sent because of an invalid message
+    std::vector<std::shared_ptr<dai::RawBuffer>> rawMsgs;
+    rawMsgs.reserve(msgs.size());
+    for(const auto& msg : msgs){
+        if(msg == nullptr) throw std::invalid_argument("Message passed is not valid (None)");
+        auto rawMsg = msg->serialize();
+        if(rawMsg->data.size() > obj.getMaxDataSize()){
+            throw std::runtime_error("Trying to send larger (" + std::to_string(rawMsg->data.size()) + "B) message than XLinkIn maxDataSize (" + std::to_string(obj.getMaxDataSize()) + "B)");
+        }
+        rawMsgs.push_back(std::move(rawMsg));
+    }
+
+    const auto sendMtx = inputQueueSendMutex(queue);
+    return sendBatchHelper(rawMsgs, timeout, sendMtx.get(), [&obj](const std::shared_ptr<dai::RawBuffer>& rawMsg, std::chrono::milliseconds remaining){
+        return inputQueueSend(obj, rawMsg, remaining);
+    });
+}
+
+static std::size_t messageQueueSendManyHelper(dai::python::MessageQueue& obj, const std::vector<std::shared_ptr<dai::ADatatype>>& msgs, std::chrono::milliseconds timeout){
+    // Validate all messages first, so a batch isn't partially sent because of an invalid message
+    for(const auto& msg : msgs){
+        if(msg == nullptr) throw std::invalid_argument("Message passed is not valid (None)");
+    }
+
+    return sendBatchHelper(msgs, timeout, nullptr, [&obj](const std::shared_ptr<dai::ADatatype>& msg, std::chrono::milliseconds remaining){
+        // Otherwise an unlimited send would retry a closed queue forever
+        if(obj.isClosed()) throw std::runtime_error("MessageQueue (" + obj.getName() + ") closed");
+        return obj.send(msg, remaining);
+    });
+}
+
+// Moves a column into a numpy array without copying
+static py::array_t<double> columnToNumpy(std::vector<double>&& column){
+    auto* data = new std::vector<double>(std::move(column));
+    py::capsule owner(data, [](void* p){ delete reinterpret_cast<std::vector<double>*>(p); });
+    return py::array_t<double>(data->size(), data->data(), owner);
+}
+
 void DataQueueBindings::bind(pybind11::module& m, void* pCallstack){
     using namespace dai;
+    using namespace dai::python;
     using namespace std::chrono;
 
 
     // Type definitions
     py::class_<DataOutputQueue, std::shared_ptr<DataOutputQueue>> dataOutputQueue(m, "DataOutputQueue", DOC(dai, DataOutputQueue));
     py::class_<DataInputQueue, std::shared_ptr<DataInputQueue>> dataInputQueue(m, "DataInputQueue", DOC(dai, DataInputQueue));
+    py::class_<MessageQueue, std::shared_ptr<MessageQueue>> messageQueue(m, "MessageQueue", "Host side message queue with the same interface as DataOutputQueue");
+    py::class_<MessageDemux, std::shared_ptr<MessageDemux>> messageDemux(m, "MessageDemux", "Routes messages of a single DataOutputQueue or MessageQueue into per-key child queues, without passing them through Python");
+    py::enum_<MessageDemux::Key> messageDemuxKey(messageDemux, "Key", "Property of a message which selects the child queue");
+    py::class_<MessageFilter, std::shared_ptr<MessageFilter>> messageFilter(m, "MessageFilter", "Composable chain of message filters, evaluated in C++ on the reading thread of a DataOutputQueue");
+    py::class_<QueueStats> queueStats(m, "QueueStats", "Statistics of a DataOutputQueue, DataInputQueue or MessageQueue");
+    py::class_<LatencySummary> latencySummary(m, "LatencySummary", "Summary of a latency histogram. Latencies are in milliseconds");
+    py::class_<LatencyReport> latencyReport(m, "LatencyReport", "Latencies of messages received by an output queue");
+    py::class_<MessagePool, std::shared_ptr<MessagePool>> messagePool(m, "MessagePool", "Pool of preallocated messages, recycled once they aren't referenced anymore (eg. after being written to XLink by a DataInputQueue)");
+    py::class_<FilteredQueue, MessageQueue, std::shared_ptr<FilteredQueue>> filteredQueue(m, "FilteredQueue", "Host side queue fed with messages of a DataOutputQueue or MessageQueue which passed a MessageFilter");
+    py::class_<TimeSeriesAggregate> timeSeriesAggregate(m, "TimeSeriesAggregate", "Aggregates of a time series field over a window");
+    py::class_<SystemInformationCollector, std::shared_ptr<SystemInformationCollector>> systemInformationCollector(m, "SystemInformationCollector", "Collects SystemInformation messages into a fixed-size ring buffer with one column per field, without passing them through Python");
 
 
     ///////////////////////////////////////////////////////////////////////
@@ -30,24 +290,44 @@ void DataQueueBindings::bind(pybind11::module& m, void* pCallstack){
     ///////////////////////////////////////////////////////////////////////
 
 
-    // To prevent blocking whole python interpreter, blocking functions like 'get' and 'send'
-    // are pooled with a reasonable delay and check for python interrupt signal in between.
+    // Bind QueueStats
+    queueStats
+        .def(py::init<>())
+        .def_readwrite("numReceived", &QueueStats::numReceived, "Number of messages received from the device (output queues)")
+        .def_readwrite("numConsumed", &QueueStats::numConsumed, "Number of messages retrieved by the host (output queues)")
+        .def_readwrite("numDropped", &QueueStats::numDropped, "Number of messages overwritten because a non-blocking queue was full (output queues)")
+        .def_readwrite("numSent", &QueueStats::numSent, "Number of messages sent to the device (input queues)")
+        .def_readwrite("numBytes", &QueueStats::numBytes, "Number of data bytes received or sent")
+        .def_readwrite("depth", &QueueStats::depth, "Number of messages currently in the queue (output queues). Messages already queued when monitoring started aren't accounted for")
+        .def_readwrite("peakDepth", &QueueStats::peakDepth, "Maximum number of messages in the queue so far (output queues)")
+        .def_readwrite("rate", &QueueStats::rate, "Exponentially weighted moving average of message rate [Hz]")
+        .def_readwrite("jitter", &QueueStats::jitter, "Exponentially weighted moving average of inter-arrival time deviation")
+        .def_readwrite("timeBlocked", &QueueStats::timeBlocked, "Total time spent blocked in send (input queues)")
+        ;
+
+    // Bind LatencySummary
+    latencySummary
+        .def(py::init<>())
+        .def_readwrite("count", &LatencySummary::count, "Number of recorded samples")
+        .def_readwrite("min", &LatencySummary::min, "Minimum latency [ms]")
+        .def_readwrite("max", &LatencySummary::max, "Maximum latency [ms]")
+        .def_readwrite("mean", &LatencySummary::mean, "Average latency [ms]")
+        .def_readwrite("p50", &LatencySummary::p50, "Median latency [ms]")
+        .def_readwrite("p90", &LatencySummary::p90, "90th percentile latency [ms]")
+        .def_readwrite("p99", &LatencySummary::p99, "99th percentile latency [ms]")
+        .def_readwrite("p999", &LatencySummary::p999, "99.9th percentile latency [ms]")
+        ;
+
+    // Bind LatencyReport
+    latencyReport
+        .def(py::init<>())
+        .def_readwrite("transport", &LatencyReport::transport, "From capture (message timestamp) to arrival on the host")
+        .def_readwrite("backlog", &LatencyReport::backlog, "From arrival on the host to retrieval from the queue")
+        .def_readwrite("total", &LatencyReport::total, "From capture (message timestamp) to retrieval from the queue")
+        ;
 
     // Bind DataOutputQueue
-    auto addCallbackLambda = [](DataOutputQueue& q, py::function cb) -> int {
-        pybind11::module inspect_module = pybind11::module::import("inspect");
-        pybind11::object result = inspect_module.attr("signature")(cb).attr("parameters");
-        auto numParams = pybind11::len(result);
-        if(numParams == 2){
-            return q.addCallback(cb.cast<std::function<void(std::string, std::shared_ptr<ADatatype>)>>());
-        } else if (numParams == 1){
-            return q.addCallback(cb.cast<std::function<void(std::shared_ptr<ADatatype>)>>());
-        } else if (numParams == 0){
-            return q.addCallback(cb.cast<std::function<void()>>());
-        } else {
-            throw py::value_error("Callback must take either zero, one or two arguments");
-        }
-    };
+    auto addCallbackLambda = &queueAddCallbackHelper<DataOutputQueue>;
     dataOutputQueue
         .def("getName", &DataOutputQueue::getName, DOC(dai, DataOutputQueue, getName))
         .def("isClosed", &DataOutputQueue::isClosed, DOC(dai, DataOutputQueue, isClosed))
@@ -62,30 +342,166 @@ void DataQueueBindings::bind(pybind11::module& m, void* pCallstack){
         .def("getBlocking", &DataOutputQueue::getBlocking, DOC(dai, DataOutputQueue, getBlocking))
         .def("setMaxSize", &DataOutputQueue::setMaxSize, py::arg("maxSize"), DOC(dai, DataOutputQueue, setMaxSize))
         .def("getMaxSize", &DataOutputQueue::getMaxSize, DOC(dai, DataOutputQueue, getMaxSize))
-        .def("getAll", [](DataOutputQueue& obj){
+        .def("getAll", &queueGetAllHelper<DataOutputQueue>, DOC(dai, DataOutputQueue, getAll, 2))
+        .def("get", &queueGetHelper<DataOutputQueue>, DOC(dai, DataOutputQueue, get, 2))
+        .def("has", static_cast<bool(DataOutputQueue::*)()>(&DataOutputQueue::has), DOC(dai, DataOutputQueue, has, 2))
+        .def("tryGet", &queueTryGetHelper<DataOutputQueue>, DOC(dai, DataOutputQueue, tryGet, 2))
+        .def("tryGetAll", &queueTryGetAllHelper<DataOutputQueue>, DOC(dai, DataOutputQueue, tryGetAll, 2))
+        .def("getStats", [](std::shared_ptr<DataOutputQueue> q){
+            return QueueMonitor::attach(q)->getStats();
+        }, "Retrieves statistics of this queue. Output queues of a Device are monitored from the start of the pipeline, others from the first call of getStats or getLatencyReport on, messages received before aren't counted")
+        .def("getLatencyReport", [](std::shared_ptr<DataOutputQueue> q, bool reset){
+            return QueueMonitor::attach(q)->getLatencyReport(reset);
+        }, py::arg("reset") = false, "Retrieves latency histograms of messages received by this queue, optionally discarding recorded latencies. Output queues of a Device are monitored from the start of the pipeline, others from the first call of getStats or getLatencyReport on")
+        .def("split", [](std::shared_ptr<DataOutputQueue> q, MessageDemux::Key key){
+            return std::make_shared<MessageDemux>(q, key, q->getMaxSize(), q->getBlocking());
+        }, py::arg("key") = MessageDemux::Key::INSTANCE_NUM, "Routes incoming messages into per-key child queues, which inherit this queues maxSize and blocking behavior. This queue stops retaining messages")
+        .def("split", [](std::shared_ptr<DataOutputQueue> q, MessageDemux::Key key, unsigned int maxSize, bool blocking){
+            return std::make_shared<MessageDemux>(q, key, maxSize, blocking);
+        }, py::arg("key"), py::arg("maxSize"), py::arg("blocking") = true, "Routes incoming messages into per-key child queues with given default maxSize and blocking behavior. This queue stops retaining messages")
+        .def("filter", [](std::shared_ptr<DataOutputQueue> q, std::shared_ptr<MessageFilter> filter){
+            return FilteredQueue::create(q, filter, q->getMaxSize(), q->getBlocking());
+        }, py::arg("filter"), "Creates a queue retaining only messages which pass given filter. It inherits this queues maxSize and blocking behavior. This queue stops retaining messages until the filtered queue is closed")
+        .def("filter", [](std::shared_ptr<DataOutputQueue> q, std::shared_ptr<MessageFilter> filter, unsigned int maxSize, bool blocking){
+            return FilteredQueue::create(q, filter, maxSize, blocking);
+        }, py::arg("filter"), py::arg("maxSize"), py::arg("blocking") = true, "Creates a queue retaining only messages which pass given filter, with given maxSize and blocking behavior. This queue stops retaining messages until the filtered queue is closed")
+        ;
 
-            std::vector<std::shared_ptr<ADatatype>> messages;
-            bool timedout = true;
-            do {
-                {
-                    // releases python GIL
-                    py::gil_scoped_release release;
+    // Bind MessageQueue
+    messageQueue
+        .def(py::init<std::string, unsigned int, bool>(), py::arg("name"), py::arg("maxSize") = 16, py::arg("blocking") = true)
+        .def("getName", &MessageQueue::getName, "Gets queues name")
+        .def("isClosed", &MessageQueue::isClosed, "Check whether queue is closed")
+        .def("close", &MessageQueue::close, "Closes the queue and unblocks any waiting consumers or producers")
+
+        .def("addCallback", &queueAddCallbackHelper<MessageQueue>, py::arg("callback"), "Adds a callback on message received, taking zero, one (message) or two (queue name, message) arguments")
+        .def("removeCallback", &MessageQueue::removeCallback, py::arg("callbackId"), "Removes a callback")
+
+        .def("setBlocking", &MessageQueue::setBlocking, py::arg("blocking"), "Sets queue behavior when full (maxSize)")
+        .def("getBlocking", &MessageQueue::getBlocking, "Gets current queue behavior when full (maxSize)")
+        .def("setMaxSize", &MessageQueue::setMaxSize, py::arg("maxSize"), "Sets queue maximum size")
+        .def("getMaxSize", &MessageQueue::getMaxSize, "Gets queue maximum size")
+        .def("getAll", &queueGetAllHelper<MessageQueue>, "Block until at least one message in the queue. Then return all messages from the queue")
+        .def("get", &queueGetHelper<MessageQueue>, "Block until a message is available")
+        .def("has", &MessageQueue::has, "Check whether front of the queue has a message (isn't empty)")
+        .def("tryGet", &queueTryGetHelper<MessageQueue>, "Try to retrieve message from queue. If no message available, return immediately with None")
+        .def("tryGetAll", &queueTryGetAllHelper<MessageQueue>, "Try to retrieve all messages in the queue")
+        .def("send", [](MessageQueue& obj, std::shared_ptr<ADatatype> d){
+            py::gil_scoped_release release;
+            return obj.send(d);
+        }, py::arg("msg"), "Adds a message to the queue, respecting its blocking behavior")
+        .def("sendMany", &messageQueueSendManyHelper, py::arg("msgs"), py::arg("timeout") = std::chrono::milliseconds(-1),
+            "Adds messages to the queue in order, respecting its blocking behavior. "
+            "Blocks for at most 'timeout' for the whole batch (unlimited if negative), releasing the GIL once. "
+            "Returns number of messages accepted. All messages are validated before any is sent")
+        .def("getStats", [](std::shared_ptr<MessageQueue> q){
+            return QueueMonitor::attach(q)->getStats();
+        }, "Retrieves statistics of this queue. The queue is monitored from the first call of getStats or getLatencyReport on, messages received before aren't counted")
+        .def("getLatencyReport", [](std::shared_ptr<MessageQueue> q, bool reset){
+            return QueueMonitor::attach(q)->getLatencyReport(reset);
+        }, py::arg("reset") = false, "Retrieves latency histograms of messages received by this queue, optionally discarding recorded latencies. The queue is monitored from the first call of getStats or getLatencyReport on")
+        .def("split", [](std::shared_ptr<MessageQueue> q, MessageDemux::Key key){
+            return std::make_shared<MessageDemux>(q, key, q->getMaxSize(), q->getBlocking());
+        }, py::arg("key") = MessageDemux::Key::INSTANCE_NUM, "Routes sent messages into per-key child queues, which inherit this queues maxSize and blocking behavior. This queue stops retaining messages")
+        .def("split", [](std::shared_ptr<MessageQueue> q, MessageDemux::Key key, unsigned int maxSize, bool blocking){
+            return std::make_shared<MessageDemux>(q, key, maxSize, blocking);
+        }, py::arg("key"), py::arg("maxSize"), py::arg("blocking") = true, "Routes sent messages into per-key child queues with given default maxSize and blocking behavior. This queue stops retaining messages")
+        .def("filter", [](std::shared_ptr<MessageQueue> q, std::shared_ptr<MessageFilter> filter){
+            return FilteredQueue::create(q, filter, q->getMaxSize(), q->getBlocking());
+        }, py::arg("filter"), "Creates a queue retaining only messages which pass given filter. It inherits this queues maxSize and blocking behavior. This queue stops retaining messages until the filtered queue is closed")
+        .def("filter", [](std::shared_ptr<MessageQueue> q, std::shared_ptr<MessageFilter> filter, unsigned int maxSize, bool blocking){
+            return FilteredQueue::create(q, filter, maxSize, blocking);
+        }, py::arg("filter"), py::arg("maxSize"), py::arg("blocking") = true, "Creates a queue retaining only messages which pass given filter, with given maxSize and blocking behavior. This queue stops retaining messages until the filtered queue is closed")
+        ;
 
-                    // block for 100ms
-                    messages = obj.getAll(milliseconds(100), timedout);
-                }
+    // Bind MessageDemux
+    messageDemuxKey
+        .value("INSTANCE_NUM", MessageDemux::Key::INSTANCE_NUM)
+        .value("TYPE", MessageDemux::Key::TYPE)
+        .value("CATEGORY", MessageDemux::Key::CATEGORY)
+    ;
+
+    messageDemux
+        .def("getKey", &MessageDemux::getKey, "Retrieves the key by which messages are routed")
+        .def("getQueue", static_cast<std::shared_ptr<MessageQueue>(MessageDemux::*)(int)>(&MessageDemux::getQueue), py::arg("key"), "Retrieves the child queue for given key, creating it with default maxSize and blocking behavior if it doesn't exist yet")
+        .def("getQueue", static_cast<std::shared_ptr<MessageQueue>(MessageDemux::*)(int, unsigned int, bool)>(&MessageDemux::getQueue), py::arg("key"), py::arg("maxSize"), py::arg("blocking") = true, "Retrieves the child queue for given key, creating it if it doesn't exist yet, and sets its maxSize and blocking behavior")
+        .def("getQueue", [](MessageDemux& d, DatatypeEnum type){
+            return d.getQueue(static_cast<int>(type));
+        }, py::arg("type"), "Retrieves the child queue for given datatype (Key.TYPE)")
+        .def("getKeys", &MessageDemux::getKeys, "Retrieves keys of all child queues created so far")
+        .def("close", &MessageDemux::close, py::call_guard<py::gil_scoped_release>(), "Stops routing, closes all child queues and restores parent queue settings")
+        ;
 
-                // reacquires python GIL for PyErr_CheckSignals call
+    // Bind MessageFilter
+    messageFilter
+        .def(py::init<>())
+        .def("decimate", &MessageFilter::decimate, py::arg("n"), py::return_value_policy::reference_internal, "Passes only every n-th message reaching this stage")
+        .def("type", &MessageFilter::type, py::arg("type"), py::return_value_policy::reference_internal, "Passes only messages of given datatype")
+        .def("dataSize", &MessageFilter::dataSize, py::arg("minSize"), py::arg("maxSize") = std::numeric_limits<std::size_t>::max(), py::return_value_policy::reference_internal, "Passes only messages which data size (in bytes) is within given bounds")
+        .def("detections", &MessageFilter::detections, py::arg("minCount"), py::arg("maxCount") = std::numeric_limits<std::size_t>::max(), py::return_value_policy::reference_internal, "Passes only detection messages (ImgDetections, SpatialImgDetections, Tracklets) which number of detections is within given bounds. Other messages pass through")
+        .def("sequenceGaps", &MessageFilter::sequenceGaps, py::return_value_policy::reference_internal, "Tracks gaps in sequence numbers, per ImgFrame instance number. Doesn't drop any messages")
+        .def("keepLatestPerInstance", &MessageFilter::keepLatestPerInstance, py::return_value_policy::reference_internal, "Retains only the latest message per ImgFrame instance number in the filtered queue")
+        .def("apply", &MessageFilter::apply, py::arg("msg"), "Evaluates the filter chain on given message")
+        .def("getKeepLatestPerInstance", &MessageFilter::getKeepLatestPerInstance, "Check whether only the latest message per instance is retained")
+        .def("getNumPassed", &MessageFilter::getNumPassed, "Retrieves number of messages which passed the filter")
+        .def("getNumDropped", &MessageFilter::getNumDropped, "Retrieves number of messages which were dropped by the filter")
+        .def("getSequenceGaps", &MessageFilter::getSequenceGaps, "Retrieves number of messages missing based on sequence numbers. Requires sequenceGaps stage")
+        .def("reset", &MessageFilter::reset, "Resets counters and state of all stages")
+        ;
 
-                // check if interrupt triggered in between
-                if (PyErr_CheckSignals() != 0) throw py::error_already_set();
+    // Bind FilteredQueue
+    filteredQueue
+        .def("getFilter", &FilteredQueue::getFilter, "Retrieves filter chain of this queue")
+        .def("close", &FilteredQueue::close, py::call_guard<py::gil_scoped_release>(), "Stops filtering, closes the queue and restores parent queue settings")
+        ;
 
-            } while(timedout); // Keep reiterating until a message is received (not timedout)
+    // Bind TimeSeriesAggregate
+    timeSeriesAggregate
+        .def(py::init<>())
+        .def_readwrite("count", &TimeSeriesAggregate::count, "Number of samples in the window")
+        .def_readwrite("min", &TimeSeriesAggregate::min, "Minimum value")
+        .def_readwrite("max", &TimeSeriesAggregate::max, "Maximum value")
+        .def_readwrite("mean", &TimeSeriesAggregate::mean, "Average value")
+        .def_readwrite("p95", &TimeSeriesAggregate::p95, "95th percentile value")
+        ;
 
-            return messages;
-        }, DOC(dai, DataOutputQueue, getAll, 2))
-        .def("get", [](DataOutputQueue& obj){
+    // Bind SystemInformationCollector
+    systemInformationCollector
+        .def(py::init<std::size_t>(), py::arg("capacity") = SystemInformationCollector::DEFAULT_CAPACITY, "Constructs a collector, samples are added manually with 'add'")
+        .def(py::init(&SystemInformationCollector::create), py::arg("queue"), py::arg("capacity") = SystemInformationCollector::DEFAULT_CAPACITY, "Constructs a collector subscribed to output queue of a SystemLogger node. Queue is set to not retain any messages until the collector is closed")
+        .def("add", &SystemInformationCollector::add, py::arg("msg"), "Adds a sample")
+        .def("getFieldNames", &SystemInformationCollector::getFields, "Retrieves names of collected fields, eg. 'ddrMemoryUsage.used' or 'chipTemperature.average'")
+        .def("getSize", &SystemInformationCollector::getSize, "Retrieves number of samples retained")
+        .def("getCapacity", &SystemInformationCollector::getCapacity, "Retrieves maximum number of samples retained")
+        .def("getTimestamps", [](SystemInformationCollector& c){
+            return columnToNumpy(c.getTimestamps());
+        }, "Retrieves host arrival timestamps of retained samples in seconds (same clock as dai.Clock.now()), oldest first")
+        .def("getField", [](SystemInformationCollector& c, const std::string& field){
+            return columnToNumpy(c.getField(field));
+        }, py::arg("field"), "Retrieves values of given field of retained samples, oldest first")
+        .def("getAll", [](SystemInformationCollector& c){
+            py::dict columns;
+            columns["timestamp"] = columnToNumpy(c.getTimestamps());
+            for(const auto& field : c.getFields()) columns[py::str(field)] = columnToNumpy(c.getField(field));
+            return columns;
+        }, "Retrieves timestamps and all fields of retained samples as a dictionary of arrays")
+        .def("aggregate", &SystemInformationCollector::aggregate, py::arg("field"), py::arg("window") = duration<double>(-1),
+            "Computes min/max/mean/p95 of given field over samples within 'window' before the latest sample, or over all retained samples if not specified")
+        .def("clear", &SystemInformationCollector::clear, "Discards all samples")
+        .def("dump", &SystemInformationCollector::dump, py::arg("path"), py::call_guard<py::gil_scoped_release>(), "Writes retained samples into a binary file, readable with 'load'")
+        .def_static("load", [](const Path& path){
+            py::dict columns;
+            for(auto& kv : SystemInformationCollector::load(path)) columns[py::str(kv.first)] = columnToNumpy(std::move(kv.second));
+            return columns;
+        }, py::arg("path"), "Reads samples written by 'dump' as a dictionary of arrays, timestamps under 'timestamp'")
+        .def("close", &SystemInformationCollector::close, py::call_guard<py::gil_scoped_release>(), "Stops collecting and restores parent queue settings. Collected samples are kept")
+        ;
 
+    // Bind MessagePool
+    messagePool
+        .def(py::init(&createMessagePool), py::arg("type"), py::arg("count"), py::arg("capacity") = 0, "Constructs a pool of 'count' messages of given type, each with 'capacity' bytes reserved for data")
+        .def("tryAcquire", &MessagePool::tryAcquire, "Try to acquire a free message. If no message is free, return immediately with None. Acquired message retains metadata and data from its previous use")
+        .def("acquire", [](MessagePool& pool){
             std::shared_ptr<ADatatype> d = nullptr;
             bool timedout = true;
             do {
@@ -94,7 +510,7 @@ void DataQueueBindings::bind(pybind11::module& m, void* pCallstack){
                     py::gil_scoped_release release;
 
                     // block for 100ms
-                    d = obj.get(milliseconds(100), timedout);
+                    d = pool.acquire(std::chrono::milliseconds(100), timedout);
                 }
 
                 // reacquires python GIL for PyErr_CheckSignals call
@@ -103,12 +519,11 @@ void DataQueueBindings::bind(pybind11::module& m, void* pCallstack){
                 if (PyErr_CheckSignals() != 0) throw py::error_already_set();
 
             } while(timedout);
-
             return d;
-        }, DOC(dai, DataOutputQueue, get, 2))
-        .def("has", static_cast<bool(DataOutputQueue::*)()>(&DataOutputQueue::has), DOC(dai, DataOutputQueue, has, 2))
-        .def("tryGet", static_cast<std::shared_ptr<ADatatype>(DataOutputQueue::*)()>(&DataOutputQueue::tryGet), DOC(dai, DataOutputQueue, tryGet, 2))
-        .def("tryGetAll", static_cast<std::vector<std::shared_ptr<ADatatype>>(DataOutputQueue::*)()>(&DataOutputQueue::tryGetAll), DOC(dai, DataOutputQueue, tryGetAll, 2))
+        }, "Block until a message is free, then acquire it. Acquired message retains metadata and data from its previous use")
+        .def("getSize", &MessagePool::getSize, "Retrieves number of messages in the pool")
+        .def("getNumAvailable", &MessagePool::getNumAvailable, "Retrieves number of messages which can currently be acquired")
+        .def("getCapacity", &MessagePool::getCapacity, "Retrieves number of bytes reserved for data of each message")
         ;
 
     // Bind DataInputQueue
@@ -120,8 +535,19 @@ void DataQueueBindings::bind(pybind11::module& m, void* pCallstack){
         .def("getBlocking", &DataInputQueue::getBlocking, DOC(dai, DataInputQueue, getBlocking))
         .def("setMaxSize", &DataInputQueue::setMaxSize, py::arg("maxSize"), DOC(dai, DataInputQueue, setMaxSize))
         .def("getMaxSize", &DataInputQueue::getMaxSize, DOC(dai, DataInputQueue, getMaxSize))
-        .def("send", [](DataInputQueue& obj, std::shared_ptr<ADatatype> d){
-
+        .def("getStats", [](std::shared_ptr<DataInputQueue> q){
+            return QueueMonitor::attach(q)->getStats();
+        }, "Retrieves statistics of this queue. The queue is monitored from the first call on")
+        .def("createPool", [](DataInputQueue& obj, py::object type, unsigned int count, std::size_t capacity){
+            if(capacity > obj.getMaxDataSize()) {
+                throw std::invalid_argument("Pool capacity (" + std::to_string(capacity) + "B) larger than queue maxDataSize (" + std::to_string(obj.getMaxDataSize()) + "B)");
+            }
+            return createMessagePool(type, count, capacity);
+        }, py::arg("type"), py::arg("count"), py::arg("capacity"), "Creates a pool of 'count' recyclable messages of given type for this queue, each with 'capacity' bytes reserved for data. A sent message returns to the pool once written to XLink. 'count' should exceed queues maxSize, to not wait on messages still queued")
+        .def("send", [](std::shared_ptr<DataInputQueue> queue, std::shared_ptr<ADatatype> d){
+
+            auto& obj = *queue;
+            const auto sendMtx = inputQueueSendMutex(queue);
             bool sent = false;
             do {
 
@@ -129,7 +555,8 @@ void DataQueueBindings::bind(pybind11::module& m, void* pCallstack){
                 {
                     // Release GIL, then block
                     py::gil_scoped_release release;
-                    sent = obj.send(d, milliseconds(100));
+                    std::unique_lock<std::mutex> l(*sendMtx);
+                    sent = inputQueueSend(obj, d ? d->serialize() : nullptr, milliseconds(100));
                 }
 
                 // reacquires GIL as PyErr_CheckSignals requires GIL
@@ -140,15 +567,18 @@ void DataQueueBindings::bind(pybind11::module& m, void* pCallstack){
             } while(!sent);
 
         }, py::arg("msg"), DOC(dai, DataInputQueue, send, 2))
-        .def("send", [](DataInputQueue& obj, std::shared_ptr<dai::RawBuffer> d){
+        .def("send", [](std::shared_ptr<DataInputQueue> queue, std::shared_ptr<dai::RawBuffer> d){
 
+            auto& obj = *queue;
+            const auto sendMtx = inputQueueSendMutex(queue);
             bool sent = false;
             do {
                  // block for 100ms
                 {
                     // Release GIL, then block
                     py::gil_scoped_release release;
-                    sent = obj.send(d, milliseconds(100));
+                    std::unique_lock<std::mutex> l(*sendMtx);
+                    sent = inputQueueSend(obj, d, milliseconds(100));
                 }
                 // reacquires GIL as PyErr_CheckSignals requires GIL
 
@@ -158,6 +588,11 @@ void DataQueueBindings::bind(pybind11::module& m, void* pCallstack){
             } while(!sent);
 
         }, py::arg("rawMsg"), DOC(dai, DataInputQueue, send))
+        .def("sendMany", &inputQueueSendManyHelper, py::arg("msgs"), py::arg("timeout") = std::chrono::milliseconds(-1),
+            "Adds messages to the queue in order, without interleaving other sends from this process. "
+            "Blocks for at most 'timeout' for the whole batch (unlimited if negative), releasing the GIL once. "
+            "Returns number of messages accepted, which with a non-blocking queue is always all of them. "
+            "The batch isn't atomic: on timeout the first returned number of messages stay queued and the rest isn't sent, resend 'msgs[sent:]' to continue")
         ;
 
 }
\ No newline at end of file
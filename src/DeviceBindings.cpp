@@ -8,6 +8,11 @@
 #include "depthai/xlink/XLinkConnection.hpp"
 #include "depthai-shared/device/CrashDump.hpp"
 
+// project
+#include "log/LogBuffer.hpp"
+#include "queue/QueueMonitor.hpp"
+#include "utility/Initialization.hpp"
+
 // std::chrono bindings
 #include <pybind11/chrono.h>
 // py::detail
@@ -208,6 +213,21 @@ static std::vector<std::string> deviceGetQueueEventsHelper(dai::Device& d, const
 }
 
 
+// Monitors output queues of a device which started a pipeline, so received messages are stamped with host arrival time from the start
+static void monitorOutputQueues(dai::DeviceBase& d){
+    auto device = dynamic_cast<dai::Device*>(&d);
+    if(device == nullptr) return;
+    for(const auto& name : device->getOutputQueueNames()) {
+        dai::python::QueueMonitor::attach(device->getOutputQueue(name));
+    }
+}
+
+template<typename D>
+static std::unique_ptr<D> monitorOutputQueues(std::unique_ptr<D> device){
+    monitorOutputQueues(*device);
+    return device;
+}
+
 template<typename D, typename ARG>
 static void bindConstructors(ARG& arg){
     using namespace dai;
@@ -216,102 +236,102 @@ static void bindConstructors(ARG& arg){
     .def(py::init([](const Pipeline& pipeline){
         auto dev = deviceSearchHelper<D>();
         py::gil_scoped_release release;
-        return std::make_unique<D>(pipeline, dev);
-    }), py::arg("pipeline"), DOC(dai, DeviceBase, DeviceBase))
+        return monitorOutputQueues(std::make_unique<D>(pipeline, dev));
+    }), py::arg("pipeline"), py::call_guard<python::InitializeGuard>(), DOC(dai, DeviceBase, DeviceBase))
     .def(py::init([](const Pipeline& pipeline, bool usb2Mode){
         PyErr_WarnEx(PyExc_DeprecationWarning, "Use constructor taking 'UsbSpeed' instead", 1);
         auto dev = deviceSearchHelper<D>();
         py::gil_scoped_release release;
-        return std::make_unique<D>(pipeline, dev, usb2Mode);
-    }), py::arg("pipeline"), py::arg("usb2Mode"), DOC(dai, DeviceBase, DeviceBase, 2))
+        return monitorOutputQueues(std::make_unique<D>(pipeline, dev, usb2Mode));
+    }), py::arg("pipeline"), py::arg("usb2Mode"), py::call_guard<python::InitializeGuard>(), DOC(dai, DeviceBase, DeviceBase, 2))
     .def(py::init([](const Pipeline& pipeline, UsbSpeed maxUsbSpeed){
         auto dev = deviceSearchHelper<D>();
         py::gil_scoped_release release;
-        return std::make_unique<D>(pipeline, dev, maxUsbSpeed);
-    }), py::arg("pipeline"), py::arg("maxUsbSpeed"), DOC(dai, DeviceBase, DeviceBase, 3))
+        return monitorOutputQueues(std::make_unique<D>(pipeline, dev, maxUsbSpeed));
+    }), py::arg("pipeline"), py::arg("maxUsbSpeed"), py::call_guard<python::InitializeGuard>(), DOC(dai, DeviceBase, DeviceBase, 3))
     .def(py::init([](const Pipeline& pipeline, const dai::Path& pathToCmd){
         auto dev = deviceSearchHelper<D>();
         py::gil_scoped_release release;
-        return std::make_unique<D>(pipeline, dev, pathToCmd);
-    }), py::arg("pipeline"), py::arg("pathToCmd"), DOC(dai, DeviceBase, DeviceBase, 4))
+        return monitorOutputQueues(std::make_unique<D>(pipeline, dev, pathToCmd));
+    }), py::arg("pipeline"), py::arg("pathToCmd"), py::call_guard<python::InitializeGuard>(), DOC(dai, DeviceBase, DeviceBase, 4))
     .def(py::init([](const Pipeline& pipeline, const DeviceInfo& deviceInfo, bool usb2Mode){
         PyErr_WarnEx(PyExc_DeprecationWarning, "Use constructor taking 'UsbSpeed' instead", 1);
         py::gil_scoped_release release;
-        return std::make_unique<D>(pipeline, deviceInfo, usb2Mode);
-    }), py::arg("pipeline"), py::arg("devInfo"), py::arg("usb2Mode") = false, DOC(dai, DeviceBase, DeviceBase, 6))
+        return monitorOutputQueues(std::make_unique<D>(pipeline, deviceInfo, usb2Mode));
+    }), py::arg("pipeline"), py::arg("devInfo"), py::arg("usb2Mode") = false, py::call_guard<python::InitializeGuard>(), DOC(dai, DeviceBase, DeviceBase, 6))
     .def(py::init([](const Pipeline& pipeline, const DeviceInfo& deviceInfo, UsbSpeed maxUsbSpeed){
         py::gil_scoped_release release;
-        return std::make_unique<D>(pipeline, deviceInfo, maxUsbSpeed);
-    }), py::arg("pipeline"), py::arg("deviceInfo"), py::arg("maxUsbSpeed"), DOC(dai, DeviceBase, DeviceBase, 7))
+        return monitorOutputQueues(std::make_unique<D>(pipeline, deviceInfo, maxUsbSpeed));
+    }), py::arg("pipeline"), py::arg("deviceInfo"), py::arg("maxUsbSpeed"), py::call_guard<python::InitializeGuard>(), DOC(dai, DeviceBase, DeviceBase, 7))
     .def(py::init([](const Pipeline& pipeline, const DeviceInfo& deviceInfo, dai::Path pathToCmd){
         py::gil_scoped_release release;
-        return std::make_unique<D>(pipeline, deviceInfo, pathToCmd);
-    }), py::arg("pipeline"), py::arg("devInfo"), py::arg("pathToCmd"), DOC(dai, DeviceBase, DeviceBase, 8))
+        return monitorOutputQueues(std::make_unique<D>(pipeline, deviceInfo, pathToCmd));
+    }), py::arg("pipeline"), py::arg("devInfo"), py::arg("pathToCmd"), py::call_guard<python::InitializeGuard>(), DOC(dai, DeviceBase, DeviceBase, 8))
 
     // DeviceBase constructor - OpenVINO version
     .def(py::init([](OpenVINO::Version version){
         auto dev = deviceSearchHelper<D>();
         py::gil_scoped_release release;
         return std::make_unique<D>(version, dev);
-    }), py::arg("version") = OpenVINO::VERSION_UNIVERSAL, DOC(dai, DeviceBase, DeviceBase, 10))
+    }), py::arg("version") = OpenVINO::VERSION_UNIVERSAL, py::call_guard<python::InitializeGuard>(), DOC(dai, DeviceBase, DeviceBase, 10))
     .def(py::init([](OpenVINO::Version version, bool usb2Mode){
         PyErr_WarnEx(PyExc_DeprecationWarning, "Use constructor taking 'UsbSpeed' instead", 1);
         auto dev = deviceSearchHelper<D>();
         py::gil_scoped_release release;
         return std::make_unique<D>(version, dev, usb2Mode);
-    }), py::arg("version"), py::arg("usb2Mode") = false, DOC(dai, DeviceBase, DeviceBase, 11))
+    }), py::arg("version"), py::arg("usb2Mode") = false, py::call_guard<python::InitializeGuard>(), DOC(dai, DeviceBase, DeviceBase, 11))
     .def(py::init([](OpenVINO::Version version, UsbSpeed maxUsbSpeed){
         auto dev = deviceSearchHelper<D>();
         py::gil_scoped_release release;
         return std::make_unique<D>(version, dev, maxUsbSpeed);
-    }), py::arg("version"), py::arg("maxUsbSpeed"), DOC(dai, DeviceBase, DeviceBase, 12))
+    }), py::arg("version"), py::arg("maxUsbSpeed"), py::call_guard<python::InitializeGuard>(), DOC(dai, DeviceBase, DeviceBase, 12))
     .def(py::init([](OpenVINO::Version version, const dai::Path& pathToCmd){
         auto dev = deviceSearchHelper<D>();
         py::gil_scoped_release release;
         return std::make_unique<D>(version, dev, pathToCmd);
-    }), py::arg("version"), py::arg("pathToCmd"), DOC(dai, DeviceBase, DeviceBase, 13))
+    }), py::arg("version"), py::arg("pathToCmd"), py::call_guard<python::InitializeGuard>(), DOC(dai, DeviceBase, DeviceBase, 13))
     .def(py::init([](OpenVINO::Version version, const DeviceInfo& deviceInfo, bool usb2Mode){
         PyErr_WarnEx(PyExc_DeprecationWarning, "Use constructor taking 'UsbSpeed' instead", 1);
         py::gil_scoped_release release;
         return std::make_unique<D>(version, deviceInfo, usb2Mode);
-    }), py::arg("version"), py::arg("deviceInfo"), py::arg("usb2Mode") = false, DOC(dai, DeviceBase, DeviceBase, 15))
+    }), py::arg("version"), py::arg("deviceInfo"), py::arg("usb2Mode") = false, py::call_guard<python::InitializeGuard>(), DOC(dai, DeviceBase, DeviceBase, 15))
     .def(py::init([](OpenVINO::Version version, const DeviceInfo& deviceInfo, UsbSpeed maxUsbSpeed){
         py::gil_scoped_release release;
         return std::make_unique<D>(version, deviceInfo, maxUsbSpeed);
-    }), py::arg("version"), py::arg("deviceInfo"), py::arg("maxUsbSpeed"), DOC(dai, DeviceBase, DeviceBase, 16))
+    }), py::arg("version"), py::arg("deviceInfo"), py::arg("maxUsbSpeed"), py::call_guard<python::InitializeGuard>(), DOC(dai, DeviceBase, DeviceBase, 16))
     .def(py::init([](OpenVINO::Version version, const DeviceInfo& deviceInfo, dai::Path pathToCmd){
         py::gil_scoped_release release;
         return std::make_unique<D>(version, deviceInfo, pathToCmd);
-    }), py::arg("version"), py::arg("deviceDesc"), py::arg("pathToCmd"), DOC(dai, DeviceBase, DeviceBase, 17))
+    }), py::arg("version"), py::arg("deviceDesc"), py::arg("pathToCmd"), py::call_guard<python::InitializeGuard>(), DOC(dai, DeviceBase, DeviceBase, 17))
     .def(py::init([](typename D::Config config){
         auto dev = deviceSearchHelper<D>();
         py::gil_scoped_release release;
         return std::make_unique<D>(config, dev);
-    }), py::arg("config"), DOC(dai, DeviceBase, DeviceBase, 18))
+    }), py::arg("config"), py::call_guard<python::InitializeGuard>(), DOC(dai, DeviceBase, DeviceBase, 18))
     .def(py::init([](typename D::Config config, const DeviceInfo& deviceInfo){
         py::gil_scoped_release release;
         return std::make_unique<D>(config, deviceInfo);
-    }), py::arg("config"), py::arg("deviceInfo"), DOC(dai, DeviceBase, DeviceBase, 19))
+    }), py::arg("config"), py::arg("deviceInfo"), py::call_guard<python::InitializeGuard>(), DOC(dai, DeviceBase, DeviceBase, 19))
 
     // DeviceInfo version
     .def(py::init([](const DeviceInfo& deviceInfo){
         py::gil_scoped_release release;
         return std::make_unique<D>(deviceInfo);
-    }), py::arg("deviceInfo"), DOC(dai, DeviceBase, DeviceBase, 20))
+    }), py::arg("deviceInfo"), py::call_guard<python::InitializeGuard>(), DOC(dai, DeviceBase, DeviceBase, 20))
     .def(py::init([](const DeviceInfo& deviceInfo, UsbSpeed maxUsbSpeed){
         py::gil_scoped_release release;
         return std::make_unique<D>(deviceInfo, maxUsbSpeed);
-    }), py::arg("deviceInfo"), py::arg("maxUsbSpeed"), DOC(dai, DeviceBase, DeviceBase, 21))
+    }), py::arg("deviceInfo"), py::arg("maxUsbSpeed"), py::call_guard<python::InitializeGuard>(), DOC(dai, DeviceBase, DeviceBase, 21))
 
     // name or device id version
     .def(py::init([](std::string nameOrDeviceId){
         py::gil_scoped_release release;
         return std::make_unique<D>(std::move(nameOrDeviceId));
-    }), py::arg("nameOrDeviceId"), DOC(dai, DeviceBase, DeviceBase, 22))
+    }), py::arg("nameOrDeviceId"), py::call_guard<python::InitializeGuard>(), DOC(dai, DeviceBase, DeviceBase, 22))
     .def(py::init([](std::string nameOrDeviceId, UsbSpeed maxUsbSpeed){
         py::gil_scoped_release release;
         return std::make_unique<D>(std::move(nameOrDeviceId), maxUsbSpeed);
-    }), py::arg("nameOrDeviceId"), py::arg("maxUsbSpeed"), DOC(dai, DeviceBase, DeviceBase, 23))
+    }), py::arg("nameOrDeviceId"), py::arg("maxUsbSpeed"), py::call_guard<python::InitializeGuard>(), DOC(dai, DeviceBase, DeviceBase, 23))
     ;
 
 }
@@ -575,15 +595,15 @@ void DeviceBindings::bind(pybind11::module& m, void* pCallstack){
 
         //dai::Device methods
         //static
-        .def_static("getAnyAvailableDevice", [](std::chrono::milliseconds ms){ return DeviceBase::getAnyAvailableDevice(ms); }, py::arg("timeout"), DOC(dai, DeviceBase, getAnyAvailableDevice))
-        .def_static("getAnyAvailableDevice", [](){ return DeviceBase::getAnyAvailableDevice(); }, DOC(dai, DeviceBase, getAnyAvailableDevice, 2))
-        .def_static("getFirstAvailableDevice", &DeviceBase::getFirstAvailableDevice, py::arg("skipInvalidDevices") = true, DOC(dai, DeviceBase, getFirstAvailableDevice))
-        .def_static("getAllAvailableDevices", &DeviceBase::getAllAvailableDevices, DOC(dai, DeviceBase, getAllAvailableDevices))
-        .def_static("getEmbeddedDeviceBinary", py::overload_cast<bool, OpenVINO::Version>(&DeviceBase::getEmbeddedDeviceBinary), py::arg("usb2Mode"), py::arg("version") = OpenVINO::VERSION_UNIVERSAL, DOC(dai, DeviceBase, getEmbeddedDeviceBinary))
-        .def_static("getEmbeddedDeviceBinary", py::overload_cast<DeviceBase::Config>(&DeviceBase::getEmbeddedDeviceBinary), py::arg("config"), DOC(dai, DeviceBase, getEmbeddedDeviceBinary, 2))
-        .def_static("getDeviceByMxId", &DeviceBase::getDeviceByMxId, py::arg("mxId"), DOC(dai, DeviceBase, getDeviceByMxId))
-        .def_static("getAllConnectedDevices", &DeviceBase::getAllConnectedDevices, DOC(dai, DeviceBase, getAllConnectedDevices))
-        .def_static("getGlobalProfilingData", &DeviceBase::getGlobalProfilingData, DOC(dai, DeviceBase, getGlobalProfilingData))
+        .def_static("getAnyAvailableDevice", [](std::chrono::milliseconds ms){ return DeviceBase::getAnyAvailableDevice(ms); }, py::arg("timeout"), py::call_guard<python::InitializeGuard>(), DOC(dai, DeviceBase, getAnyAvailableDevice))
+        .def_static("getAnyAvailableDevice", [](){ return DeviceBase::getAnyAvailableDevice(); }, py::call_guard<python::InitializeGuard>(), DOC(dai, DeviceBase, getAnyAvailableDevice, 2))
+        .def_static("getFirstAvailableDevice", &DeviceBase::getFirstAvailableDevice, py::arg("skipInvalidDevices") = true, py::call_guard<python::InitializeGuard>(), DOC(dai, DeviceBase, getFirstAvailableDevice))
+        .def_static("getAllAvailableDevices", &DeviceBase::getAllAvailableDevices, py::call_guard<python::InitializeGuard>(), DOC(dai, DeviceBase, getAllAvailableDevices))
+        .def_static("getEmbeddedDeviceBinary", py::overload_cast<bool, OpenVINO::Version>(&DeviceBase::getEmbeddedDeviceBinary), py::arg("usb2Mode"), py::arg("version") = OpenVINO::VERSION_UNIVERSAL, py::call_guard<python::InitializeGuard>(), DOC(dai, DeviceBase, getEmbeddedDeviceBinary))
+        .def_static("getEmbeddedDeviceBinary", py::overload_cast<DeviceBase::Config>(&DeviceBase::getEmbeddedDeviceBinary), py::arg("config"), py::call_guard<python::InitializeGuard>(), DOC(dai, DeviceBase, getEmbeddedDeviceBinary, 2))
+        .def_static("getDeviceByMxId", &DeviceBase::getDeviceByMxId, py::arg("mxId"), py::call_guard<python::InitializeGuard>(), DOC(dai, DeviceBase, getDeviceByMxId))
+        .def_static("getAllConnectedDevices", &DeviceBase::getAllConnectedDevices, py::call_guard<python::InitializeGuard>(), DOC(dai, DeviceBase, getAllConnectedDevices))
+        .def_static("getGlobalProfilingData", &DeviceBase::getGlobalProfilingData, py::call_guard<python::InitializeGuard>(), DOC(dai, DeviceBase, getGlobalProfilingData))
 
         // methods
         .def("getBootloaderVersion", &DeviceBase::getBootloaderVersion, DOC(dai, DeviceBase, getBootloaderVersion))
@@ -596,8 +616,14 @@ void DeviceBindings::bind(pybind11::module& m, void* pCallstack){
             py::gil_scoped_release release;
             d.startPipeline();
             HEDLEY_DIAGNOSTIC_POP
+            monitorOutputQueues(d);
         }, DOC(dai, DeviceBase, startPipeline))
-        .def("startPipeline", [](DeviceBase& d, const Pipeline& pipeline) { py::gil_scoped_release release; return d.startPipeline(pipeline); }, DOC(dai, DeviceBase, startPipeline, 2))
+        .def("startPipeline", [](DeviceBase& d, const Pipeline& pipeline) {
+            py::gil_scoped_release release;
+            const bool started = d.startPipeline(pipeline);
+            monitorOutputQueues(d);
+            return started;
+        }, DOC(dai, DeviceBase, startPipeline, 2))
 
         // Doesn't require GIL release (eg, don't do RPC or long blocking things in background)
         .def("setLogOutputLevel", &DeviceBase::setLogOutputLevel, py::arg("level"), DOC(dai, DeviceBase, setLogOutputLevel))
@@ -627,6 +653,13 @@ void DeviceBindings::bind(pybind11::module& m, void* pCallstack){
         .def("getLeonMssCpuUsage", [](DeviceBase& d) { py::gil_scoped_release release; return d.getLeonMssCpuUsage(); }, DOC(dai, DeviceBase, getLeonMssCpuUsage))
         .def("addLogCallback", [](DeviceBase& d, std::function<void(LogMessage)> callback) { py::gil_scoped_release release; return d.addLogCallback(callback); }, py::arg("callback"), DOC(dai, DeviceBase, addLogCallback))
         .def("removeLogCallback", [](DeviceBase& d, int cbId) { py::gil_scoped_release release; return d.removeLogCallback(cbId); }, py::arg("callbackId"), DOC(dai, DeviceBase, removeLogCallback))
+        .def("getLogMessages", [](DeviceBase& d, std::size_t maxCount) { py::gil_scoped_release release; return dai::python::LogBuffer::attach(d)->pop(maxCount); }, py::arg("maxCount") = 0, "Retrieves and removes up to 'maxCount' (0 for all) log messages buffered natively, oldest first. Buffering starts with the first call of this or other log buffer functions, earlier messages are only passed to log callbacks")
+        .def("setLogBufferCapacity", [](DeviceBase& d, std::size_t capacity) { py::gil_scoped_release release; dai::python::LogBuffer::attach(d)->setCapacity(capacity); }, py::arg("capacity"), "Sets maximum number of buffered log messages retrieved with getLogMessages, oldest are dropped once full. 0 disables buffering")
+        .def("getLogBufferCapacity", [](DeviceBase& d) { py::gil_scoped_release release; return dai::python::LogBuffer::attach(d)->getCapacity(); }, "Retrieves maximum number of buffered log messages")
+        .def("getNumDroppedLogMessages", [](DeviceBase& d) { py::gil_scoped_release release; auto b = dai::python::LogBuffer::find(d); return b ? b->getNumDropped() : 0; }, "Retrieves number of log messages dropped because the log buffer was full")
+        .def("setLogFileSink", [](DeviceBase& d, const Path& path) { py::gil_scoped_release release; dai::python::LogBuffer::attach(d)->setFileSink(path); }, py::arg("path"), "Appends log messages to given file from a native writer thread, replacing previous file sink. Like getLogMessages, only messages received since the first call of a log buffer function are captured")
+        .def("removeLogFileSink", [](DeviceBase& d) { py::gil_scoped_release release; auto b = dai::python::LogBuffer::find(d); if(b) b->removeFileSink(); }, "Stops writing log messages to a file, after writing out pending ones")
+        .def("getNumDroppedFileSinkLogMessages", [](DeviceBase& d) { py::gil_scoped_release release; auto b = dai::python::LogBuffer::find(d); return b ? b->getNumSinkDropped() : 0; }, "Retrieves number of log messages dropped because the file sink couldn't keep up")
         .def("getUsbSpeed", [](DeviceBase& d) { py::gil_scoped_release release; return d.getUsbSpeed(); }, DOC(dai, DeviceBase, getUsbSpeed))
         .def("getDeviceInfo", [](DeviceBase& d) { py::gil_scoped_release release; return d.getDeviceInfo(); }, DOC(dai, DeviceBase, getDeviceInfo))
         .def("getMxId", [](DeviceBase& d) { py::gil_scoped_release release; return d.getMxId(); }, DOC(dai, DeviceBase, getMxId))
@@ -664,6 +697,14 @@ void DeviceBindings::bind(pybind11::module& m, void* pCallstack){
         .def("getOutputQueue", static_cast<std::shared_ptr<DataOutputQueue>(Device::*)(const std::string&)>(&Device::getOutputQueue), py::arg("name"), DOC(dai, Device, getOutputQueue))
         .def("getOutputQueue", static_cast<std::shared_ptr<DataOutputQueue>(Device::*)(const std::string&, unsigned int, bool)>(&Device::getOutputQueue), py::arg("name"), py::arg("maxSize"), py::arg("blocking") = true, DOC(dai, Device, getOutputQueue, 2))
         .def("getOutputQueueNames", &Device::getOutputQueueNames, DOC(dai, Device, getOutputQueueNames))
+        .def("getLatencyReport", [](Device& d, bool reset) {
+            std::map<std::string, dai::python::LatencyReport> reports;
+            for(const auto& name : d.getOutputQueueNames()) {
+                reports[name] = dai::python::QueueMonitor::attach(d.getOutputQueue(name))->getLatencyReport(reset);
+            }
+            return reports;
+        }, py::arg("reset") = false, "Retrieves latency histograms per output stream (capture to host arrival, host arrival to retrieval, capture to retrieval), optionally discarding recorded latencies. "
+           "Output queues are monitored from the start of the pipeline")
 
         .def("getInputQueue", static_cast<std::shared_ptr<DataInputQueue>(Device::*)(const std::string&)>(&Device::getInputQueue), py::arg("name"), DOC(dai, Device, getInputQueue))
         .def("getInputQueue", static_cast<std::shared_ptr<DataInputQueue>(Device::*)(const std::string&, unsigned int, bool)>(&Device::getInputQueue), py::arg("name"), py::arg("maxSize"), py::arg("blocking") = true, DOC(dai, Device, getInputQueue, 2))
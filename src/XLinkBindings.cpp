@@ -8,6 +8,9 @@
 #include "depthai/xlink/XLinkConnection.hpp"
 #include "depthai/xlink/XLinkStream.hpp"
 
+// project
+#include "utility/Initialization.hpp"
+
 
 void XLinkBindings::bind(pybind11::module &m, void *pCallstack)
 {
@@ -130,14 +133,14 @@ void XLinkBindings::bind(pybind11::module &m, void *pCallstack)
         ;
 
     xLinkConnection
-        .def(py::init<const DeviceInfo &, std::vector<std::uint8_t> >())
-        .def(py::init<const DeviceInfo &, std::string>())
-        .def(py::init<const DeviceInfo &>())
-        .def_static("getAllConnectedDevices", &XLinkConnection::getAllConnectedDevices, py::arg("state") = X_LINK_ANY_STATE, py::arg("skipInvalidDevices") = true)
-        .def_static("getFirstDevice", &XLinkConnection::getFirstDevice, py::arg("state") = X_LINK_ANY_STATE, py::arg("skipInvalidDevice") = true)
-        .def_static("getDeviceByMxId", &XLinkConnection::getDeviceByMxId, py::arg("mxId"), py::arg("state") = X_LINK_ANY_STATE, py::arg("skipInvalidDevice") = true)
-        .def_static("bootBootloader", &XLinkConnection::bootBootloader, py::arg("devInfo"))
-        .def_static("getGlobalProfilingData", &XLinkConnection::getGlobalProfilingData, DOC(dai, XLinkConnection, getGlobalProfilingData))
+        .def(py::init<const DeviceInfo &, std::vector<std::uint8_t> >(), py::call_guard<python::InitializeGuard>())
+        .def(py::init<const DeviceInfo &, std::string>(), py::call_guard<python::InitializeGuard>())
+        .def(py::init<const DeviceInfo &>(), py::call_guard<python::InitializeGuard>())
+        .def_static("getAllConnectedDevices", &XLinkConnection::getAllConnectedDevices, py::call_guard<python::InitializeGuard>(), py::arg("state") = X_LINK_ANY_STATE, py::arg("skipInvalidDevices") = true)
+        .def_static("getFirstDevice", &XLinkConnection::getFirstDevice, py::call_guard<python::InitializeGuard>(), py::arg("state") = X_LINK_ANY_STATE, py::arg("skipInvalidDevice") = true)
+        .def_static("getDeviceByMxId", &XLinkConnection::getDeviceByMxId, py::call_guard<python::InitializeGuard>(), py::arg("mxId"), py::arg("state") = X_LINK_ANY_STATE, py::arg("skipInvalidDevice") = true)
+        .def_static("bootBootloader", &XLinkConnection::bootBootloader, py::call_guard<python::InitializeGuard>(), py::arg("devInfo"))
+        .def_static("getGlobalProfilingData", &XLinkConnection::getGlobalProfilingData, py::call_guard<python::InitializeGuard>(), DOC(dai, XLinkConnection, getGlobalProfilingData))
         ;
 
     xLinkError
@@ -0,0 +1,61 @@
+#include "CalibrationCache.hpp"
+
+// std
+#include <stdexcept>
+
+// project
+#include "device/CameraLens.hpp"
+
+namespace dai {
+namespace python {
+
+namespace {
+
+template <typename T>
+void appendBytes(std::string& key, const T& value) {
+    key.append(reinterpret_cast<const char*>(&value), sizeof(value));
+}
+
+void appendVector(std::string& key, const std::vector<float>& values) {
+    appendBytes(key, values.size());
+    key.append(reinterpret_cast<const char*>(values.data()), values.size() * sizeof(float));
+}
+
+void appendMatrix(std::string& key, const std::vector<std::vector<float>>& rows) {
+    appendBytes(key, rows.size());
+    for(const auto& row : rows) appendVector(key, row);
+}
+
+}  // namespace
+
+std::string getCalibrationKey(const EepromData& eeprom, const std::vector<CameraBoardSocket>& sockets, bool stereo) {
+    std::string key;
+    for(const auto socket : sockets) {
+        auto it = eeprom.cameraData.find(socket);
+        if(it == eeprom.cameraData.end()) throw std::invalid_argument("There is no calibration data for camera " + describeSocket(socket));
+        const auto& info = it->second;
+        appendBytes(key, socket);
+        appendBytes(key, info.cameraType);
+        appendBytes(key, info.width);
+        appendBytes(key, info.height);
+        appendBytes(key, info.lensPosition);
+        appendBytes(key, info.specHfovDeg);
+        appendMatrix(key, info.intrinsicMatrix);
+        appendVector(key, info.distortionCoeff);
+        appendMatrix(key, info.extrinsics.rotationMatrix);
+        appendBytes(key, info.extrinsics.translation);
+        appendBytes(key, info.extrinsics.specTranslation);
+        appendBytes(key, info.extrinsics.toCameraSocket);
+    }
+    if(stereo) {
+        const auto& rectification = eeprom.stereoRectificationData;
+        appendBytes(key, rectification.leftCameraSocket);
+        appendBytes(key, rectification.rightCameraSocket);
+        appendMatrix(key, rectification.rectifiedRotationLeft);
+        appendMatrix(key, rectification.rectifiedRotationRight);
+    }
+    return key;
+}
+
+}  // namespace python
+}  // namespace dai
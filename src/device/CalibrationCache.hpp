@@ -0,0 +1,115 @@
+#pragma once
+
+// std
+#include <cstddef>
+#include <list>
+#include <mutex>
+#include <string>
+#include <unordered_map>
+#include <utility>
+#include <vector>
+
+// depthai
+#include "depthai/device/CalibrationHandler.hpp"
+
+namespace dai {
+namespace python {
+
+/**
+ * Retrieves cache key of calibration data of given cameras, and optionally of stereo rectification.
+ * Raw values are appended, so the key is cheap to build, but only meaningful for comparison
+ *
+ * @throws std::invalid_argument if there is no calibration data for one of the cameras
+ */
+std::string getCalibrationKey(const EepromData& eeprom, const std::vector<CameraBoardSocket>& sockets, bool stereo);
+
+/**
+ * Thread safe cache of values derived from calibration data, evicting least recently used ones once over capacity.
+ * Values are computed outside of the lock on a miss
+ */
+template <typename Value>
+class CalibrationCache {
+   public:
+    struct Stats {
+        std::size_t numHits = 0;
+        std::size_t numMisses = 0;
+        std::size_t numEntries = 0;
+    };
+
+    explicit CalibrationCache(std::size_t capacity) : capacity(capacity) {}
+
+    /**
+     * Retrieves value of given key, computing it with compute() on a miss
+     */
+    template <typename Compute>
+    Value get(const std::string& key, Compute compute) {
+        {
+            std::unique_lock<std::mutex> l(mtx);
+            auto it = index.find(key);
+            if(it != index.end()) {
+                entries.splice(entries.begin(), entries, it->second);
+                stats.numHits++;
+                return it->second->second;
+            }
+        }
+        Value value = compute();
+        std::unique_lock<std::mutex> l(mtx);
+        stats.numMisses++;
+        // Computed concurrently by another caller
+        auto it = index.find(key);
+        if(it != index.end()) return it->second->second;
+        entries.emplace_front(key, value);
+        index[key] = entries.begin();
+        evict();
+        return value;
+    }
+
+    /**
+     * Sets number of values retained, evicting least recently used ones
+     */
+    void setCapacity(std::size_t capacity) {
+        std::unique_lock<std::mutex> l(mtx);
+        this->capacity = capacity;
+        evict();
+    }
+
+    std::size_t getCapacity() const {
+        std::unique_lock<std::mutex> l(mtx);
+        return capacity;
+    }
+
+    Stats getStats() const {
+        std::unique_lock<std::mutex> l(mtx);
+        auto s = stats;
+        s.numEntries = entries.size();
+        return s;
+    }
+
+    /**
+     * Discards cached values and resets statistics
+     */
+    void clear() {
+        std::unique_lock<std::mutex> l(mtx);
+        entries.clear();
+        index.clear();
+        stats = {};
+    }
+
+   private:
+    mutable std::mutex mtx;
+    std::list<std::pair<std::string, Value>> entries;
+    std::unordered_map<std::string, typename std::list<std::pair<std::string, Value>>::iterator> index;
+    std::size_t capacity;
+    Stats stats;
+
+    void evict() {
+        // Must be called with mtx held
+        while(entries.size() > capacity) {
+            index.erase(entries.back().first);
+            entries.pop_back();
+        }
+    }
+};
+
+}  // namespace python
+}  // namespace dai
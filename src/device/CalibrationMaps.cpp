@@ -0,0 +1,265 @@
+#include "CalibrationMaps.hpp"
+
+// std
+#include <algorithm>
+#include <cmath>
+#include <cstring>
+#include <limits>
+#include <stdexcept>
+#include <string>
+
+// project
+#include "device/CalibrationCache.hpp"
+#include "device/CameraLens.hpp"
+
+namespace dai {
+namespace python {
+
+namespace {
+
+// Fractional bits of fixed-point maps, as OpenCV's INTER_BITS
+constexpr int INTER_BITS = 5;
+constexpr int INTER_TAB_SIZE = 1 << INTER_BITS;
+// Grid of points sampled along image borders when computing new intrinsics, as OpenCV's getOptimalNewCameraMatrix
+constexpr int BORDER_GRID = 9;
+
+// Maps output image pixels to source image coordinates: inverse of new intrinsics and rotation, then lens distortion
+struct Projection {
+    const CameraLens& lens;
+    Matrix3 inverse;
+
+    Projection(const CameraLens& lens, const Matrix3& rotation, const Matrix3& newIntrinsics) : lens(lens), inverse(invert(multiply(newIntrinsics, rotation))) {}
+
+    void operator()(double u, double v, float& mapX, float& mapY) const {
+        const double x = inverse[0] * u + inverse[1] * v + inverse[2];
+        const double y = inverse[3] * u + inverse[4] * v + inverse[5];
+        const double w = inverse[6] * u + inverse[7] * v + inverse[8];
+        if(w <= 0) {
+            // Behind the camera, outside of the source image
+            mapX = mapY = -1.0f;
+            return;
+        }
+        double sourceU, sourceV;
+        lens.distort(x / w, y / w, sourceU, sourceV);
+        mapX = static_cast<float>(sourceU);
+        mapY = static_cast<float>(sourceV);
+    }
+};
+
+// New intrinsics retaining valid pixels (alpha 0) up to all source pixels (alpha 1), as OpenCV's getOptimalNewCameraMatrix
+Matrix3 getOptimalIntrinsics(const CameraLens& lens, int width, int height, double alpha) {
+    double outerX0 = INFINITY, outerY0 = INFINITY, outerX1 = -INFINITY, outerY1 = -INFINITY;
+    double innerX0 = -INFINITY, innerY0 = -INFINITY, innerX1 = INFINITY, innerY1 = INFINITY;
+    for(int j = 0; j < BORDER_GRID; j++) {
+        for(int i = 0; i < BORDER_GRID; i++) {
+            double x, y;
+            lens.undistort(i * (width - 1) / double(BORDER_GRID - 1), j * (height - 1) / double(BORDER_GRID - 1), x, y);
+            outerX0 = std::min(outerX0, x);
+            outerX1 = std::max(outerX1, x);
+            outerY0 = std::min(outerY0, y);
+            outerY1 = std::max(outerY1, y);
+            if(i == 0) innerX0 = std::max(innerX0, x);
+            if(i == BORDER_GRID - 1) innerX1 = std::min(innerX1, x);
+            if(j == 0) innerY0 = std::max(innerY0, y);
+            if(j == BORDER_GRID - 1) innerY1 = std::min(innerY1, y);
+        }
+    }
+    const double fx0 = (width - 1) / (innerX1 - innerX0), fy0 = (height - 1) / (innerY1 - innerY0);
+    const double fx1 = (width - 1) / (outerX1 - outerX0), fy1 = (height - 1) / (outerY1 - outerY0);
+    const double fx = fx0 * (1 - alpha) + fx1 * alpha;
+    const double fy = fy0 * (1 - alpha) + fy1 * alpha;
+    const double cx = -fx0 * innerX0 * (1 - alpha) - fx1 * outerX0 * alpha;
+    const double cy = -fy0 * innerY0 * (1 - alpha) - fy1 * outerY0 * alpha;
+    return Matrix3{fx, 0, cx, 0, fy, cy, 0, 0, 1};
+}
+
+std::int16_t saturate16(int value) {
+    return static_cast<std::int16_t>(std::min<int>(std::max<int>(value, std::numeric_limits<std::int16_t>::min()), std::numeric_limits<std::int16_t>::max()));
+}
+
+std::shared_ptr<const CalibrationMaps::Maps> computeMaps(const Projection& projection, int width, int height, CalibrationMaps::Format format) {
+    auto maps = std::make_shared<CalibrationMaps::Maps>();
+    maps->width = width;
+    maps->height = height;
+    maps->format = format;
+    const std::size_t count = static_cast<std::size_t>(width) * height;
+    if(format == CalibrationMaps::Format::FLOAT32) {
+        maps->mapX.resize(count);
+        maps->mapY.resize(count);
+    } else {
+        maps->mapXY.resize(2 * count);
+        maps->mapInterpolation.resize(count);
+    }
+    for(int v = 0; v < height; v++) {
+        for(int u = 0; u < width; u++) {
+            const std::size_t i = static_cast<std::size_t>(v) * width + u;
+            float mapX, mapY;
+            projection(u, v, mapX, mapY);
+            if(format == CalibrationMaps::Format::FLOAT32) {
+                maps->mapX[i] = mapX;
+                maps->mapY[i] = mapY;
+                continue;
+            }
+            const auto limit = static_cast<double>(std::numeric_limits<int>::max() / 2);
+            const int ix = static_cast<int>(std::lround(std::max(-limit, std::min(limit, mapX * static_cast<double>(INTER_TAB_SIZE)))));
+            const int iy = static_cast<int>(std::lround(std::max(-limit, std::min(limit, mapY * static_cast<double>(INTER_TAB_SIZE)))));
+            maps->mapXY[2 * i] = saturate16(ix >> INTER_BITS);
+            maps->mapXY[2 * i + 1] = saturate16(iy >> INTER_BITS);
+            maps->mapInterpolation[i] = static_cast<std::uint16_t>((iy & (INTER_TAB_SIZE - 1)) * INTER_TAB_SIZE + (ix & (INTER_TAB_SIZE - 1)));
+        }
+    }
+    return maps;
+}
+
+std::shared_ptr<const WarpMesh> computeMesh(const Projection& projection, int width, int height, int stepWidth, int stepHeight) {
+    auto mesh = std::make_shared<WarpMesh>();
+    mesh->width = width / stepWidth + 1;
+    mesh->height = height / stepHeight + 1;
+    mesh->stepWidth = stepWidth;
+    mesh->stepHeight = stepHeight;
+    mesh->points.reserve(static_cast<std::size_t>(mesh->width) * mesh->height);
+    for(int j = 0; j < mesh->height; j++) {
+        for(int i = 0; i < mesh->width; i++) {
+            // Last row and column are sampled at the image border
+            Point2f point;
+            projection(std::min(i * stepWidth, width - 1), std::min(j * stepHeight, height - 1), point.x, point.y);
+            mesh->points.push_back(point);
+        }
+    }
+    return mesh;
+}
+
+struct Entry {
+    std::shared_ptr<const CalibrationMaps::Maps> maps;
+    std::shared_ptr<const WarpMesh> mesh;
+};
+
+CalibrationCache<Entry> cache(CalibrationMaps::DEFAULT_CACHE_CAPACITY);
+
+void checkSize(std::tuple<int, int> size) {
+    if(std::get<0>(size) <= 0 || std::get<1>(size) <= 0) throw std::invalid_argument("Image size must be positive");
+}
+
+void checkStep(std::tuple<int, int> step) {
+    if(std::get<0>(step) <= 0 || std::get<1>(step) <= 0) throw std::invalid_argument("Mesh step must be positive");
+}
+
+void checkStereo(const CalibrationHandler& calib, CameraBoardSocket left, CameraBoardSocket right) {
+    if(calib.getStereoLeftCameraId() != left || calib.getStereoRightCameraId() != right) {
+        throw std::invalid_argument("Cameras " + describeSocket(left) + " and " + describeSocket(right) + " aren't the calibrated stereo pair");
+    }
+}
+
+std::string describeRequest(const char* kind, std::tuple<int, int> size, std::tuple<int, int> extra, float alpha) {
+    return std::string(kind) + ":" + std::to_string(std::get<0>(size)) + "x" + std::to_string(std::get<1>(size)) + ":" + std::to_string(std::get<0>(extra)) + ","
+           + std::to_string(std::get<1>(extra)) + ":" + std::to_string(alpha) + ":";
+}
+
+// Projection of the left or right camera of the stereo pair
+template <typename Compute>
+Entry rectified(const CalibrationHandler& calib,
+                CameraBoardSocket left,
+                CameraBoardSocket right,
+                bool isLeft,
+                std::tuple<int, int> size,
+                const std::string& key,
+                Compute compute) {
+    return cache.get(key + (isLeft ? "L" : "R"), [&]() {
+        const int width = std::get<0>(size), height = std::get<1>(size);
+        const CameraLens lens(calib, isLeft ? left : right, width, height);
+        const CameraLens rightLens(calib, right, width, height);
+        const auto rotation = toMatrix3(isLeft ? calib.getStereoLeftRectificationRotation() : calib.getStereoRightRectificationRotation());
+        return compute(Projection(lens, rotation, rightLens.getIntrinsics()));
+    });
+}
+
+}  // namespace
+
+constexpr std::size_t CalibrationMaps::DEFAULT_CACHE_CAPACITY;
+
+std::vector<std::uint8_t> WarpMesh::toStereoMeshData() const {
+    std::vector<float> data;
+    data.reserve(points.size() * 2);
+    for(const auto& p : points) {
+        data.push_back(p.y);
+        data.push_back(p.x);
+    }
+    std::vector<std::uint8_t> bytes(data.size() * sizeof(float));
+    std::memcpy(bytes.data(), data.data(), bytes.size());
+    return bytes;
+}
+
+std::shared_ptr<const CalibrationMaps::Maps> CalibrationMaps::getUndistortMaps(
+    const CalibrationHandler& calib, CameraBoardSocket socket, std::tuple<int, int> size, float alpha, Format format) {
+    checkSize(size);
+    const auto request = describeRequest("undistortMaps", size, std::make_tuple(static_cast<int>(socket), static_cast<int>(format)), alpha);
+    return cache.get(request + getCalibrationKey(calib.getEepromData(), {socket}, false),
+                  [&]() {
+                      const int width = std::get<0>(size), height = std::get<1>(size);
+                      const CameraLens lens(calib, socket, width, height);
+                      const auto intrinsics = alpha < 0 ? lens.getIntrinsics() : getOptimalIntrinsics(lens, width, height, std::min(alpha, 1.0f));
+                      return Entry{computeMaps(Projection(lens, IDENTITY3, intrinsics), width, height, format), nullptr};
+                  })
+        .maps;
+}
+
+std::pair<std::shared_ptr<const CalibrationMaps::Maps>, std::shared_ptr<const CalibrationMaps::Maps>> CalibrationMaps::getRectificationMaps(
+    const CalibrationHandler& calib, CameraBoardSocket left, CameraBoardSocket right, std::tuple<int, int> size, Format format) {
+    checkSize(size);
+    checkStereo(calib, left, right);
+    const auto key = describeRequest("rectificationMaps", size, std::make_tuple(static_cast<int>(format), 0), 0)
+                     + getCalibrationKey(calib.getEepromData(), {left, right}, true);
+    auto compute = [&](const Projection& projection) { return Entry{computeMaps(projection, std::get<0>(size), std::get<1>(size), format), nullptr}; };
+    return {rectified(calib, left, right, true, size, key, compute).maps, rectified(calib, left, right, false, size, key, compute).maps};
+}
+
+std::shared_ptr<const WarpMesh> CalibrationMaps::getUndistortMesh(
+    const CalibrationHandler& calib, CameraBoardSocket socket, std::tuple<int, int> size, float alpha, std::tuple<int, int> step) {
+    checkSize(size);
+    checkStep(step);
+    const auto request = describeRequest("undistortMesh", size, step, alpha) + std::to_string(static_cast<int>(socket));
+    return cache.get(request + getCalibrationKey(calib.getEepromData(), {socket}, false),
+                  [&]() {
+                      const int width = std::get<0>(size), height = std::get<1>(size);
+                      const CameraLens lens(calib, socket, width, height);
+                      const auto intrinsics = alpha < 0 ? lens.getIntrinsics() : getOptimalIntrinsics(lens, width, height, std::min(alpha, 1.0f));
+                      return Entry{nullptr, computeMesh(Projection(lens, IDENTITY3, intrinsics), width, height, std::get<0>(step), std::get<1>(step))};
+                  })
+        .mesh;
+}
+
+std::pair<std::shared_ptr<const WarpMesh>, std::shared_ptr<const WarpMesh>> CalibrationMaps::getRectificationMeshes(
+    const CalibrationHandler& calib, CameraBoardSocket left, CameraBoardSocket right, std::tuple<int, int> size, std::tuple<int, int> step) {
+    checkSize(size);
+    checkStep(step);
+    checkStereo(calib, left, right);
+    const auto key = describeRequest("rectificationMesh", size, step, 0) + getCalibrationKey(calib.getEepromData(), {left, right}, true);
+    auto compute = [&](const Projection& projection) {
+        return Entry{nullptr, computeMesh(projection, std::get<0>(size), std::get<1>(size), std::get<0>(step), std::get<1>(step))};
+    };
+    return {rectified(calib, left, right, true, size, key, compute).mesh, rectified(calib, left, right, false, size, key, compute).mesh};
+}
+
+void CalibrationMaps::setCacheCapacity(std::size_t capacity) {
+    cache.setCapacity(capacity);
+}
+
+std::size_t CalibrationMaps::getCacheCapacity() {
+    return cache.getCapacity();
+}
+
+CalibrationMaps::CacheStats CalibrationMaps::getCacheStats() {
+    const auto stats = cache.getStats();
+    CacheStats out;
+    out.numHits = stats.numHits;
+    out.numMisses = stats.numMisses;
+    out.numEntries = stats.numEntries;
+    return out;
+}
+
+void CalibrationMaps::clearCache() {
+    cache.clear();
+}
+
+}  // namespace python
+}  // namespace dai
@@ -0,0 +1,137 @@
+#pragma once
+
+// std
+#include <cstddef>
+#include <cstdint>
+#include <memory>
+#include <tuple>
+#include <utility>
+#include <vector>
+
+// depthai
+#include "depthai/device/CalibrationHandler.hpp"
+
+// depthai-shared
+#include "depthai-shared/common/Point2f.hpp"
+
+namespace dai {
+namespace python {
+
+/**
+ * Sparse mesh of source image coordinates, sampled every step pixels of the output image
+ */
+struct WarpMesh {
+    /// Number of mesh points in a row
+    int width = 0;
+    /// Number of mesh rows
+    int height = 0;
+    int stepWidth = 0;
+    int stepHeight = 0;
+    /// Source coordinates, row by row from top left
+    std::vector<Point2f> points;
+
+    /**
+     * Retrieves the mesh in StereoDepth mesh format, a sequence of (y, x) float points
+     */
+    std::vector<std::uint8_t> toStereoMeshData() const;
+};
+
+/**
+ * Generates undistortion and stereo rectification maps and meshes from calibration, following OpenCV's
+ * initUndistortRectifyMap for perspective and fisheye camera models.
+ * Results are kept in an LRU cache keyed by the relevant calibration data and parameters,
+ * so repeated requests (eg. per frame) return the same, read-only results.
+ */
+class CalibrationMaps {
+   public:
+    enum class Format {
+        /// Separate x and y float32 maps
+        FLOAT32,
+        /// Interleaved int16 integer coordinates and uint16 interpolation table indices, as OpenCV's CV_16SC2 and CV_16UC1
+        FIXED_POINT
+    };
+
+    /**
+     * Maps of output image pixels to source image coordinates, for remapping
+     */
+    struct Maps {
+        unsigned int width = 0;
+        unsigned int height = 0;
+        Format format = Format::FLOAT32;
+        /// FLOAT32 maps
+        std::vector<float> mapX, mapY;
+        /// FIXED_POINT maps
+        std::vector<std::int16_t> mapXY;
+        std::vector<std::uint16_t> mapInterpolation;
+    };
+
+    struct CacheStats {
+        std::size_t numHits = 0;
+        std::size_t numMisses = 0;
+        std::size_t numEntries = 0;
+    };
+
+    /// Default number of maps and meshes retained in cache
+    static constexpr std::size_t DEFAULT_CACHE_CAPACITY = 16;
+
+    /**
+     * Retrieves maps undistorting images of a camera
+     *
+     * @param calib Calibration data
+     * @param socket Camera to undistort
+     * @param size Image size, intrinsics are scaled accordingly
+     * @param alpha Free scaling between 0 (only valid pixels retained) and 1 (all source pixels retained).
+     * Negative keeps calibrated intrinsics
+     * @param format Format of maps
+     */
+    static std::shared_ptr<const Maps> getUndistortMaps(
+        const CalibrationHandler& calib, CameraBoardSocket socket, std::tuple<int, int> size, float alpha, Format format);
+
+    /**
+     * Retrieves maps rectifying images of the calibrated stereo pair, with intrinsics of the right camera
+     *
+     * @param calib Calibration data
+     * @param left Left camera of the stereo pair
+     * @param right Right camera of the stereo pair
+     * @param size Image size, intrinsics are scaled accordingly
+     * @param format Format of maps
+     * @returns Maps of left and right camera
+     */
+    static std::pair<std::shared_ptr<const Maps>, std::shared_ptr<const Maps>> getRectificationMaps(
+        const CalibrationHandler& calib, CameraBoardSocket left, CameraBoardSocket right, std::tuple<int, int> size, Format format);
+
+    /**
+     * Retrieves a mesh undistorting images of a camera, as getUndistortMaps but sampled every step pixels
+     */
+    static std::shared_ptr<const WarpMesh> getUndistortMesh(
+        const CalibrationHandler& calib, CameraBoardSocket socket, std::tuple<int, int> size, float alpha, std::tuple<int, int> step);
+
+    /**
+     * Retrieves meshes rectifying images of the calibrated stereo pair, as getRectificationMaps but sampled every step pixels
+     */
+    static std::pair<std::shared_ptr<const WarpMesh>, std::shared_ptr<const WarpMesh>> getRectificationMeshes(
+        const CalibrationHandler& calib, CameraBoardSocket left, CameraBoardSocket right, std::tuple<int, int> size, std::tuple<int, int> step);
+
+    /**
+     * Sets number of maps and meshes retained in cache, evicting least recently used ones
+     */
+    static void setCacheCapacity(std::size_t capacity);
+
+    /**
+     * Retrieves number of maps and meshes retained in cache
+     */
+    static std::size_t getCacheCapacity();
+
+    /**
+     * Retrieves cache statistics
+     */
+    static CacheStats getCacheStats();
+
+    /**
+     * Discards cached maps and meshes and resets statistics
+     */
+    static void clearCache();
+};
+
+}  // namespace python
+}  // namespace dai
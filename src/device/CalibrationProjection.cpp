@@ -0,0 +1,106 @@
+#include "CalibrationProjection.hpp"
+
+// std
+#include <algorithm>
+#include <array>
+#include <cmath>
+#include <limits>
+#include <memory>
+#include <stdexcept>
+#include <string>
+#include <vector>
+
+// project
+#include "device/CalibrationCache.hpp"
+#include "device/CameraLens.hpp"
+
+namespace dai {
+namespace python {
+
+namespace {
+
+// Rotation and translation from one camera to another
+struct Transform {
+    Matrix3 rotation;
+    std::array<double, 3> translation;
+};
+
+CalibrationCache<std::shared_ptr<const CameraLens>> lenses(CalibrationProjection::CACHE_CAPACITY);
+CalibrationCache<std::shared_ptr<const Transform>> transforms(CalibrationProjection::CACHE_CAPACITY);
+
+std::shared_ptr<const CameraLens> getLens(const CalibrationHandler& calib, CameraBoardSocket socket, std::tuple<int, int> size) {
+    const int width = std::get<0>(size), height = std::get<1>(size);
+    if(width <= 0 || height <= 0) throw std::invalid_argument("Image size must be positive");
+    const auto key = std::to_string(width) + "x" + std::to_string(height) + ":" + getCalibrationKey(calib.getEepromData(), {socket}, false);
+    return lenses.get(key, [&]() { return std::make_shared<const CameraLens>(calib, socket, width, height); });
+}
+
+}  // namespace
+
+constexpr std::size_t CalibrationProjection::CACHE_CAPACITY;
+
+void CalibrationProjection::unproject(const CalibrationHandler& calib,
+                                      CameraBoardSocket socket,
+                                      const float* pixels,
+                                      const float* depth,
+                                      std::size_t count,
+                                      std::tuple<int, int> size,
+                                      float* points) {
+    const auto lens = getLens(calib, socket, size);
+    for(std::size_t i = 0; i < count; i++) {
+        double x, y;
+        lens->undistort(pixels[2 * i], pixels[2 * i + 1], x, y);
+        const double z = depth[i];
+        points[3 * i] = static_cast<float>(x * z);
+        points[3 * i + 1] = static_cast<float>(y * z);
+        points[3 * i + 2] = static_cast<float>(z);
+    }
+}
+
+void CalibrationProjection::project(
+    const CalibrationHandler& calib, CameraBoardSocket socket, const float* points, std::size_t count, std::tuple<int, int> size, float* pixels) {
+    const auto lens = getLens(calib, socket, size);
+    for(std::size_t i = 0; i < count; i++) {
+        const double z = points[3 * i + 2];
+        if(!(z > 0)) {
+            pixels[2 * i] = pixels[2 * i + 1] = std::numeric_limits<float>::quiet_NaN();
+            continue;
+        }
+        double u, v;
+        lens->distort(points[3 * i] / z, points[3 * i + 1] / z, u, v);
+        pixels[2 * i] = static_cast<float>(u);
+        pixels[2 * i + 1] = static_cast<float>(v);
+    }
+}
+
+void CalibrationProjection::transform(const CalibrationHandler& calib,
+                                      CameraBoardSocket src,
+                                      CameraBoardSocket dst,
+                                      const float* points,
+                                      std::size_t count,
+                                      bool useSpecTranslation,
+                                      float* out) {
+    // Extrinsics may be chained through other cameras, so all of them are part of the key
+    const auto eeprom = calib.getEepromData();
+    std::vector<CameraBoardSocket> sockets{src, dst};
+    for(const auto& kv : eeprom.cameraData) sockets.push_back(kv.first);
+    std::sort(sockets.begin() + 2, sockets.end());
+    const auto key = std::string(useSpecTranslation ? "spec:" : "calibrated:") + getCalibrationKey(eeprom, sockets, false);
+    const auto t = transforms.get(key, [&]() {
+        const auto m = calib.getCameraExtrinsics(src, dst, useSpecTranslation);
+        auto e = std::make_shared<Transform>();
+        e->rotation = toMatrix3({{m[0][0], m[0][1], m[0][2]}, {m[1][0], m[1][1], m[1][2]}, {m[2][0], m[2][1], m[2][2]}});
+        e->translation = {m[0][3], m[1][3], m[2][3]};
+        return std::shared_ptr<const Transform>(std::move(e));
+    });
+    const auto& r = t->rotation;
+    for(std::size_t i = 0; i < count; i++) {
+        const double x = points[3 * i], y = points[3 * i + 1], z = points[3 * i + 2];
+        out[3 * i] = static_cast<float>(r[0] * x + r[1] * y + r[2] * z + t->translation[0]);
+        out[3 * i + 1] = static_cast<float>(r[3] * x + r[4] * y + r[5] * z + t->translation[1]);
+        out[3 * i + 2] = static_cast<float>(r[6] * x + r[7] * y + r[8] * z + t->translation[2]);
+    }
+}
+
+}  // namespace python
+}  // namespace dai
@@ -0,0 +1,77 @@
+#pragma once
+
+// std
+#include <cstddef>
+#include <tuple>
+
+// depthai
+#include "depthai/device/CalibrationHandler.hpp"
+
+namespace dai {
+namespace python {
+
+/**
+ * Batched conversions of points between pixel and metric space of calibrated cameras.
+ * Intrinsics, distortion and extrinsics are cached per calibration data, camera and image size,
+ * so repeated calls (eg. per frame) only convert points.
+ */
+class CalibrationProjection {
+   public:
+    /// Maximum number of cached intrinsics and of cached extrinsics, least recently used ones are evicted once exceeded
+    static constexpr std::size_t CACHE_CAPACITY = 32;
+
+    /**
+     * Converts pixels with depth to points in the camera coordinate system, removing lens distortion
+     *
+     * @param calib Calibration data
+     * @param socket Camera
+     * @param pixels Pixel coordinates, count (x, y) pairs
+     * @param depth Depth (distance along the optical axis) of each pixel
+     * @param count Number of pixels
+     * @param size Image size, intrinsics are scaled accordingly
+     * @param[out] points Points, count (x, y, z) triplets in units of depth
+     */
+    static void unproject(const CalibrationHandler& calib,
+                          CameraBoardSocket socket,
+                          const float* pixels,
+                          const float* depth,
+                          std::size_t count,
+                          std::tuple<int, int> size,
+                          float* points);
+
+    /**
+     * Converts points in the camera coordinate system to pixels, applying lens distortion.
+     * Points behind the camera are projected to NaN
+     *
+     * @param calib Calibration data
+     * @param socket Camera
+     * @param points Points, count (x, y, z) triplets
+     * @param count Number of points
+     * @param size Image size, intrinsics are scaled accordingly
+     * @param[out] pixels Pixel coordinates, count (x, y) pairs
+     */
+    static void project(
+        const CalibrationHandler& calib, CameraBoardSocket socket, const float* points, std::size_t count, std::tuple<int, int> size, float* pixels);
+
+    /**
+     * Transforms points from the coordinate system of one camera to another
+     *
+     * @param calib Calibration data
+     * @param src Camera of input points
+     * @param dst Camera of output points
+     * @param points Points, count (x, y, z) triplets in centimeters, the unit of calibration translations
+     * @param count Number of points
+     * @param useSpecTranslation Use translation from board design data instead of calibration
+     * @param[out] out Transformed points, count (x, y, z) triplets
+     */
+    static void transform(const CalibrationHandler& calib,
+                          CameraBoardSocket src,
+                          CameraBoardSocket dst,
+                          const float* points,
+                          std::size_t count,
+                          bool useSpecTranslation,
+                          float* out);
+};
+
+}  // namespace python
+}  // namespace dai
@@ -0,0 +1,140 @@
+#include "CameraLens.hpp"
+
+// std
+#include <algorithm>
+#include <cmath>
+#include <limits>
+#include <sstream>
+#include <stdexcept>
+
+// depthai
+#include "depthai/common/CameraBoardSocket.hpp"
+
+namespace dai {
+namespace python {
+
+namespace {
+
+// Iterations of undistort, which stops earlier once converged
+constexpr int UNDISTORT_ITERATIONS = 20;
+constexpr double UNDISTORT_EPSILON = 1e-12;
+// M_PI isn't standard, MSVC only defines it with _USE_MATH_DEFINES
+constexpr double PI = 3.14159265358979323846;
+
+}  // namespace
+
+const Matrix3 IDENTITY3{1, 0, 0, 0, 1, 0, 0, 0, 1};
+
+Matrix3 toMatrix3(const std::vector<std::vector<float>>& m) {
+    if(m.size() != 3 || m[0].size() != 3 || m[1].size() != 3 || m[2].size() != 3) throw std::invalid_argument("Expected a 3x3 matrix");
+    Matrix3 out;
+    for(int r = 0; r < 3; r++) {
+        for(int c = 0; c < 3; c++) out[r * 3 + c] = m[r][c];
+    }
+    return out;
+}
+
+Matrix3 multiply(const Matrix3& a, const Matrix3& b) {
+    Matrix3 out{};
+    for(int r = 0; r < 3; r++) {
+        for(int c = 0; c < 3; c++) {
+            for(int k = 0; k < 3; k++) out[r * 3 + c] += a[r * 3 + k] * b[k * 3 + c];
+        }
+    }
+    return out;
+}
+
+Matrix3 invert(const Matrix3& m) {
+    const double det = m[0] * (m[4] * m[8] - m[5] * m[7]) - m[1] * (m[3] * m[8] - m[5] * m[6]) + m[2] * (m[3] * m[7] - m[4] * m[6]);
+    if(std::abs(det) < std::numeric_limits<double>::epsilon()) throw std::invalid_argument("Camera matrix isn't invertible");
+    const double inv = 1.0 / det;
+    return Matrix3{(m[4] * m[8] - m[5] * m[7]) * inv,
+                   (m[2] * m[7] - m[1] * m[8]) * inv,
+                   (m[1] * m[5] - m[2] * m[4]) * inv,
+                   (m[5] * m[6] - m[3] * m[8]) * inv,
+                   (m[0] * m[8] - m[2] * m[6]) * inv,
+                   (m[2] * m[3] - m[0] * m[5]) * inv,
+                   (m[3] * m[7] - m[4] * m[6]) * inv,
+                   (m[1] * m[6] - m[0] * m[7]) * inv,
+                   (m[0] * m[4] - m[1] * m[3]) * inv};
+}
+
+std::string describeSocket(CameraBoardSocket socket) {
+    std::ostringstream ss;
+    ss << socket;
+    return ss.str();
+}
+
+CameraLens::CameraLens(const CalibrationHandler& calib, CameraBoardSocket socket, int width, int height)
+    : intrinsics(toMatrix3(calib.getCameraIntrinsics(socket, width, height))), model(calib.getDistortionModel(socket)) {
+    if(model != CameraModel::Perspective && model != CameraModel::Fisheye) {
+        throw std::invalid_argument("Distortion model of camera " + describeSocket(socket) + " isn't supported, only perspective and fisheye are");
+    }
+    const auto coeffs = calib.getDistortionCoefficients(socket);
+    for(std::size_t i = 0; i < std::min(coeffs.size(), k.size()); i++) k[i] = coeffs[i];
+    // Tilted sensor coefficients
+    if(coeffs.size() > 12 && (coeffs[12] != 0.0f || (coeffs.size() > 13 && coeffs[13] != 0.0f))) {
+        throw std::invalid_argument("Tilted sensor distortion of camera " + describeSocket(socket) + " isn't supported");
+    }
+}
+
+const Matrix3& CameraLens::getIntrinsics() const {
+    return intrinsics;
+}
+
+void CameraLens::distort(double x, double y, double& u, double& v) const {
+    double xd, yd;
+    if(model == CameraModel::Fisheye) {
+        const double r = std::sqrt(x * x + y * y);
+        const double theta = std::atan(r);
+        const double t2 = theta * theta;
+        const double thetaD = theta * (1 + t2 * (k[0] + t2 * (k[1] + t2 * (k[2] + t2 * k[3]))));
+        const double scale = r > 1e-8 ? thetaD / r : 1.0;
+        xd = x * scale;
+        yd = y * scale;
+    } else {
+        const double x2 = x * x, y2 = y * y, r2 = x2 + y2, xy2 = 2 * x * y;
+        const double kr = (1 + ((k[4] * r2 + k[1]) * r2 + k[0]) * r2) / (1 + ((k[7] * r2 + k[6]) * r2 + k[5]) * r2);
+        xd = x * kr + k[2] * xy2 + k[3] * (r2 + 2 * x2) + k[8] * r2 + k[9] * r2 * r2;
+        yd = y * kr + k[2] * (r2 + 2 * y2) + k[3] * xy2 + k[10] * r2 + k[11] * r2 * r2;
+    }
+    u = intrinsics[0] * xd + intrinsics[1] * yd + intrinsics[2];
+    v = intrinsics[4] * yd + intrinsics[5];
+}
+
+void CameraLens::undistort(double u, double v, double& x, double& y) const {
+    const double yd = (v - intrinsics[5]) / intrinsics[4];
+    const double xd = (u - intrinsics[2] - intrinsics[1] * yd) / intrinsics[0];
+    if(model == CameraModel::Fisheye) {
+        const double thetaD = std::min(std::sqrt(xd * xd + yd * yd), PI / 2);
+        double theta = thetaD;
+        for(int i = 0; i < UNDISTORT_ITERATIONS; i++) {
+            const double t2 = theta * theta;
+            const double f = theta * (1 + t2 * (k[0] + t2 * (k[1] + t2 * (k[2] + t2 * k[3])))) - thetaD;
+            const double df = 1 + t2 * (3 * k[0] + t2 * (5 * k[1] + t2 * (7 * k[2] + t2 * 9 * k[3])));
+            const double step = f / df;
+            theta -= step;
+            if(std::abs(step) < UNDISTORT_EPSILON) break;
+        }
+        const double scale = thetaD > 1e-8 ? std::tan(theta) / thetaD : 1.0;
+        x = xd * scale;
+        y = yd * scale;
+        return;
+    }
+    x = xd;
+    y = yd;
+    for(int i = 0; i < UNDISTORT_ITERATIONS; i++) {
+        const double r2 = x * x + y * y;
+        const double icdist = (1 + ((k[7] * r2 + k[6]) * r2 + k[5]) * r2) / (1 + ((k[4] * r2 + k[1]) * r2 + k[0]) * r2);
+        const double dx = 2 * k[2] * x * y + k[3] * (r2 + 2 * x * x) + k[8] * r2 + k[9] * r2 * r2;
+        const double dy = k[2] * (r2 + 2 * y * y) + 2 * k[3] * x * y + k[10] * r2 + k[11] * r2 * r2;
+        const double nextX = (xd - dx) * icdist, nextY = (yd - dy) * icdist;
+        const double change = std::abs(nextX - x) + std::abs(nextY - y);
+        x = nextX;
+        y = nextY;
+        if(change < UNDISTORT_EPSILON) break;
+    }
+}
+
+}  // namespace python
+}  // namespace dai
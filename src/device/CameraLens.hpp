@@ -0,0 +1,82 @@
+#pragma once
+
+// std
+#include <array>
+#include <string>
+#include <vector>
+
+// depthai
+#include "depthai/device/CalibrationHandler.hpp"
+
+// depthai-shared
+#include "depthai-shared/common/CameraModel.hpp"
+
+namespace dai {
+namespace python {
+
+/// Row-major 3x3 matrix
+using Matrix3 = std::array<double, 9>;
+
+/// Identity 3x3 matrix
+extern const Matrix3 IDENTITY3;
+
+/**
+ * Converts a 3x3 matrix as returned by CalibrationHandler
+ */
+Matrix3 toMatrix3(const std::vector<std::vector<float>>& m);
+
+/**
+ * Multiplies two 3x3 matrices
+ */
+Matrix3 multiply(const Matrix3& a, const Matrix3& b);
+
+/**
+ * Inverts a 3x3 matrix, throws if it is singular
+ */
+Matrix3 invert(const Matrix3& m);
+
+/**
+ * Retrieves name of a camera socket, for messages
+ */
+std::string describeSocket(CameraBoardSocket socket);
+
+/**
+ * Intrinsics and lens distortion of a calibrated camera at an image size, following OpenCV's perspective
+ * (rational and thin prism) and fisheye camera models
+ */
+class CameraLens {
+   public:
+    /**
+     * Reads intrinsics and distortion of a camera
+     *
+     * @param calib Calibration data
+     * @param socket Camera
+     * @param width Image width, intrinsics are scaled accordingly
+     * @param height Image height, intrinsics are scaled accordingly
+     */
+    CameraLens(const CalibrationHandler& calib, CameraBoardSocket socket, int width, int height);
+
+    /**
+     * Retrieves intrinsics at the image size
+     */
+    const Matrix3& getIntrinsics() const;
+
+    /**
+     * Projects normalized undistorted coordinates to distorted pixel coordinates
+     */
+    void distort(double x, double y, double& u, double& v) const;
+
+    /**
+     * Inverse of distort, computed iteratively
+     */
+    void undistort(double u, double v, double& x, double& y) const;
+
+   private:
+    Matrix3 intrinsics;
+    CameraModel model = CameraModel::Perspective;
+    // k1, k2, p1, p2, k3, k4, k5, k6, s1, s2, s3, s4 for perspective, k1..k4 for fisheye
+    std::array<double, 12> k{};
+};
+
+}  // namespace python
+}  // namespace dai
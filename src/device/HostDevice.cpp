@@ -0,0 +1,140 @@
+#include "HostDevice.hpp"
+
+// std
+#include <algorithm>
+#include <stdexcept>
+
+namespace dai {
+namespace python {
+
+namespace {
+
+// Same limit as Device event queue
+constexpr std::size_t EVENT_QUEUE_MAXIMUM_SIZE = 2048;
+
+}  // namespace
+
+HostDevice::~HostDevice() {
+    close();
+}
+
+std::shared_ptr<MessageQueue> HostDevice::addOutputQueue(const std::string& name) {
+    auto queue = std::make_shared<MessageQueue>(name);
+    queue->addCallback([this](std::string name, std::shared_ptr<ADatatype>) {
+        {
+            std::unique_lock<std::mutex> l(eventMtx);
+            eventQueue.push_back(std::move(name));
+            if(eventQueue.size() > EVENT_QUEUE_MAXIMUM_SIZE) eventQueue.pop_front();
+        }
+        eventCv.notify_all();
+    });
+
+    std::unique_lock<std::mutex> l(queuesMtx);
+    if(!outputQueues.emplace(name, queue).second) throw std::invalid_argument("Queue with name '" + name + "' already exists");
+    return queue;
+}
+
+void HostDevice::startProducer(std::function<void()> producer) {
+    std::unique_lock<std::mutex> l(closeMtx);
+    if(!running) throw std::runtime_error("Device closed");
+    producers.emplace_back(std::move(producer));
+}
+
+bool HostDevice::sleepUntil(std::chrono::steady_clock::time_point time) {
+    std::unique_lock<std::mutex> l(closeMtx);
+    return !closeCv.wait_until(l, time, [this]() { return !running; });
+}
+
+std::shared_ptr<MessageQueue> HostDevice::getOutputQueue(const std::string& name) const {
+    std::unique_lock<std::mutex> l(queuesMtx);
+    auto it = outputQueues.find(name);
+    if(it == outputQueues.end()) throw std::runtime_error("Queue for stream name '" + name + "' doesn't exist");
+    return it->second;
+}
+
+std::shared_ptr<MessageQueue> HostDevice::getOutputQueue(const std::string& name, unsigned int maxSize, bool blocking) const {
+    auto queue = getOutputQueue(name);
+    queue->setMaxSize(maxSize);
+    queue->setBlocking(blocking);
+    return queue;
+}
+
+std::vector<std::string> HostDevice::getOutputQueueNames() const {
+    std::unique_lock<std::mutex> l(queuesMtx);
+    std::vector<std::string> names;
+    for(const auto& kv : outputQueues) names.push_back(kv.first);
+    return names;
+}
+
+std::shared_ptr<MessageQueue> HostDevice::getInputQueue(const std::string& name) {
+    std::unique_lock<std::mutex> l(queuesMtx);
+    auto& queue = inputQueues[name];
+    // Queue of size 0 retains no messages
+    if(queue == nullptr) queue = std::make_shared<MessageQueue>(name, 0, false);
+    return queue;
+}
+
+std::vector<std::string> HostDevice::getInputQueueNames() const {
+    std::unique_lock<std::mutex> l(queuesMtx);
+    std::vector<std::string> names;
+    for(const auto& kv : inputQueues) names.push_back(kv.first);
+    return names;
+}
+
+std::vector<std::string> HostDevice::getQueueEvents(const std::vector<std::string>& queueNames, std::size_t maxNumEvents, std::chrono::microseconds timeout) {
+    for(const auto& name : queueNames) getOutputQueue(name);
+
+    std::vector<std::string> events;
+    auto predicate = [this, &queueNames, &events, maxNumEvents]() {
+        for(auto it = eventQueue.begin(); it != eventQueue.end() && events.size() < maxNumEvents;) {
+            if(std::find(queueNames.begin(), queueNames.end(), *it) != queueNames.end()) {
+                events.push_back(*it);
+                it = eventQueue.erase(it);
+            } else {
+                ++it;
+            }
+        }
+        return !events.empty() || !running;
+    };
+
+    std::unique_lock<std::mutex> l(eventMtx);
+    if(timeout < std::chrono::microseconds(0)) {
+        eventCv.wait(l, predicate);
+    } else {
+        eventCv.wait_for(l, timeout, predicate);
+    }
+    return events;
+}
+
+bool HostDevice::isClosed() const {
+    return !running;
+}
+
+void HostDevice::close() {
+    std::call_once(closeFlag, [this]() {
+        {
+            std::unique_lock<std::mutex> l(closeMtx);
+            running = false;
+        }
+        closeCv.notify_all();
+        {
+            // Waiters check 'running' under the lock, so they can't miss the notification
+            std::unique_lock<std::mutex> l(eventMtx);
+        }
+        eventCv.notify_all();
+
+        // Unblocks producers waiting on full queues
+        std::vector<std::shared_ptr<MessageQueue>> queues;
+        {
+            std::unique_lock<std::mutex> l(queuesMtx);
+            for(auto& kv : outputQueues) queues.push_back(kv.second);
+            for(auto& kv : inputQueues) queues.push_back(kv.second);
+        }
+        for(auto& q : queues) q->close();
+
+        for(auto& producer : producers) producer.join();
+    });
+}
+
+}  // namespace python
+}  // namespace dai
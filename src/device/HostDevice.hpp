@@ -0,0 +1,116 @@
+#pragma once
+
+// std
+#include <atomic>
+#include <chrono>
+#include <condition_variable>
+#include <deque>
+#include <functional>
+#include <limits>
+#include <map>
+#include <memory>
+#include <mutex>
+#include <string>
+#include <thread>
+#include <vector>
+
+// project
+#include "queue/MessageQueue.hpp"
+
+namespace dai {
+namespace python {
+
+/**
+ * Base of devices living entirely on the host (replayed or simulated), with the queue surface of a Device
+ * (getOutputQueue, getInputQueue, getQueueEvent). Output queues are fed by producer threads,
+ * input queues discard sent messages.
+ *
+ * Queues are MessageQueue instances, as DataOutputQueue and DataInputQueue can't exist without an XLink connection.
+ */
+class HostDevice {
+   public:
+    virtual ~HostDevice();
+
+    /**
+     * Retrieves an output queue
+     */
+    std::shared_ptr<MessageQueue> getOutputQueue(const std::string& name) const;
+
+    /**
+     * Retrieves an output queue and sets its size and blocking behavior
+     */
+    std::shared_ptr<MessageQueue> getOutputQueue(const std::string& name, unsigned int maxSize, bool blocking = true) const;
+
+    /**
+     * Retrieves names of output queues
+     */
+    std::vector<std::string> getOutputQueueNames() const;
+
+    /**
+     * Retrieves an input queue, which discards sent messages
+     */
+    std::shared_ptr<MessageQueue> getInputQueue(const std::string& name);
+
+    /**
+     * Retrieves names of input queues retrieved so far
+     */
+    std::vector<std::string> getInputQueueNames() const;
+
+    /**
+     * Gets or waits until any of specified queues has received a message
+     *
+     * @param queueNames Names of queues for which to block
+     * @param maxNumEvents Maximum number of events to remove from queue
+     * @param timeout Timeout after which return regardless. If negative then wait is indefinite
+     * @returns Names of queues which received messages first
+     */
+    std::vector<std::string> getQueueEvents(const std::vector<std::string>& queueNames,
+                                            std::size_t maxNumEvents = std::numeric_limits<std::size_t>::max(),
+                                            std::chrono::microseconds timeout = std::chrono::microseconds(-1));
+
+    /**
+     * Check whether the device was closed
+     */
+    bool isClosed() const;
+
+    /**
+     * Stops producers and closes all queues
+     */
+    void close();
+
+   protected:
+    /**
+     * Creates an output queue
+     */
+    std::shared_ptr<MessageQueue> addOutputQueue(const std::string& name);
+
+    /**
+     * Starts a producer thread, joined on close. Derived classes must call close() in their destructor
+     */
+    void startProducer(std::function<void()> producer);
+
+    /**
+     * Waits until given time point
+     *
+     * @returns False if device was closed in between
+     */
+    bool sleepUntil(std::chrono::steady_clock::time_point time);
+
+   private:
+    mutable std::mutex queuesMtx;
+    std::map<std::string, std::shared_ptr<MessageQueue>> outputQueues;
+    std::map<std::string, std::shared_ptr<MessageQueue>> inputQueues;
+
+    std::mutex eventMtx;
+    std::condition_variable eventCv;
+    std::deque<std::string> eventQueue;
+
+    std::atomic<bool> running{true};
+    std::mutex closeMtx;
+    std::condition_variable closeCv;
+    std::vector<std::thread> producers;
+    std::once_flag closeFlag;
+};
+
+}  // namespace python
+}  // namespace dai
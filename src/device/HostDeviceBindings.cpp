@@ -0,0 +1,112 @@
+#include "HostDeviceBindings.hpp"
+
+// project
+#include "device/HostDevice.hpp"
+#include "device/SimulatedDevice.hpp"
+
+// Blocking wait is polled, so Python interrupts are checked in between (as for Device)
+static std::vector<std::string> hostDeviceGetQueueEventsHelper(dai::python::HostDevice& d, const std::vector<std::string>& queueNames, std::size_t maxNumEvents, std::chrono::microseconds timeout){
+    using namespace std::chrono;
+
+    // if timeout < 0, unlimited timeout
+    bool unlimitedTimeout = timeout < microseconds(0);
+    auto startTime = steady_clock::now();
+    do {
+        {
+            // releases python GIL
+            py::gil_scoped_release release;
+            // block for 100ms
+            auto events = d.getQueueEvents(queueNames, maxNumEvents, std::chrono::milliseconds(100));
+            if(!events.empty() || d.isClosed()) return events;
+        }
+        // reacquires python GIL for PyErr_CheckSignals call
+        // check if interrupt triggered in between
+        if (PyErr_CheckSignals() != 0) throw py::error_already_set();
+    } while(unlimitedTimeout || steady_clock::now() - startTime < timeout);
+
+    return std::vector<std::string>();
+}
+
+void HostDeviceBindings::bind(pybind11::module& m, void* pCallstack){
+
+    using namespace dai;
+    using namespace dai::python;
+
+    // Type definitions
+    py::class_<HostDevice, std::shared_ptr<HostDevice>> hostDevice(m, "HostDevice", "Base of devices living entirely on the host (ReplayDevice, SimulatedDevice), with the queue interface of Device (getOutputQueue, getInputQueue, getQueueEvent)");
+    py::class_<SimulatedDevice, HostDevice, std::shared_ptr<SimulatedDevice>> simulatedDevice(m, "SimulatedDevice", "Device stand-in producing synthetic ImgFrame, NNData, IMUData and Buffer messages at configured rates and sizes, for benchmarking and testing host code without hardware. Queues are host queues with the behavior of DataOutputQueue and DataInputQueue, XLink transfer isn't simulated");
+
+
+    ///////////////////////////////////////////////////////////////////////
+    ///////////////////////////////////////////////////////////////////////
+    ///////////////////////////////////////////////////////////////////////
+    // Call the rest of the type defines, then perform the actual bindings
+    Callstack* callstack = (Callstack*) pCallstack;
+    auto cb = callstack->top();
+    callstack->pop();
+    cb(m, pCallstack);
+    // Actual bindings
+    ///////////////////////////////////////////////////////////////////////
+    ///////////////////////////////////////////////////////////////////////
+    ///////////////////////////////////////////////////////////////////////
+
+
+    hostDevice
+        .def("__enter__", [](std::shared_ptr<HostDevice> d) { return d; })
+        .def("__exit__", [](HostDevice& d, py::object type, py::object value, py::object traceback) {
+            py::gil_scoped_release release;
+            d.close();
+        })
+        .def("close", &HostDevice::close, py::call_guard<py::gil_scoped_release>(), "Stops producing messages and closes all queues")
+        .def("isClosed", &HostDevice::isClosed, "Check whether the device was closed")
+        .def("getOutputQueue", static_cast<std::shared_ptr<MessageQueue>(HostDevice::*)(const std::string&) const>(&HostDevice::getOutputQueue), py::arg("name"), "Retrieves an output queue")
+        .def("getOutputQueue", static_cast<std::shared_ptr<MessageQueue>(HostDevice::*)(const std::string&, unsigned int, bool) const>(&HostDevice::getOutputQueue), py::arg("name"), py::arg("maxSize"), py::arg("blocking") = true, "Retrieves an output queue and sets its size and blocking behavior")
+        .def("getOutputQueueNames", &HostDevice::getOutputQueueNames, "Retrieves names of output queues")
+        .def("getInputQueue", &HostDevice::getInputQueue, py::arg("name"), "Retrieves an input queue, which discards sent messages")
+        .def("getInputQueue", [](HostDevice& d, const std::string& name, unsigned int, bool){
+            return d.getInputQueue(name);
+        }, py::arg("name"), py::arg("maxSize"), py::arg("blocking") = true, "Retrieves an input queue, which discards sent messages. Size and blocking behavior are accepted for compatibility with Device")
+        .def("getInputQueueNames", &HostDevice::getInputQueueNames, "Retrieves names of input queues retrieved so far")
+
+        .def("getQueueEvents", [](HostDevice& d, const std::vector<std::string>& queueNames, std::size_t maxNumEvents, std::chrono::microseconds timeout) {
+            return hostDeviceGetQueueEventsHelper(d, queueNames, maxNumEvents, timeout);
+        }, py::arg("queueNames"), py::arg("maxNumEvents") = std::numeric_limits<std::size_t>::max(), py::arg("timeout") = std::chrono::microseconds(-1), "Gets or waits until any of specified queues has received a message")
+        .def("getQueueEvents", [](HostDevice& d, std::string queueName, std::size_t maxNumEvents, std::chrono::microseconds timeout) {
+            return hostDeviceGetQueueEventsHelper(d, std::vector<std::string>{queueName}, maxNumEvents, timeout);
+        }, py::arg("queueName"), py::arg("maxNumEvents") = std::numeric_limits<std::size_t>::max(), py::arg("timeout") = std::chrono::microseconds(-1), "Gets or waits until specified queue has received a message")
+        .def("getQueueEvents", [](HostDevice& d, std::size_t maxNumEvents, std::chrono::microseconds timeout) {
+            return hostDeviceGetQueueEventsHelper(d, d.getOutputQueueNames(), maxNumEvents, timeout);
+        }, py::arg("maxNumEvents") = std::numeric_limits<std::size_t>::max(), py::arg("timeout") = std::chrono::microseconds(-1), "Gets or waits until any queue has received a message")
+
+        .def("getQueueEvent", [](HostDevice& d, const std::vector<std::string>& queueNames, std::chrono::microseconds timeout) {
+            auto events = hostDeviceGetQueueEventsHelper(d, queueNames, std::numeric_limits<std::size_t>::max(), timeout);
+            if(events.empty()) return std::string("");
+            return events[0];
+        }, py::arg("queueNames"), py::arg("timeout") = std::chrono::microseconds(-1), "Gets or waits until any of specified queues has received a message")
+        .def("getQueueEvent", [](HostDevice& d, std::string queueName, std::chrono::microseconds timeout) {
+            auto events = hostDeviceGetQueueEventsHelper(d, std::vector<std::string>{queueName}, std::numeric_limits<std::size_t>::max(), timeout);
+            if(events.empty()) return std::string("");
+            return events[0];
+        }, py::arg("queueName"), py::arg("timeout") = std::chrono::microseconds(-1), "Gets or waits until specified queue has received a message")
+        .def("getQueueEvent", [](HostDevice& d, std::chrono::microseconds timeout) {
+            auto events = hostDeviceGetQueueEventsHelper(d, d.getOutputQueueNames(), std::numeric_limits<std::size_t>::max(), timeout);
+            if(events.empty()) return std::string("");
+            return events[0];
+        }, py::arg("timeout") = std::chrono::microseconds(-1), "Gets or waits until any queue has received a message")
+        ;
+
+    simulatedDevice
+        .def(py::init<>(), "Constructs a simulated device without streams. Streams are added with 'add*Stream' and start producing immediately")
+        .def("addImgFrameStream", &SimulatedDevice::addImgFrameStream, py::arg("name"), py::arg("width"), py::arg("height"), py::arg("type"), py::arg("fps") = 30.0f,
+            "Adds an output queue of image frames of given size and type. 'fps' of 0 produces as fast as the queue is consumed")
+        .def("addNNDataStream", &SimulatedDevice::addNNDataStream, py::arg("name"), py::arg("layers"), py::arg("fps") = 30.0f,
+            "Adds an output queue of neural network results, with 'layers' mapping layer names to numbers of FP16 elements. 'fps' of 0 produces as fast as the queue is consumed")
+        .def("addIMUDataStream", &SimulatedDevice::addIMUDataStream, py::arg("name"), py::arg("packetsPerMessage") = 1, py::arg("rate") = 400.0f,
+            "Adds an output queue of IMU data with accelerometer and gyroscope reports. 'rate' of 0 produces as fast as the queue is consumed")
+        .def("addBufferStream", &SimulatedDevice::addBufferStream, py::arg("name"), py::arg("size"), py::arg("rate") = 30.0f,
+            "Adds an output queue of raw buffers of given size. 'rate' of 0 produces as fast as the queue is consumed")
+        .def("getNumProduced", &SimulatedDevice::getNumProduced, py::arg("name"), "Retrieves number of messages produced on a stream so far")
+        .def_static("getFrameSize", &SimulatedDevice::getFrameSize, py::arg("width"), py::arg("height"), py::arg("type"), "Computes payload size in bytes of a frame of given size and type")
+        ;
+
+}
@@ -0,0 +1,166 @@
+#include "SimulatedDevice.hpp"
+
+// std
+#include <stdexcept>
+
+// depthai
+#include "depthai/pipeline/datatype/Buffer.hpp"
+#include "depthai/pipeline/datatype/IMUData.hpp"
+#include "depthai/pipeline/datatype/NNData.hpp"
+#include "depthai/pipeline/datatype/StreamMessageParser.hpp"
+
+// project
+#include "queue/HostTimestamps.hpp"
+#include "utility/DatatypeUtils.hpp"
+
+namespace dai {
+namespace python {
+
+namespace {
+
+std::vector<std::uint8_t> pattern(std::size_t size) {
+    std::vector<std::uint8_t> data(size);
+    for(std::size_t i = 0; i < size; i++) data[i] = static_cast<std::uint8_t>(i);
+    return data;
+}
+
+// Each message is parsed from the serialized template, as DataOutputQueue parses packets read from a device
+template <typename Raw>
+std::function<std::shared_ptr<ADatatype>(std::int64_t, std::chrono::steady_clock::time_point)> parsedFrom(const std::shared_ptr<Raw>& raw) {
+    auto serialized = std::make_shared<std::vector<std::uint8_t>>(StreamMessageParser::serializeMessage(*raw));
+    return [serialized](std::int64_t sequenceNum, std::chrono::steady_clock::time_point ts) {
+        streamPacketDesc_t packet = {};
+        packet.data = serialized->data();
+        packet.length = static_cast<std::uint32_t>(serialized->size());
+        auto msg = StreamMessageParser::parseMessageToADatatype(&packet);
+        auto& buffer = static_cast<Buffer&>(*msg);
+        buffer.setSequenceNum(sequenceNum);
+        buffer.setTimestamp(ts);
+        buffer.setTimestampDevice(ts);
+        return msg;
+    };
+}
+
+}  // namespace
+
+SimulatedDevice::~SimulatedDevice() {
+    // Producers use members of this class, stop them before they are destroyed
+    close();
+}
+
+std::size_t SimulatedDevice::getFrameSize(unsigned int width, unsigned int height, ImgFrame::Type type) {
+    return python::getFrameSize(width, height, type);
+}
+
+void SimulatedDevice::addImgFrameStream(const std::string& name, unsigned int width, unsigned int height, ImgFrame::Type type, float fps) {
+    ImgFrame frame;
+    frame.setSize(width, height);
+    frame.setType(type);
+    frame.setData(pattern(getFrameSize(width, height, type)));
+    auto raw = std::static_pointer_cast<RawImgFrame>(static_cast<const ADatatype&>(frame).serialize());
+
+    // Planes follow each other without padding
+    const unsigned int plane = width * height;
+    raw->fb.p1Offset = 0;
+    raw->fb.p2Offset = 0;
+    raw->fb.p3Offset = 0;
+    switch(type) {
+        case ImgFrame::Type::RGB888p:
+        case ImgFrame::Type::BGR888p:
+            raw->fb.p2Offset = plane;
+            raw->fb.p3Offset = 2 * plane;
+            break;
+        case ImgFrame::Type::YUV420p:
+            raw->fb.p2Offset = plane;
+            raw->fb.p3Offset = plane + plane / 4;
+            break;
+        case ImgFrame::Type::NV12:
+        case ImgFrame::Type::NV21:
+            raw->fb.p2Offset = plane;
+            break;
+        default:
+            break;
+    }
+    addStream(name, fps, parsedFrom(raw));
+}
+
+void SimulatedDevice::addNNDataStream(const std::string& name, const std::map<std::string, std::size_t>& layers, float fps) {
+    NNData nn;
+    for(const auto& layer : layers) {
+        std::vector<float> values(layer.second);
+        for(std::size_t i = 0; i < values.size(); i++) values[i] = static_cast<float>(i % 256) / 256.0f;
+        nn.setLayer(layer.first, std::move(values));
+    }
+    addStream(name, fps, parsedFrom(std::static_pointer_cast<RawNNData>(static_cast<const ADatatype&>(nn).serialize())));
+}
+
+void SimulatedDevice::addIMUDataStream(const std::string& name, unsigned int packetsPerMessage, float rate) {
+    auto raw = std::make_shared<RawIMUData>();
+    for(unsigned int i = 0; i < packetsPerMessage; i++) {
+        IMUPacket packet;
+        packet.acceleroMeter.x = 0.0f;
+        packet.acceleroMeter.y = 0.0f;
+        packet.acceleroMeter.z = 9.81f;
+        packet.acceleroMeter.sequence = static_cast<std::int32_t>(i);
+        packet.acceleroMeter.accuracy = IMUReport::Accuracy::HIGH;
+        packet.gyroscope.x = 0.01f;
+        packet.gyroscope.y = 0.02f;
+        packet.gyroscope.z = 0.03f;
+        packet.gyroscope.sequence = static_cast<std::int32_t>(i);
+        packet.gyroscope.accuracy = IMUReport::Accuracy::HIGH;
+        raw->packets.push_back(packet);
+    }
+
+    auto copy = parsedFrom(raw);
+    addStream(name, rate, [copy](std::int64_t sequenceNum, std::chrono::steady_clock::time_point ts) {
+        auto msg = copy(sequenceNum, ts);
+        const auto ns = std::chrono::duration_cast<std::chrono::nanoseconds>(ts.time_since_epoch()).count();
+        Timestamp stamp{ns / 1000000000, ns % 1000000000};
+        for(auto& packet : std::static_pointer_cast<IMUData>(msg)->packets) {
+            packet.acceleroMeter.timestamp = packet.acceleroMeter.tsDevice = stamp;
+            packet.gyroscope.timestamp = packet.gyroscope.tsDevice = stamp;
+        }
+        return msg;
+    });
+}
+
+void SimulatedDevice::addBufferStream(const std::string& name, std::size_t size, float rate) {
+    auto raw = std::make_shared<RawBuffer>();
+    raw->data = pattern(size);
+    addStream(name, rate, parsedFrom(raw));
+}
+
+void SimulatedDevice::addStream(const std::string& name, float rate, Factory factory) {
+    auto queue = addOutputQueue(name);
+    auto counter = std::make_shared<std::atomic<std::uint64_t>>(0);
+    {
+        std::unique_lock<std::mutex> l(countersMtx);
+        counters[name] = counter;
+    }
+
+    startProducer([this, queue, counter, rate, factory]() {
+        using namespace std::chrono;
+        const auto start = steady_clock::now();
+        for(std::int64_t seq = 0; !isClosed(); seq++) {
+            if(rate > 0) {
+                const auto offset = duration_cast<steady_clock::duration>(duration<double>(seq / static_cast<double>(rate)));
+                if(!sleepUntil(start + offset)) return;
+            }
+            auto msg = factory(seq, steady_clock::now());
+            HostTimestamps::stampArrival(*msg);
+            // Blocks while a blocking queue is full, returns false once closed
+            if(!queue->send(msg)) return;
+            (*counter)++;
+        }
+    });
+}
+
+std::uint64_t SimulatedDevice::getNumProduced(const std::string& name) const {
+    std::unique_lock<std::mutex> l(countersMtx);
+    auto it = counters.find(name);
+    if(it == counters.end()) throw std::runtime_error("Queue for stream name '" + name + "' doesn't exist");
+    return *it->second;
+}
+
+}  // namespace python
+}  // namespace dai
@@ -0,0 +1,98 @@
+#pragma once
+
+// std
+#include <atomic>
+#include <chrono>
+#include <cstddef>
+#include <cstdint>
+#include <functional>
+#include <map>
+#include <memory>
+#include <mutex>
+#include <string>
+
+// depthai
+#include "depthai/pipeline/datatype/ImgFrame.hpp"
+
+// project
+#include "device/HostDevice.hpp"
+
+namespace dai {
+namespace python {
+
+/**
+ * Device stand-in producing synthetic messages (ImgFrame, NNData, IMUData, Buffer) on the host,
+ * with the queue surface of a Device (getOutputQueue, getInputQueue, getQueueEvent).
+ * Each output stream is fed by its own producer thread at a configured rate,
+ * every message being parsed from a prebuilt serialized packet, as DataOutputQueue parses packets read from a device.
+ * Input queues discard sent messages.
+ *
+ * Queues are host MessageQueue instances rather than DataOutputQueue / DataInputQueue, which can only be backed by an
+ * XLink connection to a device. Queue behavior (size, blocking, callbacks, events) matches, but XLink transfer cost isn't simulated.
+ */
+class SimulatedDevice : public HostDevice {
+   public:
+    SimulatedDevice() = default;
+    ~SimulatedDevice() override;
+
+    /**
+     * Adds a stream of image frames and starts producing
+     *
+     * @param name Output queue name
+     * @param width Frame width
+     * @param height Frame height
+     * @param type Frame type, which together with size determines the payload size
+     * @param fps Messages per second, 0 or negative to produce as fast as possible
+     */
+    void addImgFrameStream(const std::string& name, unsigned int width, unsigned int height, ImgFrame::Type type, float fps = 30.0f);
+
+    /**
+     * Adds a stream of neural network results and starts producing
+     *
+     * @param name Output queue name
+     * @param layers Number of FP16 elements of each output layer, by layer name
+     * @param fps Messages per second, 0 or negative to produce as fast as possible
+     */
+    void addNNDataStream(const std::string& name, const std::map<std::string, std::size_t>& layers, float fps = 30.0f);
+
+    /**
+     * Adds a stream of IMU data and starts producing
+     *
+     * @param name Output queue name
+     * @param packetsPerMessage Number of IMU packets (accelerometer and gyroscope reports) in each message
+     * @param rate Messages per second, 0 or negative to produce as fast as possible
+     */
+    void addIMUDataStream(const std::string& name, unsigned int packetsPerMessage = 1, float rate = 400.0f);
+
+    /**
+     * Adds a stream of raw buffers and starts producing
+     *
+     * @param name Output queue name
+     * @param size Buffer size in bytes
+     * @param rate Messages per second, 0 or negative to produce as fast as possible
+     */
+    void addBufferStream(const std::string& name, std::size_t size, float rate = 30.0f);
+
+    /**
+     * Retrieves number of messages produced on a stream so far
+     */
+    std::uint64_t getNumProduced(const std::string& name) const;
+
+    /**
+     * Computes payload size of a frame
+     *
+     * @returns Size in bytes, as expected by ImgFrame.getFrame
+     */
+    static std::size_t getFrameSize(unsigned int width, unsigned int height, ImgFrame::Type type);
+
+   private:
+    using Factory = std::function<std::shared_ptr<ADatatype>(std::int64_t sequenceNum, std::chrono::steady_clock::time_point ts)>;
+
+    mutable std::mutex countersMtx;
+    std::map<std::string, std::shared_ptr<std::atomic<std::uint64_t>>> counters;
+
+    void addStream(const std::string& name, float rate, Factory factory);
+};
+
+}  // namespace python
+}  // namespace dai
@@ -38,6 +38,7 @@ void LogBindings::bind(pybind11::module& m, void* pCallstack){
     ;
 
     logMessage
+        .def(py::init<>())
         .def_readwrite("nodeIdName", &LogMessage::nodeIdName)
         .def_readwrite("level", &LogMessage::level)
         .def_readwrite("time", &LogMessage::time)
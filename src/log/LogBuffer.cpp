@@ -0,0 +1,166 @@
+#include "LogBuffer.hpp"
+
+// std
+#include <algorithm>
+#include <iomanip>
+#include <stdexcept>
+#include <unordered_map>
+
+namespace dai {
+namespace python {
+
+namespace {
+
+// Maximum number of messages pending to be written by the file sink
+constexpr std::size_t SINK_MAX_PENDING = 1 << 14;
+
+constexpr const char* LOG_LEVEL_NAMES[] = {"trace", "debug", "info", "warn", "error", "critical", "off"};
+
+std::mutex registryMtx;
+// Buffers are owned by log callbacks of their devices, so an expired entry means the device was destroyed
+std::unordered_map<const DeviceBase*, std::weak_ptr<LogBuffer>> registry;
+
+void writeMessage(std::ostream& out, const LogMessage& msg) {
+    out << '[' << msg.time.sec << '.' << std::setfill('0') << std::setw(3) << msg.time.nsec / 1000000 << "] [" << msg.nodeIdName << "] ["
+        << getLogLevelName(msg.level) << "] " << msg.payload << '\n';
+}
+
+}  // namespace
+
+const char* getLogLevelName(LogLevel level) {
+    const auto index = static_cast<std::size_t>(level);
+    return index < sizeof(LOG_LEVEL_NAMES) / sizeof(LOG_LEVEL_NAMES[0]) ? LOG_LEVEL_NAMES[index] : "unknown";
+}
+
+constexpr std::size_t LogBuffer::DEFAULT_CAPACITY;
+
+std::shared_ptr<LogBuffer> LogBuffer::attach(DeviceBase& device) {
+    std::unique_lock<std::mutex> l(registryMtx);
+    auto it = registry.find(&device);
+    if(it != registry.end()) {
+        if(auto buffer = it->second.lock()) return buffer;
+    }
+
+    auto buffer = std::make_shared<LogBuffer>();
+    device.addLogCallback([buffer](LogMessage msg) { buffer->push(msg); });
+    registry[&device] = buffer;
+    return buffer;
+}
+
+std::shared_ptr<LogBuffer> LogBuffer::find(const DeviceBase& device) {
+    std::unique_lock<std::mutex> l(registryMtx);
+    auto it = registry.find(&device);
+    if(it == registry.end()) return nullptr;
+    auto buffer = it->second.lock();
+    if(buffer == nullptr) registry.erase(it);
+    return buffer;
+}
+
+LogBuffer::LogBuffer(std::size_t capacity) : capacity(capacity) {}
+
+LogBuffer::~LogBuffer() {
+    removeFileSink();
+}
+
+void LogBuffer::push(const LogMessage& msg) {
+    {
+        std::unique_lock<std::mutex> l(mtx);
+        if(capacity > 0) {
+            if(messages.size() >= capacity) {
+                messages.pop_front();
+                numDropped++;
+            }
+            messages.push_back(msg);
+        }
+    }
+
+    if(sinkActive) {
+        {
+            std::unique_lock<std::mutex> l(sinkMtx);
+            if(sinkPending.size() >= SINK_MAX_PENDING) {
+                numSinkDropped++;
+                return;
+            }
+            sinkPending.push_back(msg);
+        }
+        sinkCv.notify_one();
+    }
+}
+
+std::vector<LogMessage> LogBuffer::pop(std::size_t maxCount) {
+    std::unique_lock<std::mutex> l(mtx);
+    const std::size_t count = maxCount == 0 ? messages.size() : std::min(maxCount, messages.size());
+    std::vector<LogMessage> out(std::make_move_iterator(messages.begin()), std::make_move_iterator(messages.begin() + count));
+    messages.erase(messages.begin(), messages.begin() + count);
+    return out;
+}
+
+void LogBuffer::setCapacity(std::size_t capacity) {
+    std::unique_lock<std::mutex> l(mtx);
+    this->capacity = capacity;
+    while(messages.size() > capacity) {
+        messages.pop_front();
+        numDropped++;
+    }
+}
+
+std::size_t LogBuffer::getCapacity() const {
+    std::unique_lock<std::mutex> l(mtx);
+    return capacity;
+}
+
+std::size_t LogBuffer::getSize() const {
+    std::unique_lock<std::mutex> l(mtx);
+    return messages.size();
+}
+
+std::uint64_t LogBuffer::getNumDropped() const {
+    return numDropped;
+}
+
+void LogBuffer::setFileSink(const dai::Path& path) {
+    removeFileSink();
+
+    std::unique_lock<std::mutex> l(sinkMtx);
+    sinkFile.open(path, std::ios::app);
+    if(!sinkFile) throw std::runtime_error("Cannot open log file '" + path.u8string() + "' for writing");
+    sinkRunning = true;
+    sinkActive = true;
+    sinkThread = std::thread(&LogBuffer::sinkLoop, this);
+}
+
+void LogBuffer::removeFileSink() {
+    {
+        std::unique_lock<std::mutex> l(sinkMtx);
+        sinkActive = false;
+        sinkRunning = false;
+    }
+    sinkCv.notify_one();
+    if(sinkThread.joinable()) sinkThread.join();
+
+    std::unique_lock<std::mutex> l(sinkMtx);
+    if(sinkFile.is_open()) sinkFile.close();
+}
+
+std::uint64_t LogBuffer::getNumSinkDropped() const {
+    return numSinkDropped;
+}
+
+void LogBuffer::sinkLoop() {
+    std::deque<LogMessage> batch;
+    while(true) {
+        {
+            std::unique_lock<std::mutex> l(sinkMtx);
+            sinkCv.wait(l, [this]() { return !sinkPending.empty() || !sinkRunning; });
+            batch.swap(sinkPending);
+            if(batch.empty() && !sinkRunning) break;
+        }
+        // Written without holding the lock, so the connection thread isn't blocked by disk writes
+        for(const auto& msg : batch) writeMessage(sinkFile, msg);
+        sinkFile.flush();
+        batch.clear();
+    }
+}
+
+}  // namespace python
+}  // namespace dai
@@ -0,0 +1,130 @@
+#pragma once
+
+// std
+#include <atomic>
+#include <condition_variable>
+#include <cstddef>
+#include <cstdint>
+#include <deque>
+#include <fstream>
+#include <memory>
+#include <mutex>
+#include <string>
+#include <thread>
+#include <vector>
+
+// depthai
+#include "depthai/device/DeviceBase.hpp"
+#include "depthai/utility/Path.hpp"
+#include "depthai-shared/log/LogMessage.hpp"
+
+namespace dai {
+namespace python {
+
+/**
+ * Retrieves lowercase name of given log level, as written by the log file sink and exported as metrics label
+ *
+ * @returns Level name or "unknown" for out of range values
+ */
+const char* getLogLevelName(LogLevel level);
+
+/**
+ * Bounded buffer of device log messages, filled by a native log callback on the connection thread.
+ * Messages are retrieved in batches, and optionally written to a file by a dedicated writer thread,
+ * so verbose device logging doesn't invoke Python per message.
+ * Once full, the oldest messages are overwritten and counted as dropped.
+ *
+ * A buffer is attached to a device on first use (attach), only messages received from then on are captured.
+ */
+class LogBuffer {
+   public:
+    /// Default number of messages retained
+    static constexpr std::size_t DEFAULT_CAPACITY = 1024;
+
+    /**
+     * Retrieves the log buffer of given device, attaching one if the device isn't buffered yet
+     */
+    static std::shared_ptr<LogBuffer> attach(DeviceBase& device);
+
+    /**
+     * Retrieves the log buffer of given device
+     *
+     * @returns Log buffer or nullptr if device isn't buffered
+     */
+    static std::shared_ptr<LogBuffer> find(const DeviceBase& device);
+
+    explicit LogBuffer(std::size_t capacity = DEFAULT_CAPACITY);
+    ~LogBuffer();
+
+    /**
+     * Adds a message to the buffer and file sink
+     */
+    void push(const LogMessage& msg);
+
+    /**
+     * Retrieves and removes buffered messages, oldest first
+     *
+     * @param maxCount Maximum number of messages retrieved, 0 for all
+     */
+    std::vector<LogMessage> pop(std::size_t maxCount = 0);
+
+    /**
+     * Sets maximum number of messages retained. Oldest messages are dropped if over capacity.
+     * Capacity of 0 disables buffering (eg. when only the file sink is used)
+     */
+    void setCapacity(std::size_t capacity);
+
+    /**
+     * Retrieves maximum number of messages retained
+     */
+    std::size_t getCapacity() const;
+
+    /**
+     * Retrieves number of messages currently buffered
+     */
+    std::size_t getSize() const;
+
+    /**
+     * Retrieves number of messages dropped because the buffer was full
+     */
+    std::uint64_t getNumDropped() const;
+
+    /**
+     * Starts writing messages into a file on a writer thread, replacing previous file sink
+     *
+     * @param path Path of the log file, appended to
+     */
+    void setFileSink(const dai::Path& path);
+
+    /**
+     * Stops writing messages into a file, after writing out pending ones
+     */
+    void removeFileSink();
+
+    /**
+     * Retrieves number of messages dropped because the file sink couldn't keep up
+     */
+    std::uint64_t getNumSinkDropped() const;
+
+   private:
+    // Ring buffer retrieved by pop
+    mutable std::mutex mtx;
+    std::deque<LogMessage> messages;
+    std::size_t capacity;
+    std::atomic<std::uint64_t> numDropped{0};
+
+    // File sink
+    std::mutex sinkMtx;
+    std::condition_variable sinkCv;
+    std::deque<LogMessage> sinkPending;
+    std::ofstream sinkFile;
+    std::thread sinkThread;
+    bool sinkRunning = false;
+    std::atomic<bool> sinkActive{false};
+    std::atomic<std::uint64_t> numSinkDropped{0};
+
+    void sinkLoop();
+};
+
+}  // namespace python
+}  // namespace dai
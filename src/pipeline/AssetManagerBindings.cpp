@@ -3,14 +3,59 @@
 // depthai
 #include "depthai/pipeline/AssetManager.hpp"
 
+// project
+#include "pipeline/AssetRegistry.hpp"
+
+namespace {
+
+// Asset managers record themselves on assets they return, so a write to a shared asset detaches it in the right one
+constexpr const char* ASSET_MANAGER_ATTR = "_assetManager";
+
+py::object withAssetManager(py::object asset, py::object manager) {
+    if(!asset.is_none()) asset.attr(ASSET_MANAGER_ATTR) = manager;
+    return asset;
+}
+
+// Points an Asset Python object to another Asset
+void rebind(py::handle obj, const std::shared_ptr<dai::Asset>& asset) {
+    auto* inst = reinterpret_cast<py::detail::instance*>(obj.ptr());
+    auto vh = inst->get_value_and_holder(py::detail::get_type_info(typeid(dai::Asset)));
+    py::detail::deregister_instance(inst, vh.value_ptr(), vh.type);
+    vh.holder<std::shared_ptr<dai::Asset>>() = asset;
+    vh.value_ptr() = asset.get();
+    py::detail::register_instance(inst, asset.get(), vh.type);
+}
+
+// Modifies an asset. Assets shared across asset managers (see AssetRegistry) are copied on write:
+// the asset manager the asset was retrieved from gets a modified copy, registered again, which the Python object then refers to
+template <typename Modify>
+void modifyAsset(py::object& obj, Modify modify) {
+    auto asset = obj.cast<std::shared_ptr<dai::Asset>>();
+    if(!dai::python::AssetRegistry::isRegistered(*asset)) {
+        modify(*asset);
+        return;
+    }
+
+    dai::AssetManager* manager = nullptr;
+    if(py::hasattr(obj, ASSET_MANAGER_ATTR)) manager = obj.attr(ASSET_MANAGER_ATTR).cast<dai::AssetManager*>();
+    auto copy = dai::python::AssetRegistry::detach(manager, asset);
+    modify(*copy);
+    if(manager != nullptr && manager->get(copy->key) == copy) copy = dai::python::AssetRegistry::intern(*manager, copy->key);
+    rebind(obj, copy);
+}
+
+}  // namespace
+
 void AssetManagerBindings::bind(pybind11::module& m, void* pCallstack){
 
     using namespace dai;
 
 
     // Type definitions
-    py::class_<Asset, std::shared_ptr<Asset>> asset(m, "Asset", DOC(dai, Asset));
+    py::class_<Asset, std::shared_ptr<Asset>> asset(m, "Asset", py::dynamic_attr(), DOC(dai, Asset));
     py::class_<AssetManager> assetManager(m, "AssetManager", DOC(dai, AssetManager));
+    py::class_<python::AssetRegistry> assetRegistry(m, "AssetRegistry", "Process wide registry sharing assets with equal content (NN blobs, tuning blobs, scripts) across pipelines. Shared assets are copied on write");
+    py::class_<python::AssetRegistry::Stats> assetRegistryStats(assetRegistry, "Stats", "Asset deduplication statistics");
 
 
     ///////////////////////////////////////////////////////////////////////
@@ -33,28 +78,78 @@ void AssetManagerBindings::bind(pybind11::module& m, void* pCallstack){
         .def(py::init<std::string>())
         .def_readonly("key", &Asset::key)
         // numpy array access - zero copy on access
+        // Assets held by asset managers are shared across pipelines (see AssetRegistry), thus their data is read-only and setters copy on write
         .def_property("data", [](py::object &obj){
-            dai::Asset &a = obj.cast<dai::Asset&>();
-            return py::array_t<std::uint8_t>(a.data.size(), a.data.data(), obj);
+            auto a = obj.cast<std::shared_ptr<dai::Asset>>();
+            // Array keeps the asset alive itself, as the Python object refers to a copy after a write
+            auto* owner = new std::shared_ptr<dai::Asset>(a);
+            py::capsule base(owner, [](void* p){ delete reinterpret_cast<std::shared_ptr<dai::Asset>*>(p); });
+            py::array_t<std::uint8_t> array(a->data.size(), a->data.data(), base);
+            if(python::AssetRegistry::isRegistered(*a)) array.attr("setflags")(py::arg("write") = false);
+            return array;
         }, [](py::object &obj, py::array_t<std::uint8_t, py::array::c_style> array){
-            dai::Asset &a = obj.cast<dai::Asset&>();
-            a.data = {array.data(), array.data() + array.size()};
+            modifyAsset(obj, [&array](dai::Asset& a) { a.data = {array.data(), array.data() + array.size()}; });
+        })
+        .def_property("alignment", [](const Asset& a) {
+            return a.alignment;
+        }, [](py::object &obj, int alignment) {
+            modifyAsset(obj, [alignment](dai::Asset& a) { a.alignment = alignment; });
+        })
+    ;
+
+    // Bind AssetRegistry
+    assetRegistryStats
+        .def(py::init<>())
+        .def_readonly("numAssets", &python::AssetRegistry::Stats::numAssets, "Number of unique assets alive")
+        .def_readonly("numBytes", &python::AssetRegistry::Stats::numBytes, "Total size of unique assets alive")
+        .def_readonly("numDeduplicated", &python::AssetRegistry::Stats::numDeduplicated, "Number of times an existing asset was reused")
+        .def_readonly("numBytesSaved", &python::AssetRegistry::Stats::numBytesSaved, "Bytes not allocated thanks to reuse")
+        .def("__repr__", [](const python::AssetRegistry::Stats& s) {
+            return "AssetRegistry.Stats(numAssets=" + std::to_string(s.numAssets) + ", numBytes=" + std::to_string(s.numBytes)
+                   + ", numDeduplicated=" + std::to_string(s.numDeduplicated) + ", numBytesSaved=" + std::to_string(s.numBytesSaved) + ")";
         })
-        .def_readwrite("alignment", &Asset::alignment)
+    ;
+    assetRegistry
+        .def_static("getStats", &python::AssetRegistry::getStats, "Retrieves statistics of assets deduplicated across asset managers")
     ;
 
     // Bind AssetManager
     assetManager
         .def(py::init<>())
         .def("addExisting", &AssetManager::addExisting, py::arg("assets"), DOC(dai, AssetManager, addExisting))
-        .def("set", static_cast<std::shared_ptr<dai::Asset> (AssetManager::*)(Asset)>(&AssetManager::set), py::arg("asset"), DOC(dai, AssetManager, set))
-        .def("set", static_cast<std::shared_ptr<dai::Asset> (AssetManager::*)(const std::string&, Asset)>(&AssetManager::set), py::arg("key"), py::arg("asset"), DOC(dai, AssetManager, set, 2))
-        .def("set", static_cast<std::shared_ptr<dai::Asset> (AssetManager::*)(const std::string& key, const dai::Path& path, int alignment)>(&AssetManager::set), py::arg("key"), py::arg("path"), py::arg("alignment") = 64, DOC(dai, AssetManager, set, 3))
-        .def("set", static_cast<std::shared_ptr<dai::Asset> (AssetManager::*)(const std::string& key, const std::vector<std::uint8_t>& data, int alignment)>(&AssetManager::set), py::arg("key"), py::arg("data"), py::arg("alignment") = 64, DOC(dai, AssetManager, set, 4))
-        .def("get", static_cast<std::shared_ptr<const Asset> (AssetManager::*)(const std::string&) const>(&AssetManager::get), py::arg("key"), DOC(dai, AssetManager, get))
-        .def("get", static_cast<std::shared_ptr<Asset> (AssetManager::*)(const std::string&)>(&AssetManager::get), py::arg("key"), DOC(dai, AssetManager, get, 2))
-        .def("getAll", static_cast<std::vector<std::shared_ptr<const Asset>> (AssetManager::*)() const>(&AssetManager::getAll), DOC(dai, AssetManager, getAll))
-        .def("getAll", static_cast<std::vector<std::shared_ptr<Asset>> (AssetManager::*)()>(&AssetManager::getAll), DOC(dai, AssetManager, getAll, 2))
+        // Assets set are deduplicated by content across asset managers, see AssetRegistry
+        .def("set", [](py::object self, Asset asset) {
+            auto& am = self.cast<AssetManager&>();
+            const auto key = asset.key;
+            am.set(std::move(asset));
+            return withAssetManager(py::cast(python::AssetRegistry::intern(am, key)), self);
+        }, py::arg("asset"), DOC(dai, AssetManager, set))
+        .def("set", [](py::object self, const std::string& key, Asset asset) {
+            auto& am = self.cast<AssetManager&>();
+            am.set(key, std::move(asset));
+            return withAssetManager(py::cast(python::AssetRegistry::intern(am, key)), self);
+        }, py::arg("key"), py::arg("asset"), DOC(dai, AssetManager, set, 2))
+        .def("set", [](py::object self, const std::string& key, const dai::Path& path, int alignment) {
+            auto& am = self.cast<AssetManager&>();
+            // Reuses an asset loaded from the same unmodified file without reading it again
+            auto asset = python::AssetRegistry::load(key, path, alignment);
+            am.remove(key);
+            am.addExisting({asset});
+            return withAssetManager(py::cast(asset), self);
+        }, py::arg("key"), py::arg("path"), py::arg("alignment") = 64, DOC(dai, AssetManager, set, 3))
+        .def("set", [](py::object self, const std::string& key, const std::vector<std::uint8_t>& data, int alignment) {
+            auto& am = self.cast<AssetManager&>();
+            am.set(key, data, alignment);
+            return withAssetManager(py::cast(python::AssetRegistry::intern(am, key)), self);
+        }, py::arg("key"), py::arg("data"), py::arg("alignment") = 64, DOC(dai, AssetManager, set, 4))
+        .def("get", [](py::object self, const std::string& key) {
+            return withAssetManager(py::cast(self.cast<AssetManager&>().get(key)), self);
+        }, py::arg("key"), DOC(dai, AssetManager, get, 2))
+        .def("getAll", [](py::object self) {
+            py::list assets;
+            for(auto& asset : self.cast<AssetManager&>().getAll()) assets.append(withAssetManager(py::cast(asset), self));
+            return assets;
+        }, DOC(dai, AssetManager, getAll, 2))
         .def("size", &AssetManager::size, DOC(dai, AssetManager, size))
         .def("remove", &AssetManager::remove, py::arg("key"), DOC(dai, AssetManager, remove))
     ;
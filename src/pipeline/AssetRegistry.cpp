@@ -0,0 +1,171 @@
+#include "AssetRegistry.hpp"
+
+// std
+#include <cstdint>
+#include <cstring>
+#include <ctime>
+#include <fstream>
+#include <iterator>
+#include <mutex>
+#include <stdexcept>
+#include <unordered_map>
+#include <vector>
+
+#include <sys/stat.h>
+#include <sys/types.h>
+
+// project
+#include "utility/CacheEntry.hpp"
+
+namespace dai {
+namespace python {
+
+namespace {
+
+std::mutex mtx;
+// By key, alignment, size and content hash. Colliding hashes are told apart by comparing content
+std::unordered_multimap<std::string, std::weak_ptr<Asset>> byContent;
+// By key, alignment and file identity
+std::unordered_map<std::string, std::weak_ptr<Asset>> byFile;
+// By address, to tell registered assets apart
+std::unordered_map<const Asset*, std::weak_ptr<Asset>> registered;
+std::size_t numDeduplicated = 0;
+std::size_t numBytesSaved = 0;
+
+std::string contentKey(const Asset& asset) {
+    const auto hash = CacheEntry::fnv1a(asset.data.data(), asset.data.size());
+    return asset.key + '\0' + std::to_string(asset.alignment) + '\0' + std::to_string(asset.data.size()) + '\0' + CacheEntry::toHex(hash);
+}
+
+// Files changed more recently than this aren't identified by their timestamps
+constexpr std::time_t RACY_SECONDS = 2;
+
+// Identity of a file, empty if it can't be determined reliably
+std::string fileIdentity(const dai::Path& path) {
+#if defined(_WIN32)
+    // Windows stat only reports whole second timestamps, which miss quick rewrites, so files are always read
+    (void)path;
+    return {};
+#else
+    struct stat st;
+    if(stat(path.native().c_str(), &st) != 0) return {};
+    #if defined(__APPLE__)
+    const auto& mtime = st.st_mtimespec;
+    const auto& ctime = st.st_ctimespec;
+    #else
+    const auto& mtime = st.st_mtim;
+    const auto& ctime = st.st_ctim;
+    #endif
+    // Timestamps are updated with a coarse clock, so a rewrite right after a load may keep them unchanged.
+    // Recently changed files are thus always read, as git does for racily clean files
+    if(static_cast<std::time_t>(ctime.tv_sec) + RACY_SECONDS > std::time(nullptr)) return {};
+    // Status change time can't be set by users, so rewrites restoring the modification time are caught as well
+    const auto timestamp = [](const struct timespec& ts) { return std::to_string(static_cast<long long>(ts.tv_sec)) + '.' + std::to_string(static_cast<long>(ts.tv_nsec)); };
+    return path.u8string() + '\0' + std::to_string(static_cast<unsigned long long>(st.st_dev)) + '\0' + std::to_string(static_cast<unsigned long long>(st.st_ino))
+           + '\0' + std::to_string(static_cast<long long>(st.st_size)) + '\0' + timestamp(mtime) + '\0' + timestamp(ctime);
+#endif
+}
+
+void prune() {
+    // Must be called with mtx held
+    for(auto it = byContent.begin(); it != byContent.end();) it = it->second.expired() ? byContent.erase(it) : std::next(it);
+    for(auto it = byFile.begin(); it != byFile.end();) it = it->second.expired() ? byFile.erase(it) : std::next(it);
+    for(auto it = registered.begin(); it != registered.end();) it = it->second.expired() ? registered.erase(it) : std::next(it);
+}
+
+}  // namespace
+
+std::shared_ptr<Asset> AssetRegistry::intern(const std::shared_ptr<Asset>& asset) {
+    if(asset == nullptr) return asset;
+    const auto key = contentKey(*asset);
+
+    std::unique_lock<std::mutex> l(mtx);
+    auto range = byContent.equal_range(key);
+    for(auto it = range.first; it != range.second; ++it) {
+        auto existing = it->second.lock();
+        if(existing == asset) return asset;
+        if(existing != nullptr && existing->data == asset->data) {
+            numDeduplicated++;
+            numBytesSaved += asset->data.size();
+            return existing;
+        }
+    }
+    prune();
+    byContent.emplace(key, asset);
+    registered[asset.get()] = asset;
+    return asset;
+}
+
+std::shared_ptr<Asset> AssetRegistry::intern(AssetManager& manager, const std::string& key) {
+    auto asset = manager.get(key);
+    auto interned = intern(asset);
+    if(interned != asset) {
+        manager.remove(key);
+        manager.addExisting({interned});
+    }
+    return interned;
+}
+
+std::shared_ptr<Asset> AssetRegistry::load(const std::string& key, const dai::Path& path, int alignment) {
+    const auto identity = fileIdentity(path);
+    const auto fileKey = key + '\0' + std::to_string(alignment) + '\0' + identity;
+    if(!identity.empty()) {
+        std::unique_lock<std::mutex> l(mtx);
+        auto it = byFile.find(fileKey);
+        if(it != byFile.end()) {
+            if(auto existing = it->second.lock()) {
+                numDeduplicated++;
+                numBytesSaved += existing->data.size();
+                return existing;
+            }
+        }
+    }
+
+    std::ifstream stream(path, std::ios::in | std::ios::binary);
+    if(!stream.is_open()) throw std::runtime_error("Cannot load asset, file at path " + path.u8string() + " doesn't exist.");
+    auto asset = std::make_shared<Asset>(key);
+    asset->alignment = alignment;
+    asset->data = std::vector<std::uint8_t>(std::istreambuf_iterator<char>(stream), {});
+
+    asset = intern(asset);
+    if(!identity.empty()) {
+        std::unique_lock<std::mutex> l(mtx);
+        byFile[fileKey] = asset;
+    }
+    return asset;
+}
+
+std::shared_ptr<Asset> AssetRegistry::detach(AssetManager* manager, const std::shared_ptr<Asset>& asset) {
+    auto copy = std::make_shared<Asset>(*asset);
+    // Only if the asset manager still holds this asset, it might have been replaced or removed since
+    if(manager != nullptr && manager->get(asset->key) == asset) {
+        manager->remove(asset->key);
+        manager->addExisting({copy});
+    }
+    return copy;
+}
+
+bool AssetRegistry::isRegistered(const Asset& asset) {
+    std::unique_lock<std::mutex> l(mtx);
+    auto it = registered.find(&asset);
+    // An expired entry may refer to a freed asset whose address got reused
+    return it != registered.end() && it->second.lock().get() == &asset;
+}
+
+AssetRegistry::Stats AssetRegistry::getStats() {
+    std::unique_lock<std::mutex> l(mtx);
+    prune();
+    Stats stats;
+    for(const auto& kv : byContent) {
+        if(auto asset = kv.second.lock()) {
+            stats.numAssets++;
+            stats.numBytes += asset->data.size();
+        }
+    }
+    stats.numDeduplicated = numDeduplicated;
+    stats.numBytesSaved = numBytesSaved;
+    return stats;
+}
+
+}  // namespace python
+}  // namespace dai
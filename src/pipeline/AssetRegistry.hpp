@@ -0,0 +1,81 @@
+#pragma once
+
+// std
+#include <cstddef>
+#include <memory>
+#include <string>
+
+// depthai
+#include "depthai/pipeline/AssetManager.hpp"
+#include "depthai/utility/Path.hpp"
+
+namespace dai {
+namespace python {
+
+/**
+ * Process wide registry deduplicating assets (NN blobs, tuning blobs, scripts, ...) by content,
+ * so asset managers of several pipelines holding the same data share a single Asset.
+ * Assets loaded from files are additionally looked up by file identity (path, device, inode, size, modification and status change time), skipping the read.
+ *
+ * Assets are held weakly, an asset is freed once no asset manager uses it.
+ * Registered assets are shared and must not be modified in place, as the change would be visible to all pipelines using them
+ * and would leave the registry indexing them by stale content. They are copied on write instead, see detach().
+ */
+class AssetRegistry {
+   public:
+    struct Stats {
+        /// Number of unique assets alive
+        std::size_t numAssets = 0;
+        /// Total size of unique assets alive
+        std::size_t numBytes = 0;
+        /// Number of times an existing asset was reused
+        std::size_t numDeduplicated = 0;
+        /// Bytes not allocated thanks to reuse
+        std::size_t numBytesSaved = 0;
+    };
+
+    /**
+     * Retrieves a registered asset with the same key, alignment and data, registering the given one if there is none
+     */
+    static std::shared_ptr<Asset> intern(const std::shared_ptr<Asset>& asset);
+
+    /**
+     * Replaces an asset of an asset manager with its registered equivalent
+     *
+     * @returns Asset stored under the key afterwards, nullptr if there is none
+     */
+    static std::shared_ptr<Asset> intern(AssetManager& manager, const std::string& key);
+
+    /**
+     * Loads a file as an asset, reusing a registered asset loaded from the same unmodified file
+     *
+     * @param key Asset key
+     * @param path Path of the file
+     * @param alignment Alignment of asset data in asset storage
+     */
+    static std::shared_ptr<Asset> load(const std::string& key, const dai::Path& path, int alignment);
+
+    /**
+     * Detaches a registered asset before it is modified (copy-on-write).
+     * The asset manager holding it gets a private, unregistered copy instead, other asset managers keep sharing the original.
+     * Once modified, the copy can be registered again with intern(manager, key)
+     *
+     * @param manager Asset manager the asset was retrieved from, or nullptr
+     * @param asset Registered asset
+     * @returns Private copy of the asset
+     */
+    static std::shared_ptr<Asset> detach(AssetManager* manager, const std::shared_ptr<Asset>& asset);
+
+    /**
+     * Checks whether an asset is registered, and thus possibly shared with other asset managers
+     */
+    static bool isRegistered(const Asset& asset);
+
+    /**
+     * Retrieves deduplication statistics
+     */
+    static Stats getStats();
+};
+
+}  // namespace python
+}  // namespace dai
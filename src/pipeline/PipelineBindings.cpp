@@ -33,6 +33,13 @@
 // depthai-shared
 #include "depthai-shared/properties/GlobalProperties.hpp"
 
+// project
+#include "utility/Initialization.hpp"
+#include "pipeline/AssetRegistry.hpp"
+#include "pipeline/PipelineBuilder.hpp"
+#include "pipeline/ResourceEstimator.hpp"
+#include "pipeline/StallAnalyzer.hpp"
+
 std::shared_ptr<dai::Node> createNode(dai::Pipeline& p, py::object class_){
     auto nodeCreateMap = NodeBindings::getNodeCreateMap();
     for(auto& kv : nodeCreateMap){
@@ -51,6 +58,13 @@ void PipelineBindings::bind(pybind11::module& m, void* pCallstack){
     // Type definitions
     py::class_<GlobalProperties> globalProperties(m, "GlobalProperties", DOC(dai, GlobalProperties));
     py::class_<Pipeline> pipeline(m, "Pipeline", DOC(dai, Pipeline, 2));
+    py::class_<python::ResourceEstimate> resourceEstimate(m, "ResourceEstimate", "Static estimate of XLink bandwidth and device memory required by a pipeline");
+    py::class_<python::ResourceEstimate::Stream> resourceEstimateStream(resourceEstimate, "Stream", "Stream sent to the host by an XLinkOut node");
+    py::class_<python::ResourceEstimate::Pool> resourceEstimatePool(resourceEstimate, "Pool", "Pool of messages preallocated on the device by a node");
+    py::class_<python::StallReport> stallReport(m, "StallReport", "Configurations of a pipeline which may stall or deadlock it on the device");
+    py::enum_<python::StallReport::Severity> stallReportSeverity(stallReport, "Severity");
+    py::enum_<python::StallReport::Type> stallReportType(stallReport, "Type");
+    py::class_<python::StallReport::Issue> stallReportIssue(stallReport, "Issue");
 
     ///////////////////////////////////////////////////////////////////////
     ///////////////////////////////////////////////////////////////////////
@@ -79,9 +93,73 @@ void PipelineBindings::bind(pybind11::module& m, void* pCallstack){
         .def_readwrite("sippDmaBufferSize", &GlobalProperties::sippDmaBufferSize, DOC(dai, GlobalProperties, sippDmaBufferSize))
         ;
 
+    // Bind resource estimate
+    resourceEstimateStream
+        .def(py::init<>())
+        .def_readwrite("streamName", &python::ResourceEstimate::Stream::streamName)
+        .def_readwrite("nodeId", &python::ResourceEstimate::Stream::nodeId)
+        .def_readwrite("messageSize", &python::ResourceEstimate::Stream::messageSize, "Estimated message size, including metadata [B]")
+        .def_readwrite("fps", &python::ResourceEstimate::Stream::fps, "Estimated message rate [Hz]")
+        .def_readwrite("bytesPerSecond", &python::ResourceEstimate::Stream::bytesPerSecond, "Estimated throughput [B/s]")
+        .def_readwrite("estimated", &python::ResourceEstimate::Stream::estimated, "False if a node feeding the stream couldn't be estimated, the stream then isn't included in totals")
+        .def("__repr__", [](const python::ResourceEstimate::Stream& s) {
+            return "<ResourceEstimate.Stream '" + s.streamName + "' " + std::to_string(s.bytesPerSecond) + " B/s>";
+        })
+        ;
+    resourceEstimatePool
+        .def(py::init<>())
+        .def_readwrite("nodeId", &python::ResourceEstimate::Pool::nodeId)
+        .def_readwrite("nodeName", &python::ResourceEstimate::Pool::nodeName)
+        .def_readwrite("name", &python::ResourceEstimate::Pool::name)
+        .def_readwrite("numFrames", &python::ResourceEstimate::Pool::numFrames)
+        .def_readwrite("frameSize", &python::ResourceEstimate::Pool::frameSize)
+        .def_readwrite("size", &python::ResourceEstimate::Pool::size)
+        ;
+    resourceEstimate
+        .def(py::init<>())
+        .def_readwrite("streams", &python::ResourceEstimate::streams)
+        .def_readwrite("pools", &python::ResourceEstimate::pools)
+        .def_readwrite("totalBytesPerSecond", &python::ResourceEstimate::totalBytesPerSecond, "Sum of throughputs of estimated streams [B/s]")
+        .def_readwrite("linkBytesPerSecond", &python::ResourceEstimate::linkBytesPerSecond, "Usable link throughput the estimate was made for [B/s]")
+        .def_readwrite("linkUtilization", &python::ResourceEstimate::linkUtilization, "Ratio of total to usable link throughput, above 1 the link is saturated")
+        .def_readwrite("poolMemory", &python::ResourceEstimate::poolMemory, "Sum of pool sizes [B]")
+        .def_readwrite("warnings", &python::ResourceEstimate::warnings, "Nodes and outputs which couldn't be estimated")
+        .def_static("getLinkBytesPerSecond", &python::ResourceEstimator::getLinkBytesPerSecond, py::arg("usbSpeed"), "Retrieves usable link throughput of a USB speed [B/s]")
+        ;
+
+    // Bind stall report
+    stallReportSeverity
+        .value("WARNING", python::StallReport::Severity::WARNING, "Producers may be throttled to the rate of the slowest consumer")
+        .value("ERROR", python::StallReport::Severity::ERROR, "Pipeline may freeze")
+        ;
+    stallReportType
+        .value("BLOCKING_CYCLE", python::StallReport::Type::BLOCKING_CYCLE, "Cycle of connections into blocking inputs, each node may wait on the next one to free its queue")
+        .value("WAITING_CYCLE", python::StallReport::Type::WAITING_CYCLE, "Cycle of connections into inputs which wait for messages, no message enters the cycle")
+        .value("UNDERSIZED_POOL", python::StallReport::Type::UNDERSIZED_POOL, "Pool of an output is smaller than number of its messages consumers may retain")
+        .value("BLOCKING_FANOUT", python::StallReport::Type::BLOCKING_FANOUT, "Output feeds multiple consumers and a slow blocking one throttles the others")
+        ;
+    stallReportIssue
+        .def(py::init<>())
+        .def_readwrite("type", &python::StallReport::Issue::type)
+        .def_readwrite("severity", &python::StallReport::Issue::severity)
+        .def_readwrite("nodeIds", &python::StallReport::Issue::nodeIds, "Ids of nodes involved, producer first for pool and fan-out issues")
+        .def_readwrite("output", &python::StallReport::Issue::output, "Output of the producer for pool and fan-out issues, as 'group.name' if grouped")
+        .def_readwrite("poolSize", &python::StallReport::Issue::poolSize, "Number of frames in pool of the output, 0 if not applicable or unknown")
+        .def_readwrite("suggestedPoolSize", &python::StallReport::Issue::suggestedPoolSize, "Suggested minimum number of frames in pool of the output, 0 if not applicable")
+        .def_readwrite("message", &python::StallReport::Issue::message)
+        .def("__repr__", [](const python::StallReport::Issue& issue) {
+            return "<StallReport.Issue " + issue.message + ">";
+        })
+        ;
+    stallReport
+        .def(py::init<>())
+        .def_readwrite("issues", &python::StallReport::issues)
+        .def("hasIssues", &python::StallReport::hasIssues, py::arg("severity") = python::StallReport::Severity::WARNING, "Check whether any issue of given severity or higher was found")
+        ;
+
     // bind pipeline
     pipeline
-        .def(py::init<>(), DOC(dai, Pipeline, Pipeline))
+        .def(py::init<>(), py::call_guard<python::InitializeGuard>(), DOC(dai, Pipeline, Pipeline))
         //.def(py::init<const Pipeline&>())
         .def("getGlobalProperties", &Pipeline::getGlobalProperties, DOC(dai, Pipeline, getGlobalProperties))
         //.def("create", &Pipeline::create<node::XLinkIn>)
@@ -100,7 +178,11 @@ void PipelineBindings::bind(pybind11::module& m, void* pCallstack){
         .def("setOpenVINOVersion", &Pipeline::setOpenVINOVersion, py::arg("version"), DOC(dai, Pipeline, setOpenVINOVersion))
         .def("getOpenVINOVersion", &Pipeline::getOpenVINOVersion, DOC(dai, Pipeline, getOpenVINOVersion))
         .def("getRequiredOpenVINOVersion", &Pipeline::getRequiredOpenVINOVersion, DOC(dai, Pipeline, getRequiredOpenVINOVersion))
-        .def("setCameraTuningBlobPath", &Pipeline::setCameraTuningBlobPath, py::arg("path"), DOC(dai, Pipeline, setCameraTuningBlobPath))
+        .def("setCameraTuningBlobPath", [](Pipeline& p, const dai::Path& path) {
+            // Tuning blobs are deduplicated across pipelines, see AssetRegistry
+            p.setCameraTuningBlobPath(path);
+            python::AssetRegistry::intern(p.getAssetManager(), "camTuning");
+        }, py::arg("path"), DOC(dai, Pipeline, setCameraTuningBlobPath))
         .def("setXLinkChunkSize", &Pipeline::setXLinkChunkSize, py::arg("sizeBytes"), DOC(dai, Pipeline, setXLinkChunkSize))
         .def("setSippBufferSize", &Pipeline::setSippBufferSize, py::arg("sizeBytes"), DOC(dai, Pipeline, setSippBufferSize))
         .def("setSippDmaBufferSize", &Pipeline::setSippDmaBufferSize, py::arg("sizeBytes"), DOC(dai, Pipeline, setSippDmaBufferSize))
@@ -108,6 +190,11 @@ void PipelineBindings::bind(pybind11::module& m, void* pCallstack){
         .def("getCalibrationData", &Pipeline::getCalibrationData, DOC(dai, Pipeline, getCalibrationData))
         .def("getDeviceConfig", &Pipeline::getDeviceConfig, DOC(dai, Pipeline, getDeviceConfig))
         .def("serializeToJson", &Pipeline::serializeToJson, DOC(dai, Pipeline, serializeToJson))
+        .def_static("fromJson", &python::PipelineBuilder::fromJson, py::arg("json"), py::call_guard<python::InitializeGuard>(), "Builds a pipeline from JSON produced by serializeToJson, preserving node ids. Assets are shared between pipelines built from equal JSON. OpenVINO version and board configuration aren't part of the JSON and must be set separately if needed")
+        .def("clone", &python::PipelineBuilder::clone, "Copies the pipeline: nodes with their properties, input settings and connections, global properties, OpenVINO version and board configuration. Node ids are preserved and assets are shared with this pipeline, not copied or read again")
+        .def("estimateResources", static_cast<python::ResourceEstimate (*)(const Pipeline&, UsbSpeed)>(&python::ResourceEstimator::estimate), py::arg("usbSpeed") = UsbSpeed::SUPER, "Estimates XLink bandwidth and device memory required by the pipeline over a USB link of given speed, without a device. Message sizes and rates are derived from node properties and propagated along connections; nodes whose outputs depend on runtime (eg. Script) are reported in warnings")
+        .def("estimateResources", static_cast<python::ResourceEstimate (*)(const Pipeline&, double)>(&python::ResourceEstimator::estimate), py::arg("linkBytesPerSecond"), "Estimates XLink bandwidth and device memory required by the pipeline for given usable link throughput [B/s], eg. of an Ethernet link")
+        .def("analyzeStalls", &python::StallAnalyzer::analyze, "Statically analyzes connections and input settings (blocking, queue size, waiting for messages) for configurations which stall or deadlock the pipeline: cycles of blocking or waiting inputs, pools smaller than number of frames consumers may retain (with a suggested minimum pool size), and outputs where a slow blocking consumer throttles the others")
         .def("setBoardConfig", &Pipeline::setBoardConfig, DOC(dai, Pipeline, setBoardConfig))
         .def("getBoardConfig", &Pipeline::getBoardConfig, DOC(dai, Pipeline, getBoardConfig))
         // 'Template' create function
@@ -0,0 +1,256 @@
+#include "PipelineBuilder.hpp"
+
+// std
+#include <algorithm>
+#include <cstdint>
+#include <mutex>
+#include <stdexcept>
+#include <unordered_map>
+#include <vector>
+
+// depthai
+#include "depthai/pipeline/node/XLinkIn.hpp"
+
+// depthai-shared
+#include "depthai-shared/pipeline/NodeConnectionSchema.hpp"
+#include "depthai-shared/pipeline/NodeIoInfo.hpp"
+
+// project
+#include "pipeline/AssetRegistry.hpp"
+
+namespace dai {
+namespace python {
+
+namespace {
+
+std::mutex nodeTypesMtx;
+std::unordered_map<std::string, PipelineBuilder::NodeType> nodeTypes;
+
+// Description of a node, as found in a pipeline schema
+struct NodeDescription {
+    Node::Id id;
+    std::string name;
+    nlohmann::json properties;
+    std::vector<NodeIoInfo> ioInfo;
+    std::vector<std::shared_ptr<Asset>> assets;
+};
+
+// Access to inputs and outputs of a node by group and name, including ones created on demand in input and output maps
+struct NodeIo : Node {
+    static Node::Output& output(Node& node, const std::string& group, const std::string& name) {
+        if(group.empty()) {
+            auto& refs = node.*(&NodeIo::outputRefs);
+            auto it = refs.find(name);
+            if(it == refs.end()) throw std::invalid_argument(std::string("Node '") + node.getName() + "' has no output '" + name + "'");
+            return *it->second;
+        }
+        auto& maps = node.*(&NodeIo::outputMapRefs);
+        auto it = maps.find(group);
+        if(it == maps.end()) throw std::invalid_argument(std::string("Node '") + node.getName() + "' has no output group '" + group + "'");
+        return (*it->second)[name];
+    }
+
+    static Node::Input& input(Node& node, const std::string& group, const std::string& name) {
+        if(group.empty()) {
+            auto& refs = node.*(&NodeIo::inputRefs);
+            auto it = refs.find(name);
+            if(it == refs.end()) throw std::invalid_argument(std::string("Node '") + node.getName() + "' has no input '" + name + "'");
+            return *it->second;
+        }
+        auto& maps = node.*(&NodeIo::inputMapRefs);
+        auto it = maps.find(group);
+        if(it == maps.end()) throw std::invalid_argument(std::string("Node '") + node.getName() + "' has no input group '" + group + "'");
+        return (*it->second)[name];
+    }
+};
+
+bool isOutput(NodeIoInfo::Type type) {
+    return type == NodeIoInfo::Type::MSender || type == NodeIoInfo::Type::SSender;
+}
+
+// Global properties of a pipeline are private, with setters for only some of them (the tuning blob only from a file).
+// Explicit instantiation of a template skips access checks, so it can name private members
+template <typename Tag, typename Tag::Type Member>
+struct PrivateMember {
+    friend typename Tag::Type memberOf(Tag) {
+        return Member;
+    }
+};
+
+struct PipelineImplTag {
+    using Type = std::shared_ptr<PipelineImpl> Pipeline::*;
+    friend Type memberOf(PipelineImplTag);
+};
+template struct PrivateMember<PipelineImplTag, &Pipeline::pimpl>;
+
+struct GlobalPropertiesTag {
+    using Type = GlobalProperties PipelineImpl::*;
+    friend Type memberOf(GlobalPropertiesTag);
+};
+template struct PrivateMember<GlobalPropertiesTag, &PipelineImpl::globalProperties>;
+
+GlobalProperties& globalPropertiesOf(Pipeline& pipeline) {
+    return (*(pipeline.*memberOf(PipelineImplTag{}))).*memberOf(GlobalPropertiesTag{});
+}
+
+// Same as Pipeline::setCameraTuningBlobPath, with the asset shared instead of read from a file
+void setCameraTuningBlob(Pipeline& pipeline, const std::shared_ptr<Asset>& asset) {
+    pipeline.getAssetManager().remove(asset->key);
+    pipeline.getAssetManager().addExisting({asset});
+
+    auto& properties = globalPropertiesOf(pipeline);
+    properties.cameraTuningBlobUri = asset->getRelativeUri();
+    properties.cameraTuningBlobSize = static_cast<std::uint32_t>(asset->data.size());
+}
+
+Pipeline build(const GlobalProperties& globalProperties,
+               std::vector<NodeDescription> nodes,
+               const std::vector<NodeConnectionSchema>& connections,
+               const std::vector<std::shared_ptr<Asset>>& pipelineAssets) {
+    Pipeline pipeline;
+
+    // Global properties. Leon frequencies and pipeline name and version can't be changed through the public API, so remain default
+    if(globalProperties.xlinkChunkSize != GlobalProperties().xlinkChunkSize) pipeline.setXLinkChunkSize(globalProperties.xlinkChunkSize);
+    if(globalProperties.sippBufferSize != GlobalProperties::SIPP_BUFFER_DEFAULT_SIZE) pipeline.setSippBufferSize(globalProperties.sippBufferSize);
+    if(globalProperties.sippDmaBufferSize != GlobalProperties::SIPP_DMA_BUFFER_DEFAULT_SIZE) pipeline.setSippDmaBufferSize(globalProperties.sippDmaBufferSize);
+    if(globalProperties.calibData) pipeline.setCalibrationData(CalibrationHandler(*globalProperties.calibData));
+    for(const auto& asset : pipelineAssets) {
+        if(asset->key == "camTuning" && globalProperties.cameraTuningBlobSize) {
+            setCameraTuningBlob(pipeline, asset);
+        } else {
+            pipeline.getAssetManager().remove(asset->key);
+            pipeline.getAssetManager().addExisting({asset});
+        }
+    }
+
+    // Nodes, created in order of their ids so the ids are preserved
+    std::sort(nodes.begin(), nodes.end(), [](const NodeDescription& a, const NodeDescription& b) { return a.id < b.id; });
+    std::unordered_map<Node::Id, std::shared_ptr<Node>> created;
+    Node::Id nextId = 0;
+    for(const auto& desc : nodes) {
+        PipelineBuilder::NodeType type;
+        {
+            std::unique_lock<std::mutex> l(nodeTypesMtx);
+            auto it = nodeTypes.find(desc.name);
+            if(it == nodeTypes.end()) throw std::invalid_argument("Unknown node type '" + desc.name + "'");
+            type = it->second;
+        }
+        // Skip ids of removed nodes
+        for(; nextId < desc.id; nextId++) pipeline.remove(pipeline.create<node::XLinkIn>());
+
+        auto node = type.create(pipeline);
+        nextId = node->id + 1;
+        if(node->id != desc.id) throw std::invalid_argument("Node ids must be unique, got duplicate id " + std::to_string(desc.id));
+        type.setProperties(*node, desc.properties);
+
+        for(const auto& io : desc.ioInfo) {
+            if(isOutput(io.type)) {
+                // Creates outputs of output maps
+                NodeIo::output(*node, io.group, io.name);
+            } else {
+                auto& input = NodeIo::input(*node, io.group, io.name);
+                input.setBlocking(io.blocking);
+                input.setQueueSize(io.queueSize);
+                input.setWaitForMessage(io.waitForMessage);
+            }
+        }
+        for(const auto& asset : desc.assets) {
+            node->getAssetManager().remove(asset->key);
+            node->getAssetManager().addExisting({asset});
+        }
+        created[desc.id] = node;
+    }
+
+    for(const auto& c : connections) {
+        auto out = created.find(c.node1Id);
+        auto in = created.find(c.node2Id);
+        if(out == created.end() || in == created.end()) {
+            throw std::invalid_argument("Connection between unknown nodes " + std::to_string(c.node1Id) + " and " + std::to_string(c.node2Id));
+        }
+        pipeline.link(NodeIo::output(*out->second, c.node1OutputGroup, c.node1Output), NodeIo::input(*in->second, c.node2InputGroup, c.node2Input));
+    }
+    return pipeline;
+}
+
+// Assets with given key prefix, copied out of asset storage of a serialized pipeline
+std::vector<std::shared_ptr<Asset>> assetsWithPrefix(const nlohmann::json& assetMap, const std::vector<std::uint8_t>& storage, const std::string& prefix) {
+    std::vector<std::shared_ptr<Asset>> assets;
+    for(const auto& kv : assetMap.items()) {
+        if(kv.key().compare(0, prefix.size(), prefix) != 0) continue;
+        const auto offset = kv.value().at("offset").get<std::size_t>();
+        const auto size = kv.value().at("size").get<std::size_t>();
+        if(offset > storage.size() || size > storage.size() - offset) throw std::invalid_argument("Asset '" + kv.key() + "' lies outside of asset storage");
+        auto asset = std::make_shared<Asset>(kv.key().substr(prefix.size()));
+        asset->alignment = kv.value().at("alignment").get<std::uint32_t>();
+        asset->data.assign(storage.begin() + offset, storage.begin() + offset + size);
+        // Pipelines built from the same JSON share their assets
+        assets.push_back(AssetRegistry::intern(asset));
+    }
+    return assets;
+}
+
+}  // namespace
+
+void PipelineBuilder::registerNodeType(const std::string& name, NodeType type) {
+    std::unique_lock<std::mutex> l(nodeTypesMtx);
+    nodeTypes[name] = std::move(type);
+}
+
+Pipeline PipelineBuilder::fromJson(const nlohmann::json& json) {
+    try {
+        const auto& schema = json.at("pipeline");
+        const auto storage = json.value("assetStorage", std::vector<std::uint8_t>());
+        const auto assetMap = json.contains("assets") ? json.at("assets").value("map", nlohmann::json::object()) : nlohmann::json::object();
+
+        std::vector<NodeDescription> nodes;
+        for(const auto& kv : schema.at("nodes")) {
+            const auto& info = kv.at(1);
+            NodeDescription desc;
+            desc.id = info.at("id").get<Node::Id>();
+            desc.name = info.at("name").get<std::string>();
+            desc.properties = info.at("properties");
+            for(const auto& io : info.at("ioInfo")) desc.ioInfo.push_back(io.at(1).get<NodeIoInfo>());
+            desc.assets = assetsWithPrefix(assetMap, storage, "/node/" + std::to_string(desc.id) + "/");
+            nodes.push_back(std::move(desc));
+        }
+        return build(schema.at("globalProperties").get<GlobalProperties>(),
+                     std::move(nodes),
+                     schema.at("connections").get<std::vector<NodeConnectionSchema>>(),
+                     assetsWithPrefix(assetMap, storage, "/pipeline/"));
+    } catch(const nlohmann::json::exception& ex) {
+        throw std::invalid_argument(std::string("Invalid pipeline JSON: ") + ex.what());
+    }
+}
+
+Pipeline PipelineBuilder::clone(const Pipeline& source) {
+    // Properties in JSON form, the same as deserialized by fromJson
+    const auto schema = source.getPipelineSchema(SerializationType::JSON);
+
+    auto shared = [](const AssetManager& manager) {
+        std::vector<std::shared_ptr<Asset>> assets;
+        // Assets are shared and treated as immutable
+        for(const auto& asset : manager.getAll()) assets.push_back(std::const_pointer_cast<Asset>(asset));
+        return assets;
+    };
+
+    std::vector<NodeDescription> nodes;
+    for(const auto& kv : schema.nodes) {
+        const auto& info = kv.second;
+        NodeDescription desc;
+        desc.id = info.id;
+        desc.name = info.name;
+        desc.properties = nlohmann::json::parse(info.properties);
+        for(const auto& io : info.ioInfo) desc.ioInfo.push_back(io.second);
+        desc.assets = shared(source.getNode(info.id)->getAssetManager());
+        nodes.push_back(std::move(desc));
+    }
+
+    auto pipeline = build(schema.globalProperties, std::move(nodes), schema.connections, shared(source.getAssetManager()));
+    const auto version = source.getRequiredOpenVINOVersion();
+    if(version) pipeline.setOpenVINOVersion(*version);
+    pipeline.setBoardConfig(source.getBoardConfig());
+    return pipeline;
+}
+
+}  // namespace python
+}  // namespace dai
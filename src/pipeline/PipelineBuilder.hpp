@@ -0,0 +1,56 @@
+#pragma once
+
+// std
+#include <functional>
+#include <memory>
+#include <string>
+
+// depthai
+#include "depthai/pipeline/Pipeline.hpp"
+
+// libraries
+#include <nlohmann/json.hpp>
+
+namespace dai {
+namespace python {
+
+/**
+ * Rebuilds pipelines from their serialized description, either JSON produced by Pipeline::serializeToJson
+ * or an existing pipeline. Node ids, properties, input settings and connections are preserved,
+ * assets are shared with the source (cloned pipelines) or deduplicated through AssetRegistry (JSON).
+ */
+class PipelineBuilder {
+   public:
+    /**
+     * Operations on a concrete node type
+     */
+    struct NodeType {
+        /// Creates a node of the type in given pipeline
+        std::function<std::shared_ptr<Node>(Pipeline&)> create;
+        /// Sets node properties from their JSON representation
+        std::function<void(Node&, const nlohmann::json&)> setProperties;
+    };
+
+    /**
+     * Registers a node type, so pipelines containing it can be rebuilt
+     *
+     * @param name Node name, as returned by Node::getName
+     * @param type Operations on the node type
+     */
+    static void registerNodeType(const std::string& name, NodeType type);
+
+    /**
+     * Builds a pipeline from JSON produced by Pipeline::serializeToJson.
+     * OpenVINO version and board configuration aren't part of it and must be set separately if needed
+     */
+    static Pipeline fromJson(const nlohmann::json& json);
+
+    /**
+     * Copies a pipeline: nodes with their properties, input settings and connections,
+     * global properties, OpenVINO version and board configuration. Assets are shared, not copied
+     */
+    static Pipeline clone(const Pipeline& pipeline);
+};
+
+}  // namespace python
+}  // namespace dai
@@ -0,0 +1,415 @@
+#include "ResourceEstimator.hpp"
+
+// std
+#include <algorithm>
+#include <map>
+#include <memory>
+#include <stdexcept>
+#include <string>
+#include <tuple>
+#include <vector>
+
+// depthai
+#include "depthai/openvino/OpenVINO.hpp"
+#include "depthai/pipeline/node/Camera.hpp"
+#include "depthai/pipeline/node/ColorCamera.hpp"
+#include "depthai/pipeline/node/DetectionNetwork.hpp"
+#include "depthai/pipeline/node/IMU.hpp"
+#include "depthai/pipeline/node/ImageManip.hpp"
+#include "depthai/pipeline/node/MonoCamera.hpp"
+#include "depthai/pipeline/node/NeuralNetwork.hpp"
+#include "depthai/pipeline/node/SpatialDetectionNetwork.hpp"
+#include "depthai/pipeline/node/StereoDepth.hpp"
+#include "depthai/pipeline/node/VideoEncoder.hpp"
+#include "depthai/pipeline/node/XLinkIn.hpp"
+#include "depthai/pipeline/node/XLinkOut.hpp"
+
+// project
+#include "utility/DatatypeUtils.hpp"
+
+namespace dai {
+namespace python {
+
+namespace {
+
+// Serialized metadata sent along each message
+constexpr double METADATA_SIZE = 128.0;
+// Typical size of (spatial) detections message payloads
+constexpr double DETECTIONS_SIZE = 1024.0;
+// Size of a single IMU report of a sensor
+constexpr double IMU_REPORT_SIZE = 48.0;
+// Encoder bits per pixel when bitrate is left to the device
+constexpr double AUTO_BITS_PER_PIXEL = 0.1;
+
+// Messages of a node output, absent if they can't be estimated
+struct Stream {
+    double size = 0.0;
+    double fps = 0.0;
+    unsigned int width = 0;
+    unsigned int height = 0;
+
+    bool operator==(const Stream& rhs) const {
+        return size == rhs.size && fps == rhs.fps && width == rhs.width && height == rhs.height;
+    }
+};
+
+// By node id, group and name of an output or input
+using IoKey = std::tuple<Node::Id, std::string, std::string>;
+using Streams = std::map<IoKey, Stream>;
+
+Stream frame(unsigned int width, unsigned int height, double bytesPerPixel, double fps) {
+    return Stream{width * static_cast<double>(height) * bytesPerPixel, fps, width, height};
+}
+
+double rawBytesPerPixel(const tl::optional<bool>& rawPacked) {
+    // RAW10 packed or stored in 16 bits
+    return rawPacked.value_or(false) ? 1.25 : 2.0;
+}
+
+std::size_t tensorSize(const TensorInfo& tensor) {
+    std::size_t size = 1;
+    for(const auto d : tensor.dims) size *= d;
+    switch(tensor.dataType) {
+        case TensorInfo::DataType::U8F:
+        case TensorInfo::DataType::I8:
+            return size;
+        case TensorInfo::DataType::FP16:
+            return size * 2;
+        case TensorInfo::DataType::INT:
+        case TensorInfo::DataType::FP32:
+            return size * 4;
+    }
+    return size;
+}
+
+// Tensor sizes of a parsed blob, or why it can't be parsed
+struct BlobSizes {
+    bool parsed = false;
+    std::size_t inputSize = 0;
+    std::size_t outputSize = 0;
+    std::string error;
+};
+
+// By blob asset, parsed once per estimate rather than on each propagation pass
+using Blobs = std::map<const Asset*, BlobSizes>;
+
+Blobs parseBlobs(const std::vector<std::shared_ptr<const Node>>& nodes) {
+    Blobs blobs;
+    for(const auto& node : nodes) {
+        auto nn = std::dynamic_pointer_cast<const node::NeuralNetwork>(node);
+        if(nn == nullptr) continue;
+        const auto blob = nn->getAssetManager().get("__blob");
+        if(blob == nullptr || blobs.count(blob.get()) > 0) continue;
+        auto& sizes = blobs[blob.get()];
+        try {
+            OpenVINO::Blob parsed(blob->data);
+            for(const auto& kv : parsed.networkInputs) sizes.inputSize += tensorSize(kv.second);
+            for(const auto& kv : parsed.networkOutputs) sizes.outputSize += tensorSize(kv.second);
+            sizes.parsed = true;
+        } catch(const std::exception& ex) {
+            sizes.error = ex.what();
+        }
+    }
+    return blobs;
+}
+
+// Estimates outputs of a single node from its inputs, recording pools and warnings into report if given
+class NodeEstimator {
+   public:
+    NodeEstimator(const Node& node, const Blobs& blobs, const Streams& inputs, Streams& outputs, ResourceEstimate* report)
+        : node(node), blobs(blobs), inputs(inputs), outputs(outputs), report(report) {}
+
+    void estimate() {
+        if(auto* n = dynamic_cast<const node::ColorCamera*>(&node)) return colorCamera(*n);
+        if(auto* n = dynamic_cast<const node::Camera*>(&node)) return camera(*n);
+        if(auto* n = dynamic_cast<const node::MonoCamera*>(&node)) return monoCamera(*n);
+        if(auto* n = dynamic_cast<const node::ImageManip*>(&node)) return imageManip(*n);
+        if(auto* n = dynamic_cast<const node::StereoDepth*>(&node)) return stereoDepth(*n);
+        if(auto* n = dynamic_cast<const node::VideoEncoder*>(&node)) return videoEncoder(*n);
+        if(auto* n = dynamic_cast<const node::SpatialDetectionNetwork*>(&node)) return neuralNetwork(*n, true);
+        if(auto* n = dynamic_cast<const node::NeuralNetwork*>(&node)) return neuralNetwork(*n, false);
+        if(auto* n = dynamic_cast<const node::IMU*>(&node)) return imu(*n);
+        if(auto* n = dynamic_cast<const node::XLinkIn*>(&node)) return xlinkIn(*n);
+        if(dynamic_cast<const node::XLinkOut*>(&node)) return;
+        warn(std::string("Outputs of node '") + node.getName() + "' (id " + std::to_string(node.id) + ") can't be estimated");
+    }
+
+   private:
+    const Node& node;
+    const Blobs& blobs;
+    const Streams& inputs;
+    Streams& outputs;
+    ResourceEstimate* report;
+
+    const Stream* input(const std::string& name) const {
+        auto it = inputs.find(IoKey{node.id, "", name});
+        return it == inputs.end() ? nullptr : &it->second;
+    }
+    void output(const std::string& name, const Stream& stream) {
+        outputs[IoKey{node.id, "", name}] = stream;
+    }
+    void pool(const std::string& name, std::size_t numFrames, std::size_t frameSize) {
+        if(report == nullptr || numFrames == 0 || frameSize == 0) return;
+        ResourceEstimate::Pool p;
+        p.nodeId = node.id;
+        p.nodeName = node.getName();
+        p.name = name;
+        p.numFrames = numFrames;
+        p.frameSize = frameSize;
+        p.size = numFrames * frameSize;
+        report->pools.push_back(p);
+    }
+    void warn(const std::string& message) {
+        if(report != nullptr) report->warnings.push_back(message);
+    }
+
+    template <typename CameraNode>
+    void cameraOutputs(const CameraNode& cam, std::tuple<int, int> ispSize, std::tuple<int, int> rawSize) {
+        const auto& props = cam.properties;
+        const float fps = cam.getFps();
+        auto add = [&](const std::string& name, std::tuple<int, int> size, double bytesPerPixel, double rate, int numFrames) {
+            const auto s = frame(std::get<0>(size), std::get<1>(size), bytesPerPixel, rate);
+            output(name, s);
+            pool(name, numFrames, static_cast<std::size_t>(s.size));
+        };
+        add("preview", cam.getPreviewSize(), props.fp16 ? 6.0 : 3.0, fps, props.numFramesPoolPreview);
+        add("video", cam.getVideoSize(), 1.5, fps, props.numFramesPoolVideo);
+        // Stills are produced on capture requests only
+        add("still", cam.getStillSize(), 1.5, 0.0, props.numFramesPoolStill);
+        add("isp", ispSize, 1.5, fps, props.numFramesPoolIsp);
+        add("raw", rawSize, rawBytesPerPixel(props.rawPacked), fps, props.numFramesPoolRaw);
+        output("frameEvent", Stream{0.0, fps, 0, 0});
+    }
+
+    void colorCamera(const node::ColorCamera& cam) {
+        cameraOutputs(cam, cam.getIspSize(), cam.getResolutionSize());
+    }
+
+    void camera(const node::Camera& cam) {
+        cameraOutputs(cam, cam.getSize(), cam.getSize());
+    }
+
+    void monoCamera(const node::MonoCamera& cam) {
+        const auto& props = cam.properties;
+        const auto out = frame(cam.getResolutionWidth(), cam.getResolutionHeight(), 1.0, cam.getFps());
+        const auto raw = frame(cam.getResolutionWidth(), cam.getResolutionHeight(), rawBytesPerPixel(props.rawPacked), cam.getFps());
+        output("out", out);
+        output("raw", raw);
+        output("frameEvent", Stream{0.0, cam.getFps(), 0, 0});
+        pool("out", props.numFramesPool, static_cast<std::size_t>(out.size));
+        pool("raw", props.numFramesPoolRaw, static_cast<std::size_t>(raw.size));
+    }
+
+    void imageManip(const node::ImageManip& manip) {
+        const auto& props = manip.properties;
+        pool("out", props.numFramesPool, props.outputFrameSize);
+
+        const auto* in = input("inputImage");
+        if(in == nullptr) return;
+        const auto& config = manip.initialConfig;
+        const unsigned int width = config.getResizeWidth() > 0 ? config.getResizeWidth() : in->width;
+        const unsigned int height = config.getResizeHeight() > 0 ? config.getResizeHeight() : in->height;
+        const auto type = config.getFormatConfig().type;
+
+        Stream out{in->size, in->fps, width, height};
+        if(type != RawImgFrame::Type::NONE) {
+            try {
+                out.size = static_cast<double>(getFrameSize(width, height, type));
+            } catch(const std::invalid_argument&) {
+                warn("Output of ImageManip (id " + std::to_string(node.id) + ") has frame type which can't be estimated");
+                return;
+            }
+        } else if(in->width > 0 && in->height > 0) {
+            out.size = in->size * (static_cast<double>(width) * height) / (static_cast<double>(in->width) * in->height);
+        }
+        // Output is limited by the output frame size
+        out.size = std::min(out.size, static_cast<double>(props.outputFrameSize));
+        output("out", out);
+    }
+
+    void stereoDepth(const node::StereoDepth& stereo) {
+        const auto& props = stereo.properties;
+        const auto* left = input("left");
+        const auto* right = input("right");
+        if(left == nullptr) return;
+
+        const double fps = right == nullptr ? left->fps : std::min(left->fps, right->fps);
+        unsigned int width = props.width ? *props.width : left->width;
+        unsigned int height = props.height ? *props.height : left->height;
+        if(props.outWidth && props.outHeight) {
+            width = *props.outWidth;
+            height = *props.outHeight;
+        }
+        const bool subpixel = stereo.initialConfig.get().algorithmControl.enableSubpixel;
+
+        const auto depth = frame(width, height, 2.0, fps);
+        const auto disparity = frame(width, height, subpixel ? 2.0 : 1.0, fps);
+        const auto confidence = frame(width, height, 1.0, fps);
+        const auto rectified = frame(left->width, left->height, 1.0, fps);
+        output("depth", depth);
+        output("disparity", disparity);
+        output("confidenceMap", confidence);
+        output("rectifiedLeft", rectified);
+        output("rectifiedRight", rectified);
+        output("syncedLeft", *left);
+        if(right != nullptr) output("syncedRight", *right);
+        output("outConfig", Stream{static_cast<double>(sizeof(RawStereoDepthConfig)), fps, 0, 0});
+        pool("outputs", props.numFramesPool, static_cast<std::size_t>(depth.size + disparity.size + confidence.size + 2 * rectified.size));
+    }
+
+    void videoEncoder(const node::VideoEncoder& encoder) {
+        const auto* in = input("in");
+        const double rawSize = in == nullptr ? 0.0 : in->width * static_cast<double>(in->height) * 1.5;
+        const std::size_t numFrames = encoder.getNumFramesPool() > 0 ? encoder.getNumFramesPool() : 4;
+        const std::size_t frameSize = encoder.getMaxOutputFrameSize() > 0 ? encoder.getMaxOutputFrameSize() : static_cast<std::size_t>(rawSize);
+        pool("bitstream", numFrames, frameSize);
+        if(in == nullptr) return;
+
+        Stream out{0.0, in->fps, in->width, in->height};
+        if(encoder.getProfile() == VideoEncoderProperties::Profile::MJPEG) {
+            const double quality = encoder.properties.quality / 100.0;
+            out.size = encoder.getLossless() ? rawSize : rawSize * (0.02 + 0.23 * quality * quality);
+        } else if(in->fps > 0) {
+            const double bitrate = encoder.getBitrate() > 0 ? encoder.getBitrate() : in->width * static_cast<double>(in->height) * in->fps * AUTO_BITS_PER_PIXEL;
+            out.size = bitrate / 8.0 / in->fps;
+        }
+        output("bitstream", out);
+    }
+
+    void neuralNetwork(const node::NeuralNetwork& nn, bool spatial) {
+        const auto blob = nn.getAssetManager().get("__blob");
+        if(blob == nullptr) {
+            warn("NeuralNetwork (id " + std::to_string(node.id) + ") has no blob set");
+            return;
+        }
+        const auto& sizes = blobs.at(blob.get());
+        if(!sizes.parsed) {
+            warn("Blob of NeuralNetwork (id " + std::to_string(node.id) + ") can't be parsed: " + sizes.error);
+            return;
+        }
+        pool("blob", 1, blob->data.size());
+        pool("out", nn.properties.numFrames, sizes.outputSize);
+        pool("in", nn.properties.numFrames, sizes.inputSize);
+
+        // Inference is assumed to keep up with the input
+        const auto* in = input("in");
+        if(in == nullptr) return;
+        const Stream tensors{static_cast<double>(sizes.outputSize), in->fps, 0, 0};
+        output("passthrough", *in);
+        if(dynamic_cast<const node::DetectionNetwork*>(&nn) != nullptr) {
+            output("out", Stream{DETECTIONS_SIZE, in->fps, 0, 0});
+            output("outNetwork", tensors);
+        } else if(spatial) {
+            output("out", Stream{DETECTIONS_SIZE * 1.5, in->fps, 0, 0});
+            output("boundingBoxMapping", Stream{DETECTIONS_SIZE, in->fps, 0, 0});
+            if(const auto* depth = input("inputDepth")) output("passthroughDepth", *depth);
+        } else {
+            output("out", tensors);
+        }
+    }
+
+    void imu(const node::IMU& imu) {
+        const auto& props = imu.properties;
+        std::uint32_t rate = 0;
+        for(const auto& sensor : props.imuSensors) rate = std::max(rate, sensor.reportRate);
+        const auto batch = std::max<std::int32_t>(props.batchReportThreshold, 1);
+        output("out", Stream{IMU_REPORT_SIZE * props.imuSensors.size() * batch, static_cast<double>(rate) / batch, 0, 0});
+    }
+
+    void xlinkIn(const node::XLinkIn& xin) {
+        // Output depends on what the host sends
+        pool("out", xin.getNumFrames(), xin.getMaxDataSize());
+    }
+};
+
+}  // namespace
+
+constexpr double ResourceEstimator::LINK_EFFICIENCY;
+
+double ResourceEstimator::getLinkBytesPerSecond(UsbSpeed usbSpeed) {
+    double bitsPerSecond = 0.0;
+    switch(usbSpeed) {
+        case UsbSpeed::LOW:
+            bitsPerSecond = 1.5e6;
+            break;
+        case UsbSpeed::FULL:
+            bitsPerSecond = 12e6;
+            break;
+        case UsbSpeed::HIGH:
+            bitsPerSecond = 480e6;
+            break;
+        case UsbSpeed::SUPER:
+            bitsPerSecond = 5e9;
+            break;
+        case UsbSpeed::SUPER_PLUS:
+            bitsPerSecond = 10e9;
+            break;
+        case UsbSpeed::UNKNOWN:
+            throw std::invalid_argument("USB speed must be known to estimate link utilization");
+    }
+    return bitsPerSecond / 8.0 * LINK_EFFICIENCY;
+}
+
+ResourceEstimate ResourceEstimator::estimate(const Pipeline& pipeline, UsbSpeed usbSpeed) {
+    return estimate(pipeline, getLinkBytesPerSecond(usbSpeed));
+}
+
+ResourceEstimate ResourceEstimator::estimate(const Pipeline& pipeline, double linkBytesPerSecond) {
+    if(linkBytesPerSecond <= 0) throw std::invalid_argument("Link throughput must be positive");
+
+    auto nodes = pipeline.getAllNodes();
+    std::sort(nodes.begin(), nodes.end(), [](const std::shared_ptr<const Node>& a, const std::shared_ptr<const Node>& b) { return a->id < b->id; });
+    const auto connections = pipeline.getConnections();
+    const auto blobs = parseBlobs(nodes);
+
+    // Propagates streams along connections until they settle, bounded by the longest possible path
+    Streams outputs;
+    auto gatherInputs = [&]() {
+        Streams inputs;
+        for(const auto& c : connections) {
+            auto it = outputs.find(IoKey{c.outputId, c.outputGroup, c.outputName});
+            if(it != outputs.end()) inputs[IoKey{c.inputId, c.inputGroup, c.inputName}] = it->second;
+        }
+        return inputs;
+    };
+    for(std::size_t pass = 0; pass <= nodes.size(); pass++) {
+        const auto inputs = gatherInputs();
+        Streams next;
+        for(const auto& node : nodes) NodeEstimator(*node, blobs, inputs, next, nullptr).estimate();
+        if(next == outputs) break;
+        outputs = std::move(next);
+    }
+
+    ResourceEstimate report;
+    report.linkBytesPerSecond = linkBytesPerSecond;
+    const auto inputs = gatherInputs();
+    Streams unused;
+    for(const auto& node : nodes) NodeEstimator(*node, blobs, inputs, unused, &report).estimate();
+
+    for(const auto& node : nodes) {
+        auto xout = std::dynamic_pointer_cast<const node::XLinkOut>(node);
+        if(xout == nullptr) continue;
+        ResourceEstimate::Stream stream;
+        stream.streamName = xout->getStreamName();
+        stream.nodeId = xout->id;
+
+        auto it = inputs.find(IoKey{xout->id, "", xout->input.name});
+        stream.estimated = it != inputs.end();
+        if(stream.estimated) {
+            const auto& in = it->second;
+            stream.fps = xout->getFpsLimit() > 0 ? std::min<double>(in.fps, xout->getFpsLimit()) : in.fps;
+            stream.messageSize = (xout->getMetadataOnly() ? 0.0 : in.size) + METADATA_SIZE;
+            stream.bytesPerSecond = stream.messageSize * stream.fps;
+            report.totalBytesPerSecond += stream.bytesPerSecond;
+        } else {
+            report.warnings.push_back("Stream '" + stream.streamName + "' can't be estimated, as its source can't be");
+        }
+        report.streams.push_back(stream);
+    }
+    report.linkUtilization = report.totalBytesPerSecond / linkBytesPerSecond;
+    for(const auto& pool : report.pools) report.poolMemory += pool.size;
+    return report;
+}
+
+}  // namespace python
+}  // namespace dai
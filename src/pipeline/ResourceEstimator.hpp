@@ -0,0 +1,97 @@
+#pragma once
+
+// std
+#include <string>
+#include <vector>
+
+// depthai
+#include "depthai/pipeline/Pipeline.hpp"
+
+// depthai-shared
+#include "depthai-shared/common/UsbSpeed.hpp"
+
+namespace dai {
+namespace python {
+
+/**
+ * Static estimate of XLink bandwidth and device memory required by a pipeline
+ */
+struct ResourceEstimate {
+    /**
+     * Stream sent to the host by an XLinkOut node
+     */
+    struct Stream {
+        std::string streamName;
+        Node::Id nodeId = -1;
+        /// Estimated message size, including metadata [B]
+        double messageSize = 0.0;
+        /// Estimated message rate [Hz]
+        double fps = 0.0;
+        /// Estimated throughput [B/s]
+        double bytesPerSecond = 0.0;
+        /// False if a node feeding the stream couldn't be estimated, the stream then isn't included in totals
+        bool estimated = false;
+    };
+
+    /**
+     * Pool of messages preallocated on the device by a node
+     */
+    struct Pool {
+        Node::Id nodeId = -1;
+        std::string nodeName;
+        std::string name;
+        std::size_t numFrames = 0;
+        std::size_t frameSize = 0;
+        std::size_t size = 0;
+    };
+
+    std::vector<Stream> streams;
+    std::vector<Pool> pools;
+    /// Sum of throughputs of estimated streams [B/s]
+    double totalBytesPerSecond = 0.0;
+    /// Usable link throughput the estimate was made for [B/s]
+    double linkBytesPerSecond = 0.0;
+    /// Ratio of total to usable link throughput, above 1 the link is saturated
+    double linkUtilization = 0.0;
+    /// Sum of pool sizes [B]
+    std::size_t poolMemory = 0;
+    /// Nodes and outputs which couldn't be estimated
+    std::vector<std::string> warnings;
+};
+
+/**
+ * Estimates resources required by a pipeline from node properties and connections, without a device.
+ * Messages of each node output are modeled by size and rate, propagated along connections,
+ * and summed over XLinkOut nodes. Estimates are approximate: neural network inference rate is assumed
+ * to keep up with its input, encoder output is derived from bitrate or quality, and nodes
+ * whose outputs depend on runtime (eg. Script) aren't estimated.
+ */
+class ResourceEstimator {
+   public:
+    /// Ratio of nominal link speed usable by XLink
+    static constexpr double LINK_EFFICIENCY = 0.8;
+
+    /**
+     * Estimates resources for given usable link throughput
+     *
+     * @param pipeline Pipeline to estimate
+     * @param linkBytesPerSecond Usable link throughput [B/s]
+     */
+    static ResourceEstimate estimate(const Pipeline& pipeline, double linkBytesPerSecond);
+
+    /**
+     * Estimates resources for a USB link of given speed
+     *
+     * @param pipeline Pipeline to estimate
+     * @param usbSpeed USB speed, determines usable link throughput
+     */
+    static ResourceEstimate estimate(const Pipeline& pipeline, UsbSpeed usbSpeed);
+
+    /**
+     * Retrieves usable link throughput of a USB speed [B/s]
+     */
+    static double getLinkBytesPerSecond(UsbSpeed usbSpeed);
+};
+
+}  // namespace python
+}  // namespace dai
@@ -0,0 +1,289 @@
+#include "StallAnalyzer.hpp"
+
+// std
+#include <algorithm>
+#include <functional>
+#include <map>
+#include <set>
+#include <tuple>
+
+// depthai
+#include "depthai/pipeline/node/Camera.hpp"
+#include "depthai/pipeline/node/ColorCamera.hpp"
+#include "depthai/pipeline/node/ImageManip.hpp"
+#include "depthai/pipeline/node/MonoCamera.hpp"
+#include "depthai/pipeline/node/NeuralNetwork.hpp"
+#include "depthai/pipeline/node/Script.hpp"
+#include "depthai/pipeline/node/SpatialDetectionNetwork.hpp"
+#include "depthai/pipeline/node/StereoDepth.hpp"
+#include "depthai/pipeline/node/VideoEncoder.hpp"
+#include "depthai/pipeline/node/XLinkIn.hpp"
+#include "depthai/pipeline/node/XLinkOut.hpp"
+
+namespace dai {
+namespace python {
+
+namespace {
+
+// Frames being produced and being processed by a consumer, besides queued ones
+constexpr int FRAMES_IN_FLIGHT = 2;
+
+// Outputs forwarding messages received on an input, so these are accounted to the pool they originate from
+const std::map<std::string, std::string> FORWARDING_OUTPUTS = {
+    {"passthrough", "in"},
+    {"passthroughDepth", "inputDepth"},
+    {"passthroughInputImage", "inputImage"},
+    {"passthroughTrackerFrame", "inputTrackerFrame"},
+    {"passthroughDetectionFrame", "inputDetectionFrame"},
+    {"passthroughDetections", "inputDetections"},
+    {"syncedLeft", "left"},
+    {"syncedRight", "right"},
+};
+
+// By node id, group and name of an output
+using OutputKey = std::tuple<Node::Id, std::string, std::string>;
+
+std::string describe(const Node& node) {
+    return std::string(node.getName()) + " (id " + std::to_string(node.id) + ")";
+}
+
+std::string describeOutput(const std::string& group, const std::string& name) {
+    return group.empty() ? name : group + "." + name;
+}
+
+template <typename Properties>
+int getCameraPoolSize(const Properties& props, const std::string& output) {
+    if(output == "preview") return props.numFramesPoolPreview;
+    if(output == "video") return props.numFramesPoolVideo;
+    if(output == "still") return props.numFramesPoolStill;
+    if(output == "isp") return props.numFramesPoolIsp;
+    if(output == "raw") return props.numFramesPoolRaw;
+    return 0;
+}
+
+// Number of frames in pool of an output, 0 if unknown
+int getPoolSize(const Node& node, const std::string& output) {
+    if(auto* cam = dynamic_cast<const node::ColorCamera*>(&node)) return getCameraPoolSize(cam->properties, output);
+    if(auto* cam = dynamic_cast<const node::Camera*>(&node)) return getCameraPoolSize(cam->properties, output);
+    if(auto* cam = dynamic_cast<const node::MonoCamera*>(&node)) {
+        if(output == "out") return cam->getNumFramesPool();
+        if(output == "raw") return cam->getRawNumFramesPool();
+    } else if(auto* manip = dynamic_cast<const node::ImageManip*>(&node)) {
+        if(output == "out") return manip->properties.numFramesPool;
+    } else if(auto* stereo = dynamic_cast<const node::StereoDepth*>(&node)) {
+        return stereo->properties.numFramesPool;
+    } else if(auto* encoder = dynamic_cast<const node::VideoEncoder*>(&node)) {
+        if(output == "bitstream") return encoder->getNumFramesPool();
+    } else if(auto* nn = dynamic_cast<const node::NeuralNetwork*>(&node)) {
+        return nn->properties.numFrames;
+    } else if(auto* xin = dynamic_cast<const node::XLinkIn*>(&node)) {
+        if(output == "out") return static_cast<int>(xin->getNumFrames());
+    }
+    return 0;
+}
+
+// Consumer keeps messages for as long as its code decides
+bool isRetaining(const Node& node) {
+    return dynamic_cast<const node::Script*>(&node) != nullptr;
+}
+
+// Consumer may take longer to process a message than producers to produce one
+bool isSlow(const Node& node) {
+    return dynamic_cast<const node::XLinkOut*>(&node) != nullptr || dynamic_cast<const node::VideoEncoder*>(&node) != nullptr
+           || dynamic_cast<const node::NeuralNetwork*>(&node) != nullptr || dynamic_cast<const node::Script*>(&node) != nullptr;
+}
+
+const Node::Input* findInput(const Node& node, const std::string& group, const std::string& name) {
+    for(const auto* input : node.getInputRefs()) {
+        if(input->group == group && input->name == name) return input;
+    }
+    return nullptr;
+}
+
+// Strongly connected components of nodes which contain a cycle
+std::vector<std::vector<Node::Id>> findCycles(const std::vector<Node::Id>& ids, const std::multimap<Node::Id, Node::Id>& edges) {
+    std::map<Node::Id, int> index, lowlink;
+    std::set<Node::Id> onStack;
+    std::vector<Node::Id> stack;
+    std::vector<std::vector<Node::Id>> cycles;
+    int counter = 0;
+
+    std::function<void(Node::Id)> connect = [&](Node::Id v) {
+        index[v] = lowlink[v] = counter++;
+        stack.push_back(v);
+        onStack.insert(v);
+        auto range = edges.equal_range(v);
+        for(auto it = range.first; it != range.second; ++it) {
+            const auto w = it->second;
+            if(index.count(w) == 0) {
+                connect(w);
+                lowlink[v] = std::min(lowlink[v], lowlink[w]);
+            } else if(onStack.count(w)) {
+                lowlink[v] = std::min(lowlink[v], index[w]);
+            }
+        }
+        if(lowlink[v] != index[v]) return;
+        std::vector<Node::Id> component;
+        Node::Id w;
+        do {
+            w = stack.back();
+            stack.pop_back();
+            onStack.erase(w);
+            component.push_back(w);
+        } while(w != v);
+        bool selfLoop = false;
+        range = edges.equal_range(v);
+        for(auto it = range.first; it != range.second; ++it) selfLoop = selfLoop || it->second == v;
+        if(component.size() > 1 || selfLoop) {
+            std::sort(component.begin(), component.end());
+            cycles.push_back(std::move(component));
+        }
+    };
+    for(const auto id : ids) {
+        if(index.count(id) == 0) connect(id);
+    }
+    return cycles;
+}
+
+}  // namespace
+
+bool StallReport::hasIssues(Severity severity) const {
+    return std::any_of(issues.begin(), issues.end(), [severity](const Issue& issue) { return issue.severity >= severity; });
+}
+
+StallReport StallAnalyzer::analyze(const Pipeline& pipeline) {
+    std::map<Node::Id, std::shared_ptr<const Node>> nodes;
+    std::vector<Node::Id> ids;
+    for(const auto& node : pipeline.getAllNodes()) {
+        nodes[node->id] = node;
+        ids.push_back(node->id);
+    }
+    std::sort(ids.begin(), ids.end());
+
+    // Resolve connections to their inputs, skipping ones to removed nodes
+    std::vector<std::pair<Node::Connection, const Node::Input*>> connections;
+    for(const auto& c : pipeline.getConnections()) {
+        auto in = nodes.find(c.inputId);
+        if(in == nodes.end() || nodes.count(c.outputId) == 0) continue;
+        const auto* input = findInput(*in->second, c.inputGroup, c.inputName);
+        if(input != nullptr) connections.emplace_back(c, input);
+    }
+
+    StallReport report;
+    auto describeCycle = [&](const std::vector<Node::Id>& cycle) {
+        std::string names;
+        for(const auto id : cycle) names += (names.empty() ? "" : ", ") + describe(*nodes[id]);
+        return names;
+    };
+
+    // Cycles where each node may block sending to the next one
+    std::multimap<Node::Id, Node::Id> blockingEdges, waitingEdges;
+    for(const auto& c : connections) {
+        if(c.second->getBlocking()) blockingEdges.emplace(c.first.outputId, c.first.inputId);
+        if(c.second->getWaitForMessage()) waitingEdges.emplace(c.first.outputId, c.first.inputId);
+    }
+    for(auto& cycle : findCycles(ids, blockingEdges)) {
+        StallReport::Issue issue;
+        issue.type = StallReport::Type::BLOCKING_CYCLE;
+        issue.severity = StallReport::Severity::ERROR;
+        issue.message = "Nodes " + describeCycle(cycle)
+                        + " form a cycle of blocking inputs and deadlock once its queues fill up. Make an input on the cycle non-blocking";
+        issue.nodeIds = std::move(cycle);
+        report.issues.push_back(std::move(issue));
+    }
+
+    // Cycles where each node waits for a message from the previous one, unless messages also enter from outside
+    for(auto& cycle : findCycles(ids, waitingEdges)) {
+        const std::set<Node::Id> members(cycle.begin(), cycle.end());
+        std::set<const Node::Input*> cycleInputs;
+        for(const auto& c : connections) {
+            if(c.second->getWaitForMessage() && members.count(c.first.outputId) && members.count(c.first.inputId)) cycleInputs.insert(c.second);
+        }
+        const bool fedFromOutside = std::any_of(connections.begin(), connections.end(), [&](const std::pair<Node::Connection, const Node::Input*>& c) {
+            return cycleInputs.count(c.second) && members.count(c.first.outputId) == 0;
+        });
+        if(fedFromOutside) continue;
+        StallReport::Issue issue;
+        issue.type = StallReport::Type::WAITING_CYCLE;
+        issue.severity = StallReport::Severity::ERROR;
+        issue.message = "Nodes " + describeCycle(cycle)
+                        + " form a cycle of inputs waiting for messages which no message can enter. Set an input on the cycle to reuse the previous message";
+        issue.nodeIds = std::move(cycle);
+        report.issues.push_back(std::move(issue));
+    }
+
+    // Group consumers by the output whose pool their messages are taken from
+    auto origin = [&](OutputKey key) {
+        for(std::size_t depth = 0; depth < ids.size(); depth++) {
+            auto fwd = FORWARDING_OUTPUTS.find(std::get<2>(key));
+            if(!std::get<1>(key).empty() || fwd == FORWARDING_OUTPUTS.end()) break;
+            auto source = std::find_if(connections.begin(), connections.end(), [&](const std::pair<Node::Connection, const Node::Input*>& c) {
+                return c.first.inputId == std::get<0>(key) && c.first.inputGroup.empty() && c.first.inputName == fwd->second;
+            });
+            if(source == connections.end()) break;
+            key = OutputKey{source->first.outputId, source->first.outputGroup, source->first.outputName};
+        }
+        return key;
+    };
+    std::map<OutputKey, std::vector<std::pair<Node::Connection, const Node::Input*>>> consumers;
+    for(const auto& c : connections) consumers[origin(OutputKey{c.first.outputId, c.first.outputGroup, c.first.outputName})].push_back(c);
+
+    for(const auto& kv : consumers) {
+        const auto& producer = *nodes[std::get<0>(kv.first)];
+        const auto output = describeOutput(std::get<1>(kv.first), std::get<2>(kv.first));
+        const int poolSize = std::get<1>(kv.first).empty() ? getPoolSize(producer, std::get<2>(kv.first)) : 0;
+
+        // Messages which may pile up in consumer queues while still taken from the pool
+        int held = 0;
+        std::vector<Node::Id> retaining, throttling;
+        for(const auto& c : kv.second) {
+            const auto& consumer = *nodes[c.first.inputId];
+            const bool retains = isRetaining(consumer);
+            const bool blockingSlow = c.second->getBlocking() && isSlow(consumer);
+            if(retains || blockingSlow) held += c.second->getQueueSize();
+            if(retains) retaining.push_back(consumer.id);
+            if(blockingSlow) throttling.push_back(consumer.id);
+        }
+        const int suggested = held + FRAMES_IN_FLIGHT;
+        auto describeIds = [&](const std::vector<Node::Id>& list) {
+            std::string names;
+            for(const auto id : list) names += (names.empty() ? "" : ", ") + describe(*nodes[id]);
+            return names;
+        };
+
+        if(!retaining.empty() && poolSize > 0 && poolSize < suggested) {
+            StallReport::Issue issue;
+            issue.type = StallReport::Type::UNDERSIZED_POOL;
+            issue.severity = StallReport::Severity::ERROR;
+            issue.nodeIds.push_back(producer.id);
+            issue.nodeIds.insert(issue.nodeIds.end(), retaining.begin(), retaining.end());
+            issue.output = output;
+            issue.poolSize = poolSize;
+            issue.suggestedPoolSize = suggested;
+            issue.message = "Output '" + output + "' of " + describe(producer) + " has a pool of " + std::to_string(poolSize) + " frames, but "
+                            + describeIds(retaining) + " may retain up to " + std::to_string(held)
+                            + " of them and the producer freezes once the pool is exhausted. Increase the pool to at least " + std::to_string(suggested)
+                            + " frames";
+            report.issues.push_back(std::move(issue));
+        }
+
+        if(kv.second.size() > 1 && !throttling.empty() && throttling.size() < kv.second.size()) {
+            StallReport::Issue issue;
+            issue.type = StallReport::Type::BLOCKING_FANOUT;
+            issue.severity = StallReport::Severity::WARNING;
+            issue.nodeIds.push_back(producer.id);
+            issue.nodeIds.insert(issue.nodeIds.end(), throttling.begin(), throttling.end());
+            issue.output = output;
+            issue.poolSize = poolSize;
+            issue.suggestedPoolSize = std::max(poolSize, suggested);
+            issue.message = "Output '" + output + "' of " + describe(producer) + " feeds " + std::to_string(kv.second.size()) + " inputs, and blocking inputs of "
+                            + describeIds(throttling) + " throttle all of them to the slowest consumer. Make these inputs non-blocking";
+            if(poolSize > 0 && poolSize < suggested) issue.message += " or increase the pool to at least " + std::to_string(suggested) + " frames";
+            report.issues.push_back(std::move(issue));
+        }
+    }
+    return report;
+}
+
+}  // namespace python
+}  // namespace dai
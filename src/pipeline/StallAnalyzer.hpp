@@ -0,0 +1,75 @@
+#pragma once
+
+// std
+#include <string>
+#include <vector>
+
+// depthai
+#include "depthai/pipeline/Pipeline.hpp"
+
+namespace dai {
+namespace python {
+
+/**
+ * Configurations of a pipeline which may stall or deadlock it on the device
+ */
+struct StallReport {
+    enum class Severity {
+        /// Producers may be throttled to the rate of the slowest consumer
+        WARNING,
+        /// Pipeline may freeze
+        ERROR
+    };
+
+    enum class Type {
+        /// Cycle of connections into blocking inputs, each node may wait on the next one to free its queue
+        BLOCKING_CYCLE,
+        /// Cycle of connections into inputs which wait for messages, no message enters the cycle
+        WAITING_CYCLE,
+        /// Pool of an output is smaller than number of its messages consumers may retain
+        UNDERSIZED_POOL,
+        /// Output feeds multiple consumers and a slow blocking one throttles the others
+        BLOCKING_FANOUT
+    };
+
+    struct Issue {
+        Type type = Type::BLOCKING_CYCLE;
+        Severity severity = Severity::WARNING;
+        /// Ids of nodes involved, producer first for pool and fan-out issues
+        std::vector<Node::Id> nodeIds;
+        /// Output of the producer for pool and fan-out issues, as "group.name" if grouped
+        std::string output;
+        /// Number of frames in pool of the output, 0 if not applicable or unknown
+        int poolSize = 0;
+        /// Suggested minimum number of frames in pool of the output, 0 if not applicable
+        int suggestedPoolSize = 0;
+        std::string message;
+    };
+
+    std::vector<Issue> issues;
+
+    /**
+     * Check whether any issue of given severity or higher was found
+     */
+    bool hasIssues(Severity severity = Severity::WARNING) const;
+};
+
+/**
+ * Statically analyzes connections and input settings (blocking, queue size, waiting for messages) of a pipeline
+ * for configurations which stall or deadlock it. Messages are taken from a pool of the producing node and returned
+ * once all consumers release them, so consumers which retain messages (Script) or fill blocking queues slowly
+ * (XLinkOut, VideoEncoder, NeuralNetwork, Script) can exhaust the pool. Messages forwarded through passthrough and
+ * synced outputs are accounted to the pool they originate from.
+ */
+class StallAnalyzer {
+   public:
+    /**
+     * Analyzes a pipeline
+     *
+     * @param pipeline Pipeline to analyze
+     */
+    static StallReport analyze(const Pipeline& pipeline);
+};
+
+}  // namespace python
+}  // namespace dai
@@ -2,9 +2,12 @@
 #include "pipeline/CommonBindings.hpp"
 #include <unordered_map>
 #include <memory>
+#include <cstdint>
+#include <stdexcept>
 
 // depthai
 #include "depthai/pipeline/datatype/ADatatype.hpp"
+#include "depthai/pipeline/datatype/StreamMessageParser.hpp"
 
 //pybind
 #include <pybind11/chrono.h>
@@ -33,6 +36,21 @@ void bind_adatatype(pybind11::module& m, void* pCallstack){
 
     // Message
     adatatype
-        .def("getRaw", &ADatatype::getRaw);
+        .def("getRaw", &ADatatype::getRaw)
+        .def("serialize", [](const ADatatype& msg){
+            auto data = StreamMessageParser::serializeMessage(msg);
+            return py::bytes(reinterpret_cast<const char*>(data.data()), data.size());
+        }, "Serializes the message into the packet format of device streams")
+        .def_static("parse", [](py::bytes data){
+            char* buffer = nullptr;
+            Py_ssize_t size = 0;
+            if(PyBytes_AsStringAndSize(data.ptr(), &buffer, &size) != 0) throw py::error_already_set();
+            if(static_cast<std::uint64_t>(size) > UINT32_MAX) throw std::invalid_argument("Message too large");
+            // Parser only reads the packet
+            streamPacketDesc_t packet = {};
+            packet.data = reinterpret_cast<std::uint8_t*>(buffer);
+            packet.length = static_cast<std::uint32_t>(size);
+            return StreamMessageParser::parseMessageToADatatype(&packet);
+        }, py::arg("data"), "Parses a message serialized with serialize (or read from a device stream) as its datatype (ImgFrame, NNData, ...)");
 
 }
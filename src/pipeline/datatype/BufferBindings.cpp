@@ -6,6 +6,9 @@
 // depthai
 #include "depthai/pipeline/datatype/Buffer.hpp"
 
+// project
+#include "queue/HostTimestamps.hpp"
+
 //pybind
 #include <pybind11/chrono.h>
 #include <pybind11/numpy.h>
@@ -83,6 +86,12 @@ void bind_buffer(pybind11::module& m, void* pCallstack){
         .def("getTimestamp", &Buffer::getTimestamp, DOC(dai, Buffer, getTimestamp))
         .def("getTimestampDevice", &Buffer::getTimestampDevice, DOC(dai, Buffer, getTimestampDevice))
         .def("getSequenceNum", &Buffer::getSequenceNum, DOC(dai, Buffer, getSequenceNum))
+        .def("getTimestampHostArrival", [](const Buffer& buffer){
+            return dai::python::HostTimestamps::getArrival(buffer);
+        }, "Retrieves host clock timestamp at which the message arrived to the host: when the callbacks of a Device output queue ran for it, right after it was read, parsed and queued, or when it was first sent to a MessageQueue. Time of retrieval if the message was retrieved before, None if it wasn't received by a queue")
+        .def("getTimestampHostDequeue", [](const Buffer& buffer){
+            return dai::python::HostTimestamps::getDequeue(buffer);
+        }, "Retrieves host clock timestamp at which the message was first retrieved from a queue, None if it wasn't retrieved yet")
         .def("setTimestamp", &Buffer::setTimestamp, DOC(dai, Buffer, setTimestamp))
         .def("setTimestampDevice", &Buffer::setTimestampDevice, DOC(dai, Buffer, setTimestampDevice))
         .def("setSequenceNum", &Buffer::setSequenceNum, DOC(dai, Buffer, setSequenceNum))
@@ -6,6 +6,9 @@
 // depthai
 #include "depthai/pipeline/datatype/ImgFrame.hpp"
 
+// project
+#include "utility/Tracer.hpp"
+
 //pybind
 #include <pybind11/chrono.h>
 #include <pybind11/numpy.h>
@@ -268,6 +271,7 @@ void bind_imgframe(pybind11::module& m, void* pCallstack){
 
             // ImgFrame
             auto& img = obj.cast<dai::ImgFrame&>();
+            dai::python::Tracer::Scope scope("getCvFrame", "conversion", "", img.getSequenceNum());
 
             // Get numpy frame (python object) by calling getFrame
             auto frame = obj.attr("getFrame")();
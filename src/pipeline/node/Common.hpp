@@ -12,16 +12,44 @@
 #include "depthai/pipeline/Pipeline.hpp"
 #include "depthai/pipeline/Node.hpp"
 
+// project
+#include "pipeline/PipelineBuilder.hpp"
+
 // Map of python node classes and call to pipeline to create it
 extern std::vector<std::pair<py::handle, std::function<std::shared_ptr<dai::Node>(dai::Pipeline&, py::object class_)>>> pyNodeCreateMap;
 extern py::handle daiNodeModule;
 
+// Nodes keeping their initial config or control outside of properties, which is synced into properties on serialization
+template<typename T>
+auto syncInitialConfig(T& node, int) -> decltype(node.initialControl.set(node.properties.initialControl), void()) {
+    node.initialControl.set(node.properties.initialControl);
+}
+template<typename T>
+auto syncInitialConfig(T& node, int) -> decltype(node.initialConfig.set(node.properties.initialConfig), void()) {
+    node.initialConfig.set(node.properties.initialConfig);
+}
+template<typename T>
+auto syncInitialConfig(T& node, int) -> decltype(node.initialConfig.set(node.properties.roiConfig), void()) {
+    node.initialConfig.set(node.properties.roiConfig);
+}
+template<typename T>
+void syncInitialConfig(T&, long) {}
+
 template<typename T, typename DERIVED = dai::Node>
 py::class_<T> addNode(const char* name, const char* docstring = nullptr){
     auto node = py::class_<T, DERIVED, std::shared_ptr<T>>(daiNodeModule, name, docstring);
     pyNodeCreateMap.push_back(std::make_pair(node, [](dai::Pipeline& p, py::object class_){
         return p.create<T>();
     }));
+    // Allows rebuilding pipelines containing the node (Pipeline.clone, Pipeline.fromJson)
+    dai::python::PipelineBuilder::NodeType type;
+    type.create = [](dai::Pipeline& p) -> std::shared_ptr<dai::Node> { return p.create<T>(); };
+    type.setProperties = [](dai::Node& n, const nlohmann::json& j) {
+        auto& typed = static_cast<T&>(n);
+        j.get_to(typed.properties);
+        syncInitialConfig(typed, 0);
+    };
+    dai::python::PipelineBuilder::registerNodeType(T::NAME, std::move(type));
     return node;
 }
 
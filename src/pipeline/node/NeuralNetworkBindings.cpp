@@ -5,6 +5,9 @@
 #include "depthai/pipeline/Node.hpp"
 #include "depthai/pipeline/node/NeuralNetwork.hpp"
 
+// project
+#include "pipeline/AssetRegistry.hpp"
+
 
 void bind_neuralnetwork(pybind11::module& m, void* pCallstack){
 
@@ -42,13 +45,23 @@ void bind_neuralnetwork(pybind11::module& m, void* pCallstack){
         .def_readonly("input", &NeuralNetwork::input, DOC(dai, node, NeuralNetwork, input))
         .def_readonly("out", &NeuralNetwork::out, DOC(dai, node, NeuralNetwork, out))
         .def_readonly("passthrough", &NeuralNetwork::passthrough, DOC(dai, node, NeuralNetwork, passthrough))
-        .def("setBlobPath", &NeuralNetwork::setBlobPath, py::arg("path"), DOC(dai, node, NeuralNetwork, setBlobPath))
+        // Blobs are deduplicated across pipelines, see AssetRegistry
+        .def("setBlobPath", [](NeuralNetwork& nn, const dai::Path& path) {
+            nn.setBlobPath(path);
+            python::AssetRegistry::intern(nn.getAssetManager(), "__blob");
+        }, py::arg("path"), DOC(dai, node, NeuralNetwork, setBlobPath))
         .def("setNumPoolFrames", &NeuralNetwork::setNumPoolFrames, py::arg("numFrames"), DOC(dai, node, NeuralNetwork, setNumPoolFrames))
         .def("setNumInferenceThreads", &NeuralNetwork::setNumInferenceThreads, py::arg("numThreads"), DOC(dai, node, NeuralNetwork, setNumInferenceThreads))
         .def("setNumNCEPerInferenceThread", &NeuralNetwork::setNumNCEPerInferenceThread, py::arg("numNCEPerThread"), DOC(dai, node, NeuralNetwork, setNumNCEPerInferenceThread))
         .def("getNumInferenceThreads", &NeuralNetwork::getNumInferenceThreads, DOC(dai, node, NeuralNetwork, getNumInferenceThreads))
-        .def("setBlob", py::overload_cast<dai::OpenVINO::Blob>(&NeuralNetwork::setBlob), py::arg("blob"), DOC(dai, node, NeuralNetwork, setBlob))
-        .def("setBlob", py::overload_cast<const dai::Path&>(&NeuralNetwork::setBlob), py::arg("path"), DOC(dai, node, NeuralNetwork, setBlob, 2))
+        .def("setBlob", [](NeuralNetwork& nn, dai::OpenVINO::Blob blob) {
+            nn.setBlob(std::move(blob));
+            python::AssetRegistry::intern(nn.getAssetManager(), "__blob");
+        }, py::arg("blob"), DOC(dai, node, NeuralNetwork, setBlob))
+        .def("setBlob", [](NeuralNetwork& nn, const dai::Path& path) {
+            nn.setBlob(path);
+            python::AssetRegistry::intern(nn.getAssetManager(), "__blob");
+        }, py::arg("path"), DOC(dai, node, NeuralNetwork, setBlob, 2))
 
         .def_readonly("inputs", &NeuralNetwork::inputs, DOC(dai, node, NeuralNetwork, inputs))
         .def_readonly("passthroughs", &NeuralNetwork::passthroughs, DOC(dai, node, NeuralNetwork, passthroughs))
@@ -5,6 +5,9 @@
 #include "depthai/pipeline/Node.hpp"
 #include "depthai/pipeline/node/Script.hpp"
 
+// project
+#include "pipeline/AssetRegistry.hpp"
+
 void bind_script(pybind11::module& m, void* pCallstack){
 
     using namespace dai;
@@ -38,10 +41,23 @@ void bind_script(pybind11::module& m, void* pCallstack){
     script
         .def_readonly("inputs", &Script::inputs)
         .def_readonly("outputs", &Script::outputs)
-        .def("setScriptPath", &Script::setScriptPath, DOC(dai, node, Script, setScriptPath))
-        .def("setScript", py::overload_cast<const std::string&, const std::string&>(&Script::setScript), py::arg("script"), py::arg("name") = "", DOC(dai, node, Script, setScript))
-        .def("setScript", py::overload_cast<const std::vector<std::uint8_t>&, const std::string&>(&Script::setScript), py::arg("data"), py::arg("name") = "", DOC(dai, node, Script, setScript, 2))
-        .def("setScriptPath", &Script::setScriptPath, py::arg("path"), py::arg("name") = "", DOC(dai, node, Script, setScriptPath))
+        // Scripts are deduplicated across pipelines, see AssetRegistry
+        .def("setScriptPath", [](Script& s, const dai::Path& path, const std::string& name) {
+            s.setScriptPath(path, name);
+            python::AssetRegistry::intern(s.getAssetManager(), "__script");
+        }, DOC(dai, node, Script, setScriptPath))
+        .def("setScript", [](Script& s, const std::string& script, const std::string& name) {
+            s.setScript(script, name);
+            python::AssetRegistry::intern(s.getAssetManager(), "__script");
+        }, py::arg("script"), py::arg("name") = "", DOC(dai, node, Script, setScript))
+        .def("setScript", [](Script& s, const std::vector<std::uint8_t>& data, const std::string& name) {
+            s.setScript(data, name);
+            python::AssetRegistry::intern(s.getAssetManager(), "__script");
+        }, py::arg("data"), py::arg("name") = "", DOC(dai, node, Script, setScript, 2))
+        .def("setScriptPath", [](Script& s, const dai::Path& path, const std::string& name) {
+            s.setScriptPath(path, name);
+            python::AssetRegistry::intern(s.getAssetManager(), "__script");
+        }, py::arg("path"), py::arg("name") = "", DOC(dai, node, Script, setScriptPath))
         .def("getScriptName", &Script::getScriptName, DOC(dai, node, Script, getScriptName))
         .def("setProcessor", &Script::setProcessor, DOC(dai, node, Script, setProcessor))
         .def("getProcessor", &Script::getProcessor, DOC(dai, node, Script, getProcessor))
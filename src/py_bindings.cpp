@@ -28,6 +28,12 @@
 #include "openvino/OpenVINOBindings.hpp"
 #include "log/LogBindings.hpp"
 #include "VersionBindings.hpp"
+#include "utility/TracerBindings.hpp"
+#include "utility/MetricsExporterBindings.hpp"
+#include "utility/FirmwareCacheBindings.hpp"
+#include "record/RecordBindings.hpp"
+#include "device/HostDeviceBindings.hpp"
+#include "utility/Initialization.hpp"
 
 PYBIND11_MODULE(depthai, m)
 {
@@ -45,6 +51,11 @@ PYBIND11_MODULE(depthai, m)
     DatatypeBindings::addToCallstack(callstack);
     callstack.push_front(&LogBindings::bind);
     callstack.push_front(&VersionBindings::bind);
+    callstack.push_front(&TracerBindings::bind);
+    callstack.push_front(&MetricsExporterBindings::bind);
+    callstack.push_front(&FirmwareCacheBindings::bind);
+    callstack.push_front(&RecordBindings::bind);
+    callstack.push_front(&HostDeviceBindings::bind);
     callstack.push_front(&DataQueueBindings::bind);
     callstack.push_front(&OpenVINOBindings::bind);
     NodeBindings::addToCallstack(callstack);
@@ -82,11 +93,9 @@ PYBIND11_MODULE(depthai, m)
         // ignore
     }
 
-    // Call dai::initialize on 'import depthai' to initialize asap with additional information to print
-    try {
-        dai::initialize(std::string("Python bindings - version: ") + DEPTHAI_PYTHON_VERSION + " from " + DEPTHAI_PYTHON_COMMIT_DATETIME + " build: " + DEPTHAI_PYTHON_BUILD_DATETIME, installSignalHandler);
-    } catch (const std::exception&) {
-        // ignore, will be initialized later on if possible
-    }
+    // Defer dai::initialize until first device, XLink or pipeline use, so 'import depthai' stays cheap
+    dai::python::setInitializationOptions(std::string("Python bindings - version: ") + DEPTHAI_PYTHON_VERSION + " from " + DEPTHAI_PYTHON_COMMIT_DATETIME + " build: " + DEPTHAI_PYTHON_BUILD_DATETIME, installSignalHandler);
+    m.def("initialize", &dai::python::initialize, py::call_guard<py::gil_scoped_release>(), "Initializes the library (logging, resources, XLink) if not initialized yet. Done implicitly on first device, XLink or pipeline use");
+    m.def("isInitialized", &dai::python::isInitialized, "Check whether the library was initialized");
 
 }
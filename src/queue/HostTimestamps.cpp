@@ -0,0 +1,102 @@
+#include "HostTimestamps.hpp"
+
+// std
+#include <algorithm>
+#include <mutex>
+#include <unordered_map>
+
+namespace dai {
+namespace python {
+
+namespace {
+
+struct Entry {
+    std::weak_ptr<RawBuffer> raw;
+    tl::optional<HostTimestamps::TimePoint> arrival;
+    tl::optional<HostTimestamps::TimePoint> dequeue;
+};
+
+// Expired entries are purged once the table grows over this size
+constexpr std::size_t PURGE_THRESHOLD = 1024;
+
+std::mutex mtx;
+std::unordered_map<const RawBuffer*, Entry> entries;
+std::size_t purgeSize = PURGE_THRESHOLD;
+
+void purgeExpired() {
+    for(auto it = entries.begin(); it != entries.end();) {
+        if(it->second.raw.expired()) {
+            it = entries.erase(it);
+        } else {
+            ++it;
+        }
+    }
+    // Don't purge on every insertion if many messages are alive
+    purgeSize = std::max(PURGE_THRESHOLD, entries.size() * 2);
+}
+
+// Retrieves entry of a live message, creating it if needed. Must be called with mtx held
+Entry& entryOf(const std::shared_ptr<RawBuffer>& raw) {
+    auto& entry = entries[raw.get()];
+    if(entry.raw.expired()) {
+        // New message, or address of a destroyed one reused
+        entry = Entry{raw, tl::nullopt, tl::nullopt};
+        if(entries.size() > purgeSize) purgeExpired();
+    }
+    return entries[raw.get()];
+}
+
+// Looks up entry of a live message, nullptr if it has none. Must be called with mtx held
+const Entry* findEntry(const std::shared_ptr<RawBuffer>& raw) {
+    auto it = entries.find(raw.get());
+    if(it == entries.end() || it->second.raw.expired()) return nullptr;
+    return &it->second;
+}
+
+}  // namespace
+
+HostTimestamps::TimePoint HostTimestamps::stampArrival(const ADatatype& msg) {
+    const TimePoint now = std::chrono::steady_clock::now();
+    auto raw = msg.getRaw();
+    if(raw == nullptr) return now;
+
+    std::unique_lock<std::mutex> l(mtx);
+    auto& entry = entryOf(raw);
+    if(!entry.arrival) entry.arrival = now;
+    return *entry.arrival;
+}
+
+bool HostTimestamps::stampDequeue(const ADatatype& msg, TimePoint& arrival, TimePoint& dequeue) {
+    const TimePoint now = std::chrono::steady_clock::now();
+    auto raw = msg.getRaw();
+    if(raw == nullptr) return false;
+
+    std::unique_lock<std::mutex> l(mtx);
+    auto& entry = entryOf(raw);
+    const bool first = !entry.dequeue;
+    if(first) entry.dequeue = now;
+    // Arrival isn't stamped yet if the message was retrieved before the queue callbacks ran, it arrived at the latest now
+    if(!entry.arrival) entry.arrival = *entry.dequeue;
+    arrival = *entry.arrival;
+    dequeue = *entry.dequeue;
+    return first;
+}
+
+tl::optional<HostTimestamps::TimePoint> HostTimestamps::getArrival(const ADatatype& msg) {
+    auto raw = msg.getRaw();
+    std::unique_lock<std::mutex> l(mtx);
+    auto entry = findEntry(raw);
+    if(entry == nullptr) return tl::nullopt;
+    return entry->arrival;
+}
+
+tl::optional<HostTimestamps::TimePoint> HostTimestamps::getDequeue(const ADatatype& msg) {
+    auto raw = msg.getRaw();
+    std::unique_lock<std::mutex> l(mtx);
+    auto entry = findEntry(raw);
+    if(entry == nullptr) return tl::nullopt;
+    return entry->dequeue;
+}
+
+}  // namespace python
+}  // namespace dai
@@ -0,0 +1,60 @@
+#pragma once
+
+// std
+#include <chrono>
+#include <memory>
+
+// depthai
+#include "depthai/pipeline/datatype/ADatatype.hpp"
+
+// libraries
+#include "tl/optional.hpp"
+
+namespace dai {
+namespace python {
+
+/**
+ * Host side timestamps of messages received by DataOutputQueues.
+ * Kept in a side table keyed by message, as raw messages don't have room for them.
+ * Arrival is stamped by monitored DataOutputQueues (see QueueMonitor, Device output queues are monitored from the start of the pipeline)
+ * and by MessageQueue::send, dequeue on every retrieval from Python. A message retrieved before being stamped gets its dequeue time as arrival.
+ *
+ * Arrival is callback time: DataOutputQueue reads, parses and queues a message before running its callbacks, which stamp it.
+ * It therefore includes parsing, misses time spent in the XLink read, and a consumer may retrieve the message before it is stamped.
+ * Recorder and SystemInformationCollector stamp messages not stamped yet when they are handed over, which is later still.
+ */
+class HostTimestamps {
+   public:
+    using TimePoint = std::chrono::time_point<std::chrono::steady_clock, std::chrono::steady_clock::duration>;
+
+    /**
+     * Records the time a message arrived to the host (current time, see above), if not recorded yet
+     *
+     * @param msg Received message
+     * @returns Recorded arrival time
+     */
+    static TimePoint stampArrival(const ADatatype& msg);
+
+    /**
+     * Records the time a message was retrieved by the host, if not recorded yet
+     *
+     * @param msg Retrieved message
+     * @param[out] arrival Recorded arrival time, recorded as dequeue time if it wasn't recorded yet
+     * @param[out] dequeue Recorded dequeue time
+     * @returns True if dequeue time was recorded by this call, false if message was retrieved before
+     */
+    static bool stampDequeue(const ADatatype& msg, TimePoint& arrival, TimePoint& dequeue);
+
+    /**
+     * Retrieves the time a message arrived to the host
+     */
+    static tl::optional<TimePoint> getArrival(const ADatatype& msg);
+
+    /**
+     * Retrieves the time a message was retrieved by the host
+     */
+    static tl::optional<TimePoint> getDequeue(const ADatatype& msg);
+};
+
+}  // namespace python
+}  // namespace dai
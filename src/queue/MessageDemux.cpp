@@ -0,0 +1,136 @@
+#include "MessageDemux.hpp"
+
+// std
+#include <algorithm>
+
+// depthai-shared
+#include "depthai-shared/datatype/RawImgFrame.hpp"
+
+// project
+#include "queue/QueueCallbacks.hpp"
+#include "utility/DatatypeUtils.hpp"
+
+namespace dai {
+namespace python {
+
+std::shared_ptr<MessageQueue> MessageDemux::State::getOrCreate(int k) {
+    std::unique_lock<std::mutex> l(mtx);
+    if(closed) return nullptr;
+    auto& q = queues[k];
+    if(q == nullptr) {
+        q = std::make_shared<MessageQueue>(name + "/" + std::to_string(k), maxSize, blocking);
+    }
+    return q;
+}
+
+void MessageDemux::State::route(const std::shared_ptr<ADatatype>& msg) {
+    if(msg == nullptr) return;
+    auto raw = msg->getRaw();
+
+    int k = -1;
+    switch(key) {
+        case Key::INSTANCE_NUM: {
+            auto frame = dynamic_cast<const RawImgFrame*>(raw.get());
+            if(frame != nullptr) k = static_cast<int>(frame->instanceNum);
+        } break;
+        case Key::TYPE:
+            k = static_cast<int>(getDatatype(*msg));
+            break;
+        case Key::CATEGORY: {
+            auto frame = dynamic_cast<const RawImgFrame*>(raw.get());
+            if(frame != nullptr) k = static_cast<int>(frame->category);
+        } break;
+    }
+
+    // Respects blocking behavior of the child queue - a full blocking child queue applies backpressure to the stream
+    auto q = getOrCreate(k);
+    if(q) q->send(msg);
+}
+
+MessageDemux::MessageDemux(std::shared_ptr<DataOutputQueue> queue, Key key, unsigned int maxSize, bool blocking)
+    : state(std::make_shared<State>()) {
+    state->key = key;
+    state->maxSize = maxSize;
+    state->blocking = blocking;
+    subscribe(std::move(queue));
+}
+
+MessageDemux::MessageDemux(std::shared_ptr<MessageQueue> queue, Key key, unsigned int maxSize, bool blocking)
+    : state(std::make_shared<State>()) {
+    state->key = key;
+    state->maxSize = maxSize;
+    state->blocking = blocking;
+    subscribe(std::move(queue));
+}
+
+template <typename Q>
+void MessageDemux::subscribe(std::shared_ptr<Q> queue) {
+    state->name = queue->getName();
+
+    // Parent queue doesn't retain any messages, all are routed to child queues
+    const auto parentMaxSize = queue->getMaxSize();
+    const auto parentBlocking = queue->getBlocking();
+    queue->setBlocking(false);
+    queue->setMaxSize(0);
+
+    // Routing state is owned by the callback as well, so child queues keep being fed
+    // even if the demultiplexer handle itself goes out of scope
+    auto s = state;
+    const auto callbackId = queue->addCallback([s](std::string, std::shared_ptr<ADatatype> msg) { s->route(msg); });
+
+    unsubscribe = [queue, callbackId, parentMaxSize, parentBlocking]() {
+        removeQueueCallback(*queue, callbackId);
+        if(!queue->isClosed()) {
+            try {
+                queue->setMaxSize(parentMaxSize);
+                queue->setBlocking(parentBlocking);
+            } catch(const std::exception&) {
+                // queue closed in between
+            }
+        }
+    };
+}
+
+MessageDemux::Key MessageDemux::getKey() const {
+    return state->key;
+}
+
+std::shared_ptr<MessageQueue> MessageDemux::getQueue(int key) {
+    auto q = state->getOrCreate(key);
+    if(q == nullptr) throw std::runtime_error("MessageDemux (" + state->name + ") closed");
+    return q;
+}
+
+std::shared_ptr<MessageQueue> MessageDemux::getQueue(int key, unsigned int maxSize, bool blocking) {
+    auto q = getQueue(key);
+    q->setMaxSize(maxSize);
+    q->setBlocking(blocking);
+    return q;
+}
+
+std::vector<int> MessageDemux::getKeys() const {
+    std::unique_lock<std::mutex> l(state->mtx);
+    std::vector<int> keys;
+    keys.reserve(state->queues.size());
+    for(const auto& kv : state->queues) keys.push_back(kv.first);
+    std::sort(keys.begin(), keys.end());
+    return keys;
+}
+
+void MessageDemux::close() {
+    if(closed) return;
+    closed = true;
+
+    // Close child queues first, so a callback blocked on a full child queue returns
+    {
+        std::unique_lock<std::mutex> l(state->mtx);
+        state->closed = true;
+        for(auto& kv : state->queues) kv.second->close();
+    }
+
+    // Then stop routing and restore parent queue settings
+    unsubscribe();
+}
+
+}  // namespace python
+}  // namespace dai
@@ -0,0 +1,116 @@
+#pragma once
+
+// std
+#include <functional>
+#include <memory>
+#include <mutex>
+#include <unordered_map>
+#include <vector>
+
+// depthai
+#include "depthai/device/DataQueue.hpp"
+
+// project
+#include "queue/MessageQueue.hpp"
+
+namespace dai {
+namespace python {
+
+/**
+ * Routes messages arriving on a single DataOutputQueue or MessageQueue into per-key child queues.
+ * Routing is done on the thread delivering the message, so messages never pass through Python before being sorted.
+ * Routing stays active until close() is called or the parent queue is destroyed.
+ */
+class MessageDemux {
+   public:
+    /**
+     * Property of a message which selects the child queue
+     */
+    enum class Key {
+        /// ImgFrame instance number (source camera). Other messages are routed to key -1
+        INSTANCE_NUM,
+        /// Message datatype (DatatypeEnum)
+        TYPE,
+        /// ImgFrame category. Other messages are routed to key -1
+        CATEGORY,
+    };
+
+    /**
+     * Constructs a demultiplexer on top of given output queue.
+     * Parent queue is set to not retain any messages (maxSize 0, non-blocking) as all messages are routed to child queues.
+     *
+     * @param queue Output queue to demultiplex
+     * @param key Property of a message which selects the child queue
+     * @param maxSize Default maximum size of child queues
+     * @param blocking Default blocking behavior of child queues
+     */
+    MessageDemux(std::shared_ptr<DataOutputQueue> queue, Key key, unsigned int maxSize, bool blocking);
+
+    /**
+     * Constructs a demultiplexer on top of given message queue.
+     * Parent queue is set to not retain any messages (maxSize 0, non-blocking) as all messages are routed to child queues.
+     *
+     * @param queue Message queue to demultiplex
+     * @param key Property of a message which selects the child queue
+     * @param maxSize Default maximum size of child queues
+     * @param blocking Default blocking behavior of child queues
+     */
+    MessageDemux(std::shared_ptr<MessageQueue> queue, Key key, unsigned int maxSize, bool blocking);
+
+    /**
+     * Retrieves the key by which messages are routed
+     */
+    Key getKey() const;
+
+    /**
+     * Retrieves the child queue for given key, creating it with default maxSize and blocking behavior if it doesn't exist yet
+     *
+     * @param key Value of the key property
+     * @returns Child queue
+     */
+    std::shared_ptr<MessageQueue> getQueue(int key);
+
+    /**
+     * Retrieves the child queue for given key, creating it if it doesn't exist yet, and sets its maxSize and blocking behavior
+     *
+     * @param key Value of the key property
+     * @param maxSize Maximum size of the child queue
+     * @param blocking Blocking behavior of the child queue
+     * @returns Child queue
+     */
+    std::shared_ptr<MessageQueue> getQueue(int key, unsigned int maxSize, bool blocking);
+
+    /**
+     * Retrieves keys of all child queues created so far
+     */
+    std::vector<int> getKeys() const;
+
+    /**
+     * Stops routing, closes all child queues and restores parent queue settings
+     */
+    void close();
+
+   private:
+    struct State {
+        Key key;
+        std::string name;
+        unsigned int maxSize;
+        bool blocking;
+        bool closed = false;
+        mutable std::mutex mtx;
+        std::unordered_map<int, std::shared_ptr<MessageQueue>> queues;
+        std::shared_ptr<MessageQueue> getOrCreate(int key);
+        void route(const std::shared_ptr<ADatatype>& msg);
+    };
+
+    template <typename Q>
+    void subscribe(std::shared_ptr<Q> queue);
+
+    std::shared_ptr<State> state;
+    // Stops routing and restores parent queue settings
+    std::function<void()> unsubscribe;
+    bool closed = false;
+};
+
+}  // namespace python
+}  // namespace dai
@@ -0,0 +1,222 @@
+#include "MessageFilter.hpp"
+
+// depthai-shared
+#include "depthai-shared/datatype/RawImgDetections.hpp"
+#include "depthai-shared/datatype/RawImgFrame.hpp"
+#include "depthai-shared/datatype/RawSpatialImgDetections.hpp"
+#include "depthai-shared/datatype/RawTracklets.hpp"
+
+// project
+#include "queue/QueueCallbacks.hpp"
+#include "utility/DatatypeUtils.hpp"
+
+namespace dai {
+namespace python {
+
+namespace {
+
+// ImgFrame instance number, -1 for other messages
+int instanceOf(const RawBuffer& raw) {
+    auto frame = dynamic_cast<const RawImgFrame*>(&raw);
+    if(frame != nullptr) return static_cast<int>(frame->instanceNum);
+    return -1;
+}
+
+// Number of detections, or false if message doesn't carry detections
+bool detectionCount(const RawBuffer& raw, std::size_t& count) {
+    if(auto dets = dynamic_cast<const RawImgDetections*>(&raw)) {
+        count = dets->detections.size();
+        return true;
+    }
+    if(auto dets = dynamic_cast<const RawSpatialImgDetections*>(&raw)) {
+        count = dets->detections.size();
+        return true;
+    }
+    if(auto tracklets = dynamic_cast<const RawTracklets*>(&raw)) {
+        count = tracklets->tracklets.size();
+        return true;
+    }
+    return false;
+}
+
+}  // namespace
+
+MessageFilter& MessageFilter::addStage(Stage stage, std::function<void()> reset) {
+    std::unique_lock<std::mutex> l(mtx);
+    stages.push_back(std::move(stage));
+    if(reset) resets.push_back(std::move(reset));
+    return *this;
+}
+
+MessageFilter& MessageFilter::decimate(unsigned int n) {
+    if(n == 0) throw std::invalid_argument("Decimation factor must be at least 1");
+    auto counter = std::make_shared<std::uint64_t>(0);
+    return addStage([n, counter](const ADatatype&) { return (*counter)++ % n == 0; }, [counter]() { *counter = 0; });
+}
+
+MessageFilter& MessageFilter::type(DatatypeEnum type) {
+    return addStage([type](const ADatatype& msg) { return getDatatype(msg) == type; });
+}
+
+MessageFilter& MessageFilter::dataSize(std::size_t minSize, std::size_t maxSize) {
+    return addStage([minSize, maxSize](const ADatatype& msg) {
+        auto size = msg.getRaw()->data.size();
+        return size >= minSize && size <= maxSize;
+    });
+}
+
+MessageFilter& MessageFilter::detections(std::size_t minCount, std::size_t maxCount) {
+    return addStage([minCount, maxCount](const ADatatype& msg) {
+        std::size_t count = 0;
+        if(!detectionCount(*msg.getRaw(), count)) return true;
+        return count >= minCount && count <= maxCount;
+    });
+}
+
+MessageFilter& MessageFilter::sequenceGaps() {
+    auto last = std::make_shared<std::unordered_map<int, std::int64_t>>();
+    return addStage(
+        [this, last](const ADatatype& msg) {
+            auto raw = msg.getRaw();
+            const int instance = instanceOf(*raw);
+            auto it = last->find(instance);
+            if(it == last->end()) {
+                last->emplace(instance, raw->sequenceNum);
+            } else {
+                if(raw->sequenceNum > it->second + 1) numSequenceGaps += static_cast<std::uint64_t>(raw->sequenceNum - it->second - 1);
+                it->second = raw->sequenceNum;
+            }
+            return true;
+        },
+        [last]() { last->clear(); });
+}
+
+MessageFilter& MessageFilter::keepLatestPerInstance() {
+    latestPerInstance = true;
+    return *this;
+}
+
+bool MessageFilter::apply(const std::shared_ptr<ADatatype>& msg) {
+    if(msg == nullptr) return false;
+
+    std::unique_lock<std::mutex> l(mtx);
+    for(const auto& stage : stages) {
+        if(!stage(*msg)) {
+            numDropped++;
+            return false;
+        }
+    }
+    numPassed++;
+    return true;
+}
+
+bool MessageFilter::getKeepLatestPerInstance() const {
+    return latestPerInstance;
+}
+
+std::uint64_t MessageFilter::getNumPassed() const {
+    return numPassed;
+}
+
+std::uint64_t MessageFilter::getNumDropped() const {
+    return numDropped;
+}
+
+std::uint64_t MessageFilter::getSequenceGaps() const {
+    return numSequenceGaps;
+}
+
+void MessageFilter::reset() {
+    std::unique_lock<std::mutex> l(mtx);
+    for(const auto& r : resets) r();
+    numPassed = 0;
+    numDropped = 0;
+    numSequenceGaps = 0;
+}
+
+FilteredQueue::FilteredQueue(std::string name, std::shared_ptr<MessageFilter> filter, unsigned int maxSize, bool blocking)
+    : MessageQueue(std::move(name), maxSize, blocking), filter(std::move(filter)) {
+    if(this->filter == nullptr) throw std::invalid_argument("Filter must not be None");
+}
+
+template <typename Q>
+std::shared_ptr<FilteredQueue> FilteredQueue::subscribe(std::shared_ptr<Q> queue,
+                                                        std::shared_ptr<MessageFilter> filter,
+                                                        unsigned int maxSize,
+                                                        bool blocking) {
+    if(queue == nullptr) throw std::invalid_argument("Queue passed is not valid (nullptr)");
+    std::shared_ptr<FilteredQueue> q(new FilteredQueue(queue->getName(), std::move(filter), maxSize, blocking));
+
+    // Parent queue doesn't retain any messages, passed ones are moved to this queue
+    const auto parentMaxSize = queue->getMaxSize();
+    const auto parentBlocking = queue->getBlocking();
+    queue->setBlocking(false);
+    queue->setMaxSize(0);
+
+    // Callback doesn't keep the queue alive, nor reaches it once it started being destroyed
+    std::weak_ptr<FilteredQueue> weak = q;
+    const Q* parent = queue.get();
+    const auto callbackId = queue->addCallback([weak, parent](std::string, std::shared_ptr<ADatatype> msg) {
+        // Released within the scope, in case this was the last reference
+        QueueCallbackScope scope(parent);
+        if(auto self = weak.lock()) self->onMessage(msg);
+    });
+
+    q->unsubscribe = [queue, callbackId, parentMaxSize, parentBlocking]() {
+        removeQueueCallback(*queue, callbackId);
+        if(!queue->isClosed()) {
+            try {
+                queue->setMaxSize(parentMaxSize);
+                queue->setBlocking(parentBlocking);
+            } catch(const std::exception&) {
+                // queue closed in between
+            }
+        }
+    };
+    return q;
+}
+
+std::shared_ptr<FilteredQueue> FilteredQueue::create(std::shared_ptr<DataOutputQueue> queue,
+                                                     std::shared_ptr<MessageFilter> filter,
+                                                     unsigned int maxSize,
+                                                     bool blocking) {
+    return subscribe(std::move(queue), std::move(filter), maxSize, blocking);
+}
+
+std::shared_ptr<FilteredQueue> FilteredQueue::create(std::shared_ptr<MessageQueue> queue,
+                                                     std::shared_ptr<MessageFilter> filter,
+                                                     unsigned int maxSize,
+                                                     bool blocking) {
+    return subscribe(std::move(queue), std::move(filter), maxSize, blocking);
+}
+
+void FilteredQueue::onMessage(const std::shared_ptr<ADatatype>& msg) {
+    if(!filter->apply(msg)) return;
+    if(filter->getKeepLatestPerInstance()) {
+        const int instance = instanceOf(*msg->getRaw());
+        sendReplacing(msg, [instance](const std::shared_ptr<ADatatype>& queued) { return instanceOf(*queued->getRaw()) == instance; });
+    } else {
+        send(msg);
+    }
+}
+
+FilteredQueue::~FilteredQueue() {
+    FilteredQueue::close();
+}
+
+std::shared_ptr<MessageFilter> FilteredQueue::getFilter() const {
+    return filter;
+}
+
+void FilteredQueue::close() {
+    std::call_once(closeFlag, [this]() {
+        // Close own queue first, so a callback blocked on a full queue returns
+        MessageQueue::close();
+
+        // Then stop filtering and restore parent queue settings
+        if(unsubscribe) unsubscribe();
+    });
+}
+
+}  // namespace python
+}  // namespace dai
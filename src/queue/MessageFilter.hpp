@@ -0,0 +1,182 @@
+#pragma once
+
+// std
+#include <atomic>
+#include <cstddef>
+#include <cstdint>
+#include <functional>
+#include <limits>
+#include <memory>
+#include <mutex>
+#include <unordered_map>
+#include <vector>
+
+// depthai
+#include "depthai/device/DataQueue.hpp"
+#include "depthai-shared/datatype/DatatypeEnum.hpp"
+
+// project
+#include "queue/MessageQueue.hpp"
+
+namespace dai {
+namespace python {
+
+/**
+ * Composable chain of message filters, evaluated in C++ on the reading thread of a DataOutputQueue.
+ * Stages are evaluated in the order they were added, a message is dropped at the first stage which rejects it.
+ */
+class MessageFilter {
+   public:
+    MessageFilter() = default;
+    MessageFilter(const MessageFilter&) = delete;
+    MessageFilter& operator=(const MessageFilter&) = delete;
+
+    /**
+     * Passes only every n-th message reaching this stage
+     *
+     * @param n Decimation factor, 1 passes all messages
+     */
+    MessageFilter& decimate(unsigned int n);
+
+    /**
+     * Passes only messages of given datatype
+     *
+     * @param type Datatype to pass
+     */
+    MessageFilter& type(DatatypeEnum type);
+
+    /**
+     * Passes only messages which data size (in bytes) is within given bounds
+     *
+     * @param minSize Minimum data size, inclusive
+     * @param maxSize Maximum data size, inclusive
+     */
+    MessageFilter& dataSize(std::size_t minSize, std::size_t maxSize = std::numeric_limits<std::size_t>::max());
+
+    /**
+     * Passes only detection messages (ImgDetections, SpatialImgDetections, Tracklets) which
+     * number of detections is within given bounds. Other messages pass through
+     *
+     * @param minCount Minimum number of detections, inclusive
+     * @param maxCount Maximum number of detections, inclusive
+     */
+    MessageFilter& detections(std::size_t minCount, std::size_t maxCount = std::numeric_limits<std::size_t>::max());
+
+    /**
+     * Tracks gaps in sequence numbers, per ImgFrame instance number. Doesn't drop any messages
+     */
+    MessageFilter& sequenceGaps();
+
+    /**
+     * Retains only the latest message per ImgFrame instance number in the output queue,
+     * replacing an older message of the same instance which wasn't consumed yet
+     */
+    MessageFilter& keepLatestPerInstance();
+
+    /**
+     * Evaluates the filter chain on given message
+     *
+     * @param msg Message
+     * @returns True if message passed all stages, false otherwise
+     */
+    bool apply(const std::shared_ptr<ADatatype>& msg);
+
+    /**
+     * Check whether only the latest message per instance should be retained
+     */
+    bool getKeepLatestPerInstance() const;
+
+    /**
+     * Retrieves number of messages which passed the filter
+     */
+    std::uint64_t getNumPassed() const;
+
+    /**
+     * Retrieves number of messages which were dropped by the filter
+     */
+    std::uint64_t getNumDropped() const;
+
+    /**
+     * Retrieves number of messages missing based on sequence numbers. Requires sequenceGaps stage
+     */
+    std::uint64_t getSequenceGaps() const;
+
+    /**
+     * Resets counters and state of all stages
+     */
+    void reset();
+
+   private:
+    using Stage = std::function<bool(const ADatatype&)>;
+
+    mutable std::mutex mtx;
+    std::vector<Stage> stages;
+    std::vector<std::function<void()>> resets;
+    std::atomic<bool> latestPerInstance{false};
+    std::atomic<std::uint64_t> numPassed{0};
+    std::atomic<std::uint64_t> numDropped{0};
+    std::atomic<std::uint64_t> numSequenceGaps{0};
+
+    MessageFilter& addStage(Stage stage, std::function<void()> reset = nullptr);
+};
+
+/**
+ * Host side queue fed with messages of a DataOutputQueue or MessageQueue which passed a MessageFilter.
+ * Dropped messages never reach Python.
+ */
+class FilteredQueue : public MessageQueue {
+   public:
+    /**
+     * Creates a filtered queue on top of given output queue.
+     * Parent queue is set to not retain any messages (maxSize 0, non-blocking) until this queue is closed.
+     *
+     * @param queue Output queue to filter
+     * @param filter Filter chain
+     * @param maxSize Maximum size of this queue
+     * @param blocking Blocking behavior of this queue
+     */
+    static std::shared_ptr<FilteredQueue> create(std::shared_ptr<DataOutputQueue> queue,
+                                                 std::shared_ptr<MessageFilter> filter,
+                                                 unsigned int maxSize,
+                                                 bool blocking);
+
+    /**
+     * Creates a filtered queue on top of given message queue.
+     * Parent queue is set to not retain any messages (maxSize 0, non-blocking) until this queue is closed.
+     *
+     * @param queue Message queue to filter
+     * @param filter Filter chain
+     * @param maxSize Maximum size of this queue
+     * @param blocking Blocking behavior of this queue
+     */
+    static std::shared_ptr<FilteredQueue> create(std::shared_ptr<MessageQueue> queue,
+                                                 std::shared_ptr<MessageFilter> filter,
+                                                 unsigned int maxSize,
+                                                 bool blocking);
+
+    ~FilteredQueue() override;
+
+    /**
+     * Retrieves filter chain of this queue
+     */
+    std::shared_ptr<MessageFilter> getFilter() const;
+
+    /**
+     * Stops filtering, closes the queue and restores parent queue settings
+     */
+    void close() override;
+
+   private:
+    FilteredQueue(std::string name, std::shared_ptr<MessageFilter> filter, unsigned int maxSize, bool blocking);
+    template <typename Q>
+    static std::shared_ptr<FilteredQueue> subscribe(std::shared_ptr<Q> queue, std::shared_ptr<MessageFilter> filter, unsigned int maxSize, bool blocking);
+    void onMessage(const std::shared_ptr<ADatatype>& msg);
+
+    std::shared_ptr<MessageFilter> filter;
+    // Stops filtering and restores parent queue settings
+    std::function<void()> unsubscribe;
+    std::once_flag closeFlag;
+};
+
+}  // namespace python
+}  // namespace dai
@@ -0,0 +1,63 @@
+#include "MessagePool.hpp"
+
+// std
+#include <stdexcept>
+
+namespace dai {
+namespace python {
+
+constexpr std::chrono::microseconds MessagePool::POLL_INTERVAL;
+
+MessagePool::MessagePool(const Factory& factory, unsigned int count, std::size_t capacity) : capacity(capacity) {
+    if(count == 0) throw std::invalid_argument("Pool must contain at least one message");
+
+    messages.reserve(count);
+    for(unsigned int i = 0; i < count; i++) {
+        auto msg = factory();
+        if(msg == nullptr) throw std::invalid_argument("Message factory returned an invalid message (nullptr)");
+        msg->getRaw()->data.reserve(capacity);
+        messages.push_back(std::move(msg));
+    }
+}
+
+bool MessagePool::isFree(const std::shared_ptr<ADatatype>& msg) {
+    // Free when only the pool references the message, and only the message (and the copy below) its raw buffer.
+    // Raw buffer stays referenced by a DataInputQueue until written to XLink
+    auto raw = msg->getRaw();
+    return msg.use_count() == 1 && raw.use_count() == 2;
+}
+
+std::shared_ptr<ADatatype> MessagePool::tryAcquire() {
+    std::unique_lock<std::mutex> l(mtx);
+
+    // Round robin, so recently sent messages are checked last
+    for(std::size_t i = 0; i < messages.size(); i++) {
+        const auto& msg = messages[(next + i) % messages.size()];
+        if(isFree(msg)) {
+            next = (next + i + 1) % messages.size();
+            return msg;
+        }
+    }
+    return nullptr;
+}
+
+unsigned int MessagePool::getSize() const {
+    std::unique_lock<std::mutex> l(mtx);
+    return static_cast<unsigned int>(messages.size());
+}
+
+unsigned int MessagePool::getNumAvailable() const {
+    std::unique_lock<std::mutex> l(mtx);
+    unsigned int available = 0;
+    for(const auto& msg : messages) {
+        if(isFree(msg)) available++;
+    }
+    return available;
+}
+
+std::size_t MessagePool::getCapacity() const {
+    return capacity;
+}
+
+}  // namespace python
+}  // namespace dai
@@ -0,0 +1,95 @@
+#pragma once
+
+// std
+#include <chrono>
+#include <cstddef>
+#include <functional>
+#include <memory>
+#include <mutex>
+#include <thread>
+#include <vector>
+
+// depthai
+#include "depthai/pipeline/datatype/ADatatype.hpp"
+
+namespace dai {
+namespace python {
+
+/**
+ * Pool of preallocated messages, recycled once they aren't referenced anymore.
+ * A message sent to a DataInputQueue is only referenced until it is written to XLink,
+ * after which it can be acquired from the pool again, without reallocating its data.
+ */
+class MessagePool {
+   public:
+    /// Factory creating a new message
+    using Factory = std::function<std::shared_ptr<ADatatype>()>;
+
+    /**
+     * Constructs a pool of messages
+     *
+     * @param factory Function creating a new message
+     * @param count Number of messages in the pool
+     * @param capacity Number of bytes reserved for data of each message
+     */
+    MessagePool(const Factory& factory, unsigned int count, std::size_t capacity);
+
+    /**
+     * Try to acquire a free message. If no message is free, return immediately with nullptr.
+     * Acquired message retains metadata and data from its previous use
+     *
+     * @returns Message or nullptr if no message is free
+     */
+    std::shared_ptr<ADatatype> tryAcquire();
+
+    /**
+     * Block until a message is free with a timeout
+     *
+     * @param timeout Duration for which the function should block
+     * @param[out] hasTimedout Outputs true if timeout occurred, false otherwise
+     * @returns Message or nullptr if no message is free
+     */
+    template <typename Rep, typename Period>
+    std::shared_ptr<ADatatype> acquire(std::chrono::duration<Rep, Period> timeout, bool& hasTimedout) {
+        // Messages are released by other threads dropping their references, without a notification
+        const auto deadline = std::chrono::steady_clock::now() + timeout;
+        do {
+            auto msg = tryAcquire();
+            if(msg != nullptr) {
+                hasTimedout = false;
+                return msg;
+            }
+            std::this_thread::sleep_for(POLL_INTERVAL);
+        } while(std::chrono::steady_clock::now() < deadline);
+        hasTimedout = true;
+        return nullptr;
+    }
+
+    /**
+     * Retrieves number of messages in the pool
+     */
+    unsigned int getSize() const;
+
+    /**
+     * Retrieves number of messages which can currently be acquired
+     */
+    unsigned int getNumAvailable() const;
+
+    /**
+     * Retrieves number of bytes reserved for data of each message
+     */
+    std::size_t getCapacity() const;
+
+   private:
+    static constexpr std::chrono::microseconds POLL_INTERVAL{500};
+
+    mutable std::mutex mtx;
+    std::vector<std::shared_ptr<ADatatype>> messages;
+    std::size_t capacity;
+    std::size_t next = 0;
+
+    static bool isFree(const std::shared_ptr<ADatatype>& msg);
+};
+
+}  // namespace python
+}  // namespace dai
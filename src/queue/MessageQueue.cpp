@@ -0,0 +1,141 @@
+#include "MessageQueue.hpp"
+
+// std
+#include <iostream>
+
+// project
+#include "queue/HostTimestamps.hpp"
+#include "utility/Tracer.hpp"
+
+namespace dai {
+namespace python {
+
+MessageQueue::MessageQueue(std::string name, unsigned int maxSize, bool blocking) : queue(maxSize, blocking), name(std::move(name)) {}
+
+MessageQueue::~MessageQueue() {
+    close();
+}
+
+bool MessageQueue::isClosed() const {
+    return !running;
+}
+
+void MessageQueue::close() {
+    // Allow to be closed only once
+    if(!running.exchange(false)) return;
+
+    // Destroy queue, unblocks any waiting producers and consumers
+    queue.destruct();
+}
+
+void MessageQueue::setBlocking(bool blocking) {
+    checkRunning();
+    queue.setBlocking(blocking);
+}
+
+bool MessageQueue::getBlocking() const {
+    checkRunning();
+    return queue.getBlocking();
+}
+
+void MessageQueue::setMaxSize(unsigned int maxSize) {
+    checkRunning();
+    queue.setMaxSize(maxSize);
+}
+
+unsigned int MessageQueue::getMaxSize() const {
+    checkRunning();
+    return queue.getMaxSize();
+}
+
+std::string MessageQueue::getName() const {
+    return name;
+}
+
+MessageQueue::CallbackId MessageQueue::addCallback(std::function<void(std::string, std::shared_ptr<ADatatype>)> callback) {
+    // Lock first
+    std::unique_lock<std::mutex> l(callbacksMtx);
+
+    // Get unique id
+    CallbackId id = uniqueCallbackId++;
+
+    // move assign callback
+    callbacks[id] = std::move(callback);
+
+    // return id assigned to the callback
+    return id;
+}
+
+MessageQueue::CallbackId MessageQueue::addCallback(std::function<void(std::shared_ptr<ADatatype>)> callback) {
+    // Create a wrapper
+    return addCallback([callback = std::move(callback)](std::string, std::shared_ptr<ADatatype> message) { callback(std::move(message)); });
+}
+
+MessageQueue::CallbackId MessageQueue::addCallback(std::function<void()> callback) {
+    // Create a wrapper
+    return addCallback([callback = std::move(callback)](std::string, std::shared_ptr<ADatatype>) { callback(); });
+}
+
+bool MessageQueue::removeCallback(CallbackId callbackId) {
+    // Lock first
+    std::unique_lock<std::mutex> l(callbacksMtx);
+
+    // If callback with id 'callbackId' doesn't exists, return false
+    if(callbacks.count(callbackId) == 0) return false;
+
+    // Otherwise erase and return true
+    callbacks.erase(callbackId);
+    return true;
+}
+
+void MessageQueue::callCallbacks(const std::shared_ptr<ADatatype>& msg) {
+    Tracer::instant("enqueue", "queue", name, msg->getRaw()->sequenceNum);
+
+    std::unique_lock<std::mutex> l(callbacksMtx);
+    for(const auto& kv : callbacks) {
+        try {
+            kv.second(name, msg);
+        } catch(const std::exception& ex) {
+            std::cerr << "MessageQueue (" << name << ") callback with id: " << kv.first << " threw an exception: " << ex.what() << std::endl;
+        }
+    }
+}
+
+bool MessageQueue::send(const std::shared_ptr<ADatatype>& msg) {
+    if(!running) return false;
+    if(msg != nullptr) HostTimestamps::stampArrival(*msg);
+    if(!queue.push(msg)) return false;
+
+    callCallbacks(msg);
+    return true;
+}
+
+bool MessageQueue::send(const std::shared_ptr<ADatatype>& msg, std::chrono::milliseconds timeout) {
+    if(!running) return false;
+    if(msg != nullptr) HostTimestamps::stampArrival(*msg);
+    if(!queue.tryWaitAndPush(msg, timeout)) return false;
+
+    callCallbacks(msg);
+    return true;
+}
+
+bool MessageQueue::sendReplacing(const std::shared_ptr<ADatatype>& msg, const std::function<bool(const std::shared_ptr<ADatatype>&)>& replaces) {
+    if(!running) return false;
+    if(msg != nullptr) HostTimestamps::stampArrival(*msg);
+
+    // Drain the queue and push back the messages which aren't replaced, keeping their order
+    std::vector<std::shared_ptr<ADatatype>> retained;
+    queue.consumeAll([&retained, &replaces](std::shared_ptr<ADatatype>& queued) {
+        if(!replaces(queued)) retained.push_back(std::move(queued));
+    });
+    for(const auto& queued : retained) {
+        if(!queue.push(queued)) return false;
+    }
+    if(!queue.push(msg)) return false;
+
+    callCallbacks(msg);
+    return true;
+}
+
+}  // namespace python
+}  // namespace dai
@@ -0,0 +1,223 @@
+#pragma once
+
+// std
+#include <atomic>
+#include <chrono>
+#include <functional>
+#include <memory>
+#include <mutex>
+#include <stdexcept>
+#include <string>
+#include <unordered_map>
+#include <vector>
+
+// depthai
+#include "depthai/pipeline/datatype/ADatatype.hpp"
+#include "depthai/utility/LockingQueue.hpp"
+
+namespace dai {
+namespace python {
+
+/**
+ * Host side message queue, fed from C++ (demultiplexers, replay, simulated producers)
+ * and read from Python with the same interface as DataOutputQueue.
+ * Messages are stamped with their host arrival time (see HostTimestamps) when first sent to any MessageQueue.
+ */
+class MessageQueue {
+   public:
+    /// Alias for callback id
+    using CallbackId = int;
+
+   private:
+    LockingQueue<std::shared_ptr<ADatatype>> queue;
+    std::atomic<bool> running{true};
+    const std::string name;
+    std::mutex callbacksMtx;
+    std::unordered_map<CallbackId, std::function<void(std::string, std::shared_ptr<ADatatype>)>> callbacks;
+    CallbackId uniqueCallbackId{0};
+
+    void callCallbacks(const std::shared_ptr<ADatatype>& msg);
+    void checkRunning() const {
+        if(!running) throw std::runtime_error("MessageQueue (" + name + ") closed");
+    }
+
+   protected:
+    /**
+     * Adds a message to the queue, first removing queued messages which the new message replaces.
+     * Must only be called from a single producer
+     *
+     * @param msg Message to add to the queue
+     * @param replaces Predicate selecting queued messages to be replaced
+     * @returns False if the queue was closed, true otherwise
+     */
+    bool sendReplacing(const std::shared_ptr<ADatatype>& msg, const std::function<bool(const std::shared_ptr<ADatatype>&)>& replaces);
+
+   public:
+    explicit MessageQueue(std::string name, unsigned int maxSize = 16, bool blocking = true);
+    virtual ~MessageQueue();
+
+    /**
+     * Check whether queue is closed
+     */
+    bool isClosed() const;
+
+    /**
+     * Closes the queue and unblocks any waiting consumers or producers
+     */
+    virtual void close();
+
+    /**
+     * Sets queue behavior when full (maxSize)
+     *
+     * @param blocking Specifies if block or overwrite the oldest message in the queue
+     */
+    void setBlocking(bool blocking);
+
+    /**
+     * Gets current queue behavior when full (maxSize)
+     *
+     * @returns True if blocking, false otherwise
+     */
+    bool getBlocking() const;
+
+    /**
+     * Sets queue maximum size
+     *
+     * @param maxSize Specifies maximum number of messages in the queue
+     */
+    void setMaxSize(unsigned int maxSize);
+
+    /**
+     * Gets queue maximum size
+     *
+     * @returns Maximum queue size
+     */
+    unsigned int getMaxSize() const;
+
+    /**
+     * Gets queues name
+     *
+     * @returns Queue name
+     */
+    std::string getName() const;
+
+    /**
+     * Adds a callback on message received
+     *
+     * @param callback Callback function with queue name and message pointer
+     * @returns Callback id
+     */
+    CallbackId addCallback(std::function<void(std::string, std::shared_ptr<ADatatype>)> callback);
+
+    /**
+     * Adds a callback on message received
+     *
+     * @param callback Callback function with message pointer
+     * @returns Callback id
+     */
+    CallbackId addCallback(std::function<void(std::shared_ptr<ADatatype>)> callback);
+
+    /**
+     * Adds a callback on message received
+     *
+     * @param callback Callback function without any parameters
+     * @returns Callback id
+     */
+    CallbackId addCallback(std::function<void()> callback);
+
+    /**
+     * Removes a callback
+     *
+     * @param callbackId Id of callback to be removed
+     * @returns True if callback was removed, false otherwise
+     */
+    bool removeCallback(CallbackId callbackId);
+
+    /**
+     * Adds a message to the queue, respecting its blocking behavior, and calls callbacks
+     *
+     * @param msg Message to add to the queue
+     * @returns False if the queue was closed, true otherwise
+     */
+    bool send(const std::shared_ptr<ADatatype>& msg);
+
+    /**
+     * Adds a message to the queue, waiting for at most 'timeout' when the queue is blocking and full
+     *
+     * @param msg Message to add to the queue
+     * @param timeout Maximum duration to block
+     * @returns True if message was added to the queue, false otherwise
+     */
+    bool send(const std::shared_ptr<ADatatype>& msg, std::chrono::milliseconds timeout);
+
+    /**
+     * Check whether front of the queue has a message (isn't empty)
+     *
+     * @returns True if queue isn't empty, false otherwise
+     */
+    bool has() {
+        checkRunning();
+        return !queue.empty();
+    }
+
+    /**
+     * Try to retrieve message from queue. If no message available, return immediately with nullptr
+     *
+     * @returns Message or nullptr if no message available
+     */
+    std::shared_ptr<ADatatype> tryGet() {
+        checkRunning();
+        std::shared_ptr<ADatatype> val = nullptr;
+        if(!queue.tryPop(val)) return nullptr;
+        return val;
+    }
+
+    /**
+     * Block until a message is available with a timeout.
+     *
+     * @param timeout Duration for which the function should block
+     * @param[out] hasTimedout Outputs true if timeout occurred, false otherwise
+     * @returns Message or nullptr if no message available
+     */
+    template <typename Rep, typename Period>
+    std::shared_ptr<ADatatype> get(std::chrono::duration<Rep, Period> timeout, bool& hasTimedout) {
+        checkRunning();
+        std::shared_ptr<ADatatype> val = nullptr;
+        if(!queue.tryWaitAndPop(val, timeout)) {
+            hasTimedout = true;
+            return nullptr;
+        }
+        hasTimedout = false;
+        return val;
+    }
+
+    /**
+     * Try to retrieve all messages in the queue.
+     *
+     * @returns Vector of messages
+     */
+    std::vector<std::shared_ptr<ADatatype>> tryGetAll() {
+        checkRunning();
+        std::vector<std::shared_ptr<ADatatype>> messages;
+        queue.consumeAll([&messages](std::shared_ptr<ADatatype>& msg) { messages.push_back(std::move(msg)); });
+        return messages;
+    }
+
+    /**
+     * Block for maximum timeout duration. Then retrieve all messages from the queue.
+     *
+     * @param timeout Maximum duration to block
+     * @param[out] hasTimedout Outputs true if timeout occurred, false otherwise
+     * @returns Vector of messages
+     */
+    template <typename Rep, typename Period>
+    std::vector<std::shared_ptr<ADatatype>> getAll(std::chrono::duration<Rep, Period> timeout, bool& hasTimedout) {
+        checkRunning();
+        std::vector<std::shared_ptr<ADatatype>> messages;
+        hasTimedout = !queue.waitAndConsumeAll([&messages](std::shared_ptr<ADatatype>& msg) { messages.push_back(std::move(msg)); }, timeout);
+        return messages;
+    }
+};
+
+}  // namespace python
+}  // namespace dai
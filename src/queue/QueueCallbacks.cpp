@@ -0,0 +1,49 @@
+#include "QueueCallbacks.hpp"
+
+// libraries
+#include <pybind11/pybind11.h>
+
+namespace dai {
+namespace python {
+
+namespace {
+
+// Queue which callback is running on this thread
+thread_local const void* currentQueue = nullptr;
+
+}  // namespace
+
+QueueCallbackScope::QueueCallbackScope(const DataOutputQueue* queue) : previous(currentQueue) {
+    currentQueue = queue;
+}
+
+QueueCallbackScope::QueueCallbackScope(const MessageQueue* queue) : previous(currentQueue) {
+    currentQueue = queue;
+}
+
+QueueCallbackScope::~QueueCallbackScope() {
+    currentQueue = previous;
+}
+
+void removeQueueCallback(DataOutputQueue& queue, DataOutputQueue::CallbackId callbackId) {
+    if(currentQueue == &queue) return;
+    if(Py_IsInitialized() && PyGILState_Check()) {
+        pybind11::gil_scoped_release release;
+        queue.removeCallback(callbackId);
+    } else {
+        queue.removeCallback(callbackId);
+    }
+}
+
+void removeQueueCallback(MessageQueue& queue, MessageQueue::CallbackId callbackId) {
+    if(currentQueue == &queue) return;
+    if(Py_IsInitialized() && PyGILState_Check()) {
+        pybind11::gil_scoped_release release;
+        queue.removeCallback(callbackId);
+    } else {
+        queue.removeCallback(callbackId);
+    }
+}
+
+}  // namespace python
+}  // namespace dai
@@ -0,0 +1,42 @@
+#pragma once
+
+// depthai
+#include "depthai/device/DataQueue.hpp"
+
+// project
+#include "queue/MessageQueue.hpp"
+
+namespace dai {
+namespace python {
+
+/**
+ * Marks the calling thread as running a native callback of given queue, for the lifetime of this object.
+ * Used by callbacks which may release the last reference to their owner on the reading thread of the queue
+ */
+class QueueCallbackScope {
+   public:
+    explicit QueueCallbackScope(const DataOutputQueue* queue);
+    explicit QueueCallbackScope(const MessageQueue* queue);
+    ~QueueCallbackScope();
+    QueueCallbackScope(const QueueCallbackScope&) = delete;
+    QueueCallbackScope& operator=(const QueueCallbackScope&) = delete;
+
+   private:
+    const void* previous;
+};
+
+/**
+ * Removes a callback of given queue.
+ * Removing waits for running callbacks of the queue, which may need the GIL (Python callbacks), so the GIL is released if held.
+ * From within a callback of the same queue (see QueueCallbackScope) the callback can't be removed and is left registered,
+ * it must return right away once its owner is gone
+ */
+void removeQueueCallback(DataOutputQueue& queue, DataOutputQueue::CallbackId callbackId);
+
+/**
+ * Removes a callback of given message queue, same as for an output queue
+ */
+void removeQueueCallback(MessageQueue& queue, MessageQueue::CallbackId callbackId);
+
+}  // namespace python
+}  // namespace dai
@@ -0,0 +1,211 @@
+#include "QueueMonitor.hpp"
+
+// std
+#include <algorithm>
+#include <cmath>
+#include <stdexcept>
+#include <unordered_map>
+
+// project
+#include "utility/Tracer.hpp"
+
+namespace dai {
+namespace python {
+
+namespace {
+
+// Weight of a new sample in moving averages (as RFC 3550 interarrival jitter)
+constexpr double EWMA_WEIGHT = 1.0 / 16.0;
+
+struct Entry {
+    std::weak_ptr<void> queue;
+    std::shared_ptr<QueueMonitor> monitor;
+};
+
+std::mutex registryMtx;
+std::unordered_map<const void*, Entry> registry;
+
+// Looks up a monitor of a live queue, must be called with registryMtx held
+std::shared_ptr<QueueMonitor> lookup(const void* queue) {
+    auto it = registry.find(queue);
+    if(it == registry.end()) return nullptr;
+    if(it->second.queue.expired()) {
+        // Queue was destroyed and its address reused
+        registry.erase(it);
+        return nullptr;
+    }
+    return it->second.monitor;
+}
+
+// Capture timestamp of a message, false if the message isn't timestamped
+bool captureOf(const ADatatype& msg, HostTimestamps::TimePoint& capture) {
+    auto raw = msg.getRaw();
+    if(raw == nullptr || (raw->ts.sec == 0 && raw->ts.nsec == 0)) return false;
+    capture = raw->ts.get();
+    return true;
+}
+
+void purgeExpired() {
+    for(auto it = registry.begin(); it != registry.end();) {
+        if(it->second.queue.expired()) {
+            it = registry.erase(it);
+        } else {
+            ++it;
+        }
+    }
+}
+
+// Attaches a monitor to a queue receiving messages (DataOutputQueue, MessageQueue)
+template <typename Q>
+std::shared_ptr<QueueMonitor> attachReceiving(const std::shared_ptr<Q>& queue) {
+    if(queue == nullptr) throw std::invalid_argument("Queue passed is not valid (nullptr)");
+
+    std::unique_lock<std::mutex> l(registryMtx);
+    auto monitor = lookup(queue.get());
+    if(monitor != nullptr) return monitor;
+    purgeExpired();
+
+    monitor = std::make_shared<QueueMonitor>();
+    registry[queue.get()] = Entry{queue, monitor};
+
+    // Callbacks are owned by the queue, so the raw pointer stays valid
+    Q* q = queue.get();
+    queue->addCallback([monitor, q](std::string name, std::shared_ptr<ADatatype> msg) {
+        if(msg == nullptr) return;
+        // Callback time, after the core queue parsed and pushed the message. Closest point to the XLink read reachable from outside of the queue
+        const auto arrival = HostTimestamps::stampArrival(*msg);
+        Tracer::instant("enqueue", "queue", name, msg->getRaw()->sequenceNum);
+        monitor->onReceived(*msg, q->getMaxSize(), q->getBlocking());
+        monitor->onArrived(*msg, arrival);
+    });
+    return monitor;
+}
+
+}  // namespace
+
+std::shared_ptr<QueueMonitor> QueueMonitor::attach(const std::shared_ptr<DataOutputQueue>& queue) {
+    return attachReceiving(queue);
+}
+
+std::shared_ptr<QueueMonitor> QueueMonitor::attach(const std::shared_ptr<MessageQueue>& queue) {
+    return attachReceiving(queue);
+}
+
+std::shared_ptr<QueueMonitor> QueueMonitor::attach(const std::shared_ptr<DataInputQueue>& queue) {
+    if(queue == nullptr) throw std::invalid_argument("Queue passed is not valid (nullptr)");
+
+    std::unique_lock<std::mutex> l(registryMtx);
+    auto monitor = lookup(queue.get());
+    if(monitor != nullptr) return monitor;
+    purgeExpired();
+
+    monitor = std::make_shared<QueueMonitor>();
+    registry[queue.get()] = Entry{queue, monitor};
+    return monitor;
+}
+
+std::shared_ptr<QueueMonitor> QueueMonitor::find(const void* queue) {
+    std::unique_lock<std::mutex> l(registryMtx);
+    return lookup(queue);
+}
+
+void QueueMonitor::onArrival() {
+    const auto now = std::chrono::steady_clock::now();
+    std::unique_lock<std::mutex> l(arrivalMtx);
+    if(hasArrival) {
+        const double intervalUs = std::chrono::duration<double, std::micro>(now - lastArrival).count();
+        if(avgIntervalUs == 0.0) {
+            avgIntervalUs = intervalUs;
+        } else {
+            jitterUs += EWMA_WEIGHT * (std::abs(intervalUs - avgIntervalUs) - jitterUs);
+            avgIntervalUs += EWMA_WEIGHT * (intervalUs - avgIntervalUs);
+        }
+    }
+    hasArrival = true;
+    lastArrival = now;
+}
+
+void QueueMonitor::onReceived(const ADatatype& msg, unsigned int maxSize, bool blocking) {
+    numReceived++;
+    numBytes += msg.getRaw()->data.size();
+    onArrival();
+
+    // Queue with maxSize 0 doesn't retain any messages (eg. split or filtered)
+    if(maxSize == 0) return;
+
+    numQueued++;
+    auto d = getDepth();
+    if(!blocking && d > static_cast<std::int64_t>(maxSize)) {
+        // Oldest message was overwritten
+        numDropped++;
+        d--;
+    }
+    auto peak = peakDepth.load();
+    while(d > peak && !peakDepth.compare_exchange_weak(peak, d)) {
+    }
+}
+
+void QueueMonitor::onConsumed(std::size_t count) {
+    numConsumed += count;
+}
+
+std::int64_t QueueMonitor::getDepth() const {
+    // Derived from monotonic counters, so concurrent updates can't make it drift.
+    // Negative if messages which arrived before the monitor was attached were consumed
+    return static_cast<std::int64_t>(numQueued.load()) - static_cast<std::int64_t>(numDropped.load()) - static_cast<std::int64_t>(numConsumed.load());
+}
+
+void QueueMonitor::onArrived(const ADatatype& msg, HostTimestamps::TimePoint arrival) {
+    HostTimestamps::TimePoint capture;
+    if(captureOf(msg, capture)) transport.record(arrival - capture);
+}
+
+void QueueMonitor::onDequeued(const ADatatype& msg, HostTimestamps::TimePoint arrival, HostTimestamps::TimePoint dequeue) {
+    backlog.record(dequeue - arrival);
+    HostTimestamps::TimePoint capture;
+    if(captureOf(msg, capture)) total.record(dequeue - capture);
+}
+
+void QueueMonitor::onSent(std::size_t size, std::chrono::steady_clock::duration blocked) {
+    numSent++;
+    numBytes += size;
+    onBlocked(blocked);
+    onArrival();
+}
+
+void QueueMonitor::onBlocked(std::chrono::steady_clock::duration blocked) {
+    timeBlockedNs += std::chrono::duration_cast<std::chrono::nanoseconds>(blocked).count();
+}
+
+QueueStats QueueMonitor::getStats() const {
+    QueueStats stats;
+    stats.numReceived = numReceived;
+    stats.numConsumed = numConsumed;
+    stats.numDropped = numDropped;
+    stats.numSent = numSent;
+    stats.numBytes = numBytes;
+    stats.depth = static_cast<unsigned int>(std::max<std::int64_t>(0, getDepth()));
+    stats.peakDepth = static_cast<unsigned int>(peakDepth);
+    stats.timeBlocked = std::chrono::duration_cast<std::chrono::microseconds>(std::chrono::nanoseconds(timeBlockedNs.load()));
+
+    std::unique_lock<std::mutex> l(arrivalMtx);
+    stats.rate = avgIntervalUs > 0.0 ? static_cast<float>(1e6 / avgIntervalUs) : 0.0f;
+    stats.jitter = std::chrono::microseconds(static_cast<std::int64_t>(jitterUs));
+    return stats;
+}
+
+LatencyReport QueueMonitor::getLatencyReport(bool reset) {
+    LatencyReport report;
+    report.transport = transport.getSummary();
+    report.backlog = backlog.getSummary();
+    report.total = total.getSummary();
+    if(reset) {
+        transport.reset();
+        backlog.reset();
+        total.reset();
+    }
+    return report;
+}
+
+}  // namespace python
+}  // namespace dai
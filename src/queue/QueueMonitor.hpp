@@ -0,0 +1,175 @@
+#pragma once
+
+// std
+#include <atomic>
+#include <chrono>
+#include <cstdint>
+#include <memory>
+#include <mutex>
+
+// depthai
+#include "depthai/device/DataQueue.hpp"
+
+// project
+#include "queue/HostTimestamps.hpp"
+#include "queue/MessageQueue.hpp"
+#include "utility/LatencyHistogram.hpp"
+
+namespace dai {
+namespace python {
+
+/**
+ * Statistics of a DataOutputQueue, DataInputQueue or MessageQueue
+ */
+struct QueueStats {
+    /// Number of messages received from the device (output queues)
+    std::uint64_t numReceived = 0;
+    /// Number of messages retrieved by the host (output queues)
+    std::uint64_t numConsumed = 0;
+    /// Number of messages overwritten because a non-blocking queue was full (output queues)
+    std::uint64_t numDropped = 0;
+    /// Number of messages sent to the device (input queues)
+    std::uint64_t numSent = 0;
+    /// Number of data bytes received or sent
+    std::uint64_t numBytes = 0;
+    /// Number of messages currently in the queue (output queues). Messages already queued when monitoring started aren't accounted for
+    unsigned int depth = 0;
+    /// Maximum number of messages in the queue so far (output queues)
+    unsigned int peakDepth = 0;
+    /// Exponentially weighted moving average of message rate [Hz]
+    float rate = 0.0f;
+    /// Exponentially weighted moving average of inter-arrival time deviation
+    std::chrono::microseconds jitter{0};
+    /// Total time spent blocked in send (input queues)
+    std::chrono::microseconds timeBlocked{0};
+};
+
+/**
+ * Latencies of messages received by an output queue
+ */
+struct LatencyReport {
+    /// From capture (message timestamp) to arrival on the host
+    LatencySummary transport;
+    /// From arrival on the host to retrieval from the queue
+    LatencySummary backlog;
+    /// From capture (message timestamp) to retrieval from the queue
+    LatencySummary total;
+};
+
+/**
+ * Maintains statistics of a single queue. Counters are updated as messages pass,
+ * Queues aren't monitored until a monitor is attached: output queues of a Device when its pipeline starts, others on the first request for their statistics.
+ * Queues aren't monitored until a monitor is attached, usually on the first request for their statistics.
+ */
+class QueueMonitor {
+   public:
+    /**
+     * Retrieves the monitor of given output queue, attaching one if the queue isn't monitored yet
+     */
+    static std::shared_ptr<QueueMonitor> attach(const std::shared_ptr<DataOutputQueue>& queue);
+
+    /**
+     * Retrieves the monitor of given input queue, attaching one if the queue isn't monitored yet
+     */
+    static std::shared_ptr<QueueMonitor> attach(const std::shared_ptr<DataInputQueue>& queue);
+
+    /**
+     * Retrieves the monitor of given host side queue, attaching one if the queue isn't monitored yet
+     */
+    static std::shared_ptr<QueueMonitor> attach(const std::shared_ptr<MessageQueue>& queue);
+
+    /**
+     * Retrieves the monitor of given queue
+     *
+     * @returns Monitor or nullptr if queue isn't monitored
+     */
+    static std::shared_ptr<QueueMonitor> find(const void* queue);
+
+    /**
+     * Records a message received by an output queue
+     *
+     * @param msg Received message
+     * @param maxSize Maximum size of the queue
+     * @param blocking Blocking behavior of the queue
+     */
+    void onReceived(const ADatatype& msg, unsigned int maxSize, bool blocking);
+
+    /**
+     * Records message latencies at arrival on the host
+     *
+     * @param msg Received message
+     * @param arrival Arrival time
+     */
+    void onArrived(const ADatatype& msg, HostTimestamps::TimePoint arrival);
+
+    /**
+     * Records messages retrieved from an output queue
+     *
+     * @param count Number of retrieved messages
+     */
+    void onConsumed(std::size_t count);
+
+    /**
+     * Records message latencies at retrieval from an output queue
+     *
+     * @param msg Retrieved message
+     * @param arrival Arrival time
+     * @param dequeue Retrieval time
+     */
+    void onDequeued(const ADatatype& msg, HostTimestamps::TimePoint arrival, HostTimestamps::TimePoint dequeue);
+
+    /**
+     * Records a message sent to an input queue
+     *
+     * @param size Data size of the sent message
+     * @param blocked Time spent blocked while sending
+     */
+    void onSent(std::size_t size, std::chrono::steady_clock::duration blocked);
+
+    /**
+     * Records time spent blocked while sending, without a message being sent
+     */
+    void onBlocked(std::chrono::steady_clock::duration blocked);
+
+    /**
+     * Retrieves a snapshot of statistics
+     */
+    QueueStats getStats() const;
+
+    /**
+     * Retrieves a summary of message latencies
+     *
+     * @param reset Discard recorded latencies after retrieving them
+     */
+    LatencyReport getLatencyReport(bool reset = false);
+
+   private:
+    std::int64_t getDepth() const;
+
+    std::atomic<std::uint64_t> numReceived{0};
+    std::atomic<std::uint64_t> numConsumed{0};
+    std::atomic<std::uint64_t> numDropped{0};
+    std::atomic<std::uint64_t> numSent{0};
+    std::atomic<std::uint64_t> numBytes{0};
+    // Messages added to a queue which retains them, depth is derived as queued - dropped - consumed
+    std::atomic<std::uint64_t> numQueued{0};
+    std::atomic<std::int64_t> peakDepth{0};
+    std::atomic<std::int64_t> timeBlockedNs{0};
+
+    // Latencies
+    LatencyHistogram transport;
+    LatencyHistogram backlog;
+    LatencyHistogram total;
+
+    // Inter-arrival statistics
+    mutable std::mutex arrivalMtx;
+    bool hasArrival = false;
+    std::chrono::steady_clock::time_point lastArrival;
+    double avgIntervalUs = 0.0;
+    double jitterUs = 0.0;
+
+    void onArrival();
+};
+
+}  // namespace python
+}  // namespace dai
@@ -0,0 +1,115 @@
+#include "SystemInformationCollector.hpp"
+
+// std
+#include <stdexcept>
+
+// project
+#include "queue/HostTimestamps.hpp"
+#include "queue/QueueCallbacks.hpp"
+
+namespace dai {
+namespace python {
+
+namespace {
+
+constexpr std::size_t NUM_FIELDS = 4 * 3 + 2 + 5;
+
+std::vector<std::string> fieldNames() {
+    std::vector<std::string> names;
+    for(const auto* memory : {"ddrMemoryUsage", "cmxMemoryUsage", "leonCssMemoryUsage", "leonMssMemoryUsage"}) {
+        for(const auto* field : {"used", "remaining", "total"}) names.push_back(std::string(memory) + "." + field);
+    }
+    for(const auto* cpu : {"leonCssCpuUsage", "leonMssCpuUsage"}) names.push_back(std::string(cpu) + ".average");
+    for(const auto* field : {"css", "mss", "upa", "dss", "average"}) names.push_back(std::string("chipTemperature.") + field);
+    return names;
+}
+
+}  // namespace
+
+constexpr std::size_t SystemInformationCollector::DEFAULT_CAPACITY;
+
+SystemInformationCollector::SystemInformationCollector(std::size_t capacity) : TimeSeriesRing(fieldNames(), capacity) {}
+
+std::shared_ptr<SystemInformationCollector> SystemInformationCollector::create(std::shared_ptr<DataOutputQueue> queue, std::size_t capacity) {
+    if(queue == nullptr) throw std::invalid_argument("Queue must not be None");
+    auto c = std::make_shared<SystemInformationCollector>(capacity);
+    c->parent = std::move(queue);
+
+    c->parentMaxSize = c->parent->getMaxSize();
+    c->parentBlocking = c->parent->getBlocking();
+    c->parent->setBlocking(false);
+    c->parent->setMaxSize(0);
+
+    // Callback doesn't keep the collector alive, nor reaches it once it started being destroyed
+    std::weak_ptr<SystemInformationCollector> weak = c;
+    const DataOutputQueue* parent = c->parent.get();
+    c->callbackId = c->parent->addCallback([weak, parent](std::shared_ptr<ADatatype> msg) {
+        // Released within the scope, in case this was the last reference
+        QueueCallbackScope scope(parent);
+        auto info = std::dynamic_pointer_cast<SystemInformation>(msg);
+        if(info == nullptr) return;
+        if(auto self = weak.lock()) self->add(*info);
+    });
+    return c;
+}
+
+SystemInformationCollector::~SystemInformationCollector() {
+    close();
+}
+
+void SystemInformationCollector::add(const SystemInformation& msg) {
+    // Arrival as stamped by a queue, otherwise time of this call
+    const auto arrival = HostTimestamps::stampArrival(msg);
+    const double ts = std::chrono::duration<double>(arrival.time_since_epoch()).count();
+
+    // Must match order of fieldNames()
+    double sample[NUM_FIELDS];
+    std::size_t i = 0;
+    for(const auto* memory : {&msg.ddrMemoryUsage, &msg.cmxMemoryUsage, &msg.leonCssMemoryUsage, &msg.leonMssMemoryUsage}) {
+        sample[i++] = static_cast<double>(memory->used);
+        sample[i++] = static_cast<double>(memory->remaining);
+        sample[i++] = static_cast<double>(memory->total);
+    }
+    sample[i++] = msg.leonCssCpuUsage.average;
+    sample[i++] = msg.leonMssCpuUsage.average;
+    const auto& temp = msg.chipTemperature;
+    for(const auto t : {temp.css, temp.mss, temp.upa, temp.dss, temp.average}) sample[i++] = t;
+
+    append(ts, sample);
+}
+
+bool SystemInformationCollector::getLatest(RawSystemInformation& info, double& timestamp) const {
+    std::vector<double> sample;
+    if(!TimeSeriesRing::getLatest(timestamp, sample)) return false;
+
+    // Must match order of fieldNames()
+    std::size_t i = 0;
+    for(auto* memory : {&info.ddrMemoryUsage, &info.cmxMemoryUsage, &info.leonCssMemoryUsage, &info.leonMssMemoryUsage}) {
+        memory->used = static_cast<std::int64_t>(sample[i++]);
+        memory->remaining = static_cast<std::int64_t>(sample[i++]);
+        memory->total = static_cast<std::int64_t>(sample[i++]);
+    }
+    info.leonCssCpuUsage.average = static_cast<float>(sample[i++]);
+    info.leonMssCpuUsage.average = static_cast<float>(sample[i++]);
+    auto& temp = info.chipTemperature;
+    for(auto* t : {&temp.css, &temp.mss, &temp.upa, &temp.dss, &temp.average}) *t = static_cast<float>(sample[i++]);
+    return true;
+}
+
+void SystemInformationCollector::close() {
+    if(parent == nullptr) return;
+    std::call_once(closeFlag, [this]() {
+        removeQueueCallback(*parent, callbackId);
+        if(!parent->isClosed()) {
+            try {
+                parent->setMaxSize(parentMaxSize);
+                parent->setBlocking(parentBlocking);
+            } catch(const std::exception&) {
+                // queue closed in between
+            }
+        }
+    });
+}
+
+}  // namespace python
+}  // namespace dai
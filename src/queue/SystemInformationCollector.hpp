@@ -0,0 +1,74 @@
+#pragma once
+
+// std
+#include <memory>
+#include <mutex>
+
+// depthai
+#include "depthai/device/DataQueue.hpp"
+#include "depthai/pipeline/datatype/SystemInformation.hpp"
+
+// project
+#include "utility/TimeSeriesRing.hpp"
+
+namespace dai {
+namespace python {
+
+/**
+ * Collects SystemInformation messages into a fixed-size time series, one column per field
+ * (eg. "ddrMemoryUsage.used", "leonCssCpuUsage.average", "chipTemperature.average").
+ * Samples are timestamped with host arrival time, in seconds of the steady clock (same as dai.Clock.now()).
+ */
+class SystemInformationCollector : public TimeSeriesRing {
+   public:
+    /// Default number of samples retained
+    static constexpr std::size_t DEFAULT_CAPACITY = 3600;
+
+    /**
+     * Constructs a collector, samples are added manually
+     *
+     * @param capacity Maximum number of samples retained
+     */
+    explicit SystemInformationCollector(std::size_t capacity = DEFAULT_CAPACITY);
+
+    /**
+     * Creates a collector subscribed to given output queue.
+     * Parent queue is set to not retain any messages (maxSize 0, non-blocking) until the collector is closed.
+     *
+     * @param queue Output queue of a SystemLogger node
+     * @param capacity Maximum number of samples retained
+     */
+    static std::shared_ptr<SystemInformationCollector> create(std::shared_ptr<DataOutputQueue> queue, std::size_t capacity = DEFAULT_CAPACITY);
+    ~SystemInformationCollector();
+
+    /**
+     * Adds a sample
+     *
+     * @param msg SystemInformation message
+     */
+    void add(const SystemInformation& msg);
+
+    /**
+     * Retrieves the latest sample
+     *
+     * @param[out] info Latest system information
+     * @param[out] timestamp Host arrival time of the sample [s]
+     * @returns False if no sample was collected yet
+     */
+    bool getLatest(RawSystemInformation& info, double& timestamp) const;
+
+    /**
+     * Stops collecting and restores parent queue settings. Collected samples are kept
+     */
+    void close();
+
+   private:
+    std::shared_ptr<DataOutputQueue> parent;
+    DataOutputQueue::CallbackId callbackId = 0;
+    unsigned int parentMaxSize = 0;
+    bool parentBlocking = false;
+    std::once_flag closeFlag;
+};
+
+}  // namespace python
+}  // namespace dai
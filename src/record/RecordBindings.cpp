@@ -0,0 +1,108 @@
+#include "RecordBindings.hpp"
+
+// project
+#include "record/Recorder.hpp"
+#include "record/RecordingReader.hpp"
+#include "record/ReplayDevice.hpp"
+
+void RecordBindings::bind(pybind11::module& m, void* pCallstack){
+
+    using namespace dai;
+    using namespace dai::python;
+
+    // Type definitions
+    py::class_<Recorder, std::shared_ptr<Recorder>> recorder(m, "Recorder", "Records messages of output queues into an indexed, chunked container file, written by a dedicated writer thread");
+    py::enum_<Recorder::Policy> recorderPolicy(recorder, "Policy", "Behavior when messages are recorded faster than they can be written");
+    py::class_<Recorder::Stats> recorderStats(recorder, "Stats", "Recording statistics");
+    py::class_<RecordingReader, std::shared_ptr<RecordingReader>> recordingReader(m, "RecordingReader", "Random access reader of recordings written by Recorder. The file is memory mapped, messages are looked up by position, sequence number or timestamp in O(log n)");
+    py::class_<RecordingReader::Entry> recordingReaderEntry(recordingReader, "Entry", "Description of a recorded message");
+    py::class_<ReplayDevice, HostDevice, std::shared_ptr<ReplayDevice>> replayDevice(m, "ReplayDevice", "Replays a recording through host side queues, with the queue interface of Device (getOutputQueue, getInputQueue, getQueueEvent). No device is needed");
+
+
+    ///////////////////////////////////////////////////////////////////////
+    ///////////////////////////////////////////////////////////////////////
+    ///////////////////////////////////////////////////////////////////////
+    // Call the rest of the type defines, then perform the actual bindings
+    Callstack* callstack = (Callstack*) pCallstack;
+    auto cb = callstack->top();
+    callstack->pop();
+    cb(m, pCallstack);
+    // Actual bindings
+    ///////////////////////////////////////////////////////////////////////
+    ///////////////////////////////////////////////////////////////////////
+    ///////////////////////////////////////////////////////////////////////
+
+
+    recorderPolicy
+        .value("DROP", Recorder::Policy::DROP, "Drop new messages while the pending limit is exceeded")
+        .value("BLOCK", Recorder::Policy::BLOCK, "Block the queue's reading thread while the pending limit is exceeded, applying backpressure")
+        ;
+
+    recorderStats
+        .def(py::init<>())
+        .def_readwrite("numRecorded", &Recorder::Stats::numRecorded, "Number of messages written")
+        .def_readwrite("numDropped", &Recorder::Stats::numDropped, "Number of messages dropped by the DROP policy")
+        .def_readwrite("numBytes", &Recorder::Stats::numBytes, "Number of bytes written")
+        .def_readwrite("numChunks", &Recorder::Stats::numChunks, "Number of chunks written")
+        .def_readwrite("pendingBytes", &Recorder::Stats::pendingBytes, "Number of bytes pending to be written")
+        ;
+
+    recorder
+        .def(py::init<const Path&, Recorder::Policy, std::size_t, std::size_t>(), py::arg("path"), py::arg("policy") = Recorder::Policy::DROP,
+            py::arg("chunkSize") = Recorder::DEFAULT_CHUNK_SIZE, py::arg("maxPending") = Recorder::DEFAULT_MAX_PENDING,
+            "Constructs a recorder writing into given file. Streams are added with 'addQueue' or written manually with 'write'")
+        .def(py::init([](Device& device, const std::vector<std::string>& streams, const Path& path, Recorder::Policy policy, std::size_t chunkSize, std::size_t maxPending){
+            auto r = std::make_shared<Recorder>(path, policy, chunkSize, maxPending);
+            r->addDevice(device, streams);
+            return r;
+        }), py::arg("device"), py::arg("streams"), py::arg("path"), py::arg("policy") = Recorder::Policy::DROP,
+            py::arg("chunkSize") = Recorder::DEFAULT_CHUNK_SIZE, py::arg("maxPending") = Recorder::DEFAULT_MAX_PENDING,
+            "Constructs a recorder of given output queues of a device (all if 'streams' is empty). Queues keep their size and blocking behavior, so set unconsumed ones to non-blocking")
+        .def("addQueue", &Recorder::addQueue, py::arg("queue"), "Records messages of an output queue, under the queue's name")
+        .def("write", &Recorder::write, py::arg("stream"), py::arg("msg"), py::call_guard<py::gil_scoped_release>(), "Records a message. Returns False if it was dropped")
+        .def("stop", &Recorder::stop, py::call_guard<py::gil_scoped_release>(), "Stops recording, writes out pending messages and the index. Raises an error encountered while writing")
+        .def("getStats", &Recorder::getStats, "Retrieves recording statistics")
+        .def("getPath", &Recorder::getPath, "Retrieves path of the recording")
+        .def("__enter__", [](std::shared_ptr<Recorder> r) { return r; })
+        .def("__exit__", [](Recorder& r, py::object type, py::object value, py::object traceback) {
+            py::gil_scoped_release release;
+            r.stop();
+        })
+        ;
+
+    recordingReaderEntry
+        .def_readonly("datatype", &RecordingReader::Entry::datatype, "Datatype of the message")
+        .def_readonly("sequenceNum", &RecordingReader::Entry::sequenceNum, "Sequence number of the message")
+        .def_readonly("timestamp", &RecordingReader::Entry::timestamp, "Timestamp of the message, synced to host steady clock")
+        .def_readonly("timestampHost", &RecordingReader::Entry::timestampHost, "Time of arrival to the host as stamped by queue callbacks (see Buffer.getTimestampHostArrival), or of recording if not stamped, steady clock")
+        .def_readonly("dataSize", &RecordingReader::Entry::dataSize, "Size of the message data")
+        ;
+
+    recordingReader
+        .def(py::init<const Path&>(), py::arg("path"), "Opens a recording. Recordings without an index (eg. after a crash) are scanned once")
+        .def("getStreams", &RecordingReader::getStreams, "Retrieves names of recorded streams")
+        .def("getCount", &RecordingReader::getCount, py::arg("stream"), "Retrieves number of messages recorded in a stream")
+        .def("isIndexed", &RecordingReader::isIndexed, "Check whether the recording contained an index, otherwise it was scanned")
+        .def("getEntry", &RecordingReader::getEntry, py::arg("stream"), py::arg("index"), "Retrieves description of a recorded message, without reading it")
+        .def("get", &RecordingReader::get, py::arg("stream"), py::arg("index"), py::call_guard<py::gil_scoped_release>(), "Reads a recorded message as its datatype (ImgFrame, NNData, IMUData, ...)")
+        .def("getData", [](py::object& obj, const std::string& stream, std::size_t index){
+            auto& reader = obj.cast<RecordingReader&>();
+            std::size_t size = 0;
+            const auto* data = reader.getData(stream, index, size);
+            // Read-only view into the mapping, which is kept alive by the view
+            py::array_t<std::uint8_t> view(size, data, obj);
+            view.attr("setflags")(py::arg("write") = false);
+            return view;
+        }, py::arg("stream"), py::arg("index"), "Retrieves data of a recorded message as a read-only array viewing the memory mapped recording, without copying")
+        .def("findSequenceNum", &RecordingReader::findSequenceNum, py::arg("stream"), py::arg("sequenceNum"), "Finds position of a message by sequence number, None if not recorded")
+        .def("findTimestamp", &RecordingReader::findTimestamp, py::arg("stream"), py::arg("timestamp"), "Finds position of the first message with timestamp at or after given time, None if all messages are older")
+        ;
+
+    replayDevice
+        .def(py::init<const Path&, float, const std::vector<std::string>&>(), py::arg("path"), py::arg("speed") = 1.0f, py::arg("streams") = std::vector<std::string>{},
+             "Opens a recording and starts replaying messages of given streams (all if empty) in timestamp order. 'speed' scales real time, 0 replays as fast as queues are consumed. "
+             "Queues are blocking, replay stalls on a full queue, so replay only streams which are read")
+        .def("isFinished", &ReplayDevice::isFinished, "Check whether all messages were replayed")
+        ;
+
+}
@@ -0,0 +1,311 @@
+#include "Recorder.hpp"
+
+// std
+#include <chrono>
+#include <stdexcept>
+
+// project
+#include "queue/HostTimestamps.hpp"
+#include "queue/QueueCallbacks.hpp"
+
+namespace dai {
+namespace python {
+
+namespace {
+
+// Approximate size of serialized metadata, accounted in pending bytes
+constexpr std::size_t METADATA_ESTIMATE = 256;
+
+// Pending messages are written out at least this often, even if a chunk isn't full
+constexpr std::chrono::milliseconds FLUSH_INTERVAL{1000};
+
+std::int64_t toNs(std::chrono::steady_clock::duration d) {
+    return std::chrono::duration_cast<std::chrono::nanoseconds>(d).count();
+}
+
+}  // namespace
+
+constexpr std::size_t Recorder::DEFAULT_CHUNK_SIZE;
+constexpr std::size_t Recorder::DEFAULT_MAX_PENDING;
+
+Recorder::Recorder(const dai::Path& path, Policy policy, std::size_t chunkSize, std::size_t maxPending)
+    : path(path), policy(policy), chunkSize(chunkSize), maxPending(maxPending) {
+    file.open(path, std::ios::binary | std::ios::trunc);
+    if(!file) throw std::runtime_error("Cannot open recording '" + path.u8string() + "' for writing");
+
+    std::vector<std::uint8_t> header(recording::MAGIC, recording::MAGIC + sizeof(recording::MAGIC));
+    recording::put<std::uint32_t>(header, recording::VERSION);
+    file.write(reinterpret_cast<const char*>(header.data()), header.size());
+    fileOffset = header.size();
+    numBytes = header.size();
+
+    chunk.reserve(chunkSize + METADATA_ESTIMATE);
+    writer = std::thread(&Recorder::writerLoop, this);
+}
+
+Recorder::~Recorder() {
+    try {
+        stop();
+    } catch(const std::exception&) {
+        // Errors are only reported by explicit stop
+    }
+}
+
+void Recorder::addQueue(const std::shared_ptr<DataOutputQueue>& queue) {
+    if(queue == nullptr) throw std::invalid_argument("Queue passed is not valid (nullptr)");
+    const auto name = queue->getName();
+    // Callback is removed in stop(), before this object is destroyed
+    const auto id = queue->addCallback([this, name](std::shared_ptr<ADatatype> msg) {
+        if(msg != nullptr) write(name, msg);
+    });
+    std::unique_lock<std::mutex> l(mtx);
+    queues.emplace_back(queue, id);
+}
+
+void Recorder::addDevice(Device& device, const std::vector<std::string>& streams) {
+    for(const auto& name : streams.empty() ? device.getOutputQueueNames() : streams) addQueue(device.getOutputQueue(name));
+}
+
+bool Recorder::write(const std::string& stream, const std::shared_ptr<ADatatype>& msg) {
+    // Messages aren't copied, raw buffer is serialized by the writer thread
+    auto raw = msg->getRaw();
+    // Arrival as stamped by a queue, otherwise time of this call
+    const auto hostTsNs = toNs(HostTimestamps::stampArrival(*msg).time_since_epoch());
+    const std::size_t size = raw->data.size() + METADATA_ESTIMATE;
+
+    std::unique_lock<std::mutex> l(mtx);
+    auto fits = [this, size]() { return pendingBytes == 0 || pendingBytes + size <= maxPending; };
+    if(!stopping && !fits()) {
+        if(policy == Policy::BLOCK) spaceCv.wait(l, [this, &fits]() { return stopping || fits(); });
+    }
+    if(stopping || !fits()) {
+        numDropped++;
+        return false;
+    }
+
+    auto it = streamIds.find(stream);
+    if(it == streamIds.end()) {
+        if(streamIds.size() > UINT16_MAX) throw std::runtime_error("Too many streams recorded");
+        it = streamIds.emplace(stream, static_cast<std::uint16_t>(streamIds.size())).first;
+        newStreams.push_back(stream);
+    }
+    pending.push_back({it->second, std::move(raw), hostTsNs});
+    pendingBytes += size;
+    l.unlock();
+    pendingCv.notify_one();
+    return true;
+}
+
+void Recorder::stop() {
+    std::call_once(stopFlag, [this]() {
+        {
+            std::unique_lock<std::mutex> l(mtx);
+            stopping = true;
+        }
+        // Unblocks callbacks waiting for space, so removing them doesn't deadlock
+        spaceCv.notify_all();
+        pendingCv.notify_one();
+
+        decltype(queues) subscribed;
+        {
+            std::unique_lock<std::mutex> l(mtx);
+            subscribed.swap(queues);
+        }
+        // Releases the GIL if held, eg. when the recorder is collected by Python without being stopped
+        for(auto& q : subscribed) removeQueueCallback(*q.first, q.second);
+
+        writer.join();
+    });
+
+    std::unique_lock<std::mutex> l(mtx);
+    if(error) std::rethrow_exception(error);
+}
+
+Recorder::Stats Recorder::getStats() const {
+    Stats stats;
+    stats.numRecorded = numRecorded;
+    stats.numDropped = numDropped;
+    stats.numBytes = numBytes;
+    stats.numChunks = numChunks;
+    std::unique_lock<std::mutex> l(mtx);
+    stats.pendingBytes = pendingBytes;
+    return stats;
+}
+
+dai::Path Recorder::getPath() const {
+    return path;
+}
+
+void Recorder::writerLoop() {
+    std::deque<Pending> batch;
+    std::vector<std::string> streams;
+    std::vector<std::uint8_t> metadata;
+    auto lastFlush = std::chrono::steady_clock::now();
+
+    try {
+        while(true) {
+            bool done = false;
+            {
+                std::unique_lock<std::mutex> l(mtx);
+                pendingCv.wait_for(l, FLUSH_INTERVAL, [this]() { return !pending.empty() || stopping; });
+                batch.swap(pending);
+                streams.swap(newStreams);
+                done = stopping && batch.empty();
+            }
+
+            // Stream definitions precede chunks referencing them
+            for(const auto& name : streams) {
+                std::vector<std::uint8_t> payload;
+                std::uint16_t id;
+                {
+                    std::unique_lock<std::mutex> l(mtx);
+                    id = streamIds.at(name);
+                }
+                recording::put<std::uint16_t>(payload, id);
+                recording::put<std::uint16_t>(payload, static_cast<std::uint16_t>(name.size()));
+                payload.insert(payload.end(), name.begin(), name.end());
+                flushChunk();
+                writeSection(recording::TAG_STREAM, payload);
+            }
+            streams.clear();
+
+            std::size_t written = 0;
+            for(auto& p : batch) {
+                DatatypeEnum datatype;
+                p.raw->serialize(metadata, datatype);
+                const auto& data = p.raw->data;
+                const std::int64_t tsNs = toNs(p.raw->ts.get().time_since_epoch());
+
+                // Packet trailer, as messages are laid out over XLink
+                metadata.reserve(metadata.size() + 8);
+                const auto metadataSize = static_cast<std::uint32_t>(metadata.size());
+                recording::put<std::int32_t>(metadata, static_cast<std::int32_t>(datatype));
+                recording::put<std::uint32_t>(metadata, metadataSize);
+                const std::uint64_t packetSize = data.size() + metadata.size();
+
+                // Large messages are written directly from the message, rather than copied into the chunk
+                const bool direct = data.size() >= chunkSize;
+                if(direct) flushChunk();
+
+                recording::put<std::uint16_t>(chunk, p.stream);
+                recording::put<std::int32_t>(chunk, static_cast<std::int32_t>(datatype));
+                recording::put<std::int64_t>(chunk, p.raw->sequenceNum);
+                recording::put<std::int64_t>(chunk, tsNs);
+                recording::put<std::int64_t>(chunk, p.hostTsNs);
+                recording::put<std::uint64_t>(chunk, packetSize);
+                chunkIndex.push_back({p.stream, static_cast<std::int32_t>(datatype), p.raw->sequenceNum, tsNs, p.hostTsNs, chunk.size(), packetSize});
+                if(direct) {
+                    flushChunk(data.data(), data.size(), metadata);
+                } else {
+                    chunk.insert(chunk.end(), data.begin(), data.end());
+                    chunk.insert(chunk.end(), metadata.begin(), metadata.end());
+                    if(chunk.size() >= chunkSize) flushChunk();
+                }
+                written += data.size() + METADATA_ESTIMATE;
+                numRecorded++;
+            }
+            batch.clear();
+
+            if(written > 0) {
+                {
+                    std::unique_lock<std::mutex> l(mtx);
+                    pendingBytes -= written;
+                }
+                spaceCv.notify_all();
+            }
+
+            if(done || std::chrono::steady_clock::now() - lastFlush >= FLUSH_INTERVAL) {
+                flushChunk();
+                file.flush();
+                lastFlush = std::chrono::steady_clock::now();
+            }
+            if(done) break;
+        }
+        writeIndex();
+        file.close();
+        if(file.fail()) throw std::runtime_error("Failed writing recording '" + path.u8string() + "'");
+    } catch(...) {
+        {
+            std::unique_lock<std::mutex> l(mtx);
+            error = std::current_exception();
+            stopping = true;
+            pending.clear();
+            pendingBytes = 0;
+        }
+        spaceCv.notify_all();
+    }
+}
+
+void Recorder::writeSection(std::uint32_t tag, const std::vector<std::uint8_t>& payload) {
+    std::vector<std::uint8_t> header;
+    recording::put<std::uint32_t>(header, tag);
+    recording::put<std::uint32_t>(header, 0);
+    recording::put<std::uint64_t>(header, payload.size());
+    file.write(reinterpret_cast<const char*>(header.data()), header.size());
+    file.write(reinterpret_cast<const char*>(payload.data()), payload.size());
+    if(!file) throw std::runtime_error("Failed writing recording '" + path.u8string() + "'");
+    fileOffset += header.size() + payload.size();
+    numBytes += header.size() + payload.size();
+}
+
+void Recorder::flushChunk(const std::uint8_t* data, std::size_t dataSize, const std::vector<std::uint8_t>& suffix) {
+    if(chunk.empty()) return;
+
+    const std::uint64_t payloadSize = chunk.size() + dataSize + suffix.size();
+    std::vector<std::uint8_t> header;
+    recording::put<std::uint32_t>(header, recording::TAG_CHUNK);
+    recording::put<std::uint32_t>(header, 0);
+    recording::put<std::uint64_t>(header, payloadSize);
+    file.write(reinterpret_cast<const char*>(header.data()), header.size());
+    file.write(reinterpret_cast<const char*>(chunk.data()), chunk.size());
+    if(data != nullptr) file.write(reinterpret_cast<const char*>(data), dataSize);
+    file.write(reinterpret_cast<const char*>(suffix.data()), suffix.size());
+    if(!file) throw std::runtime_error("Failed writing recording '" + path.u8string() + "'");
+
+    const std::uint64_t recordsOffset = fileOffset + header.size();
+    for(auto& entry : chunkIndex) {
+        entry.offset += recordsOffset;
+        index.push_back(entry);
+    }
+    chunkIndex.clear();
+
+    const std::uint64_t size = header.size() + payloadSize;
+    fileOffset += size;
+    numBytes += size;
+    numChunks++;
+    chunk.clear();
+}
+
+void Recorder::writeIndex() {
+    const std::uint64_t indexOffset = fileOffset;
+    std::vector<std::uint8_t> payload;
+    payload.reserve(sizeof(std::uint64_t) + index.size() * recording::INDEX_ENTRY_SIZE);
+    {
+        std::unique_lock<std::mutex> l(mtx);
+        recording::put<std::uint16_t>(payload, static_cast<std::uint16_t>(streamIds.size()));
+        for(const auto& stream : streamIds) {
+            recording::put<std::uint16_t>(payload, stream.second);
+            recording::put<std::uint16_t>(payload, static_cast<std::uint16_t>(stream.first.size()));
+            payload.insert(payload.end(), stream.first.begin(), stream.first.end());
+        }
+    }
+    recording::put<std::uint64_t>(payload, index.size());
+    for(const auto& entry : index) {
+        recording::put<std::uint16_t>(payload, entry.stream);
+        recording::put<std::int32_t>(payload, entry.datatype);
+        recording::put<std::int64_t>(payload, entry.sequenceNum);
+        recording::put<std::int64_t>(payload, entry.tsNs);
+        recording::put<std::int64_t>(payload, entry.hostTsNs);
+        recording::put<std::uint64_t>(payload, entry.offset);
+        recording::put<std::uint64_t>(payload, entry.size);
+    }
+    writeSection(recording::TAG_INDEX, payload);
+
+    std::vector<std::uint8_t> trailer;
+    recording::put<std::uint64_t>(trailer, indexOffset);
+    trailer.insert(trailer.end(), recording::INDEX_MAGIC, recording::INDEX_MAGIC + sizeof(recording::INDEX_MAGIC));
+    file.write(reinterpret_cast<const char*>(trailer.data()), trailer.size());
+}
+
+}  // namespace python
+}  // namespace dai
@@ -0,0 +1,160 @@
+#pragma once
+
+// std
+#include <atomic>
+#include <condition_variable>
+#include <cstdint>
+#include <deque>
+#include <exception>
+#include <fstream>
+#include <memory>
+#include <mutex>
+#include <string>
+#include <thread>
+#include <unordered_map>
+#include <vector>
+
+// depthai
+#include "depthai/device/DataQueue.hpp"
+#include "depthai/device/Device.hpp"
+#include "depthai/utility/Path.hpp"
+
+// project
+#include "record/RecordingFormat.hpp"
+
+namespace dai {
+namespace python {
+
+/**
+ * Records messages of output queues into an indexed, chunked container file (see RecordingFormat.hpp).
+ * Messages are handed over from the queues' reading threads without copying and written by a dedicated
+ * writer thread in large sequential chunks.
+ */
+class Recorder {
+   public:
+    /// Behavior when messages are recorded faster than they can be written
+    enum class Policy {
+        /// Drop new messages while the pending limit is exceeded
+        DROP,
+        /// Block the queue's reading thread while the pending limit is exceeded
+        BLOCK
+    };
+
+    /// Default size of a chunk, written at once
+    static constexpr std::size_t DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024;
+    /// Default limit of bytes pending to be written
+    static constexpr std::size_t DEFAULT_MAX_PENDING = 256 * 1024 * 1024;
+
+    /**
+     * Recording statistics
+     */
+    struct Stats {
+        /// Number of messages written
+        std::uint64_t numRecorded = 0;
+        /// Number of messages dropped by the DROP policy
+        std::uint64_t numDropped = 0;
+        /// Number of bytes written
+        std::uint64_t numBytes = 0;
+        /// Number of chunks written
+        std::uint64_t numChunks = 0;
+        /// Number of bytes pending to be written
+        std::uint64_t pendingBytes = 0;
+    };
+
+    /**
+     * Constructs a recorder writing into given file. Streams are added with addQueue or written manually
+     *
+     * @param path Path of the recording, overwritten
+     * @param policy Behavior when messages are recorded faster than they can be written
+     * @param chunkSize Size of a chunk, written at once
+     * @param maxPending Limit of bytes pending to be written
+     */
+    explicit Recorder(const dai::Path& path,
+                      Policy policy = Policy::DROP,
+                      std::size_t chunkSize = DEFAULT_CHUNK_SIZE,
+                      std::size_t maxPending = DEFAULT_MAX_PENDING);
+    ~Recorder();
+
+    /**
+     * Records messages of an output queue, under the queue's name
+     */
+    void addQueue(const std::shared_ptr<DataOutputQueue>& queue);
+
+    /**
+     * Records output queues of a device
+     *
+     * @param device Device
+     * @param streams Names of output queues, all if empty
+     */
+    void addDevice(Device& device, const std::vector<std::string>& streams);
+
+    /**
+     * Records a message
+     *
+     * @param stream Stream name
+     * @param msg Message
+     * @returns False if message was dropped
+     */
+    bool write(const std::string& stream, const std::shared_ptr<ADatatype>& msg);
+
+    /**
+     * Stops recording, writes out pending messages and the index. Rethrows an error encountered while writing
+     */
+    void stop();
+
+    /**
+     * Retrieves recording statistics
+     */
+    Stats getStats() const;
+
+    /**
+     * Retrieves path of the recording
+     */
+    dai::Path getPath() const;
+
+   private:
+    struct Pending {
+        std::uint16_t stream;
+        std::shared_ptr<RawBuffer> raw;
+        std::int64_t hostTsNs;
+    };
+
+    const dai::Path path;
+    const Policy policy;
+    const std::size_t chunkSize;
+    const std::size_t maxPending;
+
+    // Shared with recording threads
+    mutable std::mutex mtx;
+    std::condition_variable pendingCv;
+    std::condition_variable spaceCv;
+    std::deque<Pending> pending;
+    std::size_t pendingBytes = 0;
+    std::unordered_map<std::string, std::uint16_t> streamIds;
+    std::vector<std::string> newStreams;
+    bool stopping = false;
+    std::exception_ptr error;
+    std::vector<std::pair<std::shared_ptr<DataOutputQueue>, DataOutputQueue::CallbackId>> queues;
+
+    std::atomic<std::uint64_t> numRecorded{0};
+    std::atomic<std::uint64_t> numDropped{0};
+    std::atomic<std::uint64_t> numBytes{0};
+    std::atomic<std::uint64_t> numChunks{0};
+
+    // Owned by the writer thread
+    std::ofstream file;
+    std::uint64_t fileOffset = 0;
+    std::vector<std::uint8_t> chunk;
+    std::vector<recording::IndexEntry> index;
+    std::vector<recording::IndexEntry> chunkIndex;
+    std::thread writer;
+    std::once_flag stopFlag;
+
+    void writerLoop();
+    void writeSection(std::uint32_t tag, const std::vector<std::uint8_t>& payload);
+    void flushChunk(const std::uint8_t* data = nullptr, std::size_t dataSize = 0, const std::vector<std::uint8_t>& suffix = {});
+    void writeIndex();
+};
+
+}  // namespace python
+}  // namespace dai
@@ -0,0 +1,81 @@
+#pragma once
+
+// std
+#include <cstdint>
+#include <cstring>
+#include <vector>
+
+namespace dai {
+namespace python {
+
+/**
+ * On-disk layout of recordings written by Recorder. All integers are little-endian.
+ *
+ * File: header, then a sequence of sections, then (if the recording was stopped cleanly) an index section and trailer.
+ *  - Header: magic "DAIREC01", uint32 version
+ *  - Section: uint32 tag, uint32 compression (0 - none), uint64 payload size, payload
+ *    - STRM: uint16 stream id, uint16 name size, name
+ *    - CHNK: sequence of message records
+ *      - Record: uint16 stream id, int32 datatype, int64 sequence number, int64 device timestamp [ns],
+ *        int64 host arrival timestamp [ns], uint64 packet size, packet
+ *      - Packet: data, metadata, int32 datatype, uint32 metadata size (same layout as messages sent over XLink)
+ *    - INDX: uint16 number of streams, then per stream: uint16 stream id, uint16 name size, name;
+ *      uint64 number of messages, then per message: uint16 stream id, int32 datatype, int64 sequence number,
+ *      int64 device timestamp [ns], int64 host arrival timestamp [ns], uint64 file offset of the packet, uint64 packet size
+ *  - Trailer: uint64 file offset of the INDX section, magic "DAIRIDX1"
+ *
+ * Recordings without an index (eg. after a crash) can still be read by scanning the sections.
+ * Timestamps are of the steady clock, as message timestamps are.
+ * Only recordings of the current version are read, a changed layout must bump it.
+ */
+namespace recording {
+
+constexpr char MAGIC[8] = {'D', 'A', 'I', 'R', 'E', 'C', '0', '1'};
+constexpr char INDEX_MAGIC[8] = {'D', 'A', 'I', 'R', 'I', 'D', 'X', '1'};
+constexpr std::uint32_t VERSION = 1;
+
+constexpr std::uint32_t TAG_STREAM = 0x4d525453;  // "STRM"
+constexpr std::uint32_t TAG_CHUNK = 0x4b4e4843;   // "CHNK"
+constexpr std::uint32_t TAG_INDEX = 0x58444e49;   // "INDX"
+
+constexpr std::size_t HEADER_SIZE = 12;
+constexpr std::size_t SECTION_HEADER_SIZE = 16;
+constexpr std::size_t RECORD_HEADER_SIZE = 38;
+constexpr std::size_t INDEX_ENTRY_SIZE = 46;
+constexpr std::size_t TRAILER_SIZE = 16;
+
+/**
+ * Location and metadata of a recorded message
+ */
+struct IndexEntry {
+    std::uint16_t stream;
+    std::int32_t datatype;
+    std::int64_t sequenceNum;
+    std::int64_t tsNs;
+    std::int64_t hostTsNs;
+    /// File offset of the packet
+    std::uint64_t offset;
+    /// Size of the packet
+    std::uint64_t size;
+};
+
+template <typename T>
+void put(std::vector<std::uint8_t>& out, T value) {
+    std::uint64_t bits = 0;
+    std::memcpy(&bits, &value, sizeof(T));
+    for(std::size_t i = 0; i < sizeof(T); i++) out.push_back(static_cast<std::uint8_t>(bits >> (8 * i)));
+}
+
+template <typename T>
+T get(const std::uint8_t* in) {
+    std::uint64_t bits = 0;
+    for(std::size_t i = 0; i < sizeof(T); i++) bits |= static_cast<std::uint64_t>(in[i]) << (8 * i);
+    T value;
+    std::memcpy(&value, &bits, sizeof(T));
+    return value;
+}
+
+}  // namespace recording
+
+}  // namespace python
+}  // namespace dai
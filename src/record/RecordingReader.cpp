@@ -0,0 +1,213 @@
+#include "RecordingReader.hpp"
+
+// std
+#include <algorithm>
+#include <cstring>
+#include <numeric>
+#include <stdexcept>
+
+// depthai
+#include "depthai/pipeline/datatype/StreamMessageParser.hpp"
+
+namespace dai {
+namespace python {
+
+RecordingReader::RecordingReader(const dai::Path& path) : file(path) {
+    const auto* data = file.data();
+    const auto size = file.size();
+    if(size < recording::HEADER_SIZE || std::memcmp(data, recording::MAGIC, sizeof(recording::MAGIC)) != 0) {
+        throw std::runtime_error("File '" + path.u8string() + "' isn't a recording");
+    }
+    // Layouts of other versions differ, reading them would misinterpret records
+    const auto version = recording::get<std::uint32_t>(data + sizeof(recording::MAGIC));
+    if(version != recording::VERSION) {
+        throw std::runtime_error("Recording '" + path.u8string() + "' has unsupported format version " + std::to_string(version) + ", expected "
+                                 + std::to_string(recording::VERSION));
+    }
+
+    const bool hasTrailer = size >= recording::HEADER_SIZE + recording::TRAILER_SIZE
+                            && std::memcmp(data + size - sizeof(recording::INDEX_MAGIC), recording::INDEX_MAGIC, sizeof(recording::INDEX_MAGIC)) == 0;
+    if(hasTrailer) {
+        readIndex(recording::get<std::uint64_t>(data + size - recording::TRAILER_SIZE));
+        indexed = true;
+    } else {
+        scan();
+    }
+
+    // Entries are usually recorded in order, only sort if they aren't
+    for(auto& kv : streams) {
+        auto& s = kv.second;
+        if(s.entries.size() > UINT32_MAX) throw std::runtime_error("Too many messages in stream '" + kv.first + "'");
+        auto sortBy = [&s](std::vector<std::uint32_t>& order, std::int64_t recording::IndexEntry::*key) {
+            order.resize(s.entries.size());
+            std::iota(order.begin(), order.end(), 0);
+            auto less = [&s, key](std::uint32_t a, std::uint32_t b) { return s.entries[a].*key < s.entries[b].*key; };
+            if(!std::is_sorted(order.begin(), order.end(), less)) std::stable_sort(order.begin(), order.end(), less);
+        };
+        sortBy(s.bySequenceNum, &recording::IndexEntry::sequenceNum);
+        sortBy(s.byTimestamp, &recording::IndexEntry::tsNs);
+    }
+}
+
+void RecordingReader::readIndex(std::uint64_t offset) {
+    const auto* data = file.data();
+    const auto end = file.size() - recording::TRAILER_SIZE;
+    if(offset + recording::SECTION_HEADER_SIZE > end || recording::get<std::uint32_t>(data + offset) != recording::TAG_INDEX) {
+        throw std::runtime_error("Recording index is corrupted");
+    }
+
+    const auto* p = data + offset + recording::SECTION_HEADER_SIZE;
+    const auto* const last = data + end;
+    auto require = [&p, last](std::size_t n) {
+        if(static_cast<std::size_t>(last - p) < n) throw std::runtime_error("Recording index is corrupted");
+    };
+
+    require(2);
+    const auto numStreams = recording::get<std::uint16_t>(p);
+    p += 2;
+    std::unordered_map<std::uint16_t, Stream*> byId;
+    for(std::uint16_t i = 0; i < numStreams; i++) {
+        require(4);
+        const auto id = recording::get<std::uint16_t>(p);
+        const auto nameSize = recording::get<std::uint16_t>(p + 2);
+        p += 4;
+        require(nameSize);
+        std::string name(reinterpret_cast<const char*>(p), nameSize);
+        p += nameSize;
+        names.push_back(name);
+        byId[id] = &streams[name];
+    }
+
+    require(8);
+    const auto count = recording::get<std::uint64_t>(p);
+    p += 8;
+    if(count > static_cast<std::uint64_t>(last - p) / recording::INDEX_ENTRY_SIZE) throw std::runtime_error("Recording index is corrupted");
+    for(std::uint64_t i = 0; i < count; i++, p += recording::INDEX_ENTRY_SIZE) {
+        recording::IndexEntry e;
+        e.stream = recording::get<std::uint16_t>(p);
+        e.datatype = recording::get<std::int32_t>(p + 2);
+        e.sequenceNum = recording::get<std::int64_t>(p + 6);
+        e.tsNs = recording::get<std::int64_t>(p + 14);
+        e.hostTsNs = recording::get<std::int64_t>(p + 22);
+        e.offset = recording::get<std::uint64_t>(p + 30);
+        e.size = recording::get<std::uint64_t>(p + 38);
+        auto it = byId.find(e.stream);
+        if(it == byId.end() || e.offset + e.size > end) throw std::runtime_error("Recording index is corrupted");
+        it->second->entries.push_back(e);
+    }
+}
+
+void RecordingReader::scan() {
+    const auto* data = file.data();
+    const auto size = file.size();
+    std::unordered_map<std::uint16_t, Stream*> byId;
+
+    std::uint64_t pos = recording::HEADER_SIZE;
+    while(pos + recording::SECTION_HEADER_SIZE <= size) {
+        const auto tag = recording::get<std::uint32_t>(data + pos);
+        const auto compression = recording::get<std::uint32_t>(data + pos + 4);
+        const auto length = recording::get<std::uint64_t>(data + pos + 8);
+        const auto start = pos + recording::SECTION_HEADER_SIZE;
+        // Recording was interrupted while writing this section
+        if(length > size - start) break;
+        if(compression != 0) throw std::runtime_error("Recording uses unsupported compression");
+
+        if(tag == recording::TAG_STREAM && length >= 4) {
+            const auto id = recording::get<std::uint16_t>(data + start);
+            const auto nameSize = std::min<std::uint64_t>(recording::get<std::uint16_t>(data + start + 2), length - 4);
+            std::string name(reinterpret_cast<const char*>(data + start + 4), nameSize);
+            names.push_back(name);
+            byId[id] = &streams[name];
+        } else if(tag == recording::TAG_CHUNK) {
+            const auto end = start + length;
+            auto rp = start;
+            while(rp + recording::RECORD_HEADER_SIZE <= end) {
+                const auto* r = data + rp;
+                recording::IndexEntry e;
+                e.stream = recording::get<std::uint16_t>(r);
+                e.datatype = recording::get<std::int32_t>(r + 2);
+                e.sequenceNum = recording::get<std::int64_t>(r + 6);
+                e.tsNs = recording::get<std::int64_t>(r + 14);
+                e.hostTsNs = recording::get<std::int64_t>(r + 22);
+                e.size = recording::get<std::uint64_t>(r + 30);
+                e.offset = rp + recording::RECORD_HEADER_SIZE;
+                if(e.size > end - e.offset) break;
+                auto it = byId.find(e.stream);
+                if(it != byId.end()) it->second->entries.push_back(e);
+                rp = e.offset + e.size;
+            }
+        }
+        pos = start + length;
+    }
+}
+
+std::vector<std::string> RecordingReader::getStreams() const {
+    return names;
+}
+
+std::size_t RecordingReader::getCount(const std::string& name) const {
+    return stream(name).entries.size();
+}
+
+bool RecordingReader::isIndexed() const {
+    return indexed;
+}
+
+const RecordingReader::Stream& RecordingReader::stream(const std::string& name) const {
+    auto it = streams.find(name);
+    if(it == streams.end()) throw std::invalid_argument("Stream '" + name + "' isn't recorded");
+    return it->second;
+}
+
+const recording::IndexEntry& RecordingReader::entry(const std::string& name, std::size_t index) const {
+    const auto& entries = stream(name).entries;
+    if(index >= entries.size()) throw std::out_of_range("Message index out of range");
+    return entries[index];
+}
+
+RecordingReader::Entry RecordingReader::getEntry(const std::string& name, std::size_t index) const {
+    const auto& e = entry(name, index);
+    std::size_t dataSize = 0;
+    getData(name, index, dataSize);
+    return {static_cast<DatatypeEnum>(e.datatype), e.sequenceNum, std::chrono::nanoseconds(e.tsNs), std::chrono::nanoseconds(e.hostTsNs), dataSize};
+}
+
+std::shared_ptr<ADatatype> RecordingReader::get(const std::string& name, std::size_t index) const {
+    const auto& e = entry(name, index);
+    if(e.size > UINT32_MAX) throw std::runtime_error("Recorded message too large");
+
+    // Parser only reads the packet
+    streamPacketDesc_t packet = {};
+    packet.data = const_cast<std::uint8_t*>(file.data() + e.offset);
+    packet.length = static_cast<std::uint32_t>(e.size);
+    return StreamMessageParser::parseMessageToADatatype(&packet);
+}
+
+const std::uint8_t* RecordingReader::getData(const std::string& name, std::size_t index, std::size_t& size) const {
+    const auto& e = entry(name, index);
+    const auto* packet = file.data() + e.offset;
+    if(e.size < 8) throw std::runtime_error("Recorded message is corrupted");
+    const auto metadataSize = recording::get<std::uint32_t>(packet + e.size - 4);
+    if(metadataSize > e.size - 8) throw std::runtime_error("Recorded message is corrupted");
+    size = e.size - 8 - metadataSize;
+    return packet;
+}
+
+tl::optional<std::size_t> RecordingReader::findSequenceNum(const std::string& name, std::int64_t sequenceNum) const {
+    const auto& s = stream(name);
+    auto it = std::lower_bound(
+        s.bySequenceNum.begin(), s.bySequenceNum.end(), sequenceNum, [&s](std::uint32_t i, std::int64_t seq) { return s.entries[i].sequenceNum < seq; });
+    if(it == s.bySequenceNum.end() || s.entries[*it].sequenceNum != sequenceNum) return tl::nullopt;
+    return *it;
+}
+
+tl::optional<std::size_t> RecordingReader::findTimestamp(const std::string& name, std::chrono::nanoseconds timestamp) const {
+    const auto& s = stream(name);
+    auto it = std::lower_bound(
+        s.byTimestamp.begin(), s.byTimestamp.end(), timestamp.count(), [&s](std::uint32_t i, std::int64_t ts) { return s.entries[i].tsNs < ts; });
+    if(it == s.byTimestamp.end()) return tl::nullopt;
+    return *it;
+}
+
+}  // namespace python
+}  // namespace dai
@@ -0,0 +1,132 @@
+#pragma once
+
+// std
+#include <chrono>
+#include <cstddef>
+#include <cstdint>
+#include <memory>
+#include <string>
+#include <unordered_map>
+#include <vector>
+
+// depthai
+#include "depthai/pipeline/datatype/ADatatype.hpp"
+#include "depthai/utility/Path.hpp"
+#include "depthai-shared/datatype/DatatypeEnum.hpp"
+
+// project
+#include "record/RecordingFormat.hpp"
+#include "utility/MappedFile.hpp"
+
+// libraries
+#include "tl/optional.hpp"
+
+namespace dai {
+namespace python {
+
+/**
+ * Random access reader of recordings written by Recorder. The file is memory mapped,
+ * messages are looked up through the index by position, sequence number or timestamp in O(log n).
+ * Recordings without an index (eg. after a crash) are scanned once when opened.
+ */
+class RecordingReader {
+   public:
+    /**
+     * Description of a recorded message
+     */
+    struct Entry {
+        /// Datatype of the message
+        DatatypeEnum datatype;
+        /// Sequence number of the message
+        std::int64_t sequenceNum;
+        /// Timestamp of the message, synced to host steady clock
+        std::chrono::nanoseconds timestamp;
+        /// Time of arrival to the host, steady clock
+        std::chrono::nanoseconds timestampHost;
+        /// Size of the message data
+        std::size_t dataSize;
+    };
+
+    /**
+     * Opens a recording
+     *
+     * @param path Path of the recording
+     */
+    explicit RecordingReader(const dai::Path& path);
+
+    /**
+     * Retrieves names of recorded streams
+     */
+    std::vector<std::string> getStreams() const;
+
+    /**
+     * Retrieves number of messages recorded in a stream
+     */
+    std::size_t getCount(const std::string& stream) const;
+
+    /**
+     * Check whether the recording contained an index, otherwise it was scanned
+     */
+    bool isIndexed() const;
+
+    /**
+     * Retrieves description of a recorded message
+     *
+     * @param stream Stream name
+     * @param index Position of the message in the stream, in recording order
+     */
+    Entry getEntry(const std::string& stream, std::size_t index) const;
+
+    /**
+     * Reads a recorded message
+     *
+     * @param stream Stream name
+     * @param index Position of the message in the stream, in recording order
+     */
+    std::shared_ptr<ADatatype> get(const std::string& stream, std::size_t index) const;
+
+    /**
+     * Retrieves data of a recorded message within the mapping, without copying
+     *
+     * @param stream Stream name
+     * @param index Position of the message in the stream, in recording order
+     * @param[out] size Size of the data
+     * @returns Pointer to the data, valid while the reader exists
+     */
+    const std::uint8_t* getData(const std::string& stream, std::size_t index, std::size_t& size) const;
+
+    /**
+     * Finds a message by sequence number
+     *
+     * @returns Position of the message in the stream or none if not recorded
+     */
+    tl::optional<std::size_t> findSequenceNum(const std::string& stream, std::int64_t sequenceNum) const;
+
+    /**
+     * Finds first message with timestamp at or after given time
+     *
+     * @returns Position of the message in the stream or none if all messages are older
+     */
+    tl::optional<std::size_t> findTimestamp(const std::string& stream, std::chrono::nanoseconds timestamp) const;
+
+   private:
+    struct Stream {
+        std::vector<recording::IndexEntry> entries;
+        // Positions of entries ordered by sequence number and by timestamp
+        std::vector<std::uint32_t> bySequenceNum;
+        std::vector<std::uint32_t> byTimestamp;
+    };
+
+    MappedFile file;
+    bool indexed = false;
+    std::vector<std::string> names;
+    std::unordered_map<std::string, Stream> streams;
+
+    void readIndex(std::uint64_t offset);
+    void scan();
+    const Stream& stream(const std::string& name) const;
+    const recording::IndexEntry& entry(const std::string& name, std::size_t index) const;
+};
+
+}  // namespace python
+}  // namespace dai
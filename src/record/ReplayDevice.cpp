@@ -0,0 +1,80 @@
+#include "ReplayDevice.hpp"
+
+// std
+#include <functional>
+#include <queue>
+#include <tuple>
+
+// project
+#include "queue/HostTimestamps.hpp"
+
+namespace dai {
+namespace python {
+
+ReplayDevice::ReplayDevice(const dai::Path& path, float speed, const std::vector<std::string>& streams)
+    : speed(speed), reader(path), streams(streams.empty() ? reader.getStreams() : streams) {
+    for(const auto& name : this->streams) {
+        // Throws for streams which weren't recorded
+        reader.getCount(name);
+        queues.push_back(addOutputQueue(name));
+    }
+
+    startProducer([this]() { replay(); });
+}
+
+ReplayDevice::~ReplayDevice() {
+    // Replay thread uses members of this class, stop it before they are destroyed
+    close();
+}
+
+void ReplayDevice::replay() {
+    using namespace std::chrono;
+
+    // Next message of each stream, merged by timestamp. Streams are replayed in recording order
+    struct Next {
+        std::int64_t tsNs;
+        std::size_t stream;
+        std::size_t index;
+        bool operator>(const Next& other) const {
+            return std::tie(tsNs, stream) > std::tie(other.tsNs, other.stream);
+        }
+    };
+    std::priority_queue<Next, std::vector<Next>, std::greater<Next>> pending;
+    const auto push = [this, &pending](std::size_t stream, std::size_t index) {
+        if(index >= reader.getCount(streams[stream])) return;
+        // Messages without device timestamp are scheduled by host arrival time
+        const auto entry = reader.getEntry(streams[stream], index);
+        const auto ts = entry.timestamp.count() != 0 ? entry.timestamp : entry.timestampHost;
+        pending.push({ts.count(), stream, index});
+    };
+    for(std::size_t s = 0; s < streams.size(); s++) push(s, 0);
+
+    const auto start = steady_clock::now();
+    const std::int64_t firstTsNs = pending.empty() ? 0 : pending.top().tsNs;
+
+    while(!pending.empty()) {
+        if(isClosed()) return;
+        const auto m = pending.top();
+        pending.pop();
+
+        if(speed > 0) {
+            // Timestamps may go back within a stream, such messages are sent right away
+            const auto offset = duration_cast<steady_clock::duration>(nanoseconds(static_cast<std::int64_t>((m.tsNs - firstTsNs) / speed)));
+            if(!sleepUntil(start + offset)) return;
+        }
+
+        auto msg = reader.get(streams[m.stream], m.index);
+        HostTimestamps::stampArrival(*msg);
+        // Blocks while a blocking queue is full, returns false once closed
+        if(!queues[m.stream]->send(msg)) return;
+        push(m.stream, m.index + 1);
+    }
+    finished = true;
+}
+
+bool ReplayDevice::isFinished() const {
+    return finished;
+}
+
+}  // namespace python
+}  // namespace dai
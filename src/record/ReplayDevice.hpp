@@ -0,0 +1,57 @@
+#pragma once
+
+// std
+#include <atomic>
+#include <cstdint>
+#include <memory>
+#include <string>
+#include <vector>
+
+// depthai
+#include "depthai/utility/Path.hpp"
+
+// project
+#include "device/HostDevice.hpp"
+#include "record/RecordingReader.hpp"
+
+namespace dai {
+namespace python {
+
+/**
+ * Replays a recording through host side queues, with the queue surface of a Device
+ * (getOutputQueue, getInputQueue, getQueueEvent). Messages of the replayed streams are sent in timestamp order
+ * by a replay thread, in real time, scaled or as fast as possible. Input queues discard sent messages.
+ * Messages are read from the recording as they are replayed.
+ *
+ * Output queues are blocking like those of a Device, so every replayed stream must be consumed,
+ * otherwise replay stalls once its queue is full. Replay only the streams that are read.
+ */
+class ReplayDevice : public HostDevice {
+   public:
+    /**
+     * Opens a recording and starts replaying it
+     *
+     * @param path Path of the recording
+     * @param speed Replay speed relative to real time, 0 or negative to replay as fast as possible
+     * @param streams Names of streams to replay, all recorded streams if empty
+     */
+    explicit ReplayDevice(const dai::Path& path, float speed = 1.0f, const std::vector<std::string>& streams = {});
+    ~ReplayDevice() override;
+
+    /**
+     * Check whether all messages were replayed
+     */
+    bool isFinished() const;
+
+   private:
+    const float speed;
+    RecordingReader reader;
+    std::vector<std::string> streams;
+    std::vector<std::shared_ptr<MessageQueue>> queues;
+    std::atomic<bool> finished{false};
+
+    void replay();
+};
+
+}  // namespace python
+}  // namespace dai
@@ -0,0 +1,195 @@
+#include "CacheEntry.hpp"
+
+// std
+#include <cstdio>
+#include <cstdlib>
+#include <cstring>
+#include <fstream>
+#include <random>
+#include <stdexcept>
+
+#if defined(_WIN32)
+    #define WIN32_LEAN_AND_MEAN
+    #include <windows.h>
+#else
+    #include <dirent.h>
+    #include <sys/stat.h>
+    #include <sys/types.h>
+#endif
+
+namespace dai {
+namespace python {
+
+namespace {
+
+void putU64(std::uint8_t* out, std::uint64_t value) {
+    for(std::size_t i = 0; i < sizeof(value); i++) out[i] = static_cast<std::uint8_t>(value >> (8 * i));
+}
+
+std::uint64_t getU64(const std::uint8_t* in) {
+    std::uint64_t value = 0;
+    for(std::size_t i = 0; i < sizeof(value); i++) value |= static_cast<std::uint64_t>(in[i]) << (8 * i);
+    return value;
+}
+
+std::string getEnv(const char* name) {
+    const char* value = std::getenv(name);
+    return value == nullptr ? std::string() : std::string(value);
+}
+
+bool isSeparator(char c) {
+    return c == '/' || c == '\\';
+}
+
+std::vector<std::string> listDirectory(const std::string& directory) {
+    std::vector<std::string> names;
+#if defined(_WIN32)
+    WIN32_FIND_DATAW data;
+    HANDLE find = FindFirstFileW(dai::Path(directory + "/*").native().c_str(), &data);
+    if(find == INVALID_HANDLE_VALUE) return names;
+    do {
+        names.push_back(dai::Path(std::wstring(data.cFileName)).u8string());
+    } while(FindNextFileW(find, &data));
+    FindClose(find);
+#else
+    DIR* dir = opendir(directory.c_str());
+    if(dir == nullptr) return names;
+    while(const auto* entry = readdir(dir)) names.emplace_back(entry->d_name);
+    closedir(dir);
+#endif
+    return names;
+}
+
+bool removeFile(const std::string& path) {
+#if defined(_WIN32)
+    return DeleteFileW(dai::Path(path).native().c_str()) != 0;
+#else
+    return std::remove(path.c_str()) == 0;
+#endif
+}
+
+bool renameFile(const std::string& from, const std::string& to) {
+#if defined(_WIN32)
+    // Fails if the entry is mapped by another process, which means it was written meanwhile
+    return MoveFileExW(dai::Path(from).native().c_str(), dai::Path(to).native().c_str(), MOVEFILE_REPLACE_EXISTING) != 0;
+#else
+    return std::rename(from.c_str(), to.c_str()) == 0;
+#endif
+}
+
+bool hasSuffix(const std::string& str, const std::string& suffix) {
+    return str.size() >= suffix.size() && str.compare(str.size() - suffix.size(), suffix.size(), suffix) == 0;
+}
+
+// Writes header and payload to a unique temporary file, renamed into place once complete
+void write(const std::string& path, const std::uint8_t* header, std::size_t headerSize, const std::uint8_t* payload, std::size_t payloadSize) {
+    std::random_device rd;
+    const std::string tmpPath = path + "." + CacheEntry::toHex((static_cast<std::uint64_t>(rd()) << 32) | rd()) + ".tmp";
+    {
+        std::ofstream out(dai::Path(tmpPath), std::ios::binary);
+        if(!out) throw std::runtime_error("Cannot open file '" + tmpPath + "' for writing");
+        out.write(reinterpret_cast<const char*>(header), headerSize);
+        out.write(reinterpret_cast<const char*>(payload), payloadSize);
+        if(!out.flush()) {
+            out.close();
+            removeFile(tmpPath);
+            throw std::runtime_error("Failed writing file '" + tmpPath + "'");
+        }
+    }
+    // An entry written meanwhile by another process has the same content
+    if(!renameFile(tmpPath, path)) removeFile(tmpPath);
+}
+
+}  // namespace
+
+constexpr std::size_t CacheEntry::HEADER_SIZE;
+
+std::uint64_t CacheEntry::fnv1a(const std::uint8_t* data, std::size_t size, std::uint64_t hash) {
+    for(std::size_t i = 0; i < size; i++) {
+        hash ^= data[i];
+        hash *= 1099511628211ULL;
+    }
+    return hash;
+}
+
+std::uint64_t CacheEntry::fnv1a(const std::string& str, std::uint64_t hash) {
+    return fnv1a(reinterpret_cast<const std::uint8_t*>(str.data()), str.size(), hash);
+}
+
+std::string CacheEntry::toHex(std::uint64_t value) {
+    char buf[17];
+    std::snprintf(buf, sizeof(buf), "%016llx", static_cast<unsigned long long>(value));
+    return buf;
+}
+
+dai::Path CacheEntry::getDefaultDirectory(const char* envVar, const std::string& name) {
+    const auto env = getEnv(envVar);
+    if(!env.empty()) return dai::Path(env);
+
+#if defined(_WIN32)
+    const auto base = getEnv("LOCALAPPDATA");
+    if(!base.empty()) return dai::Path(base + "\\depthai\\" + name);
+#else
+    const auto xdg = getEnv("XDG_CACHE_HOME");
+    if(!xdg.empty()) return dai::Path(xdg + "/depthai/" + name);
+    const auto home = getEnv("HOME");
+    if(!home.empty()) return dai::Path(home + "/.cache/depthai/" + name);
+#endif
+    throw std::runtime_error(std::string("Cannot determine ") + name + " cache directory, set " + envVar);
+}
+
+std::string CacheEntry::createDirectory(const dai::Path& path) {
+    std::string directory = path.u8string();
+    while(directory.size() > 1 && isSeparator(directory.back())) directory.pop_back();
+    for(std::size_t i = 1; i <= directory.size(); i++) {
+        if(i != directory.size() && !isSeparator(directory[i])) continue;
+        const std::string part = directory.substr(0, i);
+#if defined(_WIN32)
+        CreateDirectoryW(dai::Path(part).native().c_str(), nullptr);
+#else
+        mkdir(part.c_str(), 0755);
+#endif
+    }
+    return directory;
+}
+
+bool CacheEntry::load(const std::string& path, const char (&magic)[8], CacheBinary& binary) {
+    std::shared_ptr<MappedFile> file;
+    try {
+        file = std::make_shared<MappedFile>(dai::Path(path));
+    } catch(const std::exception&) {
+        return false;
+    }
+    if(file->size() < HEADER_SIZE || std::memcmp(file->data(), magic, sizeof(magic)) != 0) return false;
+
+    const auto hash = getU64(file->data() + sizeof(magic));
+    const auto size = getU64(file->data() + sizeof(magic) + sizeof(std::uint64_t));
+    if(size != file->size() - HEADER_SIZE) return false;
+    if(fnv1a(file->data() + HEADER_SIZE, size) != hash) return false;
+
+    binary.file = std::move(file);
+    binary.offset = HEADER_SIZE;
+    binary.size = static_cast<std::size_t>(size);
+    return true;
+}
+
+void CacheEntry::store(const std::string& path, const char (&magic)[8], const std::vector<std::uint8_t>& payload) {
+    std::uint8_t header[HEADER_SIZE];
+    std::memcpy(header, magic, sizeof(magic));
+    putU64(header + sizeof(magic), fnv1a(payload.data(), payload.size()));
+    putU64(header + sizeof(magic) + sizeof(std::uint64_t), payload.size());
+    write(path, header, sizeof(header), payload.data(), payload.size());
+}
+
+void CacheEntry::storeRaw(const std::string& path, const std::uint8_t* data, std::size_t size) {
+    write(path, nullptr, 0, data, size);
+}
+
+void CacheEntry::removeAll(const std::string& directory, const std::string& prefix) {
+    for(const auto& name : listDirectory(directory)) {
+        if(name.compare(0, prefix.size(), prefix) == 0 && (hasSuffix(name, ".bin") || hasSuffix(name, ".raw") || hasSuffix(name, ".tmp"))) removeFile(directory + "/" + name);
+    }
+}
+
+}  // namespace python
+}  // namespace dai
@@ -0,0 +1,92 @@
+#pragma once
+
+// std
+#include <cstddef>
+#include <cstdint>
+#include <memory>
+#include <string>
+#include <vector>
+
+// depthai
+#include "depthai/utility/Path.hpp"
+
+// project
+#include "utility/MappedFile.hpp"
+
+namespace dai {
+namespace python {
+
+/**
+ * Payload of an on-disk cache entry, memory mapped
+ */
+struct CacheBinary {
+    std::shared_ptr<MappedFile> file;
+    std::size_t offset = 0;
+    std::size_t size = 0;
+
+    const std::uint8_t* data() const {
+        return file->data() + offset;
+    }
+    std::vector<std::uint8_t> toVector() const {
+        return std::vector<std::uint8_t>(data(), data() + size);
+    }
+};
+
+/**
+ * Helpers for on-disk caches (FirmwareCache).
+ *
+ * Entry format: 8 byte magic, uint64 FNV-1a hash of the payload, uint64 payload size (little-endian), payload.
+ * Entries are written to a temporary file and renamed into place, so concurrent processes never observe partial entries.
+ */
+class CacheEntry {
+   public:
+    /// Size of the entry header, payload starts at this offset
+    static constexpr std::size_t HEADER_SIZE = 8 + 2 * sizeof(std::uint64_t);
+
+    /**
+     * Computes 64-bit FNV-1a hash, continuing from given hash
+     */
+    static std::uint64_t fnv1a(const std::uint8_t* data, std::size_t size, std::uint64_t hash = 14695981039346656037ULL);
+    static std::uint64_t fnv1a(const std::string& str, std::uint64_t hash = 14695981039346656037ULL);
+
+    /**
+     * Formats a value as 16 hexadecimal digits
+     */
+    static std::string toHex(std::uint64_t value);
+
+    /**
+     * Default directory of a cache: given environment variable if set,
+     * otherwise 'depthai/<name>' in the user cache directory (LOCALAPPDATA, XDG_CACHE_HOME or ~/.cache)
+     */
+    static dai::Path getDefaultDirectory(const char* envVar, const std::string& name);
+
+    /**
+     * Normalizes a cache directory path and creates the directory, including missing parents
+     */
+    static std::string createDirectory(const dai::Path& directory);
+
+    /**
+     * Maps an entry, verifying its magic, size and hash
+     *
+     * @returns False if the entry is missing or corrupted
+     */
+    static bool load(const std::string& path, const char (&magic)[8], CacheBinary& binary);
+
+    /**
+     * Writes an entry atomically. An entry written meanwhile by another process is kept
+     */
+    static void store(const std::string& path, const char (&magic)[8], const std::vector<std::uint8_t>& payload);
+
+    /**
+     * Writes a plain file, without entry header, atomically. For consumers which read a file by path themselves
+     */
+    static void storeRaw(const std::string& path, const std::uint8_t* data, std::size_t size);
+
+    /**
+     * Removes entries, plain files ('.raw') and leftover temporary files with given name prefix from a directory
+     */
+    static void removeAll(const std::string& directory, const std::string& prefix);
+};
+
+}  // namespace python
+}  // namespace dai
@@ -0,0 +1,98 @@
+#include "DatatypeUtils.hpp"
+
+// std
+#include <stdexcept>
+#include <typeindex>
+#include <unordered_map>
+
+// depthai-shared
+#include "depthai-shared/datatype/RawAprilTagConfig.hpp"
+#include "depthai-shared/datatype/RawAprilTags.hpp"
+#include "depthai-shared/datatype/RawCameraControl.hpp"
+#include "depthai-shared/datatype/RawEdgeDetectorConfig.hpp"
+#include "depthai-shared/datatype/RawFeatureTrackerConfig.hpp"
+#include "depthai-shared/datatype/RawIMUData.hpp"
+#include "depthai-shared/datatype/RawImageManipConfig.hpp"
+#include "depthai-shared/datatype/RawImgDetections.hpp"
+#include "depthai-shared/datatype/RawImgFrame.hpp"
+#include "depthai-shared/datatype/RawNNData.hpp"
+#include "depthai-shared/datatype/RawSpatialImgDetections.hpp"
+#include "depthai-shared/datatype/RawSpatialLocationCalculatorConfig.hpp"
+#include "depthai-shared/datatype/RawSpatialLocations.hpp"
+#include "depthai-shared/datatype/RawStereoDepthConfig.hpp"
+#include "depthai-shared/datatype/RawSystemInformation.hpp"
+#include "depthai-shared/datatype/RawToFConfig.hpp"
+#include "depthai-shared/datatype/RawTrackedFeatures.hpp"
+#include "depthai-shared/datatype/RawTracklets.hpp"
+
+namespace dai {
+namespace python {
+
+DatatypeEnum getDatatype(const RawBuffer& raw) {
+    // Exact type lookup - RawBuffer::serialize would otherwise serialize the whole metadata just to retrieve the type
+    static const std::unordered_map<std::type_index, DatatypeEnum> datatypes = {
+        {typeid(RawBuffer), DatatypeEnum::Buffer},
+        {typeid(RawImgFrame), DatatypeEnum::ImgFrame},
+        {typeid(RawNNData), DatatypeEnum::NNData},
+        {typeid(RawImageManipConfig), DatatypeEnum::ImageManipConfig},
+        {typeid(RawCameraControl), DatatypeEnum::CameraControl},
+        {typeid(RawImgDetections), DatatypeEnum::ImgDetections},
+        {typeid(RawSpatialImgDetections), DatatypeEnum::SpatialImgDetections},
+        {typeid(RawSystemInformation), DatatypeEnum::SystemInformation},
+        {typeid(RawSpatialLocationCalculatorConfig), DatatypeEnum::SpatialLocationCalculatorConfig},
+        {typeid(RawSpatialLocations), DatatypeEnum::SpatialLocationCalculatorData},
+        {typeid(RawEdgeDetectorConfig), DatatypeEnum::EdgeDetectorConfig},
+        {typeid(RawAprilTagConfig), DatatypeEnum::AprilTagConfig},
+        {typeid(RawAprilTags), DatatypeEnum::AprilTags},
+        {typeid(RawTracklets), DatatypeEnum::Tracklets},
+        {typeid(RawIMUData), DatatypeEnum::IMUData},
+        {typeid(RawStereoDepthConfig), DatatypeEnum::StereoDepthConfig},
+        {typeid(RawFeatureTrackerConfig), DatatypeEnum::FeatureTrackerConfig},
+        {typeid(RawToFConfig), DatatypeEnum::ToFConfig},
+        {typeid(RawTrackedFeatures), DatatypeEnum::TrackedFeatures},
+    };
+
+    auto it = datatypes.find(std::type_index(typeid(raw)));
+    if(it == datatypes.end()) return DatatypeEnum::Buffer;
+    return it->second;
+}
+
+DatatypeEnum getDatatype(const ADatatype& msg) {
+    auto raw = msg.getRaw();
+    if(raw == nullptr) return DatatypeEnum::Buffer;
+    return getDatatype(*raw);
+}
+
+std::size_t getFrameSize(unsigned int width, unsigned int height, RawImgFrame::Type type) {
+    const std::size_t pixels = static_cast<std::size_t>(width) * height;
+    switch(type) {
+        case RawImgFrame::Type::RGB888i:
+        case RawImgFrame::Type::BGR888i:
+        case RawImgFrame::Type::RGB888p:
+        case RawImgFrame::Type::BGR888p:
+            return pixels * 3;
+        case RawImgFrame::Type::YUV420p:
+        case RawImgFrame::Type::NV12:
+        case RawImgFrame::Type::NV21:
+            return pixels * 3 / 2;
+        case RawImgFrame::Type::RAW8:
+        case RawImgFrame::Type::GRAY8:
+            return pixels;
+        case RawImgFrame::Type::GRAYF16:
+        case RawImgFrame::Type::RAW16:
+        case RawImgFrame::Type::RAW14:
+        case RawImgFrame::Type::RAW12:
+        case RawImgFrame::Type::RAW10:
+            return pixels * 2;
+        case RawImgFrame::Type::RGBF16F16F16i:
+        case RawImgFrame::Type::BGRF16F16F16i:
+        case RawImgFrame::Type::RGBF16F16F16p:
+        case RawImgFrame::Type::BGRF16F16F16p:
+            return pixels * 6;
+        default:
+            throw std::invalid_argument("Frame type not supported, use a Buffer stream for bitstreams");
+    }
+}
+
+}  // namespace python
+}  // namespace dai
@@ -0,0 +1,42 @@
+#pragma once
+
+// std
+#include <cstddef>
+
+// depthai
+#include "depthai/pipeline/datatype/ADatatype.hpp"
+#include "depthai-shared/datatype/DatatypeEnum.hpp"
+#include "depthai-shared/datatype/RawBuffer.hpp"
+#include "depthai-shared/datatype/RawImgFrame.hpp"
+
+namespace dai {
+namespace python {
+
+/**
+ * Retrieves the datatype of a raw message without serializing its metadata
+ *
+ * @param raw Raw message
+ * @returns Datatype of the message, Buffer for unknown subclasses
+ */
+DatatypeEnum getDatatype(const RawBuffer& raw);
+
+/**
+ * Retrieves the datatype of a message without serializing its metadata
+ *
+ * @param msg Message
+ * @returns Datatype of the message, Buffer for unknown subclasses
+ */
+DatatypeEnum getDatatype(const ADatatype& msg);
+
+/**
+ * Computes payload size of a frame with tightly packed planes
+ *
+ * @param width Frame width
+ * @param height Frame height
+ * @param type Frame type, encoded bitstreams aren't supported
+ * @returns Payload size in bytes
+ */
+std::size_t getFrameSize(unsigned int width, unsigned int height, RawImgFrame::Type type);
+
+}  // namespace python
+}  // namespace dai
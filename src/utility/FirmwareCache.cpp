@@ -0,0 +1,101 @@
+#include "FirmwareCache.hpp"
+
+// std
+#include <cstring>
+#include <stdexcept>
+
+// depthai
+#include "depthai/build/version.hpp"
+#include "depthai/openvino/OpenVINO.hpp"
+
+// libraries
+#include <nlohmann/json.hpp>
+
+namespace dai {
+namespace python {
+
+namespace {
+
+constexpr char MAGIC[8] = {'D', 'A', 'I', 'F', 'W', 'C', '0', '1'};
+
+}  // namespace
+
+FirmwareCache::FirmwareCache(const dai::Path& dir) : directory(CacheEntry::createDirectory(dir.empty() ? getDefaultDirectory() : dir)) {}
+
+dai::Path FirmwareCache::getDefaultDirectory() {
+    return CacheEntry::getDefaultDirectory("DEPTHAI_FIRMWARE_CACHE_DIR", "firmware");
+}
+
+dai::Path FirmwareCache::getDirectory() const {
+    return dai::Path(directory);
+}
+
+FirmwareCache::Binary FirmwareCache::getDeviceBinary(const DeviceBase::Config& config) {
+    // Everything the binary depends on: library, firmware and OpenVINO versions and preboot board config
+    const std::string key = std::string(build::VERSION) + "|" + build::DEVICE_VERSION + "|" + OpenVINO::getVersionName(config.version) + "|"
+                            + nlohmann::json(config.board).dump();
+    const std::string name = std::string("device-") + build::DEVICE_VERSION + "-" + CacheEntry::toHex(CacheEntry::fnv1a(key)) + ".bin";
+    return get(name, [&config]() { return DeviceBase::getEmbeddedDeviceBinary(config); });
+}
+
+std::string FirmwareCache::getBootloaderEntryName(DeviceBootloader::Type type) {
+    const std::string key = std::string(build::VERSION) + "|" + build::BOOTLOADER_VERSION + "|" + std::to_string(static_cast<int>(type));
+    return std::string("bootloader-") + build::BOOTLOADER_VERSION + "-" + CacheEntry::toHex(CacheEntry::fnv1a(key));
+}
+
+FirmwareCache::Binary FirmwareCache::getBootloaderBinary(DeviceBootloader::Type type) {
+    return get(getBootloaderEntryName(type) + ".bin", [type]() { return DeviceBootloader::getEmbeddedBootloaderBinary(type); });
+}
+
+dai::Path FirmwareCache::getBootloaderBinaryPath(DeviceBootloader::Type type) {
+    const auto binary = getBootloaderBinary(type);
+    const std::string name = getBootloaderEntryName(type) + ".raw";
+
+    std::unique_lock<std::mutex> l(mtx);
+    auto it = plainFiles.find(name);
+    if(it != plainFiles.end()) return it->second;
+
+    const std::string path = directory + "/" + name;
+    const auto matches = [&path, &binary]() {
+        try {
+            MappedFile file{dai::Path(path)};
+            return file.size() == binary.size && std::memcmp(file.data(), binary.data(), binary.size) == 0;
+        } catch(const std::exception&) {
+            return false;
+        }
+    };
+    if(!matches()) {
+        // Missing or corrupted file
+        CacheEntry::storeRaw(path, binary.data(), binary.size);
+        if(!matches()) throw std::runtime_error("Cannot read firmware cache file '" + path + "'");
+    }
+    plainFiles[name] = dai::Path(path);
+    return plainFiles[name];
+}
+
+FirmwareCache::Binary FirmwareCache::get(const std::string& name, const std::function<std::vector<std::uint8_t>()>& produce) {
+    std::unique_lock<std::mutex> l(mtx);
+    auto it = entries.find(name);
+    if(it != entries.end()) return it->second;
+
+    const std::string path = directory + "/" + name;
+    Binary binary;
+    if(!CacheEntry::load(path, MAGIC, binary)) {
+        // Missing or corrupted entry
+        CacheEntry::store(path, MAGIC, produce());
+        if(!CacheEntry::load(path, MAGIC, binary)) throw std::runtime_error("Cannot read firmware cache entry '" + path + "'");
+    }
+    entries[name] = binary;
+    return binary;
+}
+
+void FirmwareCache::clear() {
+    std::unique_lock<std::mutex> l(mtx);
+    entries.clear();
+    plainFiles.clear();
+    CacheEntry::removeAll(directory, "device-");
+    CacheEntry::removeAll(directory, "bootloader-");
+}
+
+}  // namespace python
+}  // namespace dai
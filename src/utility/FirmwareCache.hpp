@@ -0,0 +1,95 @@
+#pragma once
+
+// std
+#include <cstddef>
+#include <cstdint>
+#include <functional>
+#include <map>
+#include <memory>
+#include <mutex>
+#include <string>
+#include <vector>
+
+// depthai
+#include "depthai/device/DeviceBase.hpp"
+#include "depthai/device/DeviceBootloader.hpp"
+#include "depthai/utility/Path.hpp"
+
+// project
+#include "utility/CacheEntry.hpp"
+
+namespace dai {
+namespace python {
+
+/**
+ * Versioned, content-hashed on-disk cache of ready-to-send device firmware and bootloader binaries.
+ * Binaries are produced (decompressed, patched, preboot config prepended) once, then memory mapped from disk by any process.
+ * Entries are keyed by library and firmware versions and by configuration, written to a temporary file and renamed into place,
+ * so concurrent processes never observe partial entries. Content hashes are verified once per process.
+ *
+ * Entry format: see CacheEntry, with magic "DAIFWC01".
+ *
+ * DeviceBootloader flashes the bootloader from the cache (see getBootloaderBinaryPath), so flashing doesn't wait for the
+ * resource archive to be decompressed. Booting a Device doesn't use the cache: depthai-core waits for the resource archive and
+ * prepends the preboot config to any firmware it boots, including one given by path, so a cached binary can't shorten boot.
+ */
+class FirmwareCache {
+   public:
+    /**
+     * Binary mapped from a cache entry
+     */
+    using Binary = CacheBinary;
+
+    /**
+     * Constructs a cache in given directory, created if missing
+     *
+     * @param directory Cache directory, default directory if empty
+     */
+    explicit FirmwareCache(const dai::Path& directory = dai::Path());
+
+    /**
+     * Default cache directory: DEPTHAI_FIRMWARE_CACHE_DIR if set,
+     * otherwise 'depthai/firmware' in the user cache directory (LOCALAPPDATA, XDG_CACHE_HOME or ~/.cache)
+     */
+    static dai::Path getDefaultDirectory();
+
+    /**
+     * Retrieves cache directory
+     */
+    dai::Path getDirectory() const;
+
+    /**
+     * Retrieves device firmware for given configuration, as returned by DeviceBase::getEmbeddedDeviceBinary
+     */
+    Binary getDeviceBinary(const DeviceBase::Config& config);
+
+    /**
+     * Retrieves bootloader firmware of given type, as returned by DeviceBootloader::getEmbeddedBootloaderBinary
+     */
+    Binary getBootloaderBinary(DeviceBootloader::Type type);
+
+    /**
+     * Retrieves path of a plain file holding the bootloader firmware of given type, for APIs which read a binary from a path
+     * (DeviceBootloader::flashBootloader). Written next to the cache entry and verified against it once per process
+     */
+    dai::Path getBootloaderBinaryPath(DeviceBootloader::Type type);
+
+    /**
+     * Removes all cache entries from disk. Binaries already mapped stay valid
+     */
+    void clear();
+
+   private:
+    std::string directory;
+    std::mutex mtx;
+    // Entries and plain files verified by this process
+    std::map<std::string, Binary> entries;
+    std::map<std::string, dai::Path> plainFiles;
+
+    static std::string getBootloaderEntryName(DeviceBootloader::Type type);
+
+    Binary get(const std::string& name, const std::function<std::vector<std::uint8_t>()>& produce);
+};
+
+}  // namespace python
+}  // namespace dai
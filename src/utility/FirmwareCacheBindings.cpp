@@ -0,0 +1,76 @@
+#include "FirmwareCacheBindings.hpp"
+
+// project
+#include "utility/FirmwareCache.hpp"
+#include "utility/Initialization.hpp"
+
+// Read-only array viewing the mapped entry, which is kept alive by the array
+static py::array_t<std::uint8_t> binaryToNumpy(const dai::python::FirmwareCache::Binary& binary){
+    auto* file = new std::shared_ptr<dai::python::MappedFile>(binary.file);
+    py::capsule owner(file, [](void* p){ delete reinterpret_cast<std::shared_ptr<dai::python::MappedFile>*>(p); });
+    py::array_t<std::uint8_t> view(binary.size, binary.data(), owner);
+    view.attr("setflags")(py::arg("write") = false);
+    return view;
+}
+
+void FirmwareCacheBindings::bind(pybind11::module& m, void* pCallstack){
+
+    using namespace dai;
+    using namespace dai::python;
+
+    // Type definitions
+    py::class_<FirmwareCache, std::shared_ptr<FirmwareCache>> firmwareCache(m, "FirmwareCache", "Versioned, content-hashed on-disk cache of ready-to-send device firmware and bootloader binaries, memory mapped on retrieval and safe to share between processes. DeviceBootloader.flashBootloader flashes from the default cache when no path is given. Device boot doesn't use it");
+
+
+    ///////////////////////////////////////////////////////////////////////
+    ///////////////////////////////////////////////////////////////////////
+    ///////////////////////////////////////////////////////////////////////
+    // Call the rest of the type defines, then perform the actual bindings
+    Callstack* callstack = (Callstack*) pCallstack;
+    auto cb = callstack->top();
+    callstack->pop();
+    cb(m, pCallstack);
+    // Actual bindings
+    ///////////////////////////////////////////////////////////////////////
+    ///////////////////////////////////////////////////////////////////////
+    ///////////////////////////////////////////////////////////////////////
+
+
+    firmwareCache
+        .def(py::init<const Path&>(), py::arg("directory") = Path(), "Constructs a cache in given directory (created if missing), default directory if empty")
+        .def_static("getDefaultDirectory", &FirmwareCache::getDefaultDirectory, "Default cache directory: DEPTHAI_FIRMWARE_CACHE_DIR if set, otherwise 'depthai/firmware' in the user cache directory")
+        .def("getDirectory", &FirmwareCache::getDirectory, "Retrieves cache directory")
+        .def("getDeviceBinary", [](FirmwareCache& c, const DeviceBase::Config& config){
+            FirmwareCache::Binary binary;
+            {
+                py::gil_scoped_release release;
+                binary = c.getDeviceBinary(config);
+            }
+            return binaryToNumpy(binary);
+        }, py::arg("config"), py::call_guard<python::InitializeGuard>(), "Retrieves device firmware for given configuration (as Device.getEmbeddedDeviceBinary), as a read-only array mapped from the cache")
+        .def("getDeviceBinary", [](FirmwareCache& c, OpenVINO::Version version){
+            DeviceBase::Config config;
+            config.version = version;
+            FirmwareCache::Binary binary;
+            {
+                py::gil_scoped_release release;
+                binary = c.getDeviceBinary(config);
+            }
+            return binaryToNumpy(binary);
+        }, py::arg("version") = OpenVINO::VERSION_UNIVERSAL, py::call_guard<python::InitializeGuard>(), "Retrieves device firmware for given OpenVINO version and default board configuration, as a read-only array mapped from the cache")
+        .def("getBootloaderBinary", [](FirmwareCache& c, DeviceBootloader::Type type){
+            FirmwareCache::Binary binary;
+            {
+                py::gil_scoped_release release;
+                binary = c.getBootloaderBinary(type);
+            }
+            return binaryToNumpy(binary);
+        }, py::arg("type"), py::call_guard<python::InitializeGuard>(), "Retrieves bootloader firmware of given type (as DeviceBootloader.getEmbeddedBootloaderBinary), as a read-only array mapped from the cache")
+        .def("getBootloaderBinaryPath", [](FirmwareCache& c, DeviceBootloader::Type type){
+            py::gil_scoped_release release;
+            return c.getBootloaderBinaryPath(type);
+        }, py::arg("type"), py::call_guard<python::InitializeGuard>(), "Retrieves path of a plain file holding bootloader firmware of given type, as passed to DeviceBootloader.flashBootloader")
+        .def("clear", &FirmwareCache::clear, "Removes all cache entries from disk. Arrays already retrieved stay valid")
+        ;
+
+}
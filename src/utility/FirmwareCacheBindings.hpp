@@ -0,0 +1,8 @@
+#pragma once
+
+// pybind
+#include "pybind11_common.hpp"
+
+struct FirmwareCacheBindings {
+    static void bind(pybind11::module& m, void* pCallstack);
+};
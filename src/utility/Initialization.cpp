@@ -0,0 +1,48 @@
+#include "Initialization.hpp"
+
+// std
+#include <atomic>
+#include <mutex>
+
+// depthai
+#include "depthai/utility/Initialization.hpp"
+
+namespace dai {
+namespace python {
+
+namespace {
+
+std::mutex optionsMtx;
+std::string additionalInfo;
+bool installSignalHandler = true;
+std::atomic<bool> initialized{false};
+
+}  // namespace
+
+void setInitializationOptions(std::string info, bool signalHandler) {
+    std::unique_lock<std::mutex> l(optionsMtx);
+    additionalInfo = std::move(info);
+    installSignalHandler = signalHandler;
+}
+
+bool initialize() {
+    if(initialized) return true;
+
+    std::string info;
+    bool signalHandler;
+    {
+        std::unique_lock<std::mutex> l(optionsMtx);
+        info = additionalInfo;
+        signalHandler = installSignalHandler;
+    }
+    // Only the first successful call takes effect, later ones return its result
+    initialized = dai::initialize(info, signalHandler);
+    return initialized;
+}
+
+bool isInitialized() {
+    return initialized;
+}
+
+}  // namespace python
+}  // namespace dai
@@ -0,0 +1,41 @@
+#pragma once
+
+// std
+#include <string>
+
+namespace dai {
+namespace python {
+
+/**
+ * Sets up deferred initialization of depthai-core. Called on import instead of initializing right away,
+ * so importing stays cheap for code which only uses datatypes, calibration, etc.
+ *
+ * @param additionalInfo Information logged once initialized
+ * @param installSignalHandler Whether to install the signal handler printing backtraces on crashes
+ */
+void setInitializationOptions(std::string additionalInfo, bool installSignalHandler);
+
+/**
+ * Initializes depthai-core (logging, resources, XLink) with options set on import, if not initialized yet.
+ * Called before the first device, XLink or pipeline operation
+ *
+ * @returns True if initialized successfully
+ */
+bool initialize();
+
+/**
+ * Check whether depthai-core was initialized through bindings
+ */
+bool isInitialized();
+
+/**
+ * Call guard initializing depthai-core before a bound function runs, eg. py::call_guard<InitializeGuard>()
+ */
+struct InitializeGuard {
+    InitializeGuard() {
+        initialize();
+    }
+};
+
+}  // namespace python
+}  // namespace dai
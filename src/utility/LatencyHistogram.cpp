@@ -0,0 +1,105 @@
+#include "LatencyHistogram.hpp"
+
+// std
+#include <algorithm>
+#include <cmath>
+
+namespace dai {
+namespace python {
+
+constexpr unsigned LatencyHistogram::SUB_BUCKET_BITS;
+constexpr unsigned LatencyHistogram::SUB_BUCKETS;
+constexpr unsigned LatencyHistogram::MAX_EXPONENT;
+constexpr unsigned LatencyHistogram::NUM_BUCKETS;
+
+unsigned LatencyHistogram::bucketOf(std::uint64_t us) {
+    // Values below SUB_BUCKETS are stored exactly
+    if(us < SUB_BUCKETS) return static_cast<unsigned>(us);
+
+    unsigned exponent = 0;
+    while((us >> (exponent + 1)) != 0) exponent++;
+    if(exponent > MAX_EXPONENT) return NUM_BUCKETS - 1;
+
+    const unsigned sub = static_cast<unsigned>((us >> (exponent - SUB_BUCKET_BITS)) & (SUB_BUCKETS - 1));
+    return SUB_BUCKETS + (exponent - SUB_BUCKET_BITS) * SUB_BUCKETS + sub;
+}
+
+float LatencyHistogram::valueOf(unsigned bucket) {
+    if(bucket < SUB_BUCKETS) return bucket / 1000.0f;
+
+    // Middle of the bucket
+    const unsigned exponent = (bucket - SUB_BUCKETS) / SUB_BUCKETS + SUB_BUCKET_BITS;
+    const unsigned sub = (bucket - SUB_BUCKETS) % SUB_BUCKETS;
+    const double width = std::ldexp(1.0, static_cast<int>(exponent - SUB_BUCKET_BITS));
+    const double lower = std::ldexp(1.0, static_cast<int>(exponent)) + sub * width;
+    return static_cast<float>((lower + width / 2.0) / 1000.0);
+}
+
+void LatencyHistogram::record(std::chrono::nanoseconds latency) {
+    const std::uint64_t us = latency.count() > 0 ? static_cast<std::uint64_t>(latency.count() / 1000) : 0;
+
+    buckets[bucketOf(us)].fetch_add(1, std::memory_order_relaxed);
+    sumUs.fetch_add(us, std::memory_order_relaxed);
+
+    auto cur = minUs.load(std::memory_order_relaxed);
+    while(us < cur && !minUs.compare_exchange_weak(cur, us, std::memory_order_relaxed)) {
+    }
+    cur = maxUs.load(std::memory_order_relaxed);
+    while(us > cur && !maxUs.compare_exchange_weak(cur, us, std::memory_order_relaxed)) {
+    }
+
+    count.fetch_add(1, std::memory_order_release);
+}
+
+std::uint64_t LatencyHistogram::getCount() const {
+    return count.load(std::memory_order_acquire);
+}
+
+float LatencyHistogram::getPercentile(float percentile) const {
+    // Take a consistent total over the buckets, as samples may be recorded in between
+    std::array<std::uint64_t, NUM_BUCKETS> snapshot;
+    std::uint64_t total = 0;
+    for(unsigned i = 0; i < NUM_BUCKETS; i++) {
+        snapshot[i] = buckets[i].load(std::memory_order_relaxed);
+        total += snapshot[i];
+    }
+    if(total == 0) return 0.0f;
+
+    percentile = std::min(100.0f, std::max(0.0f, percentile));
+    const auto target = std::max<std::uint64_t>(1, static_cast<std::uint64_t>(std::ceil(percentile / 100.0 * total)));
+    std::uint64_t cumulative = 0;
+    for(unsigned i = 0; i < NUM_BUCKETS; i++) {
+        cumulative += snapshot[i];
+        if(cumulative >= target) {
+            // Don't report beyond the exactly tracked extremes
+            return std::min(valueOf(i), maxUs.load(std::memory_order_relaxed) / 1000.0f);
+        }
+    }
+    return maxUs.load(std::memory_order_relaxed) / 1000.0f;
+}
+
+LatencySummary LatencyHistogram::getSummary() const {
+    LatencySummary summary;
+    summary.count = getCount();
+    if(summary.count == 0) return summary;
+
+    summary.min = minUs.load(std::memory_order_relaxed) / 1000.0f;
+    summary.max = maxUs.load(std::memory_order_relaxed) / 1000.0f;
+    summary.mean = static_cast<float>(sumUs.load(std::memory_order_relaxed) / 1000.0 / summary.count);
+    summary.p50 = getPercentile(50.0f);
+    summary.p90 = getPercentile(90.0f);
+    summary.p99 = getPercentile(99.0f);
+    summary.p999 = getPercentile(99.9f);
+    return summary;
+}
+
+void LatencyHistogram::reset() {
+    for(auto& bucket : buckets) bucket.store(0, std::memory_order_relaxed);
+    sumUs = 0;
+    minUs = UINT64_MAX;
+    maxUs = 0;
+    count = 0;
+}
+
+}  // namespace python
+}  // namespace dai
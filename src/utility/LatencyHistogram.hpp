@@ -0,0 +1,87 @@
+#pragma once
+
+// std
+#include <array>
+#include <atomic>
+#include <chrono>
+#include <cstdint>
+
+namespace dai {
+namespace python {
+
+/**
+ * Summary of a latency histogram. Latencies are in milliseconds
+ */
+struct LatencySummary {
+    /// Number of recorded samples
+    std::uint64_t count = 0;
+    /// Minimum latency [ms]
+    float min = 0.0f;
+    /// Maximum latency [ms]
+    float max = 0.0f;
+    /// Average latency [ms]
+    float mean = 0.0f;
+    /// Median latency [ms]
+    float p50 = 0.0f;
+    /// 90th percentile latency [ms]
+    float p90 = 0.0f;
+    /// 99th percentile latency [ms]
+    float p99 = 0.0f;
+    /// 99.9th percentile latency [ms]
+    float p999 = 0.0f;
+};
+
+/**
+ * Latency histogram with log-linear buckets (HDR style) and fixed memory.
+ * Each power of two is split into 16 buckets, so percentiles are within ~6% of the recorded values.
+ * Recording is lock-free.
+ */
+class LatencyHistogram {
+   public:
+    /**
+     * Records a latency sample. Negative latencies are recorded as zero
+     */
+    void record(std::chrono::nanoseconds latency);
+
+    /**
+     * Retrieves number of recorded samples
+     */
+    std::uint64_t getCount() const;
+
+    /**
+     * Retrieves latency at given percentile
+     *
+     * @param percentile Percentile in range [0, 100]
+     * @returns Latency [ms]
+     */
+    float getPercentile(float percentile) const;
+
+    /**
+     * Retrieves a summary of recorded samples
+     */
+    LatencySummary getSummary() const;
+
+    /**
+     * Discards all recorded samples
+     */
+    void reset();
+
+   private:
+    static constexpr unsigned SUB_BUCKET_BITS = 4;
+    static constexpr unsigned SUB_BUCKETS = 1 << SUB_BUCKET_BITS;
+    // Samples are in microseconds, up to 2^40us
+    static constexpr unsigned MAX_EXPONENT = 40;
+    static constexpr unsigned NUM_BUCKETS = SUB_BUCKETS + (MAX_EXPONENT - SUB_BUCKET_BITS + 1) * SUB_BUCKETS;
+
+    std::array<std::atomic<std::uint64_t>, NUM_BUCKETS> buckets{};
+    std::atomic<std::uint64_t> count{0};
+    std::atomic<std::uint64_t> sumUs{0};
+    std::atomic<std::uint64_t> minUs{UINT64_MAX};
+    std::atomic<std::uint64_t> maxUs{0};
+
+    static unsigned bucketOf(std::uint64_t us);
+    static float valueOf(unsigned bucket);
+};
+
+}  // namespace python
+}  // namespace dai
@@ -0,0 +1,86 @@
+#include "MappedFile.hpp"
+
+// std
+#include <stdexcept>
+
+#if defined(_WIN32)
+    #define WIN32_LEAN_AND_MEAN
+    #include <windows.h>
+#else
+    #include <fcntl.h>
+    #include <sys/mman.h>
+    #include <sys/stat.h>
+    #include <unistd.h>
+#endif
+
+namespace dai {
+namespace python {
+
+#if defined(_WIN32)
+
+MappedFile::MappedFile(const dai::Path& path) {
+    HANDLE file = CreateFileW(path.native().c_str(), GENERIC_READ, FILE_SHARE_READ | FILE_SHARE_WRITE, nullptr, OPEN_EXISTING, FILE_ATTRIBUTE_NORMAL, nullptr);
+    if(file == INVALID_HANDLE_VALUE) throw std::runtime_error("Cannot open file '" + path.u8string() + "'");
+    fileHandle = file;
+
+    LARGE_INTEGER fileSize;
+    if(!GetFileSizeEx(file, &fileSize)) {
+        CloseHandle(file);
+        throw std::runtime_error("Cannot determine size of file '" + path.u8string() + "'");
+    }
+    length = static_cast<std::size_t>(fileSize.QuadPart);
+    if(length == 0) return;
+
+    HANDLE mapping = CreateFileMappingW(file, nullptr, PAGE_READONLY, 0, 0, nullptr);
+    if(mapping == nullptr) {
+        CloseHandle(file);
+        throw std::runtime_error("Cannot map file '" + path.u8string() + "'");
+    }
+    mappingHandle = mapping;
+
+    ptr = static_cast<const std::uint8_t*>(MapViewOfFile(mapping, FILE_MAP_READ, 0, 0, 0));
+    if(ptr == nullptr) {
+        CloseHandle(mapping);
+        CloseHandle(file);
+        throw std::runtime_error("Cannot map file '" + path.u8string() + "'");
+    }
+}
+
+MappedFile::~MappedFile() {
+    if(ptr != nullptr) UnmapViewOfFile(ptr);
+    if(mappingHandle != nullptr) CloseHandle(mappingHandle);
+    if(fileHandle != nullptr) CloseHandle(fileHandle);
+}
+
+#else
+
+MappedFile::MappedFile(const dai::Path& path) {
+    const int fd = open(path.native().c_str(), O_RDONLY);
+    if(fd < 0) throw std::runtime_error("Cannot open file '" + path.u8string() + "'");
+
+    struct stat st;
+    if(fstat(fd, &st) != 0) {
+        close(fd);
+        throw std::runtime_error("Cannot determine size of file '" + path.u8string() + "'");
+    }
+    length = static_cast<std::size_t>(st.st_size);
+    if(length > 0) {
+        void* mapping = mmap(nullptr, length, PROT_READ, MAP_SHARED, fd, 0);
+        if(mapping == MAP_FAILED) {
+            close(fd);
+            throw std::runtime_error("Cannot map file '" + path.u8string() + "'");
+        }
+        ptr = static_cast<const std::uint8_t*>(mapping);
+    }
+    // Mapping stays valid after the descriptor is closed
+    close(fd);
+}
+
+MappedFile::~MappedFile() {
+    if(ptr != nullptr) munmap(const_cast<std::uint8_t*>(ptr), length);
+}
+
+#endif
+
+}  // namespace python
+}  // namespace dai
@@ -0,0 +1,52 @@
+#pragma once
+
+// std
+#include <cstddef>
+#include <cstdint>
+
+// depthai
+#include "depthai/utility/Path.hpp"
+
+namespace dai {
+namespace python {
+
+/**
+ * Read-only memory mapping of a whole file
+ */
+class MappedFile {
+   public:
+    /**
+     * Maps given file
+     *
+     * @param path Path of the file
+     */
+    explicit MappedFile(const dai::Path& path);
+    ~MappedFile();
+    MappedFile(const MappedFile&) = delete;
+    MappedFile& operator=(const MappedFile&) = delete;
+
+    /**
+     * Retrieves start of the mapping, nullptr for an empty file
+     */
+    const std::uint8_t* data() const {
+        return ptr;
+    }
+
+    /**
+     * Retrieves size of the file
+     */
+    std::size_t size() const {
+        return length;
+    }
+
+   private:
+    const std::uint8_t* ptr = nullptr;
+    std::size_t length = 0;
+#if defined(_WIN32)
+    void* fileHandle = nullptr;
+    void* mappingHandle = nullptr;
+#endif
+};
+
+}  // namespace python
+}  // namespace dai
@@ -0,0 +1,273 @@
+#include "MetricsExporter.hpp"
+
+// std
+#include <cmath>
+#include <sstream>
+
+// project
+#include "log/LogBuffer.hpp"
+
+namespace dai {
+namespace python {
+
+namespace {
+
+std::string escapeLabel(const std::string& value) {
+    std::string escaped;
+    escaped.reserve(value.size());
+    for(const char c : value) {
+        if(c == '\\') {
+            escaped += "\\\\";
+        } else if(c == '"') {
+            escaped += "\\\"";
+        } else if(c == '\n') {
+            escaped += "\\n";
+        } else {
+            escaped += c;
+        }
+    }
+    return escaped;
+}
+
+// Writes metric families in Prometheus text exposition format
+class TextWriter {
+   public:
+    TextWriter() {
+        out.precision(9);
+    }
+
+    void family(const char* name, const char* type, const char* help) {
+        out << "# HELP " << name << ' ' << help << '\n' << "# TYPE " << name << ' ' << type << '\n';
+    }
+
+    void sample(const char* name, std::initializer_list<std::pair<const char*, std::string>> labels, double value) {
+        out << name;
+        if(labels.size() > 0) {
+            out << '{';
+            bool first = true;
+            for(const auto& label : labels) {
+                if(!first) out << ',';
+                first = false;
+                out << label.first << "=\"" << escapeLabel(label.second) << '"';
+            }
+            out << '}';
+        }
+        out << ' ';
+        // Counters are printed exactly, rather than in scientific notation
+        if(std::floor(value) == value && std::fabs(value) < 9007199254740992.0) {
+            out << static_cast<std::int64_t>(value);
+        } else {
+            out << value;
+        }
+        out << '\n';
+    }
+
+    std::string str() const {
+        return out.str();
+    }
+
+   private:
+    std::ostringstream out;
+};
+
+}  // namespace
+
+MetricsExporter::MetricsExporter(std::chrono::duration<double> minInterval)
+    : minInterval(minInterval), hostLogCounts(std::make_shared<LogCounts>()) {
+    for(auto& count : *hostLogCounts) count = 0;
+}
+
+MetricsExporter::~MetricsExporter() {
+    for(auto& entry : devices) {
+        try {
+            entry.device->removeLogCallback(entry.logCallbackId);
+        } catch(const std::exception&) {
+            // device closed in between
+        }
+    }
+}
+
+void MetricsExporter::addDevice(Device& device) {
+    DeviceEntry entry;
+    entry.device = &device;
+    entry.mxId = device.getMxId();
+    entry.logCounts = std::make_shared<LogCounts>();
+    for(auto& count : *entry.logCounts) count = 0;
+
+    // Counters are shared with the callback, so they outlive a callback in flight
+    auto counts = entry.logCounts;
+    entry.logCallbackId = device.addLogCallback([counts](LogMessage msg) {
+        const auto level = static_cast<std::size_t>(msg.level);
+        if(level < counts->size()) (*counts)[level]++;
+    });
+
+    const float rate = device.getSystemInformationLoggingRate();
+
+    {
+        std::unique_lock<std::mutex> l(mtx);
+        if(minInterval.count() < 0) minInterval = std::chrono::duration<double>(rate > 0 ? 1.0 / rate : 1.0);
+        devices.push_back(std::move(entry));
+    }
+
+    for(const auto& name : device.getOutputQueueNames()) addQueue(device.getOutputQueue(name));
+    for(const auto& name : device.getInputQueueNames()) addQueue(device.getInputQueue(name));
+}
+
+void MetricsExporter::addQueue(const std::shared_ptr<DataOutputQueue>& queue) {
+    auto monitor = QueueMonitor::attach(queue);
+    std::unique_lock<std::mutex> l(mtx);
+    for(const auto& q : queues) {
+        if(q.monitor == monitor) return;
+    }
+    queues.push_back({queue->getName(), "output", monitor});
+}
+
+void MetricsExporter::addQueue(const std::shared_ptr<DataInputQueue>& queue) {
+    auto monitor = QueueMonitor::attach(queue);
+    std::unique_lock<std::mutex> l(mtx);
+    for(const auto& q : queues) {
+        if(q.monitor == monitor) return;
+    }
+    queues.push_back({queue->getName(), "input", monitor});
+}
+
+void MetricsExporter::setSystemInformationSource(std::shared_ptr<SystemInformationCollector> collector) {
+    std::unique_lock<std::mutex> l(mtx);
+    this->collector = std::move(collector);
+}
+
+void MetricsExporter::recordLogMessage(const LogMessage& msg) {
+    const auto level = static_cast<std::size_t>(msg.level);
+    if(level < hostLogCounts->size()) (*hostLogCounts)[level]++;
+}
+
+std::chrono::duration<double> MetricsExporter::getMinInterval() const {
+    std::unique_lock<std::mutex> l(mtx);
+    return minInterval;
+}
+
+void MetricsExporter::readDevice(DeviceEntry& entry) {
+    // Must be called with mtx held
+    const auto now = std::chrono::steady_clock::now();
+    if(entry.hasReading && now - entry.lastReading < minInterval) return;
+    entry.lastReading = now;
+    entry.hasReading = true;
+
+    if(entry.device->isClosed()) {
+        entry.up = false;
+        return;
+    }
+    try {
+        entry.profiling = entry.device->getProfilingData();
+        if(collector == nullptr) {
+            entry.info.ddrMemoryUsage = entry.device->getDdrMemoryUsage();
+            entry.info.cmxMemoryUsage = entry.device->getCmxMemoryUsage();
+            entry.info.leonCssMemoryUsage = entry.device->getLeonCssHeapUsage();
+            entry.info.leonMssMemoryUsage = entry.device->getLeonMssHeapUsage();
+            entry.info.leonCssCpuUsage = entry.device->getLeonCssCpuUsage();
+            entry.info.leonMssCpuUsage = entry.device->getLeonMssCpuUsage();
+            entry.info.chipTemperature = entry.device->getChipTemperature();
+        }
+        entry.up = true;
+    } catch(const std::exception&) {
+        entry.up = false;
+        entry.numReadErrors++;
+    }
+}
+
+std::string MetricsExporter::scrape() {
+    std::unique_lock<std::mutex> l(mtx);
+
+    // System information, per device label
+    std::vector<std::pair<std::string, const RawSystemInformation*>> infos;
+    RawSystemInformation collected;
+    double collectedTs = 0.0;
+    for(auto& entry : devices) {
+        readDevice(entry);
+        if(collector == nullptr && entry.up) infos.emplace_back(entry.mxId, &entry.info);
+    }
+    if(collector != nullptr && collector->getLatest(collected, collectedTs)) {
+        infos.emplace_back(devices.size() == 1 ? devices.front().mxId : std::string(), &collected);
+    }
+
+    TextWriter w;
+
+    // Queues
+    std::vector<std::pair<const QueueEntry*, QueueStats>> stats;
+    for(const auto& q : queues) stats.emplace_back(&q, q.monitor->getStats());
+    auto queueFamily = [&](const char* name, const char* type, const char* help, const char* direction, double (*value)(const QueueStats&)) {
+        w.family(name, type, help);
+        for(const auto& s : stats) {
+            if(direction == nullptr || s.first->direction == direction) w.sample(name, {{"queue", s.first->name}, {"direction", s.first->direction}}, value(s.second));
+        }
+    };
+    queueFamily("depthai_queue_received_messages_total", "counter", "Messages received from the device", "output", [](const QueueStats& s) { return double(s.numReceived); });
+    queueFamily("depthai_queue_consumed_messages_total", "counter", "Messages retrieved by the host", "output", [](const QueueStats& s) { return double(s.numConsumed); });
+    queueFamily("depthai_queue_dropped_messages_total", "counter", "Messages overwritten because a non-blocking queue was full", "output", [](const QueueStats& s) {
+        return double(s.numDropped);
+    });
+    queueFamily("depthai_queue_sent_messages_total", "counter", "Messages sent to the device", "input", [](const QueueStats& s) { return double(s.numSent); });
+    queueFamily("depthai_queue_bytes_total", "counter", "Data bytes received or sent", nullptr, [](const QueueStats& s) { return double(s.numBytes); });
+    queueFamily("depthai_queue_depth", "gauge", "Messages currently in the queue", "output", [](const QueueStats& s) { return double(s.depth); });
+    queueFamily("depthai_queue_peak_depth", "gauge", "Maximum number of messages in the queue so far", "output", [](const QueueStats& s) { return double(s.peakDepth); });
+    queueFamily("depthai_queue_rate_hertz", "gauge", "Moving average of message rate", nullptr, [](const QueueStats& s) { return double(s.rate); });
+    queueFamily("depthai_queue_jitter_seconds", "gauge", "Moving average of inter-arrival time deviation", "output", [](const QueueStats& s) {
+        return s.jitter.count() / 1e6;
+    });
+    queueFamily("depthai_queue_blocked_seconds_total", "counter", "Time spent blocked in send", "input", [](const QueueStats& s) { return s.timeBlocked.count() / 1e6; });
+
+    // XLink profiling
+    const auto global = Device::getGlobalProfilingData();
+    w.family("depthai_xlink_global_written_bytes_total", "counter", "Bytes written over XLink by all devices");
+    w.sample("depthai_xlink_global_written_bytes_total", {}, double(global.numBytesWritten));
+    w.family("depthai_xlink_global_read_bytes_total", "counter", "Bytes read over XLink from all devices");
+    w.sample("depthai_xlink_global_read_bytes_total", {}, double(global.numBytesRead));
+    w.family("depthai_device_up", "gauge", "Whether the device responded to the last reading");
+    for(const auto& d : devices) w.sample("depthai_device_up", {{"device", d.mxId}}, d.up ? 1 : 0);
+    w.family("depthai_device_read_errors_total", "counter", "Failed device readings");
+    for(const auto& d : devices) w.sample("depthai_device_read_errors_total", {{"device", d.mxId}}, double(d.numReadErrors));
+    w.family("depthai_xlink_written_bytes_total", "counter", "Bytes written over XLink to the device");
+    for(const auto& d : devices) w.sample("depthai_xlink_written_bytes_total", {{"device", d.mxId}}, double(d.profiling.numBytesWritten));
+    w.family("depthai_xlink_read_bytes_total", "counter", "Bytes read over XLink from the device");
+    for(const auto& d : devices) w.sample("depthai_xlink_read_bytes_total", {{"device", d.mxId}}, double(d.profiling.numBytesRead));
+
+    // System information
+    const std::pair<const char*, MemoryInfo RawSystemInformation::*> memories[] = {{"ddr", &RawSystemInformation::ddrMemoryUsage},
+                                                                                   {"cmx", &RawSystemInformation::cmxMemoryUsage},
+                                                                                   {"leon_css_heap", &RawSystemInformation::leonCssMemoryUsage},
+                                                                                   {"leon_mss_heap", &RawSystemInformation::leonMssMemoryUsage}};
+    w.family("depthai_memory_used_bytes", "gauge", "Used memory");
+    for(const auto& info : infos) {
+        for(const auto& mem : memories) w.sample("depthai_memory_used_bytes", {{"device", info.first}, {"memory", mem.first}}, double(((*info.second).*mem.second).used));
+    }
+    w.family("depthai_memory_total_bytes", "gauge", "Total memory");
+    for(const auto& info : infos) {
+        for(const auto& mem : memories) w.sample("depthai_memory_total_bytes", {{"device", info.first}, {"memory", mem.first}}, double(((*info.second).*mem.second).total));
+    }
+    w.family("depthai_cpu_usage_ratio", "gauge", "Average CPU usage");
+    for(const auto& info : infos) {
+        w.sample("depthai_cpu_usage_ratio", {{"device", info.first}, {"cpu", "leon_css"}}, info.second->leonCssCpuUsage.average);
+        w.sample("depthai_cpu_usage_ratio", {{"device", info.first}, {"cpu", "leon_mss"}}, info.second->leonMssCpuUsage.average);
+    }
+    const std::pair<const char*, float ChipTemperature::*> sensors[] = {
+        {"css", &ChipTemperature::css}, {"mss", &ChipTemperature::mss}, {"upa", &ChipTemperature::upa}, {"dss", &ChipTemperature::dss}, {"average", &ChipTemperature::average}};
+    w.family("depthai_chip_temperature_celsius", "gauge", "Chip temperature");
+    for(const auto& info : infos) {
+        for(const auto& sensor : sensors) w.sample("depthai_chip_temperature_celsius", {{"device", info.first}, {"sensor", sensor.first}}, info.second->chipTemperature.*sensor.second);
+    }
+
+    // Log messages
+    w.family("depthai_log_messages_total", "counter", "Log messages by level");
+    auto logSamples = [&w](const std::string& device, const LogCounts& counts) {
+        for(std::size_t level = 0; level < counts.size() - 1; level++) {
+            w.sample("depthai_log_messages_total", {{"device", device}, {"level", getLogLevelName(static_cast<LogLevel>(level))}}, double(counts[level].load()));
+        }
+    };
+    for(const auto& d : devices) logSamples(d.mxId, *d.logCounts);
+    logSamples("", *hostLogCounts);
+
+    return w.str();
+}
+
+}  // namespace python
+}  // namespace dai
@@ -0,0 +1,114 @@
+#pragma once
+
+// std
+#include <array>
+#include <atomic>
+#include <chrono>
+#include <cstdint>
+#include <memory>
+#include <mutex>
+#include <string>
+#include <vector>
+
+// depthai
+#include "depthai/device/Device.hpp"
+#include "depthai-shared/datatype/RawSystemInformation.hpp"
+#include "depthai-shared/log/LogMessage.hpp"
+
+// project
+#include "queue/QueueMonitor.hpp"
+#include "queue/SystemInformationCollector.hpp"
+
+namespace dai {
+namespace python {
+
+/**
+ * Exports device and queue health metrics in Prometheus text exposition format.
+ * Pull based: metrics are gathered when scraped. Device readings (XLink profiling, memory usage, CPU usage,
+ * chip temperature) are cached and refreshed at most once per minimum interval, so frequent scrapes don't load the device.
+ */
+class MetricsExporter {
+   public:
+    /**
+     * Constructs an exporter
+     *
+     * @param minInterval Minimum interval between device readings. If negative,
+     * the system information logging rate of the first added device is used
+     */
+    explicit MetricsExporter(std::chrono::duration<double> minInterval = std::chrono::duration<double>(-1));
+    ~MetricsExporter();
+
+    /**
+     * Adds a device. Its current input and output queues are monitored and its log messages counted by level
+     *
+     * @param device Device, must outlive the exporter
+     */
+    void addDevice(Device& device);
+
+    /**
+     * Adds an output queue, eg. one created after the device was added
+     */
+    void addQueue(const std::shared_ptr<DataOutputQueue>& queue);
+
+    /**
+     * Adds an input queue, eg. one created after the device was added
+     */
+    void addQueue(const std::shared_ptr<DataInputQueue>& queue);
+
+    /**
+     * Uses latest sample of given collector for system information instead of reading it from devices
+     */
+    void setSystemInformationSource(std::shared_ptr<SystemInformationCollector> collector);
+
+    /**
+     * Counts a log message not received from an added device (eg. forwarded from elsewhere)
+     *
+     * @param msg Log message
+     */
+    void recordLogMessage(const LogMessage& msg);
+
+    /**
+     * Retrieves minimum interval between device readings
+     */
+    std::chrono::duration<double> getMinInterval() const;
+
+    /**
+     * Gathers metrics in Prometheus text exposition format
+     */
+    std::string scrape();
+
+   private:
+    using LogCounts = std::array<std::atomic<std::uint64_t>, static_cast<std::size_t>(LogLevel::OFF) + 1>;
+
+    struct DeviceEntry {
+        Device* device;
+        std::string mxId;
+        int logCallbackId;
+        std::shared_ptr<LogCounts> logCounts;
+        // Cached readings
+        bool up = false;
+        bool hasReading = false;
+        std::chrono::steady_clock::time_point lastReading;
+        ProfilingData profiling{0, 0};
+        RawSystemInformation info;
+        std::uint64_t numReadErrors = 0;
+    };
+
+    struct QueueEntry {
+        std::string name;
+        std::string direction;
+        std::shared_ptr<QueueMonitor> monitor;
+    };
+
+    mutable std::mutex mtx;
+    std::chrono::duration<double> minInterval;
+    std::vector<DeviceEntry> devices;
+    std::vector<QueueEntry> queues;
+    std::shared_ptr<SystemInformationCollector> collector;
+    std::shared_ptr<LogCounts> hostLogCounts;
+
+    void readDevice(DeviceEntry& entry);
+};
+
+}  // namespace python
+}  // namespace dai
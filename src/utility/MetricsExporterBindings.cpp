@@ -0,0 +1,42 @@
+#include "MetricsExporterBindings.hpp"
+
+// project
+#include "utility/MetricsExporter.hpp"
+
+void MetricsExporterBindings::bind(pybind11::module& m, void* pCallstack){
+
+    using namespace dai;
+    using namespace dai::python;
+
+    // Type definitions
+    py::class_<MetricsExporter, std::shared_ptr<MetricsExporter>> metricsExporter(m, "MetricsExporter", "Exports device and queue health metrics in Prometheus text exposition format. Device readings are cached, so scrapes don't load the device");
+
+
+    ///////////////////////////////////////////////////////////////////////
+    ///////////////////////////////////////////////////////////////////////
+    ///////////////////////////////////////////////////////////////////////
+    // Call the rest of the type defines, then perform the actual bindings
+    Callstack* callstack = (Callstack*) pCallstack;
+    auto cb = callstack->top();
+    callstack->pop();
+    cb(m, pCallstack);
+    // Actual bindings
+    ///////////////////////////////////////////////////////////////////////
+    ///////////////////////////////////////////////////////////////////////
+    ///////////////////////////////////////////////////////////////////////
+
+
+    metricsExporter
+        .def(py::init<std::chrono::duration<double>>(), py::arg("minInterval") = std::chrono::duration<double>(-1),
+            "Constructs an exporter. Devices are read at most once per 'minInterval', by default the system information logging rate of the first added device")
+        .def("addDevice", &MetricsExporter::addDevice, py::arg("device"), py::keep_alive<1, 2>(), py::call_guard<py::gil_scoped_release>(),
+            "Adds a device. Its current input and output queues are monitored and its log messages counted by level")
+        .def("addQueue", py::overload_cast<const std::shared_ptr<DataOutputQueue>&>(&MetricsExporter::addQueue), py::arg("queue"), "Adds an output queue, eg. one created after the device was added")
+        .def("addQueue", py::overload_cast<const std::shared_ptr<DataInputQueue>&>(&MetricsExporter::addQueue), py::arg("queue"), "Adds an input queue, eg. one created after the device was added")
+        .def("setSystemInformationSource", &MetricsExporter::setSystemInformationSource, py::arg("collector"), "Uses latest sample of given SystemInformationCollector for system information instead of reading it from devices")
+        .def("recordLogMessage", &MetricsExporter::recordLogMessage, py::arg("msg"), "Counts a log message not received from an added device")
+        .def("getMinInterval", &MetricsExporter::getMinInterval, "Retrieves minimum interval between device readings")
+        .def("scrape", &MetricsExporter::scrape, py::call_guard<py::gil_scoped_release>(), "Gathers metrics in Prometheus text exposition format")
+        ;
+
+}
@@ -0,0 +1,192 @@
+#include "TimeSeriesRing.hpp"
+
+// std
+#include <algorithm>
+#include <cmath>
+#include <cstdint>
+#include <cstring>
+#include <fstream>
+#include <stdexcept>
+
+namespace dai {
+namespace python {
+
+namespace {
+
+constexpr char MAGIC[8] = {'D', 'A', 'I', 'T', 'S', 'R', '0', '1'};
+
+template <typename T>
+void writeLE(std::ostream& out, T value) {
+    std::uint8_t bytes[sizeof(T)];
+    std::uint64_t bits = 0;
+    std::memcpy(&bits, &value, sizeof(T));
+    for(std::size_t i = 0; i < sizeof(T); i++) bytes[i] = static_cast<std::uint8_t>(bits >> (8 * i));
+    out.write(reinterpret_cast<const char*>(bytes), sizeof(T));
+}
+
+template <typename T>
+T readLE(std::istream& in) {
+    std::uint8_t bytes[sizeof(T)];
+    if(!in.read(reinterpret_cast<char*>(bytes), sizeof(T))) throw std::runtime_error("Time series file truncated");
+    std::uint64_t bits = 0;
+    for(std::size_t i = 0; i < sizeof(T); i++) bits |= static_cast<std::uint64_t>(bytes[i]) << (8 * i);
+    T value;
+    std::memcpy(&value, &bits, sizeof(T));
+    return value;
+}
+
+}  // namespace
+
+TimeSeriesRing::TimeSeriesRing(std::vector<std::string> fields, std::size_t capacity)
+    : fields(std::move(fields)), capacity(capacity), timestamps(capacity), values(this->fields.size() * capacity) {
+    if(capacity == 0) throw std::invalid_argument("Capacity must be at least 1");
+}
+
+void TimeSeriesRing::append(double timestamp, const double* sample) {
+    std::unique_lock<std::mutex> l(mtx);
+    timestamps[head] = timestamp;
+    for(std::size_t i = 0; i < fields.size(); i++) values[i * capacity + head] = sample[i];
+    head = (head + 1) % capacity;
+    size = std::min(size + 1, capacity);
+}
+
+const std::vector<std::string>& TimeSeriesRing::getFields() const {
+    return fields;
+}
+
+std::size_t TimeSeriesRing::getSize() const {
+    std::unique_lock<std::mutex> l(mtx);
+    return size;
+}
+
+std::size_t TimeSeriesRing::getCapacity() const {
+    return capacity;
+}
+
+std::size_t TimeSeriesRing::fieldIndex(const std::string& field) const {
+    auto it = std::find(fields.begin(), fields.end(), field);
+    if(it == fields.end()) throw std::invalid_argument("Unknown field '" + field + "'");
+    return static_cast<std::size_t>(it - fields.begin());
+}
+
+std::vector<double> TimeSeriesRing::column(const std::vector<double>& data, std::size_t offset) const {
+    // Must be called with mtx held
+    std::vector<double> out(size);
+    const std::size_t start = (head + capacity - size) % capacity;
+    for(std::size_t i = 0; i < size; i++) out[i] = data[offset + (start + i) % capacity];
+    return out;
+}
+
+std::vector<double> TimeSeriesRing::getTimestamps() const {
+    std::unique_lock<std::mutex> l(mtx);
+    return column(timestamps, 0);
+}
+
+std::vector<double> TimeSeriesRing::getField(const std::string& field) const {
+    const auto index = fieldIndex(field);
+    std::unique_lock<std::mutex> l(mtx);
+    return column(values, index * capacity);
+}
+
+bool TimeSeriesRing::getLatest(double& timestamp, std::vector<double>& sample) const {
+    std::unique_lock<std::mutex> l(mtx);
+    if(size == 0) return false;
+    const std::size_t latest = (head + capacity - 1) % capacity;
+    timestamp = timestamps[latest];
+    sample.resize(fields.size());
+    for(std::size_t i = 0; i < fields.size(); i++) sample[i] = values[i * capacity + latest];
+    return true;
+}
+
+TimeSeriesAggregate TimeSeriesRing::aggregate(const std::string& field, std::chrono::duration<double> window) const {
+    const auto index = fieldIndex(field);
+
+    std::vector<double> samples;
+    {
+        std::unique_lock<std::mutex> l(mtx);
+        if(size == 0) return {};
+        const auto ts = column(timestamps, 0);
+        const auto col = column(values, index * capacity);
+        const double from = window.count() < 0 ? -INFINITY : ts.back() - window.count();
+        for(std::size_t i = 0; i < size; i++) {
+            if(ts[i] >= from) samples.push_back(col[i]);
+        }
+    }
+
+    TimeSeriesAggregate agg;
+    agg.count = samples.size();
+    if(samples.empty()) return agg;
+
+    double sum = 0.0;
+    agg.min = samples.front();
+    agg.max = samples.front();
+    for(const auto v : samples) {
+        sum += v;
+        agg.min = std::min(agg.min, v);
+        agg.max = std::max(agg.max, v);
+    }
+    agg.mean = sum / samples.size();
+
+    // Nearest-rank percentile
+    const auto rank = static_cast<std::size_t>(std::ceil(0.95 * samples.size())) - 1;
+    std::nth_element(samples.begin(), samples.begin() + rank, samples.end());
+    agg.p95 = samples[rank];
+    return agg;
+}
+
+void TimeSeriesRing::clear() {
+    std::unique_lock<std::mutex> l(mtx);
+    head = 0;
+    size = 0;
+}
+
+void TimeSeriesRing::dump(const dai::Path& path) const {
+    std::ofstream out(path, std::ios::binary);
+    if(!out) throw std::runtime_error("Cannot open file '" + path.u8string() + "' for writing");
+
+    std::unique_lock<std::mutex> l(mtx);
+    out.write(MAGIC, sizeof(MAGIC));
+    writeLE<std::uint32_t>(out, static_cast<std::uint32_t>(fields.size()));
+    writeLE<std::uint64_t>(out, size);
+    for(const auto& field : fields) {
+        writeLE<std::uint16_t>(out, static_cast<std::uint16_t>(field.size()));
+        out.write(field.data(), field.size());
+    }
+    for(const auto v : column(timestamps, 0)) writeLE<double>(out, v);
+    for(std::size_t i = 0; i < fields.size(); i++) {
+        for(const auto v : column(values, i * capacity)) writeLE<double>(out, v);
+    }
+    if(!out) throw std::runtime_error("Failed writing file '" + path.u8string() + "'");
+}
+
+std::unordered_map<std::string, std::vector<double>> TimeSeriesRing::load(const dai::Path& path) {
+    std::ifstream in(path, std::ios::binary);
+    if(!in) throw std::runtime_error("Cannot open file '" + path.u8string() + "' for reading");
+
+    char magic[sizeof(MAGIC)];
+    if(!in.read(magic, sizeof(magic)) || std::memcmp(magic, MAGIC, sizeof(MAGIC)) != 0) {
+        throw std::runtime_error("File '" + path.u8string() + "' isn't a time series dump");
+    }
+    const auto numFields = readLE<std::uint32_t>(in);
+    const auto numSamples = readLE<std::uint64_t>(in);
+
+    std::vector<std::string> names;
+    for(std::uint32_t i = 0; i < numFields; i++) {
+        std::string name(readLE<std::uint16_t>(in), '\0');
+        if(!in.read(&name[0], name.size())) throw std::runtime_error("Time series file truncated");
+        names.push_back(std::move(name));
+    }
+
+    std::unordered_map<std::string, std::vector<double>> columns;
+    auto readColumn = [&in, numSamples]() {
+        std::vector<double> col(numSamples);
+        for(auto& v : col) v = readLE<double>(in);
+        return col;
+    };
+    columns["timestamp"] = readColumn();
+    for(const auto& name : names) columns[name] = readColumn();
+    return columns;
+}
+
+}  // namespace python
+}  // namespace dai
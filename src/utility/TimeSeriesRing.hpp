@@ -0,0 +1,134 @@
+#pragma once
+
+// std
+#include <chrono>
+#include <cstddef>
+#include <mutex>
+#include <string>
+#include <unordered_map>
+#include <vector>
+
+// depthai
+#include "depthai/utility/Path.hpp"
+
+namespace dai {
+namespace python {
+
+/**
+ * Aggregates of a time series field over a window
+ */
+struct TimeSeriesAggregate {
+    /// Number of samples in the window
+    std::size_t count = 0;
+    double min = 0.0;
+    double max = 0.0;
+    double mean = 0.0;
+    /// 95th percentile
+    double p95 = 0.0;
+};
+
+/**
+ * Fixed-size ring buffer of samples with named numeric fields, stored column-wise.
+ * Once full, the oldest sample is overwritten.
+ *
+ * Binary dump format (little-endian): magic "DAITSR01", uint32 number of fields, uint64 number of samples,
+ * then per field a uint16 name length and name, followed by timestamps and each field column as float64 arrays.
+ */
+class TimeSeriesRing {
+   public:
+    /**
+     * Constructs a ring buffer
+     *
+     * @param fields Names of fields of each sample
+     * @param capacity Maximum number of samples retained
+     */
+    TimeSeriesRing(std::vector<std::string> fields, std::size_t capacity);
+
+    /**
+     * Appends a sample
+     *
+     * @param timestamp Time of the sample [s]
+     * @param values Field values, in order of field names
+     */
+    void append(double timestamp, const double* values);
+
+    /**
+     * Retrieves field names
+     */
+    const std::vector<std::string>& getFields() const;
+
+    /**
+     * Retrieves number of samples retained
+     */
+    std::size_t getSize() const;
+
+    /**
+     * Retrieves maximum number of samples retained
+     */
+    std::size_t getCapacity() const;
+
+    /**
+     * Retrieves timestamps of retained samples, oldest first
+     */
+    std::vector<double> getTimestamps() const;
+
+    /**
+     * Retrieves values of a field of retained samples, oldest first
+     *
+     * @param field Field name
+     */
+    std::vector<double> getField(const std::string& field) const;
+
+    /**
+     * Retrieves the latest sample
+     *
+     * @param[out] timestamp Time of the sample [s]
+     * @param[out] values Field values, in order of field names
+     * @returns False if no sample is retained
+     */
+    bool getLatest(double& timestamp, std::vector<double>& values) const;
+
+    /**
+     * Computes aggregates of a field over samples within a window before the latest sample
+     *
+     * @param field Field name
+     * @param window Window duration, negative for all retained samples
+     */
+    TimeSeriesAggregate aggregate(const std::string& field, std::chrono::duration<double> window) const;
+
+    /**
+     * Discards all samples
+     */
+    void clear();
+
+    /**
+     * Writes retained samples into a binary file
+     *
+     * @param path Path of the output file
+     */
+    void dump(const dai::Path& path) const;
+
+    /**
+     * Reads samples written by dump
+     *
+     * @param path Path of the input file
+     * @returns Columns by field name, timestamps under "timestamp"
+     */
+    static std::unordered_map<std::string, std::vector<double>> load(const dai::Path& path);
+
+   private:
+    const std::vector<std::string> fields;
+    const std::size_t capacity;
+    mutable std::mutex mtx;
+    std::vector<double> timestamps;
+    // Column-major: field i occupies [i * capacity, (i + 1) * capacity)
+    std::vector<double> values;
+    std::size_t head = 0;
+    std::size_t size = 0;
+
+    std::size_t fieldIndex(const std::string& field) const;
+    std::vector<double> column(const std::vector<double>& data, std::size_t offset) const;
+};
+
+}  // namespace python
+}  // namespace dai
@@ -0,0 +1,172 @@
+#include "Tracer.hpp"
+
+// std
+#include <algorithm>
+#include <cstring>
+#include <fstream>
+#include <mutex>
+#include <stdexcept>
+#include <vector>
+
+// libraries
+#include <nlohmann/json.hpp>
+
+namespace dai {
+namespace python {
+
+namespace {
+
+constexpr std::size_t STREAM_NAME_MAX = 48;
+
+struct Event {
+    // Seqlock: 0 while being written, otherwise index of the event + 1
+    std::atomic<std::uint64_t> seq{0};
+    const char* name = nullptr;
+    const char* category = nullptr;
+    char stream[STREAM_NAME_MAX] = {};
+    std::int64_t sequenceNum = -1;
+    std::int64_t tsNs = 0;
+    std::int64_t durNs = -1;
+    std::uint32_t tid = 0;
+};
+
+// Plain copy of an event, taken when exporting
+struct EventCopy {
+    const char* name;
+    const char* category;
+    std::string stream;
+    std::int64_t sequenceNum;
+    std::int64_t tsNs;
+    std::int64_t durNs;
+    std::uint32_t tid;
+};
+
+struct Ring {
+    explicit Ring(std::size_t capacity) : capacity(capacity), events(new Event[capacity]) {}
+    const std::size_t capacity;
+    std::unique_ptr<Event[]> events;
+    std::atomic<std::uint64_t> head{0};
+};
+
+// Current ring, accessed with std::atomic_load/atomic_store. Recording threads hold a reference to the ring they use,
+// so a replaced ring is freed by whoever releases it last
+std::shared_ptr<Ring> ring;
+// Serializes replacing the ring
+std::mutex ringMtx;
+
+void replaceRing(std::size_t capacity) {
+    std::unique_lock<std::mutex> l(ringMtx);
+    std::atomic_store(&ring, std::make_shared<Ring>(capacity));
+}
+
+std::uint32_t threadId() {
+    static std::atomic<std::uint32_t> nextId{1};
+    thread_local std::uint32_t id = nextId++;
+    return id;
+}
+
+std::vector<EventCopy> snapshot() {
+    std::vector<EventCopy> copies;
+    const auto r = std::atomic_load(&ring);
+    if(r == nullptr) return copies;
+
+    const auto head = r->head.load(std::memory_order_acquire);
+    const auto count = std::min<std::uint64_t>(head, r->capacity);
+    copies.reserve(count);
+    for(std::uint64_t i = head - count; i < head; i++) {
+        const Event& e = r->events[i % r->capacity];
+        const auto seq1 = e.seq.load(std::memory_order_acquire);
+        if(seq1 != i + 1) continue;  // being written or already overwritten
+        EventCopy copy{e.name, e.category, std::string(e.stream, strnlen(e.stream, STREAM_NAME_MAX)), e.sequenceNum, e.tsNs, e.durNs, e.tid};
+        std::atomic_thread_fence(std::memory_order_acquire);
+        if(e.seq.load(std::memory_order_relaxed) != seq1) continue;
+        copies.push_back(std::move(copy));
+    }
+    std::sort(copies.begin(), copies.end(), [](const EventCopy& a, const EventCopy& b) { return a.tsNs < b.tsNs; });
+    return copies;
+}
+
+}  // namespace
+
+constexpr std::size_t Tracer::DEFAULT_CAPACITY;
+std::atomic<bool> Tracer::enabled{false};
+
+void Tracer::start(std::size_t capacity) {
+    if(capacity == 0) throw std::invalid_argument("Tracer capacity must be at least 1");
+    replaceRing(capacity);
+    enabled = true;
+}
+
+void Tracer::stop() {
+    enabled = false;
+}
+
+void Tracer::clear() {
+    std::unique_lock<std::mutex> l(ringMtx);
+    const auto current = std::atomic_load(&ring);
+    if(current == nullptr) return;
+    std::atomic_store(&ring, std::make_shared<Ring>(current->capacity));
+}
+
+void Tracer::record(const char* name,
+                    const char* category,
+                    const std::string& stream,
+                    std::int64_t sequenceNum,
+                    std::chrono::steady_clock::time_point ts,
+                    std::chrono::nanoseconds duration) {
+    const auto r = std::atomic_load(&ring);
+    if(r == nullptr) return;
+
+    const auto index = r->head.fetch_add(1, std::memory_order_relaxed);
+    Event& e = r->events[index % r->capacity];
+    e.seq.store(0, std::memory_order_relaxed);
+    std::atomic_thread_fence(std::memory_order_release);
+
+    e.name = name;
+    e.category = category;
+    const auto len = std::min(stream.size(), STREAM_NAME_MAX);
+    std::memcpy(e.stream, stream.data(), len);
+    if(len < STREAM_NAME_MAX) e.stream[len] = '\0';
+    e.sequenceNum = sequenceNum;
+    e.tsNs = std::chrono::duration_cast<std::chrono::nanoseconds>(ts.time_since_epoch()).count();
+    e.durNs = duration.count();
+    e.tid = threadId();
+
+    e.seq.store(index + 1, std::memory_order_release);
+}
+
+std::string Tracer::toChromeJson() {
+    auto traceEvents = nlohmann::json::array();
+    for(const auto& e : snapshot()) {
+        nlohmann::json event = {
+            {"name", e.name},
+            {"cat", e.category},
+            {"pid", 0},
+            {"tid", e.tid},
+            {"ts", e.tsNs / 1000.0},
+        };
+        if(e.durNs >= 0) {
+            event["ph"] = "X";
+            event["dur"] = e.durNs / 1000.0;
+        } else {
+            event["ph"] = "i";
+            event["s"] = "t";
+        }
+        nlohmann::json args = nlohmann::json::object();
+        if(!e.stream.empty()) args["stream"] = e.stream;
+        if(e.sequenceNum >= 0) args["sequenceNum"] = e.sequenceNum;
+        event["args"] = args;
+        traceEvents.push_back(std::move(event));
+    }
+    nlohmann::json trace = {{"traceEvents", traceEvents}, {"displayTimeUnit", "ms"}};
+    return trace.dump();
+}
+
+void Tracer::dump(const dai::Path& path) {
+    std::ofstream file(path);
+    if(!file) throw std::runtime_error("Cannot open trace file '" + path.u8string() + "' for writing");
+    file << toChromeJson();
+}
+
+}  // namespace python
+}  // namespace dai
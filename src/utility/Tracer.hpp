@@ -0,0 +1,123 @@
+#pragma once
+
+// std
+#include <atomic>
+#include <chrono>
+#include <cstdint>
+#include <memory>
+#include <string>
+
+// depthai
+#include "depthai/utility/Path.hpp"
+
+namespace dai {
+namespace python {
+
+/**
+ * Opt-in tracer of message flow through the bindings (queue enqueue/dequeue, callbacks, conversions, sends).
+ * Events are recorded into a ring buffer without a global lock and exported as Chrome trace JSON,
+ * which both chrome://tracing and Perfetto UI open. While disabled, recording only costs a relaxed atomic load.
+ */
+class Tracer {
+   public:
+    /// Default number of events retained in the ring buffer
+    static constexpr std::size_t DEFAULT_CAPACITY = 1 << 16;
+
+    /**
+     * Starts recording events, discarding previously recorded ones
+     *
+     * @param capacity Number of most recent events retained
+     */
+    static void start(std::size_t capacity = DEFAULT_CAPACITY);
+
+    /**
+     * Stops recording events. Recorded events are kept until started again or cleared
+     */
+    static void stop();
+
+    /**
+     * Check whether events are being recorded
+     */
+    static bool isEnabled() {
+        return enabled.load(std::memory_order_relaxed);
+    }
+
+    /**
+     * Discards recorded events
+     */
+    static void clear();
+
+    /**
+     * Retrieves recorded events as Chrome trace JSON
+     */
+    static std::string toChromeJson();
+
+    /**
+     * Writes recorded events as Chrome trace JSON to given file
+     *
+     * @param path Path of the output file
+     */
+    static void dump(const dai::Path& path);
+
+    /**
+     * Records an instant event
+     *
+     * @param name Event name, must be a string literal
+     * @param category Event category, must be a string literal
+     * @param stream Stream (queue) name
+     * @param sequenceNum Message sequence number, negative if not applicable
+     */
+    static void instant(const char* name, const char* category, const std::string& stream, std::int64_t sequenceNum) {
+        if(isEnabled()) record(name, category, stream, sequenceNum, std::chrono::steady_clock::now(), std::chrono::nanoseconds(-1));
+    }
+
+    /**
+     * Records a complete event with duration on scope exit.
+     * Stream name is only copied while tracing, callers should avoid building it otherwise (see isEnabled)
+     */
+    class Scope {
+       public:
+        Scope(const char* name, const char* category, const char* stream, std::int64_t sequenceNum)
+            : active(isEnabled()), name(name), category(category), sequenceNum(sequenceNum) {
+            if(active) {
+                this->stream = stream;
+                begin = std::chrono::steady_clock::now();
+            }
+        }
+        Scope(const char* name, const char* category, const std::string& stream, std::int64_t sequenceNum)
+            : Scope(name, category, stream.c_str(), sequenceNum) {}
+        ~Scope() {
+            if(active) record(name, category, stream, sequenceNum, begin, std::chrono::steady_clock::now() - begin);
+        }
+        Scope(const Scope&) = delete;
+        Scope& operator=(const Scope&) = delete;
+
+        /**
+         * Sets sequence number once it is known (eg. after a message was retrieved)
+         */
+        void setSequenceNum(std::int64_t seq) {
+            sequenceNum = seq;
+        }
+
+       private:
+        bool active;
+        const char* name;
+        const char* category;
+        std::string stream;
+        std::int64_t sequenceNum;
+        std::chrono::steady_clock::time_point begin;
+    };
+
+   private:
+    static std::atomic<bool> enabled;
+
+    static void record(const char* name,
+                       const char* category,
+                       const std::string& stream,
+                       std::int64_t sequenceNum,
+                       std::chrono::steady_clock::time_point ts,
+                       std::chrono::nanoseconds duration);
+};
+
+}  // namespace python
+}  // namespace dai
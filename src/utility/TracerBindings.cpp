@@ -0,0 +1,37 @@
+#include "TracerBindings.hpp"
+
+// project
+#include "utility/Tracer.hpp"
+
+void TracerBindings::bind(pybind11::module& m, void* pCallstack){
+
+    using namespace dai::python;
+
+    // Type definitions
+    py::class_<Tracer> tracer(m, "Tracer", "Opt-in tracer of message flow (queue enqueue/dequeue, callbacks, getCvFrame conversions, sends), exported as Chrome trace JSON (chrome://tracing, Perfetto UI)");
+
+
+    ///////////////////////////////////////////////////////////////////////
+    ///////////////////////////////////////////////////////////////////////
+    ///////////////////////////////////////////////////////////////////////
+    // Call the rest of the type defines, then perform the actual bindings
+    Callstack* callstack = (Callstack*) pCallstack;
+    auto cb = callstack->top();
+    callstack->pop();
+    cb(m, pCallstack);
+    // Actual bindings
+    ///////////////////////////////////////////////////////////////////////
+    ///////////////////////////////////////////////////////////////////////
+    ///////////////////////////////////////////////////////////////////////
+
+
+    tracer
+        .def_static("start", &Tracer::start, py::arg("capacity") = Tracer::DEFAULT_CAPACITY, "Starts recording events into a ring buffer retaining 'capacity' most recent events, discarding previously recorded ones")
+        .def_static("stop", &Tracer::stop, "Stops recording events. Recorded events are kept until started again or cleared")
+        .def_static("isEnabled", &Tracer::isEnabled, "Check whether events are being recorded")
+        .def_static("clear", &Tracer::clear, "Discards recorded events")
+        .def_static("toChromeJson", &Tracer::toChromeJson, "Retrieves recorded events as Chrome trace JSON")
+        .def_static("dump", &Tracer::dump, py::arg("path"), py::call_guard<py::gil_scoped_release>(), "Writes recorded events as Chrome trace JSON to given file")
+        ;
+
+}
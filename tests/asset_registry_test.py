@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+import os
+import time
+import numpy as np
+import pytest
+import depthai as dai
+
+def data_address(asset):
+    return asset.data.__array_interface__["data"][0]
+
+def test_same_file_is_shared(tmp_path):
+    path = tmp_path / "asset.bin"
+    path.write_bytes(bytes(range(256)) * 16)
+    before = dai.AssetRegistry.getStats()
+
+    first = dai.AssetManager()
+    second = dai.AssetManager()
+    a = first.set("blob", str(path))
+    b = second.set("blob", str(path))
+    assert data_address(a) == data_address(b)
+    assert bytes(b.data) == path.read_bytes()
+
+    stats = dai.AssetRegistry.getStats()
+    assert stats.numDeduplicated == before.numDeduplicated + 1
+    assert stats.numBytesSaved == before.numBytesSaved + len(path.read_bytes())
+
+def test_modified_file_is_reloaded(tmp_path):
+    path = tmp_path / "asset.bin"
+    path.write_bytes(b"first")
+    a = dai.AssetManager().set("blob", str(path))
+    path.write_bytes(b"second content")
+    b = dai.AssetManager().set("blob", str(path))
+    assert bytes(a.data) == b"first"
+    assert bytes(b.data) == b"second content"
+
+def test_same_size_rewrite_is_reloaded(tmp_path):
+    path = tmp_path / "asset.bin"
+    path.write_bytes(b"first")
+    # Let the file age, so it is identified by its timestamps instead of being read again
+    time.sleep(2.5)
+    stat = os.stat(path)
+    a = dai.AssetManager().set("blob", str(path))
+    # Same size, and the modification time restored, as done by some copy and sync tools
+    path.write_bytes(b"other")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    b = dai.AssetManager().set("blob", str(path))
+    assert bytes(a.data) == b"first"
+    assert bytes(b.data) == b"other"
+
+def test_scripts_are_shared_across_pipelines():
+    script = "while True:\n    node.warn('asset registry test')\n"
+    scripts = []
+    pipelines = [dai.Pipeline() for _ in range(3)]
+    for pipeline in pipelines:
+        node = pipeline.create(dai.node.Script)
+        node.setScript(script)
+        scripts.append(node.getAssetManager().get("__script"))
+    assert len({data_address(s) for s in scripts}) == 1
+
+def test_different_content_is_not_shared():
+    a = dai.AssetManager().set("key", [1, 2, 3])
+    b = dai.AssetManager().set("key", [1, 2, 4])
+    c = dai.AssetManager().set("other", [1, 2, 3])
+    assert data_address(a) != data_address(b)
+    assert data_address(a) != data_address(c)
+
+def test_shared_assets_are_copied_on_write():
+    first = dai.AssetManager()
+    second = dai.AssetManager()
+    a = first.set("key", [1, 2, 3])
+    b = second.set("key", [1, 2, 3])
+    assert data_address(a) == data_address(b)
+    assert not b.data.flags.writeable
+    view = b.data
+
+    # Only the asset manager the asset was retrieved from sees the change
+    b.data = np.array([4, 5, 6], dtype=np.uint8)
+    assert bytes(b.data) == bytes([4, 5, 6])
+    assert bytes(second.get("key").data) == bytes([4, 5, 6])
+    assert bytes(first.get("key").data) == bytes([1, 2, 3])
+    assert bytes(a.data) == bytes([1, 2, 3])
+    # Views of the data before the write stay valid
+    assert bytes(view) == bytes([1, 2, 3])
+
+    b.alignment = 128
+    assert second.get("key").alignment == 128
+    assert first.get("key").alignment == 64
+
+    # Modified copy is registered again, and shared with equal assets
+    c = dai.AssetManager().set("key", [4, 5, 6], 128)
+    assert data_address(c) == data_address(second.get("key"))
+    assert not c.data.flags.writeable
+
+def test_copy_on_write_of_removed_asset():
+    manager = dai.AssetManager()
+    a = manager.set("key", [1, 2, 3])
+    other = dai.AssetManager().set("key", [1, 2, 3])
+    manager.remove("key")
+    # No longer held by its asset manager, the copy stays private
+    a.data = np.array([7], dtype=np.uint8)
+    assert bytes(a.data) == bytes([7])
+    assert a.data.flags.writeable
+    assert manager.size() == 0
+    assert bytes(other.data) == bytes([1, 2, 3])
+
+def test_unregistered_asset_is_writable():
+    asset = dai.Asset("key")
+    asset.data = np.array([1, 2, 3], dtype=np.uint8)
+    asset.alignment = 128
+    assert asset.data.flags.writeable
+    assert bytes(asset.data) == bytes([1, 2, 3])
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+import depthai as dai
+import numpy as np
+import pytest
+
+SOCKET = dai.CameraBoardSocket.CAM_A
+SIZE = (1920, 1080)
+NUM_POINTS = 50000
+
+@pytest.fixture(scope="module")
+def calib():
+    calib = dai.CalibrationHandler()
+    for socket in (SOCKET, dai.CameraBoardSocket.CAM_B):
+        calib.setCameraIntrinsics(socket, [[1500.0, 0.0, 960.0], [0.0, 1500.0, 540.0], [0.0, 0.0, 1.0]], *SIZE)
+        calib.setDistortionCoefficients(socket, [-0.2, 0.05, 0.001, -0.001] + [0.0] * 10)
+        calib.setCameraType(socket, dai.CameraModel.Perspective)
+    calib.setCameraExtrinsics(SOCKET, dai.CameraBoardSocket.CAM_B, np.identity(3).tolist(), [3.75, 0.0, 0.0])
+    return calib
+
+@pytest.fixture(scope="module")
+def pixels():
+    return (np.random.default_rng(0).random((NUM_POINTS, 2)) * SIZE).astype(np.float32)
+
+@pytest.fixture(scope="module")
+def points(calib, pixels):
+    return calib.unproject(SOCKET, pixels, np.full(NUM_POINTS, 1000.0, dtype=np.float32), SIZE)
+
+@pytest.mark.benchmark(group="CalibrationHandler")
+def test_unproject(benchmark, calib, pixels):
+    depth = np.full(NUM_POINTS, 1000.0, dtype=np.float32)
+    benchmark(calib.unproject, SOCKET, pixels, depth, SIZE)
+
+@pytest.mark.benchmark(group="CalibrationHandler")
+def test_project(benchmark, calib, points):
+    benchmark(calib.project, SOCKET, points, SIZE)
+
+@pytest.mark.benchmark(group="CalibrationHandler")
+def test_transform(benchmark, calib, points):
+    benchmark(calib.transform, SOCKET, dai.CameraBoardSocket.CAM_B, points)
+
+@pytest.mark.benchmark(group="CalibrationHandler")
+def test_undistort_maps_cached(benchmark, calib):
+    calib.getUndistortMaps(SOCKET, SIZE)
+    benchmark(calib.getUndistortMaps, SOCKET, SIZE)
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""Benchmark configuration
+
+Benchmarks of binding hot paths, run with pytest-benchmark (see requirements.txt).
+A baseline is pinned once (eg. on the target branch), then runs are compared against it, failing on regressions above a threshold:
+
+    python -m pytest benchmarks --benchmark-storage=.benchmarks --benchmark-save=baseline
+    python -m pytest benchmarks --benchmark-storage=.benchmarks --benchmark-autosave --benchmark-compare=*_baseline --benchmark-compare-fail=median:10%
+
+Saved runs are selected by a glob of their file name ('0001_baseline.json'), so only one baseline should be saved in the storage.
+Or use the 'benchmark_baseline' and 'benchmark' targets when tests are enabled (DEPTHAI_PYTHON_ENABLE_TESTS).
+Comparing against a pinned baseline, rather than the previous run, keeps gradual slowdowns from passing unnoticed.
+"""
+
+import depthai as dai
+import numpy as np
+import pytest
+
+RESOLUTIONS = {
+    "400p": (640, 400),
+    "1080p": (1920, 1080),
+    "4K": (3840, 2160),
+}
+
+FRAME_TYPES = [t for t in dai.ImgFrame.Type.__members__.values() if t != dai.ImgFrame.Type.NONE]
+
+
+def frame_size(width, height, frame_type):
+    """Payload size of a frame, single byte per pixel for types without a defined layout"""
+    try:
+        return dai.SimulatedDevice.getFrameSize(width, height, frame_type)
+    except ValueError:
+        return width * height
+
+
+def make_frame(width, height, frame_type):
+    frame = dai.ImgFrame()
+    frame.setSize(width, height)
+    frame.setType(frame_type)
+    frame.setData(np.arange(frame_size(width, height, frame_type), dtype=np.uint8))
+    return frame
+
+
+@pytest.fixture(params=list(RESOLUTIONS.keys()))
+def resolution(request):
+    return RESOLUTIONS[request.param]
+
+
+@pytest.fixture(params=FRAME_TYPES, ids=lambda t: t.name)
+def frame_type(request):
+    return request.param
+
+
+@pytest.fixture
+def frame(resolution, frame_type):
+    return make_frame(*resolution, frame_type)
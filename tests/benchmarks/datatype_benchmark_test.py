@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+import depthai as dai
+import pytest
+
+@pytest.fixture
+def nn_data():
+    nn = dai.NNData()
+    nn.setLayer("boxes", [0.5] * 4 * 1000)
+    nn.setLayer("scores", [0.25] * 1000)
+    return nn
+
+@pytest.mark.benchmark(group="NNData")
+def test_nn_data_layer_fp16(benchmark, nn_data):
+    benchmark(nn_data.getLayerFp16, "boxes")
+
+@pytest.mark.benchmark(group="NNData")
+def test_nn_data_first_layer_fp16(benchmark, nn_data):
+    benchmark(nn_data.getFirstLayerFp16)
+
+@pytest.mark.benchmark(group="NNData")
+def test_nn_data_layer_names(benchmark, nn_data):
+    benchmark(nn_data.getAllLayerNames)
+
+@pytest.fixture
+def detections():
+    dets = dai.ImgDetections()
+    items = []
+    for i in range(100):
+        d = dai.ImgDetection()
+        d.label = i % 10
+        d.confidence = 0.5
+        d.xmin, d.ymin, d.xmax, d.ymax = 0.1, 0.2, 0.3, 0.4
+        items.append(d)
+    dets.detections = items
+    return dets
+
+@pytest.mark.benchmark(group="ImgDetections")
+def test_detection_list_access(benchmark, detections):
+    benchmark(lambda: detections.detections)
+
+@pytest.mark.benchmark(group="ImgDetections")
+def test_detection_fields(benchmark, detections):
+    benchmark(lambda: [(d.label, d.confidence, d.xmin, d.ymin, d.xmax, d.ymax) for d in detections.detections])
+
+@pytest.mark.benchmark(group="IMUData")
+@pytest.mark.parametrize("packets", [1, 10, 100])
+def test_imu_packet_iteration(benchmark, packets):
+    imu = dai.IMUData()
+    imu.packets = [dai.IMUPacket() for _ in range(packets)]
+
+    def iterate():
+        for packet in imu.packets:
+            accel = packet.acceleroMeter
+            gyro = packet.gyroscope
+            (accel.x, accel.y, accel.z, gyro.x, gyro.y, gyro.z, accel.getTimestampDevice())
+
+    benchmark(iterate)
+
+# Messages are serialized and parsed through the same path as device streams
+@pytest.mark.benchmark(group="serialize")
+@pytest.mark.parametrize("frame_type", [dai.ImgFrame.Type.NV12, dai.ImgFrame.Type.BGR888p], ids=lambda t: t.name)
+def test_serialize_round_trip(benchmark, frame):
+    benchmark(lambda: dai.ADatatype.parse(frame.serialize()))
+
+@pytest.mark.benchmark(group="serialize")
+def test_serialize_nn_data(benchmark, nn_data):
+    benchmark(lambda: dai.ADatatype.parse(nn_data.serialize()))
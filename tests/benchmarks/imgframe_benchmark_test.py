@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+import depthai as dai
+import numpy as np
+import pytest
+
+@pytest.mark.benchmark(group="ImgFrame.getFrame")
+def test_get_frame(benchmark, frame):
+    benchmark(frame.getFrame)
+
+@pytest.mark.benchmark(group="ImgFrame.getFrame(copy)")
+def test_get_frame_copy(benchmark, frame):
+    benchmark(frame.getFrame, True)
+
+@pytest.mark.benchmark(group="ImgFrame.getCvFrame")
+def test_get_cv_frame(benchmark, frame):
+    pytest.importorskip("cv2")
+    benchmark(frame.getCvFrame)
+
+@pytest.mark.benchmark(group="ImgFrame.setFrame")
+def test_set_frame(benchmark, resolution):
+    width, height = resolution
+    frame = dai.ImgFrame()
+    frame.setSize(width, height)
+    frame.setType(dai.ImgFrame.Type.BGR888i)
+    benchmark(frame.setFrame, np.zeros((height, width, 3), dtype=np.uint8))
+
+@pytest.mark.benchmark(group="Buffer.setData")
+def test_set_data_array(benchmark, resolution):
+    width, height = resolution
+    buffer = dai.Buffer()
+    benchmark(buffer.setData, np.zeros(width * height * 3 // 2, dtype=np.uint8))
+
+@pytest.mark.benchmark(group="Buffer.getData")
+def test_get_data(benchmark, resolution):
+    width, height = resolution
+    buffer = dai.Buffer()
+    buffer.setData(np.zeros(width * height * 3 // 2, dtype=np.uint8))
+    benchmark(buffer.getData)
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+import depthai as dai
+import pytest
+
+# Queues of SimulatedDevice are host side MessageQueues fed by producer threads, messages parsed from serialized packets.
+# These benchmarks cover queue and parsing overhead as seen from Python, not XLink transfers of DataOutputQueue/DataInputQueue
+
+# Messages per benchmark round, so per-message cost dominates over setup
+MESSAGES = 100
+
+@pytest.fixture
+def device():
+    with dai.SimulatedDevice() as device:
+        yield device
+
+@pytest.mark.benchmark(group="queue")
+@pytest.mark.parametrize("size", [1024, 1920 * 1080 * 3 // 2], ids=["1KiB", "1080p"])
+def test_queue_get(benchmark, device, size):
+    device.addBufferStream("buffers", size, rate=0)
+    queue = device.getOutputQueue("buffers", maxSize=8, blocking=True)
+
+    def consume():
+        for _ in range(MESSAGES):
+            queue.get()
+
+    benchmark(consume)
+
+@pytest.mark.benchmark(group="queue")
+def test_queue_frames_to_numpy(benchmark, device):
+    device.addImgFrameStream("frames", 1920, 1080, dai.ImgFrame.Type.NV12, fps=0)
+    queue = device.getOutputQueue("frames", maxSize=8, blocking=True)
+
+    def consume():
+        for _ in range(MESSAGES):
+            queue.get().getFrame()
+
+    benchmark(consume)
+
+@pytest.mark.benchmark(group="queue")
+def test_queue_events(benchmark, device):
+    for name in ("a", "b"):
+        device.addBufferStream(name, 1024, rate=0)
+        device.getOutputQueue(name, maxSize=8, blocking=True)
+
+    def consume():
+        for _ in range(MESSAGES):
+            name = device.getQueueEvent()
+            device.getOutputQueue(name).tryGet()
+
+    benchmark(consume)
+
+@pytest.mark.benchmark(group="queue")
+def test_queue_send(benchmark, device):
+    queue = device.getInputQueue("control")
+    buffer = dai.Buffer()
+    buffer.setData([0] * 1024)
+
+    def produce():
+        for _ in range(MESSAGES):
+            queue.send(buffer)
+
+    benchmark(produce)
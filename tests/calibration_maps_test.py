@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+import depthai as dai
+import numpy as np
+import pytest
+
+LEFT = dai.CameraBoardSocket.CAM_B
+RIGHT = dai.CameraBoardSocket.CAM_C
+SIZE = (640, 400)
+DISTORTION = [-0.2, 0.05, 0.001, -0.001, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
+ROTATION_LEFT = [[0.9998, -0.0175, 0.0], [0.0175, 0.9998, 0.0], [0.0, 0.0, 1.0]]
+ROTATION_RIGHT = [[1.0, 0.0, 0.0], [0.0, 0.9998, -0.0175], [0.0, 0.0175, 0.9998]]
+
+@pytest.fixture
+def calib():
+    dai.CalibrationMaps.clearCache()
+    calib = dai.CalibrationHandler()
+    for socket, fx in ((LEFT, 800.0), (RIGHT, 810.0)):
+        calib.setCameraIntrinsics(socket, [[fx, 0.0, 640.0], [0.0, fx, 400.0], [0.0, 0.0, 1.0]], 1280, 800)
+        calib.setDistortionCoefficients(socket, DISTORTION)
+        calib.setCameraType(socket, dai.CameraModel.Perspective)
+    calib.setStereoLeft(LEFT, ROTATION_LEFT)
+    calib.setStereoRight(RIGHT, ROTATION_RIGHT)
+    return calib
+
+def test_undistort_maps(calib):
+    mapX, mapY = calib.getUndistortMaps(LEFT, SIZE)
+    assert mapX.shape == (SIZE[1], SIZE[0])
+    assert mapX.dtype == np.float32
+    assert not mapX.flags.writeable
+
+    # Principal point isn't moved by distortion
+    K = np.array(calib.getCameraIntrinsics(LEFT, *SIZE))
+    cx, cy = int(K[0][2]), int(K[1][2])
+    assert mapX[cy, cx] == pytest.approx(cx, abs=1e-3)
+    assert mapY[cy, cx] == pytest.approx(cy, abs=1e-3)
+    # Barrel distortion pulls corners in the source towards the center
+    assert mapX[0, 0] > 0 and mapY[0, 0] > 0
+
+def test_matches_opencv(calib):
+    cv2 = pytest.importorskip("cv2")
+    K = np.array(calib.getCameraIntrinsics(LEFT, *SIZE))
+    d = np.array(calib.getDistortionCoefficients(LEFT))
+
+    mapX, mapY = calib.getUndistortMaps(LEFT, SIZE)
+    expectedX, expectedY = cv2.initUndistortRectifyMap(K, d, np.identity(3), K, SIZE, cv2.CV_32FC1)
+    assert np.allclose(mapX, expectedX, atol=1e-2)
+    assert np.allclose(mapY, expectedY, atol=1e-2)
+
+    newK, _ = cv2.getOptimalNewCameraMatrix(K, d, SIZE, 0.5)
+    mapX, mapY = calib.getUndistortMaps(LEFT, SIZE, alpha=0.5)
+    expectedX, expectedY = cv2.initUndistortRectifyMap(K, d, np.identity(3), newK, SIZE, cv2.CV_32FC1)
+    assert np.allclose(mapX, expectedX, atol=1.0)
+
+    K2 = np.array(calib.getCameraIntrinsics(RIGHT, *SIZE))
+    d2 = np.array(calib.getDistortionCoefficients(RIGHT))
+    (leftX, leftY), (rightX, rightY) = calib.getRectificationMaps(LEFT, RIGHT, SIZE)
+    expectedX, expectedY = cv2.initUndistortRectifyMap(K, d, np.array(ROTATION_LEFT), K2, SIZE, cv2.CV_32FC1)
+    assert np.allclose(leftX, expectedX, atol=1e-2)
+    assert np.allclose(leftY, expectedY, atol=1e-2)
+    expectedX, expectedY = cv2.initUndistortRectifyMap(K2, d2, np.array(ROTATION_RIGHT), K2, SIZE, cv2.CV_32FC1)
+    assert np.allclose(rightX, expectedX, atol=1e-2)
+
+def test_fixed_point(calib):
+    mapX, mapY = calib.getUndistortMaps(LEFT, SIZE)
+    mapXY, interpolation = calib.getUndistortMaps(LEFT, SIZE, format=dai.CalibrationMaps.Format.FIXED_POINT)
+    assert mapXY.shape == (SIZE[1], SIZE[0], 2)
+    assert mapXY.dtype == np.int16
+    assert interpolation.dtype == np.uint16
+    x = mapXY[..., 0] + (interpolation % 32) / 32.0
+    y = mapXY[..., 1] + (interpolation // 32) / 32.0
+    assert np.allclose(x, mapX, atol=1 / 32.0)
+    assert np.allclose(y, mapY, atol=1 / 32.0)
+
+def test_cache(calib):
+    first = calib.getUndistortMaps(LEFT, SIZE)
+    second = calib.getUndistortMaps(LEFT, SIZE)
+    assert np.shares_memory(first[0], second[0])
+    stats = dai.CalibrationMaps.getCacheStats()
+    assert stats.numMisses == 1
+    assert stats.numHits == 1
+
+    # Changed calibration isn't served from cache
+    calib.setDistortionCoefficients(LEFT, [0.0] * 14)
+    third = calib.getUndistortMaps(LEFT, SIZE)
+    assert not np.shares_memory(first[0], third[0])
+    assert dai.CalibrationMaps.getCacheStats().numMisses == 2
+
+    capacity = dai.CalibrationMaps.getCacheCapacity()
+    try:
+        dai.CalibrationMaps.setCacheCapacity(1)
+        assert dai.CalibrationMaps.getCacheStats().numEntries == 1
+    finally:
+        dai.CalibrationMaps.setCacheCapacity(capacity)
+
+def test_cache_evicts_least_recently_used(calib):
+    capacity = dai.CalibrationMaps.getCacheCapacity()
+    try:
+        dai.CalibrationMaps.setCacheCapacity(2)
+        first = calib.getUndistortMaps(LEFT, SIZE)
+        calib.getUndistortMaps(RIGHT, SIZE)
+        # Touched, so the right camera maps are evicted next
+        calib.getUndistortMaps(LEFT, SIZE)
+        calib.getUndistortMaps(LEFT, (320, 200))
+        assert np.shares_memory(first[0], calib.getUndistortMaps(LEFT, SIZE)[0])
+        misses = dai.CalibrationMaps.getCacheStats().numMisses
+        calib.getUndistortMaps(RIGHT, SIZE)
+        assert dai.CalibrationMaps.getCacheStats().numMisses == misses + 1
+    finally:
+        dai.CalibrationMaps.setCacheCapacity(capacity)
+
+def test_cache_follows_stereo_rectification(calib):
+    (first, _), _ = calib.getRectificationMaps(LEFT, RIGHT, SIZE)
+    calib.setStereoLeft(LEFT, ROTATION_RIGHT)
+    (second, _), _ = calib.getRectificationMaps(LEFT, RIGHT, SIZE)
+    assert not np.shares_memory(first, second)
+    assert not np.allclose(first, second)
+
+def test_meshes(calib):
+    left, right = calib.getRectificationMeshes(LEFT, RIGHT, (1280, 800))
+    assert (left.width, left.height) == (81, 51)
+    assert len(left.points) == 81 * 51
+    assert len(right.toStereoMeshData()) == 81 * 51 * 2 * 4
+
+    (mapX, mapY), _ = calib.getRectificationMaps(LEFT, RIGHT, (1280, 800))
+    point = left.points[2 * 81 + 3]
+    assert point.x == pytest.approx(mapX[32, 48], abs=1e-3)
+    assert point.y == pytest.approx(mapY[32, 48], abs=1e-3)
+
+    mesh = calib.getUndistortMesh(LEFT, SIZE, step=(32, 32))
+    assert (mesh.width, mesh.height) == (21, 13)
+
+def test_invalid(calib):
+    with pytest.raises(ValueError):
+        calib.getRectificationMaps(RIGHT, LEFT, SIZE)
+    with pytest.raises(ValueError):
+        calib.getUndistortMaps(dai.CameraBoardSocket.CAM_D, SIZE)
+    with pytest.raises(ValueError):
+        calib.getUndistortMaps(LEFT, (0, 0))
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+import depthai as dai
+import numpy as np
+import pytest
+
+LEFT = dai.CameraBoardSocket.CAM_B
+RIGHT = dai.CameraBoardSocket.CAM_C
+SIZE = (640, 400)
+ROTATION = [[0.9998, -0.0175, 0.0], [0.0175, 0.9998, 0.0], [0.0, 0.0, 1.0]]
+TRANSLATION = [-7.5, 0.1, 0.0]
+
+@pytest.fixture
+def calib():
+    calib = dai.CalibrationHandler()
+    for socket in (LEFT, RIGHT):
+        calib.setCameraIntrinsics(socket, [[800.0, 0.0, 640.0], [0.0, 800.0, 400.0], [0.0, 0.0, 1.0]], 1280, 800)
+        calib.setDistortionCoefficients(socket, [-0.2, 0.05, 0.001, -0.001] + [0.0] * 10)
+        calib.setCameraType(socket, dai.CameraModel.Perspective)
+    calib.setCameraExtrinsics(LEFT, RIGHT, ROTATION, TRANSLATION)
+    return calib
+
+def test_round_trip(calib):
+    rng = np.random.default_rng(0)
+    pixels = (rng.random((1000, 2)) * [SIZE[0] - 1, SIZE[1] - 1]).astype(np.float32)
+    depth = (rng.random(1000) * 5000 + 100).astype(np.float32)
+
+    points = calib.unproject(LEFT, pixels, depth, SIZE)
+    assert points.shape == (1000, 3)
+    assert points.dtype == np.float32
+    assert np.allclose(points[:, 2], depth)
+    assert np.allclose(calib.project(LEFT, points, SIZE), pixels, atol=1e-2)
+
+def test_principal_point(calib):
+    K = np.array(calib.getCameraIntrinsics(LEFT, *SIZE))
+    points = calib.unproject(LEFT, [[K[0][2], K[1][2]]], [1000.0], SIZE)
+    assert np.allclose(points, [[0.0, 0.0, 1000.0]], atol=1e-3)
+
+def test_behind_camera(calib):
+    pixels = calib.project(LEFT, [[0.0, 0.0, -1.0], [0.0, 0.0, 0.0]], SIZE)
+    assert np.isnan(pixels).all()
+
+def test_transform(calib):
+    points = np.array([[1.0, 2.0, 100.0], [-5.0, 3.0, 50.0]], dtype=np.float32)
+    extrinsics = np.array(calib.getCameraExtrinsics(LEFT, RIGHT))
+    expected = points @ extrinsics[:3, :3].T + extrinsics[:3, 3]
+    transformed = calib.transform(LEFT, RIGHT, points)
+    assert np.allclose(transformed, expected, atol=1e-4)
+    assert np.allclose(calib.transform(RIGHT, LEFT, transformed), points, atol=1e-3)
+
+    # Changed calibration isn't served from cache
+    calib.setCameraExtrinsics(LEFT, RIGHT, ROTATION, [-10.0, 0.0, 0.0])
+    assert not np.allclose(calib.transform(LEFT, RIGHT, points), transformed)
+
+def test_intrinsics_follow_calibration(calib):
+    pixels = calib.project(LEFT, [[10.0, 5.0, 100.0]], SIZE)
+    calib.setCameraIntrinsics(LEFT, [[900.0, 0.0, 640.0], [0.0, 900.0, 400.0], [0.0, 0.0, 1.0]], 1280, 800)
+    assert not np.allclose(calib.project(LEFT, [[10.0, 5.0, 100.0]], SIZE), pixels)
+
+def test_invalid(calib):
+    with pytest.raises(ValueError):
+        calib.project(LEFT, np.zeros((10, 2), dtype=np.float32), SIZE)
+    with pytest.raises(ValueError):
+        calib.unproject(LEFT, np.zeros((10, 2), dtype=np.float32), np.zeros(5, dtype=np.float32), SIZE)
+    with pytest.raises(ValueError):
+        calib.project(dai.CameraBoardSocket.CAM_D, np.zeros((1, 3), dtype=np.float32), SIZE)
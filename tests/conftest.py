@@ -11,6 +11,7 @@ import gc
 import re
 import textwrap
 
+import depthai as dai
 import pytest
 
 # Early diagnostic for failed imports
@@ -198,3 +199,51 @@ def gc_collect():
 def pytest_configure():
     pytest.suppress = suppress
     pytest.gc_collect = gc_collect
+
+
+def _make_buffer(seq, size=16):
+    buf = dai.Buffer()
+    buf.setSequenceNum(seq)
+    buf.setData([seq % 256] * size)
+    return buf
+
+
+def _make_frame(seq, instance):
+    frame = dai.ImgFrame()
+    frame.setSequenceNum(seq)
+    frame.setInstanceNum(instance)
+    frame.setSize(4, 2)
+    frame.setType(dai.ImgFrame.Type.GRAY8)
+    frame.setData([0] * 8)
+    return frame
+
+
+@pytest.fixture
+def make_buffer():
+    """Creates a Buffer with given sequence number and data size"""
+    return _make_buffer
+
+
+@pytest.fixture
+def make_frame():
+    """Creates a small GRAY8 ImgFrame with given sequence and instance number"""
+    return _make_frame
+
+
+@pytest.fixture
+def loopback():
+    """Input and output queue of a connected device, messages sent to the
+    input queue come back on the output queue. Skips without a device"""
+    # Looked up only when a test needs a device, not while collecting
+    if len(dai.Device.getAllAvailableDevices()) == 0:
+        pytest.skip("Requires a connected device")
+
+    pipeline = dai.Pipeline()
+    xin = pipeline.create(dai.node.XLinkIn)
+    xin.setStreamName("in")
+    xin.setMaxDataSize(1024)
+    xout = pipeline.create(dai.node.XLinkOut)
+    xout.setStreamName("out")
+    xin.out.link(xout.input)
+    with dai.Device(pipeline) as device:
+        yield device.getInputQueue("in"), device.getOutputQueue("out", maxSize=64, blocking=True)
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+import depthai as dai
+import numpy as np
+import pytest
+
+def test_img_frame_round_trip():
+    frame = dai.ImgFrame()
+    frame.setSize(4, 2)
+    frame.setType(dai.ImgFrame.Type.GRAY8)
+    frame.setSequenceNum(7)
+    frame.setData(np.arange(8, dtype=np.uint8))
+
+    parsed = dai.ADatatype.parse(frame.serialize())
+    assert isinstance(parsed, dai.ImgFrame)
+    assert parsed.getSequenceNum() == 7
+    assert (parsed.getWidth(), parsed.getHeight()) == (4, 2)
+    assert list(parsed.getData()) == list(range(8))
+
+def test_nn_data_round_trip():
+    nn = dai.NNData()
+    nn.setLayer("scores", [0.25, 0.5])
+    parsed = dai.ADatatype.parse(nn.serialize())
+    assert isinstance(parsed, dai.NNData)
+    assert parsed.getLayerFp16("scores") == [0.25, 0.5]
+
+def test_parse_rejects_bad_packets():
+    with pytest.raises(RuntimeError):
+        dai.ADatatype.parse(b"\x00" * 4)
+    with pytest.raises(TypeError):
+        dai.ADatatype.parse("not bytes")
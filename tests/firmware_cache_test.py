@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+import sys
+from pathlib import Path
+
+import depthai as dai
+import numpy as np
+import pytest
+
+def test_bootloader_binary_is_cached(tmp_path):
+    cache = dai.FirmwareCache(tmp_path)
+    binary = cache.getBootloaderBinary(dai.DeviceBootloader.Type.USB)
+    expected = np.array(dai.DeviceBootloader.getEmbeddedBootloaderBinary(dai.DeviceBootloader.Type.USB), dtype=np.uint8)
+    assert np.array_equal(binary, expected)
+
+    entries = list(tmp_path.iterdir())
+    assert len(entries) == 1
+    assert entries[0].read_bytes()[:8] == b"DAIFWC01"
+
+    # Another instance (as in another process) maps the existing entry
+    mtime = entries[0].stat().st_mtime_ns
+    assert np.array_equal(dai.FirmwareCache(tmp_path).getBootloaderBinary(dai.DeviceBootloader.Type.USB), expected)
+    assert entries[0].stat().st_mtime_ns == mtime
+
+def test_binary_is_read_only(tmp_path):
+    binary = dai.FirmwareCache(tmp_path).getBootloaderBinary(dai.DeviceBootloader.Type.USB)
+    with pytest.raises(ValueError):
+        binary[0] = 0
+
+def test_corrupted_entry_is_rewritten(tmp_path):
+    expected = dai.FirmwareCache(tmp_path).getBootloaderBinary(dai.DeviceBootloader.Type.USB).copy()
+    entry = next(tmp_path.iterdir())
+    data = bytearray(entry.read_bytes())
+    data[-1] ^= 0xFF
+    entry.write_bytes(bytes(data))
+
+    assert np.array_equal(dai.FirmwareCache(tmp_path).getBootloaderBinary(dai.DeviceBootloader.Type.USB), expected)
+
+def test_entries_are_keyed_by_config(tmp_path):
+    cache = dai.FirmwareCache(tmp_path)
+    config = dai.Device.Config()
+    default = cache.getDeviceBinary(config)
+    config.board.watchdogTimeoutMs = 1234
+    changed = cache.getDeviceBinary(config)
+    assert len(list(tmp_path.glob("device-*.bin"))) == 2
+    assert len(default) != len(changed) or not np.array_equal(default, changed)
+
+def test_clear_keeps_retrieved_binaries_valid(tmp_path):
+    cache = dai.FirmwareCache(tmp_path)
+    binary = cache.getBootloaderBinary(dai.DeviceBootloader.Type.USB)
+    expected = binary.copy()
+    cache.clear()
+    # Windows doesn't delete files which are mapped
+    if sys.platform != "win32":
+        assert list(tmp_path.iterdir()) == []
+    assert np.array_equal(binary, expected)
+
+def test_bootloader_binary_path(tmp_path):
+    cache = dai.FirmwareCache(tmp_path)
+    path = Path(cache.getBootloaderBinaryPath(dai.DeviceBootloader.Type.USB))
+    assert path.parent == tmp_path
+    assert path.read_bytes() == bytes(dai.DeviceBootloader.getEmbeddedBootloaderBinary(dai.DeviceBootloader.Type.USB))
+    # Plain file is removed together with the entries
+    cache.clear()
+    assert not path.exists()
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+import os
+import subprocess
+import sys
+
+# Budget for 'import depthai' in a fresh interpreter, overridable for slow machines
+IMPORT_TIME_BUDGET = float(os.environ.get("DEPTHAI_IMPORT_TIME_BUDGET", "1.0"))
+
+def run_python(code):
+    result = subprocess.run([sys.executable, "-c", code], check=True, stdout=subprocess.PIPE, universal_newlines=True)
+    return result.stdout.strip()
+
+def test_import_does_not_initialize():
+    assert run_python("import depthai as dai; print(dai.isInitialized())") == "False"
+
+def test_datatypes_do_not_initialize():
+    code = """
+import depthai as dai
+frame = dai.ImgFrame()
+frame.setData([0] * 16)
+dai.CalibrationHandler()
+dai.NNData().setLayer("output", [1.0, 2.0])
+print(dai.isInitialized())
+"""
+    assert run_python(code) == "False"
+
+def test_import_time_within_budget():
+    code = """
+import time
+start = time.perf_counter()
+import depthai
+print(time.perf_counter() - start)
+"""
+    # Best of a few runs, to be robust against a busy machine
+    elapsed = min(float(run_python(code)) for _ in range(3))
+    assert elapsed < IMPORT_TIME_BUDGET, "'import depthai' took {:.3f} s, budget is {:.3f} s".format(elapsed, IMPORT_TIME_BUDGET)
+
+def test_embedded_binaries_initialize():
+    code = """
+import depthai as dai
+dai.Device.getEmbeddedDeviceBinary(dai.Device.Config())
+print(dai.isInitialized())
+"""
+    assert run_python(code) == "True"
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+import depthai as dai
+import pytest
+
+def make_detections(seq, count):
+    msg = dai.ImgDetections()
+    msg.setSequenceNum(seq)
+    msg.detections = [dai.ImgDetection() for _ in range(count)]
+    return msg
+
+def test_decimate(make_buffer):
+    f = dai.MessageFilter().decimate(3)
+    passed = [seq for seq in range(10) if f.apply(make_buffer(seq))]
+    assert passed == [0, 3, 6, 9]
+    assert f.getNumPassed() == 4
+    assert f.getNumDropped() == 6
+
+    # Reset restarts decimation
+    f.reset()
+    assert f.getNumPassed() == 0 and f.getNumDropped() == 0
+    assert [f.apply(make_buffer(seq)) for seq in range(3)] == [True, False, False]
+
+    with pytest.raises(ValueError):
+        dai.MessageFilter().decimate(0)
+
+def test_type(make_buffer, make_frame):
+    f = dai.MessageFilter().type(dai.DatatypeEnum.ImgFrame)
+    assert f.apply(make_frame(0, 1))
+    assert not f.apply(make_buffer(1))
+
+def test_data_size(make_buffer):
+    f = dai.MessageFilter().dataSize(8, 32)
+    assert not f.apply(make_buffer(0, size=4))
+    assert f.apply(make_buffer(1, size=8))
+    assert f.apply(make_buffer(2, size=32))
+    assert not f.apply(make_buffer(3, size=33))
+    # Upper bound is optional
+    assert dai.MessageFilter().dataSize(8).apply(make_buffer(4, size=4096))
+
+def test_detections(make_buffer):
+    f = dai.MessageFilter().detections(1, 2)
+    assert not f.apply(make_detections(0, 0))
+    assert f.apply(make_detections(1, 1))
+    assert f.apply(make_detections(2, 2))
+    assert not f.apply(make_detections(3, 3))
+    # Messages without detections pass through
+    assert f.apply(make_buffer(4))
+
+def test_stages_evaluated_in_order(make_buffer):
+    # Decimation only counts messages which passed the size stage
+    f = dai.MessageFilter().dataSize(16).decimate(2)
+    sizes = [16, 4, 16, 4, 16]
+    passed = [seq for seq, size in enumerate(sizes) if f.apply(make_buffer(seq, size=size))]
+    assert passed == [0, 4]
+    assert f.getNumDropped() == 3
+
+def test_sequence_gaps(make_frame):
+    f = dai.MessageFilter().sequenceGaps()
+    # Gaps are tracked per instance, and no message is dropped
+    for seq, instance in [(0, 1), (0, 2), (1, 1), (4, 1), (1, 2), (5, 2)]:
+        assert f.apply(make_frame(seq, instance))
+    assert f.getSequenceGaps() == 2 + 3
+    assert f.getNumDropped() == 0
+
+    f.reset()
+    assert f.getSequenceGaps() == 0
+    f.apply(make_frame(10, 1))
+    assert f.getSequenceGaps() == 0
+
+def test_keep_latest_per_instance(make_frame):
+    f = dai.MessageFilter().keepLatestPerInstance()
+    assert f.getKeepLatestPerInstance()
+    parent = dai.MessageQueue("frames", 8, True)
+    filtered = parent.filter(f, 8, True)
+    assert parent.getMaxSize() == 0 and not parent.getBlocking()
+
+    for seq, instance in [(0, 1), (1, 2), (2, 1), (3, 1), (4, 2)]:
+        parent.send(make_frame(seq, instance))
+    # Older frames of the same instance are replaced, order of the retained ones is kept
+    assert [(msg.getInstanceNum(), msg.getSequenceNum()) for msg in filtered.tryGetAll()] == [(1, 3), (2, 4)]
+    assert f.getNumPassed() == 5
+
+    filtered.close()
+    assert parent.getMaxSize() == 8 and parent.getBlocking()
+
+def test_filtered_message_queue(make_buffer):
+    parent = dai.MessageQueue("buffers", 4, False)
+    filtered = parent.filter(dai.MessageFilter().decimate(2))
+    # Inherits settings of the parent queue
+    assert filtered.getMaxSize() == 4 and not filtered.getBlocking()
+    for seq in range(6):
+        parent.send(make_buffer(seq))
+    assert not parent.has()
+    assert [msg.getSequenceNum() for msg in filtered.tryGetAll()] == [0, 2, 4]
+    assert filtered.getFilter().getNumDropped() == 3
+
+    # Dropping the filtered queue stops filtering
+    del filtered
+    pytest.gc_collect()
+    assert parent.getMaxSize() == 4 and not parent.getBlocking()
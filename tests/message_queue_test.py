@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+from datetime import timedelta
+import pytest
+
+import depthai as dai
+
+def _buffer(seq):
+    buf = dai.Buffer()
+    buf.setSequenceNum(seq)
+    return buf
+
+def test_message_queue_non_blocking_overwrites_oldest():
+    q = dai.MessageQueue("test", maxSize=2, blocking=False)
+    for seq in range(5):
+        assert q.send(_buffer(seq))
+
+    assert [msg.getSequenceNum() for msg in q.tryGetAll()] == [3, 4]
+    assert q.tryGet() is None
+    assert not q.has()
+
+
+def test_message_queue_callbacks():
+    q = dai.MessageQueue("test", maxSize=4, blocking=False)
+    received = []
+    cbId = q.addCallback(lambda name, msg: received.append((name, msg.getSequenceNum())))
+    q.send(_buffer(7))
+    assert received == [("test", 7)]
+    assert q.removeCallback(cbId)
+    q.send(_buffer(8))
+    assert received == [("test", 7)]
+    assert q.get().getSequenceNum() == 7
+
+
+def test_message_queue_closed():
+    q = dai.MessageQueue("test")
+    q.close()
+    assert q.isClosed()
+    assert not q.send(_buffer(0))
+    with pytest.raises(RuntimeError):
+        q.tryGet()
+
+
+def test_message_filter_stages():
+    f = dai.MessageFilter().type(dai.DatatypeEnum.ImgDetections).detections(1).decimate(2)
+
+    empty = dai.ImgDetections()
+    dets = dai.ImgDetections()
+    dets.detections = [dai.ImgDetection()]
+
+    assert not f.apply(_buffer(0))
+    assert not f.apply(empty)
+    assert [f.apply(dets) for _ in range(4)] == [True, False, True, False]
+    assert f.getNumPassed() == 2
+    assert f.getNumDropped() == 4
+
+
+def test_message_filter_sequence_gaps():
+    f = dai.MessageFilter().sequenceGaps()
+    for seq in [0, 1, 4, 5, 9]:
+        assert f.apply(_buffer(seq))
+    assert f.getSequenceGaps() == 5
+    f.reset()
+    assert f.getSequenceGaps() == 0
+
+
+def test_message_pool_recycles_released_messages():
+    pool = dai.MessagePool(dai.ImgFrame, count=2, capacity=64)
+    assert pool.getSize() == 2
+    assert pool.getCapacity() == 64
+
+    a = pool.tryAcquire()
+    b = pool.tryAcquire()
+    assert isinstance(a, dai.ImgFrame)
+    assert pool.tryAcquire() is None
+    assert pool.getNumAvailable() == 0
+
+    del a
+    assert pool.getNumAvailable() == 1
+    assert pool.tryAcquire() is not None
+
+
+def test_message_queue_stats_start_on_first_request():
+    q = dai.MessageQueue("test", maxSize=2, blocking=False)
+    q.send(_buffer(0))
+    q.tryGet()
+
+    # Not monitored until statistics are requested
+    stats = q.getStats()
+    assert stats.numReceived == 0 and stats.numConsumed == 0
+
+    for seq in range(1, 5):
+        q.send(_buffer(seq))
+    stats = q.getStats()
+    assert stats.numReceived == 4
+    assert stats.numDropped == 2
+    assert stats.depth == 2 and stats.peakDepth == 2
+
+    assert [msg.getSequenceNum() for msg in q.tryGetAll()] == [3, 4]
+    stats = q.getStats()
+    assert stats.numConsumed == 2
+    assert stats.depth == 0
+    assert q.getLatencyReport().backlog.count == 2
+
+def test_message_queue_depth_follows_counters():
+    q = dai.MessageQueue("test", maxSize=4, blocking=False)
+    q.getStats()
+    # Consuming from an empty queue doesn't push the depth below zero for later messages
+    assert q.tryGet() is None
+    for i in range(3):
+        for seq in range(6):
+            q.send(_buffer(seq))
+        stats = q.getStats()
+        assert stats.depth == 4
+        assert stats.numDropped == 2 * (i + 1)
+        assert stats.numReceived - stats.numDropped - stats.numConsumed == stats.depth
+        q.tryGet()
+        assert q.getStats().depth == 3
+        q.tryGetAll()
+        assert q.getStats().depth == 0
+    assert q.getStats().peakDepth == 4
+
+
+def test_latency_percentiles():
+    q = dai.MessageQueue("test", maxSize=100, blocking=False)
+    report = q.getLatencyReport()
+    assert report.transport.count == 0 and report.transport.p50 == 0.0
+
+    # Captured 1 to 100ms before being sent
+    now = dai.Clock.now()
+    for ms in range(1, 101):
+        buf = _buffer(ms)
+        buf.setTimestamp(now - timedelta(milliseconds=ms))
+        q.send(buf)
+
+    # Buckets are within ~6% of recorded values, sending adds a little latency
+    approx = lambda ms: pytest.approx(ms, rel=0.07, abs=2.0)
+    transport = q.getLatencyReport(reset=True).transport
+    assert transport.count == 100
+    assert transport.min == approx(1) and transport.max == approx(100)
+    assert transport.mean == approx(50.5)
+    assert transport.p50 == approx(50)
+    assert transport.p90 == approx(90)
+    assert transport.p99 == approx(99)
+    assert transport.p999 == approx(100)
+    assert transport.min <= transport.p50 <= transport.p90 <= transport.p99 <= transport.p999 <= transport.max
+
+    assert q.getLatencyReport().transport.count == 0
+    # Captured in the future, recorded as zero latency
+    buf = _buffer(0)
+    buf.setTimestamp(dai.Clock.now() + timedelta(seconds=1))
+    q.send(buf)
+    transport = q.getLatencyReport().transport
+    assert transport.count == 1 and transport.max == 0.0
+
+
+def test_host_timestamps_of_monitored_queue():
+    q = dai.MessageQueue("test", maxSize=4, blocking=False)
+    q.getStats()
+    before = dai.Clock.now()
+    q.send(_buffer(0))
+    msg = q.get()
+    after = dai.Clock.now()
+
+    arrival = msg.getTimestampHostArrival()
+    dequeue = msg.getTimestampHostDequeue()
+    assert before <= arrival <= dequeue <= after
+
+
+def test_host_timestamps_of_unmonitored_queue():
+    unsent = _buffer(0)
+    assert unsent.getTimestampHostArrival() is None
+
+    # Sending to a MessageQueue stamps arrival, whether the queue is monitored or not
+    q = dai.MessageQueue("test", maxSize=4, blocking=False)
+    before = dai.Clock.now()
+    sent = _buffer(1)
+    q.send(sent)
+    arrival = sent.getTimestampHostArrival()
+    assert arrival is not None and before <= arrival
+    assert sent.getTimestampHostDequeue() is None
+
+    msg = q.get()
+    dequeue = msg.getTimestampHostDequeue()
+    assert arrival <= dequeue
+
+    # First arrival and retrieval are kept
+    q.send(msg)
+    msg = q.get()
+    assert msg.getTimestampHostArrival() == arrival
+    assert msg.getTimestampHostDequeue() == dequeue
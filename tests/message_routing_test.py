@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+import gc
+import depthai as dai
+import pytest
+
+def test_split_message_queue_by_instance(make_buffer, make_frame):
+    parent = dai.MessageQueue("frames", 4, True)
+    demux = parent.split(dai.MessageDemux.Key.INSTANCE_NUM, 8, False)
+    assert demux.getKey() == dai.MessageDemux.Key.INSTANCE_NUM
+    # Parent queue doesn't retain any messages
+    assert parent.getMaxSize() == 0 and not parent.getBlocking()
+
+    for msg in [make_frame(0, 1), make_frame(1, 2), make_frame(2, 1), make_buffer(3)]:
+        assert parent.send(msg)
+    assert not parent.has()
+    assert [msg.getSequenceNum() for msg in demux.getQueue(1).tryGetAll()] == [0, 2]
+    assert demux.getQueue(2).get().getSequenceNum() == 1
+    # Messages other than ImgFrame
+    assert demux.getQueue(-1).get().getSequenceNum() == 3
+    assert demux.getKeys() == [-1, 1, 2]
+    child = demux.getQueue(1)
+    assert child.getName() == "frames/1"
+
+    demux.close()
+    assert child.isClosed()
+    # Routing stopped and parent settings restored
+    assert parent.getMaxSize() == 4 and parent.getBlocking()
+    parent.send(make_frame(4, 1))
+    assert parent.get().getSequenceNum() == 4
+
+def test_split_message_queue_by_type(make_buffer, make_frame):
+    parent = dai.MessageQueue("mixed", 8, True)
+    demux = parent.split(dai.MessageDemux.Key.TYPE)
+    # Inherits settings of the parent queue
+    frames = demux.getQueue(dai.DatatypeEnum.ImgFrame)
+    assert frames.getMaxSize() == 8 and frames.getBlocking()
+
+    for msg in [make_buffer(0), make_frame(1, 1), make_buffer(2)]:
+        parent.send(msg)
+    assert frames.get().getSequenceNum() == 1
+    buffers = demux.getQueue(dai.DatatypeEnum.Buffer)
+    assert [buffers.get().getSequenceNum() for _ in range(2)] == [0, 2]
+    demux.close()
+
+def test_split_message_queue_by_category(make_buffer, make_frame):
+    parent = dai.MessageQueue("categories", 8, False)
+    demux = parent.split(dai.MessageDemux.Key.CATEGORY, 2, False)
+    first = make_frame(0, 1)
+    first.setCategory(3)
+    second = make_frame(1, 1)
+    second.setCategory(5)
+    for msg in [first, second, make_buffer(2)]:
+        parent.send(msg)
+    assert demux.getKeys() == [-1, 3, 5]
+    assert demux.getQueue(5).get().getSequenceNum() == 1
+    demux.close()
+
+def test_split_child_queue_settings(make_frame):
+    parent = dai.MessageQueue("settings", 8, True)
+    demux = parent.split(dai.MessageDemux.Key.INSTANCE_NUM, 8, True)
+    # Non-blocking child queue of size 1 retains only the latest frame
+    latest = demux.getQueue(1, 1, False)
+    assert latest.getMaxSize() == 1 and not latest.getBlocking()
+    for seq in range(5):
+        parent.send(make_frame(seq, 1))
+    assert latest.get().getSequenceNum() == 4
+    assert not latest.has()
+    demux.close()
+
+def test_split_routes_after_handle_released(make_frame):
+    parent = dai.MessageQueue("released", 8, True)
+    demux = parent.split(dai.MessageDemux.Key.INSTANCE_NUM)
+    child = demux.getQueue(1)
+    # Child queues keep being fed without the demultiplexer handle
+    del demux
+    gc.collect()
+    parent.send(make_frame(0, 1))
+    assert child.get().getSequenceNum() == 0
+
+def test_split_closed(make_frame):
+    parent = dai.MessageQueue("closed", 8, True)
+    demux = parent.split()
+    child = demux.getQueue(1)
+    demux.close()
+    assert child.isClosed()
+    assert demux.getKeys() == [1]
+    # No new child queues are created
+    with pytest.raises(RuntimeError):
+        demux.getQueue(2)
+    # Closing again is a no-op
+    demux.close()
+
+def test_split_by_instance(loopback, make_buffer, make_frame):
+    qIn, qOut = loopback
+    demux = qOut.split(dai.MessageDemux.Key.INSTANCE_NUM, 8, True)
+    assert demux.getKey() == dai.MessageDemux.Key.INSTANCE_NUM
+    assert qOut.getMaxSize() == 0 and not qOut.getBlocking()
+
+    qIn.sendMany([make_frame(0, 1), make_frame(1, 2), make_frame(2, 1), make_buffer(3)])
+    assert [demux.getQueue(1).get().getSequenceNum() for _ in range(2)] == [0, 2]
+    assert demux.getQueue(2).get().getSequenceNum() == 1
+    # Messages other than ImgFrame
+    assert demux.getQueue(-1).get().getSequenceNum() == 3
+    assert sorted(demux.getKeys()) == [-1, 1, 2]
+
+    child = demux.getQueue(1)
+    demux.close()
+    assert child.isClosed()
+    assert qOut.getMaxSize() == 64 and qOut.getBlocking()
+
+def test_split_by_type(loopback, make_buffer, make_frame):
+    qIn, qOut = loopback
+    demux = qOut.split(dai.MessageDemux.Key.TYPE)
+    # Inherits settings of the parent queue
+    frames = demux.getQueue(dai.DatatypeEnum.ImgFrame)
+    assert frames.getMaxSize() == 64 and frames.getBlocking()
+
+    qIn.sendMany([make_buffer(0), make_frame(1, 1), make_buffer(2)])
+    assert frames.get().getSequenceNum() == 1
+    buffers = demux.getQueue(dai.DatatypeEnum.Buffer)
+    assert [buffers.get().getSequenceNum() for _ in range(2)] == [0, 2]
+    demux.close()
+
+def test_filter_passes_matching_messages(loopback, make_buffer):
+    qIn, qOut = loopback
+    filtered = qOut.filter(dai.MessageFilter().decimate(2), 16, True)
+    assert qIn.sendMany([make_buffer(seq) for seq in range(10)]) == 10
+    assert [filtered.get().getSequenceNum() for _ in range(5)] == [0, 2, 4, 6, 8]
+    filtered.close()
+    assert qOut.getMaxSize() == 64 and qOut.getBlocking()
+
+def test_filter_dropped_while_receiving(loopback, make_buffer):
+    qIn, qOut = loopback
+    received = []
+    qOut.addCallback(lambda msg: received.append(msg.getSequenceNum()))
+    filtered = qOut.filter(dai.MessageFilter(), 1, False)
+    qIn.sendMany([make_buffer(seq) for seq in range(50)])
+    # Destroying without closing stops filtering, even with a Python callback on the parent queue running
+    del filtered
+    gc.collect()
+    assert qOut.getMaxSize() == 64 and qOut.getBlocking()
+    qIn.send(make_buffer(50))
+    assert qOut.get().getSequenceNum() <= 50
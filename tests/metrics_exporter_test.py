@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+import depthai as dai
+
+def test_scrape_without_device():
+    exporter = dai.MetricsExporter(minInterval=1.0)
+
+    # Stand-in for a device: system information and logs fed manually
+    collector = dai.SystemInformationCollector(capacity=4)
+    info = dai.SystemInformation()
+    info.ddrMemoryUsage.used = 123456789
+    info.chipTemperature.average = 41.5
+    collector.add(info)
+    exporter.setSystemInformationSource(collector)
+
+    msg = dai.LogMessage()
+    msg.level = dai.LogLevel.WARN
+    exporter.recordLogMessage(msg)
+    exporter.recordLogMessage(msg)
+
+    lines = exporter.scrape().splitlines()
+    assert "# TYPE depthai_memory_used_bytes gauge" in lines
+    assert 'depthai_memory_used_bytes{device="",memory="ddr"} 123456789' in lines
+    assert 'depthai_chip_temperature_celsius{device="",sensor="average"} 41.5' in lines
+    assert 'depthai_log_messages_total{device="",level="warn"} 2' in lines
+    assert 'depthai_log_messages_total{device="",level="info"} 0' in lines
+    # Each family is declared once
+    types = [l for l in lines if l.startswith("# TYPE")]
+    assert len(types) == len(set(types))
+
+def test_log_level_labels():
+    exporter = dai.MetricsExporter(minInterval=1.0)
+    lines = exporter.scrape().splitlines()
+    # Same names as written by the device log file sink
+    for name in ["trace", "debug", "info", "warn", "error", "critical"]:
+        assert 'depthai_log_messages_total{device="",level="%s"} 0' % name in lines
+    assert not any('level="off"' in l or 'level="warning"' in l for l in lines)
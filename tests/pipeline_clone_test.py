@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+import depthai as dai
+import pytest
+
+def make_pipeline():
+    pipeline = dai.Pipeline()
+    cam = pipeline.create(dai.node.ColorCamera)
+    cam.setPreviewSize(300, 300)
+    cam.initialControl.setManualFocus(130)
+
+    manip = pipeline.create(dai.node.ImageManip)
+    manip.initialConfig.setResize(200, 200)
+    manip.inputImage.setBlocking(False)
+    manip.inputImage.setQueueSize(2)
+    cam.preview.link(manip.inputImage)
+
+    script = pipeline.create(dai.node.Script)
+    script.setScript("node.io['out'].send(node.io['in'].get())")
+    manip.out.link(script.inputs["in"])
+
+    xout = pipeline.create(dai.node.XLinkOut)
+    xout.setStreamName("out")
+    script.outputs["out"].link(xout.input)
+
+    pipeline.setXLinkChunkSize(0)
+    return pipeline
+
+def schema(pipeline):
+    # Order of nodes, connections, io ids and assets in storage follows node map iteration, so is normalized
+    json = pipeline.serializeToJson()
+    nodes = []
+    for node_id, info in sorted(json["pipeline"]["nodes"], key=lambda n: n[0]):
+        for _, io in info["ioInfo"]:
+            del io["id"]
+        nodes.append([node_id, info])
+    storage = bytes(json["assetStorage"])
+    assets = {key: (bytes(storage[a["offset"]:a["offset"] + a["size"]]), a["alignment"]) for key, a in json["assets"]["map"].items()}
+    return {
+        "nodes": nodes,
+        "connections": sorted(json["pipeline"]["connections"], key=repr),
+        "globalProperties": json["pipeline"]["globalProperties"],
+        "assets": assets,
+    }
+
+def test_clone_matches_original():
+    pipeline = make_pipeline()
+    assert schema(pipeline.clone()) == schema(pipeline)
+
+def test_clone_is_independent():
+    pipeline = make_pipeline()
+    expected = schema(pipeline)
+    clone = pipeline.clone()
+
+    clone.getNode(0).setPreviewSize(100, 100)
+    clone.remove(clone.getNode(3))
+    assert schema(pipeline) == expected
+    assert schema(clone) != expected
+
+def test_clone_shares_assets():
+    pipeline = make_pipeline()
+    clone = pipeline.clone()
+    original = pipeline.getNode(2).getAssetManager().get("__script")
+    copied = clone.getNode(2).getAssetManager().get("__script")
+    assert original.data.__array_interface__["data"][0] == copied.data.__array_interface__["data"][0]
+
+def test_clone_shares_tuning_blob(tmp_path):
+    path = tmp_path / "tuning.bin"
+    path.write_bytes(bytes(range(256)) * 4)
+    pipeline = make_pipeline()
+    pipeline.setCameraTuningBlobPath(str(path))
+    clone = pipeline.clone()
+    # Shared, without the file being read again
+    path.unlink()
+    assert schema(clone) == schema(pipeline)
+    original = pipeline.getAssetManager().get("camTuning")
+    copied = clone.getAssetManager().get("camTuning")
+    assert original.data.__array_interface__["data"][0] == copied.data.__array_interface__["data"][0]
+    properties = clone.getGlobalProperties()
+    assert properties.cameraTuningBlobSize == 1024
+    assert properties.cameraTuningBlobUri == pipeline.getGlobalProperties().cameraTuningBlobUri
+
+def test_clone_preserves_ids_of_removed_nodes():
+    pipeline = make_pipeline()
+    pipeline.remove(pipeline.getNode(1))
+    clone = pipeline.clone()
+    assert sorted(n.id for n in clone.getAllNodes()) == [0, 2, 3]
+    assert schema(clone) == schema(pipeline)
+
+def test_from_json_round_trip():
+    pipeline = make_pipeline()
+    rebuilt = dai.Pipeline.fromJson(pipeline.serializeToJson())
+    assert schema(rebuilt) == schema(pipeline)
+    assert dai.Pipeline.fromJson(rebuilt.serializeToJson()).getNode(0).getPreviewSize() == (300, 300)
+
+def test_from_json_rejects_invalid():
+    with pytest.raises(ValueError):
+        dai.Pipeline.fromJson({"pipeline": {}})
+    json = make_pipeline().serializeToJson()
+    json["pipeline"]["nodes"][0][1]["name"] = "NotANode"
+    with pytest.raises(ValueError):
+        dai.Pipeline.fromJson(json)
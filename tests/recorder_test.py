@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+from datetime import timedelta
+
+import depthai as dai
+import pytest
+
+def make_buffer(seq, size):
+    buf = dai.Buffer()
+    buf.setSequenceNum(seq)
+    buf.setTimestamp(timedelta(milliseconds=100 * seq))
+    buf.setData([seq % 256] * size)
+    return buf
+
+def test_recording_is_chunked_and_indexed(tmp_path):
+    path = tmp_path / "session.dairec"
+    # Small chunks, so both copied and directly written messages are exercised
+    with dai.Recorder(path, chunkSize=1024) as recorder:
+        for seq in range(10):
+            assert recorder.write("small", make_buffer(seq, 256))
+            assert recorder.write("large", make_buffer(seq, 4096))
+
+    stats = recorder.getStats()
+    assert stats.numRecorded == 20
+    assert stats.numDropped == 0
+    assert stats.pendingBytes == 0
+    assert stats.numChunks >= 10
+
+    data = path.read_bytes()
+    assert len(data) == stats.numBytes + 16
+    assert data[:8] == b"DAIREC01"
+    assert data[-8:] == b"DAIRIDX1"
+
+def test_writes_after_stop_are_dropped(tmp_path):
+    recorder = dai.Recorder(tmp_path / "stopped.dairec")
+    recorder.stop()
+    assert not recorder.write("stream", make_buffer(0, 16))
+    assert recorder.getStats().numDropped == 1
+
+def record_frames(path, count):
+    with dai.Recorder(path, chunkSize=1024) as recorder:
+        for seq in range(count):
+            frame = dai.ImgFrame()
+            frame.setSequenceNum(seq)
+            frame.setTimestamp(timedelta(milliseconds=100 * seq))
+            frame.setWidth(32)
+            frame.setHeight(16)
+            frame.setType(dai.ImgFrame.Type.GRAY8)
+            frame.setData([seq] * 32 * 16)
+            recorder.write("frames", frame)
+            recorder.write("buffers", make_buffer(seq, 8))
+
+def test_reader_random_access(tmp_path):
+    path = tmp_path / "frames.dairec"
+    record_frames(path, 20)
+
+    reader = dai.RecordingReader(path)
+    assert reader.isIndexed()
+    assert sorted(reader.getStreams()) == ["buffers", "frames"]
+    assert reader.getCount("frames") == 20
+
+    entry = reader.getEntry("frames", 5)
+    assert entry.datatype == dai.DatatypeEnum.ImgFrame
+    assert entry.sequenceNum == 5 and entry.dataSize == 32 * 16
+
+    frame = reader.get("frames", 7)
+    assert isinstance(frame, dai.ImgFrame)
+    assert frame.getSequenceNum() == 7 and frame.getWidth() == 32
+    assert frame.getTimestamp() == timedelta(milliseconds=700)
+
+    view = reader.getData("frames", 3)
+    assert not view.flags.writeable
+    assert (view == 3).all()
+
+    assert reader.findSequenceNum("frames", 12) == 12
+    assert reader.findSequenceNum("frames", 99) is None
+    assert reader.findTimestamp("frames", timedelta(milliseconds=450)) == 5
+    assert reader.findTimestamp("frames", timedelta(seconds=10)) is None
+    with pytest.raises(IndexError):
+        reader.getEntry("frames", 20)
+
+def test_reader_scans_recording_without_index(tmp_path):
+    path = tmp_path / "interrupted.dairec"
+    record_frames(path, 10)
+    # Cut off the index and part of the last chunk, as if recording crashed
+    data = path.read_bytes()
+    index = int.from_bytes(data[-16:-8], "little")
+    path.write_bytes(data[:index - 700])
+
+    reader = dai.RecordingReader(path)
+    assert not reader.isIndexed()
+    assert 0 < reader.getCount("frames") < 10
+    assert reader.get("frames", 0).getSequenceNum() == 0
+
+def test_replay_device_as_fast_as_possible(tmp_path):
+    path = tmp_path / "replay.dairec"
+    record_frames(path, 10)
+
+    with dai.ReplayDevice(path, speed=0) as device:
+        assert sorted(device.getOutputQueueNames()) == ["buffers", "frames"]
+        frames = device.getOutputQueue("frames", maxSize=4, blocking=True)
+        buffers = device.getOutputQueue("buffers", maxSize=4, blocking=True)
+
+        received = {"frames": [], "buffers": []}
+        queues = {"frames": frames, "buffers": buffers}
+        while sum(len(v) for v in received.values()) < 20:
+            name = device.getQueueEvent(timeout=timedelta(seconds=5))
+            assert name != ""
+            for msg in queues[name].tryGetAll():
+                received[name].append(msg.getSequenceNum())
+        assert received["frames"] == list(range(10))
+        assert received["buffers"] == list(range(10))
+
+        # Input queues discard sent messages
+        control = device.getInputQueue("control")
+        assert control.send(dai.Buffer())
+        assert device.getInputQueueNames() == ["control"]
+
+    assert device.isClosed()
+
+def test_replay_device_selected_streams(tmp_path):
+    path = tmp_path / "replay.dairec"
+    record_frames(path, 10)
+
+    # Unread "buffers" stream isn't replayed, so it can't stall the read one
+    with dai.ReplayDevice(path, speed=0, streams=["frames"]) as device:
+        assert device.getOutputQueueNames() == ["frames"]
+        frames = device.getOutputQueue("frames", maxSize=2, blocking=True)
+        received = [frames.get().getSequenceNum() for _ in range(10)]
+        assert received == list(range(10))
+
+    with pytest.raises(ValueError):
+        dai.ReplayDevice(path, streams=["missing"])
+
+def test_reader_rejects_other_format_versions(tmp_path):
+    path = tmp_path / "version.dairec"
+    record_frames(path, 2)
+    data = bytearray(path.read_bytes())
+    assert int.from_bytes(data[8:12], "little") == 1
+
+    for version in (0, 2):
+        data[8:12] = version.to_bytes(4, "little")
+        path.write_bytes(data)
+        with pytest.raises(RuntimeError, match="format version"):
+            dai.RecordingReader(path)
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+import depthai as dai
+import pytest
+
+def preview_pipeline():
+    pipeline = dai.Pipeline()
+    cam = pipeline.create(dai.node.ColorCamera)
+    cam.setPreviewSize(300, 300)
+    cam.setFps(30)
+    xout = pipeline.create(dai.node.XLinkOut)
+    xout.setStreamName("preview")
+    cam.preview.link(xout.input)
+    return pipeline
+
+def test_preview_stream():
+    estimate = preview_pipeline().estimateResources(dai.UsbSpeed.SUPER)
+    assert len(estimate.streams) == 1
+    stream = estimate.streams[0]
+    assert stream.streamName == "preview"
+    assert stream.estimated
+    assert stream.fps == pytest.approx(30)
+    assert stream.messageSize >= 300 * 300 * 3
+    assert stream.bytesPerSecond == pytest.approx(stream.messageSize * 30)
+    assert estimate.totalBytesPerSecond == pytest.approx(stream.bytesPerSecond)
+    assert estimate.warnings == []
+
+def test_link_utilization():
+    pipeline = preview_pipeline()
+    usb2 = pipeline.estimateResources(dai.UsbSpeed.HIGH)
+    usb3 = pipeline.estimateResources(dai.UsbSpeed.SUPER)
+    assert usb2.totalBytesPerSecond == pytest.approx(usb3.totalBytesPerSecond)
+    assert usb2.linkUtilization > usb3.linkUtilization
+    assert usb3.linkBytesPerSecond == pytest.approx(dai.ResourceEstimate.getLinkBytesPerSecond(dai.UsbSpeed.SUPER))
+    custom = pipeline.estimateResources(linkBytesPerSecond=1e6)
+    assert custom.linkUtilization == pytest.approx(custom.totalBytesPerSecond / 1e6)
+    with pytest.raises(ValueError):
+        pipeline.estimateResources(dai.UsbSpeed.UNKNOWN)
+
+def test_propagation_and_limits():
+    pipeline = dai.Pipeline()
+    cam = pipeline.create(dai.node.ColorCamera)
+    cam.setFps(30)
+    manip = pipeline.create(dai.node.ImageManip)
+    manip.initialConfig.setResize(100, 100)
+    manip.initialConfig.setFrameType(dai.ImgFrame.Type.BGR888p)
+    cam.preview.link(manip.inputImage)
+    xout = pipeline.create(dai.node.XLinkOut)
+    xout.setStreamName("small")
+    xout.setFpsLimit(10)
+    manip.out.link(xout.input)
+
+    stream = pipeline.estimateResources().streams[0]
+    assert stream.estimated
+    assert stream.fps == pytest.approx(10)
+    assert stream.messageSize >= 100 * 100 * 3
+    assert stream.messageSize < 300 * 300 * 3
+
+def test_pools():
+    estimate = preview_pipeline().estimateResources()
+    assert estimate.poolMemory > 0
+    assert estimate.poolMemory == sum(p.size for p in estimate.pools)
+    preview = [p for p in estimate.pools if p.name == "preview"]
+    assert len(preview) == 1
+    assert preview[0].frameSize == 300 * 300 * 3
+
+def test_unknown_nodes_warn():
+    pipeline = dai.Pipeline()
+    script = pipeline.create(dai.node.Script)
+    script.setScript("pass")
+    xout = pipeline.create(dai.node.XLinkOut)
+    xout.setStreamName("script")
+    script.outputs["out"].link(xout.input)
+
+    estimate = pipeline.estimateResources()
+    assert not estimate.streams[0].estimated
+    assert estimate.totalBytesPerSecond == 0
+    assert len(estimate.warnings) >= 2
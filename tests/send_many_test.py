@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+from datetime import timedelta
+
+import depthai as dai
+import pytest
+
+def test_send_many_keeps_order(loopback, make_buffer):
+    qIn, qOut = loopback
+    # Starts counting sends
+    assert qIn.getStats().numSent == 0
+    assert qIn.sendMany([make_buffer(seq) for seq in range(20)]) == 20
+    assert [qOut.get().getSequenceNum() for _ in range(20)] == list(range(20))
+    assert qIn.getStats().numSent == 20
+
+def test_send_many_validates_before_sending(loopback, make_buffer):
+    qIn, qOut = loopback
+    with pytest.raises(ValueError):
+        qIn.sendMany([make_buffer(0), None])
+    with pytest.raises(RuntimeError):
+        qIn.sendMany([make_buffer(1), make_buffer(2, size=2048)])
+    # Nothing of the rejected batches was sent
+    assert qIn.sendMany([make_buffer(3)]) == 1
+    assert qOut.get().getSequenceNum() == 3
+
+def test_send_many_empty_batch(loopback):
+    qIn, _ = loopback
+    assert qIn.sendMany([]) == 0
+
+def test_send_many_message_queue_keeps_order(make_buffer):
+    queue = dai.MessageQueue("batch", 32, True)
+    assert queue.sendMany([make_buffer(seq) for seq in range(20)]) == 20
+    assert [msg.getSequenceNum() for msg in queue.tryGetAll()] == list(range(20))
+
+def test_send_many_message_queue_validates_before_sending(make_buffer):
+    queue = dai.MessageQueue("batch", 8, True)
+    received = []
+    queue.addCallback(lambda msg: received.append(msg.getSequenceNum()))
+    with pytest.raises(ValueError):
+        queue.sendMany([make_buffer(0), make_buffer(1), None])
+    # Nothing of the rejected batch was sent
+    assert not queue.has()
+    assert received == []
+
+def test_send_many_message_queue_timeout(make_buffer):
+    queue = dai.MessageQueue("batch", 3, True)
+    # Full blocking queue accepts only the first messages of the batch
+    assert queue.sendMany([make_buffer(seq) for seq in range(5)], timedelta(milliseconds=10)) == 3
+    assert [msg.getSequenceNum() for msg in queue.tryGetAll()] == [0, 1, 2]
+
+def test_send_many_message_queue_closed(make_buffer):
+    queue = dai.MessageQueue("batch", 8, True)
+    queue.close()
+    with pytest.raises(RuntimeError):
+        queue.sendMany([make_buffer(0)])
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+import depthai as dai
+import pytest
+
+def test_frames_match_configured_size():
+    with dai.SimulatedDevice() as device:
+        device.addImgFrameStream("nv12", 640, 400, dai.ImgFrame.Type.NV12, fps=0)
+        device.addImgFrameStream("bgr", 320, 200, dai.ImgFrame.Type.BGR888p, fps=0)
+
+        frame = device.getOutputQueue("nv12").get()
+        assert isinstance(frame, dai.ImgFrame)
+        assert (frame.getWidth(), frame.getHeight()) == (640, 400)
+        assert frame.getFrame().shape == (600, 640)
+        assert len(frame.getData()) == dai.SimulatedDevice.getFrameSize(640, 400, dai.ImgFrame.Type.NV12)
+
+        assert device.getOutputQueue("bgr").get().getFrame().shape == (3, 200, 320)
+        assert sorted(device.getOutputQueueNames()) == ["bgr", "nv12"]
+
+def test_sequence_numbers_increase():
+    with dai.SimulatedDevice() as device:
+        device.addBufferStream("buffers", 1024, rate=0)
+        queue = device.getOutputQueue("buffers", maxSize=4, blocking=True)
+        seqs = [queue.get().getSequenceNum() for _ in range(20)]
+        assert seqs == list(range(20))
+        assert device.getNumProduced("buffers") >= 20
+
+def test_nn_data_and_imu_data():
+    with dai.SimulatedDevice() as device:
+        device.addNNDataStream("nn", {"boxes": 400, "scores": 100}, fps=0)
+        device.addIMUDataStream("imu", packetsPerMessage=5, rate=0)
+
+        nn = device.getOutputQueue("nn").get()
+        assert sorted(nn.getAllLayerNames()) == ["boxes", "scores"]
+        assert len(nn.getLayerFp16("scores")) == 100
+
+        imu = device.getOutputQueue("imu").get()
+        assert len(imu.packets) == 5
+        assert imu.packets[0].acceleroMeter.z == pytest.approx(9.81)
+
+def test_rate_is_respected():
+    with dai.SimulatedDevice() as device:
+        device.addBufferStream("slow", 16, rate=2)
+        queue = device.getOutputQueue("slow")
+        queue.get()
+        # Second message is due 0.5 s after the first
+        assert queue.tryGet() is None
+        assert queue.get().getSequenceNum() == 1
+
+def test_input_queues_discard_messages():
+    with dai.SimulatedDevice() as device:
+        control = device.getInputQueue("control")
+        for _ in range(100):
+            control.send(dai.Buffer())
+        assert device.getInputQueueNames() == ["control"]
+
+def test_duplicate_stream_is_rejected():
+    with dai.SimulatedDevice() as device:
+        device.addBufferStream("stream", 16)
+        with pytest.raises(ValueError):
+            device.addBufferStream("stream", 16)
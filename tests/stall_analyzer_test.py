@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+import depthai as dai
+import pytest
+
+def issues_of(pipeline, type):
+    return [issue for issue in pipeline.analyzeStalls().issues if issue.type == type]
+
+def test_no_issues():
+    pipeline = dai.Pipeline()
+    cam = pipeline.create(dai.node.ColorCamera)
+    xout = pipeline.create(dai.node.XLinkOut)
+    xout.setStreamName("preview")
+    cam.preview.link(xout.input)
+    report = pipeline.analyzeStalls()
+    assert report.issues == []
+    assert not report.hasIssues()
+
+def test_blocking_cycle():
+    pipeline = dai.Pipeline()
+    a = pipeline.create(dai.node.Script)
+    b = pipeline.create(dai.node.Script)
+    a.outputs["out"].link(b.inputs["in"])
+    b.outputs["out"].link(a.inputs["in"])
+
+    cycles = issues_of(pipeline, dai.StallReport.Type.BLOCKING_CYCLE)
+    assert len(cycles) == 1
+    assert sorted(cycles[0].nodeIds) == sorted([a.id, b.id])
+    assert cycles[0].severity == dai.StallReport.Severity.ERROR
+
+    b.inputs["in"].setBlocking(False)
+    assert issues_of(pipeline, dai.StallReport.Type.BLOCKING_CYCLE) == []
+
+def test_waiting_cycle():
+    pipeline = dai.Pipeline()
+    a = pipeline.create(dai.node.Script)
+    b = pipeline.create(dai.node.Script)
+    a.outputs["out"].link(b.inputs["in"])
+    b.outputs["out"].link(a.inputs["in"])
+    a.inputs["in"].setWaitForMessage(True)
+    b.inputs["in"].setWaitForMessage(True)
+    assert len(issues_of(pipeline, dai.StallReport.Type.WAITING_CYCLE)) == 1
+
+    b.inputs["in"].setReusePreviousMessage(True)
+    assert issues_of(pipeline, dai.StallReport.Type.WAITING_CYCLE) == []
+
+def test_undersized_pool():
+    # Mirrors examples/mixed/frame_sync.py, where Script retains video frames
+    pipeline = dai.Pipeline()
+    cam = pipeline.create(dai.node.ColorCamera)
+    script = pipeline.create(dai.node.Script)
+    cam.video.link(script.inputs["rgb_in"])
+
+    pools = issues_of(pipeline, dai.StallReport.Type.UNDERSIZED_POOL)
+    assert len(pools) == 1
+    assert pools[0].nodeIds[0] == cam.id
+    assert pools[0].output == "video"
+    assert pools[0].poolSize == cam.getVideoNumFramesPool()
+    assert pools[0].suggestedPoolSize == 10
+
+    cam.setVideoNumFramesPool(pools[0].suggestedPoolSize)
+    assert issues_of(pipeline, dai.StallReport.Type.UNDERSIZED_POOL) == []
+
+def test_pool_through_passthrough():
+    pipeline = dai.Pipeline()
+    cam = pipeline.create(dai.node.ColorCamera)
+    nn = pipeline.create(dai.node.NeuralNetwork)
+    script = pipeline.create(dai.node.Script)
+    cam.preview.link(nn.input)
+    nn.passthrough.link(script.inputs["frame"])
+
+    pools = issues_of(pipeline, dai.StallReport.Type.UNDERSIZED_POOL)
+    assert len(pools) == 1
+    assert pools[0].nodeIds[0] == cam.id
+    assert pools[0].output == "preview"
+
+def test_blocking_fanout():
+    pipeline = dai.Pipeline()
+    cam = pipeline.create(dai.node.ColorCamera)
+    manip = pipeline.create(dai.node.ImageManip)
+    xout = pipeline.create(dai.node.XLinkOut)
+    xout.setStreamName("preview")
+    cam.preview.link(manip.inputImage)
+    cam.preview.link(xout.input)
+
+    fanouts = issues_of(pipeline, dai.StallReport.Type.BLOCKING_FANOUT)
+    assert len(fanouts) == 1
+    assert fanouts[0].nodeIds == [cam.id, xout.id]
+    assert fanouts[0].severity == dai.StallReport.Severity.WARNING
+    assert fanouts[0].suggestedPoolSize >= fanouts[0].poolSize
+    assert not pipeline.analyzeStalls().hasIssues(dai.StallReport.Severity.ERROR)
+
+    xout.input.setBlocking(False)
+    assert issues_of(pipeline, dai.StallReport.Type.BLOCKING_FANOUT) == []
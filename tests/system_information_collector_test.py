@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+import depthai as dai
+import pytest
+
+def make_info(used, temperature):
+    info = dai.SystemInformation()
+    info.ddrMemoryUsage.used = used
+    info.ddrMemoryUsage.total = 1000
+    info.chipTemperature.average = temperature
+    return info
+
+def test_ring_buffer_keeps_latest_samples(tmp_path):
+    collector = dai.SystemInformationCollector(capacity=4)
+    assert "ddrMemoryUsage.used" in collector.getFieldNames()
+    for i in range(6):
+        collector.add(make_info(i * 100, 40.0 + i))
+
+    assert collector.getSize() == 4
+    assert list(collector.getField("ddrMemoryUsage.used")) == [200, 300, 400, 500]
+    ts = collector.getTimestamps()
+    assert all(a <= b for a, b in zip(ts, ts[1:]))
+
+    agg = collector.aggregate("chipTemperature.average")
+    assert (agg.count, agg.min, agg.max, agg.mean, agg.p95) == (4, 42.0, 45.0, 43.5, 45.0)
+    assert collector.aggregate("chipTemperature.average", window=0.0).count >= 1
+    with pytest.raises(ValueError):
+        collector.getField("unknown")
+
+    path = tmp_path / "sysinfo.bin"
+    collector.dump(path)
+    columns = dai.SystemInformationCollector.load(path)
+    assert list(columns["ddrMemoryUsage.total"]) == [1000] * 4
+    assert list(columns["timestamp"]) == list(ts)
+
+    collector.clear()
+    assert collector.getSize() == 0 and collector.aggregate("ddrMemoryUsage.used").count == 0
@@ -0,0 +1,43 @@
+#include "depthai_pybind11_tests.hpp"
+
+#include <atomic>
+#include <string>
+#include <thread>
+#include <vector>
+
+#include "utility/Tracer.hpp"
+
+TEST_SUBMODULE(tracer_stress, m) {
+
+    // Records from native threads while the ring is replaced, without the GIL in between.
+    // Run under ASAN/TSAN (SANITIZE_ADDRESS/SANITIZE_THREAD) to catch accesses to freed rings.
+    // Each thread records fewer events than the ring capacity, so events themselves are never overwritten concurrently
+    m.def("restart_while_recording", [](int numThreads, int numEvents, int numRestarts){
+        using dai::python::Tracer;
+        const std::size_t capacity = static_cast<std::size_t>(numThreads) * numEvents;
+        Tracer::start(capacity);
+        std::atomic<bool> go{false};
+        std::vector<std::thread> threads;
+        for(int t = 0; t < numThreads; t++) {
+            threads.emplace_back([&go, numEvents, t]() {
+                const std::string stream = "stress" + std::to_string(t);
+                while(!go) std::this_thread::yield();
+                for(int i = 0; i < numEvents; i++) Tracer::instant("stress", "test", stream, i);
+            });
+        }
+        go = true;
+        for(int i = 0; i < numRestarts; i++) {
+            if(i % 2) {
+                Tracer::clear();
+            } else {
+                Tracer::start(capacity);
+            }
+        }
+        for(auto& thread : threads) thread.join();
+        Tracer::stop();
+        const auto json = Tracer::toChromeJson();
+        Tracer::clear();
+        return json;
+    }, py::arg("numThreads"), py::arg("numEvents"), py::arg("numRestarts"), py::call_guard<py::gil_scoped_release>());
+
+}
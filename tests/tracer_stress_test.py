@@ -0,0 +1,10 @@
+# -*- coding: utf-8 -*-
+import json
+
+from depthai_pybind11_tests import tracer_stress as m
+
+def test_tracer_restart_while_recording_native():
+    # Meaningful under sanitizers, see tracer_stress_test.cpp
+    events = json.loads(m.restart_while_recording(4, 2000, 500))["traceEvents"]
+    assert len(events) <= 4 * 2000
+    assert all(e["name"] == "stress" for e in events)
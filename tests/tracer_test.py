@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+import json
+import threading
+
+import depthai as dai
+
+def test_tracer_records_queue_flow(tmp_path):
+    q = dai.MessageQueue("traced", maxSize=4, blocking=False)
+    buf = dai.Buffer()
+    buf.setSequenceNum(3)
+
+    dai.Tracer.start(capacity=16)
+    try:
+        q.send(buf)
+        assert q.tryGet() is not None
+    finally:
+        dai.Tracer.stop()
+
+    path = tmp_path / "trace.json"
+    dai.Tracer.dump(path)
+    events = json.loads(path.read_text())["traceEvents"]
+    assert [e["name"] for e in events] == ["enqueue", "dequeue"]
+    assert all(e["args"] == {"stream": "traced", "sequenceNum": 3} for e in events)
+
+    # Not recording once stopped
+    q.send(buf)
+    assert len(json.loads(dai.Tracer.toChromeJson())["traceEvents"]) == 2
+    dai.Tracer.clear()
+    assert json.loads(dai.Tracer.toChromeJson())["traceEvents"] == []
+
+def test_tracer_restarts_while_recording():
+    q = dai.MessageQueue("restarted", maxSize=1, blocking=False)
+    buf = dai.Buffer()
+    stop = threading.Event()
+
+    def send():
+        while not stop.is_set():
+            q.send(buf)
+
+    dai.Tracer.start(capacity=64)
+    sender = threading.Thread(target=send)
+    sender.start()
+    try:
+        # Replaced rings are freed once recording threads are done with them
+        for i in range(200):
+            if i % 2:
+                dai.Tracer.clear()
+            else:
+                dai.Tracer.start(capacity=32 + i)
+    finally:
+        stop.set()
+        sender.join()
+        dai.Tracer.stop()
+
+    events = json.loads(dai.Tracer.toChromeJson())["traceEvents"]
+    assert len(events) <= 32 + 198
+    assert all(e["args"]["stream"] == "restarted" for e in events)
+    dai.Tracer.clear()